@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Indicator Kernel Benchmark
+
+Times the numpy and Numba indicator kernel backends on 1k, 10k and 100k bars
+for 500 symbols and checks that both backends return the same values.
+
+Usage: python benchmark_indicator_kernels.py [--symbols 500] [--bars 1000 10000 100000]
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from utils.indicator_kernels import NUMBA_AVAILABLE, NUMBA_KERNELS, NUMPY_KERNELS
+
+# Distinct price paths generated up front; symbols cycle through them so 100k bars x 500
+# symbols does not need 400MB per field
+SERIES_POOL = 16
+
+
+def make_ohlc(bars: int, seed: int):
+    """Random-walk close with highs/lows around it"""
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, bars)))
+    high = close * (1 + np.abs(rng.normal(0, 0.005, bars)))
+    low = close * (1 - np.abs(rng.normal(0, 0.005, bars)))
+    return high, low, close
+
+
+def run_backend(kernels, pool, symbols: int):
+    """Run every kernel once per symbol; returns elapsed seconds per indicator and the last results"""
+    timings = {}
+    results = {}
+    calls = {
+        'rsi': lambda h, l, c: kernels.rsi(c, 14),
+        'ema': lambda h, l, c: kernels.ema(c, 26),
+        'macd': lambda h, l, c: kernels.macd(c, 12, 26, 9),
+        'bollinger': lambda h, l, c: kernels.bollinger(c, 20),
+        'atr': lambda h, l, c: kernels.atr(h, l, c, 14),
+        'adx': lambda h, l, c: kernels.adx(h, l, c, 14),
+        'williams_r': lambda h, l, c: kernels.williams_r(h, l, c, 14),
+        'stochastic': lambda h, l, c: kernels.stochastic(h, l, c, 5, 3, 3),
+    }
+    for name, call in calls.items():
+        call(*pool[0])  # Warm-up (triggers Numba compilation outside the timing)
+        start = time.perf_counter()
+        for i in range(symbols):
+            value = call(*pool[i % len(pool)])
+            if i < len(pool):
+                results[(name, i)] = np.asarray(value, dtype=float)
+        timings[name] = time.perf_counter() - start
+    return timings, results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark indicator kernel backends")
+    parser.add_argument('--symbols', type=int, default=500)
+    parser.add_argument('--bars', type=int, nargs='+', default=[1000, 10000, 100000])
+    args = parser.parse_args()
+
+    backends = [NUMPY_KERNELS] + ([NUMBA_KERNELS] if NUMBA_AVAILABLE else [])
+    if not NUMBA_AVAILABLE:
+        print("⚠️ Numba not installed - benchmarking the numpy backend only")
+
+    for bars in args.bars:
+        pool = [make_ohlc(bars, seed) for seed in range(SERIES_POOL)]
+        print(f"\n📊 {bars:,} bars x {args.symbols} symbols")
+        print(f"{'indicator':<12}" + "".join(f"{k.name + ' (ms)':>16}" for k in backends))
+
+        runs = [run_backend(kernels, pool, args.symbols) for kernels in backends]
+        for name in runs[0][0]:
+            print(f"{name:<12}" + "".join(f"{timings[name] * 1000:>16.1f}" for timings, _ in runs))
+        totals = [sum(timings.values()) * 1000 for timings, _ in runs]
+        print(f"{'total':<12}" + "".join(f"{total:>16.1f}" for total in totals))
+
+        if len(runs) == 2:
+            mismatched = [key for key, value in runs[0][1].items()
+                          if not np.allclose(value, runs[1][1][key], rtol=1e-9, equal_nan=True)]
+            print(f"⚡ numba speedup: {totals[0] / totals[1]:.1f}x")
+            print("✅ Backends agree" if not mismatched else f"❌ Backends differ: {mismatched}")
+
+
+if __name__ == "__main__":
+    main()
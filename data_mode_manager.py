@@ -104,6 +104,8 @@ class DataModeManager:
             'strategy_focus': 'intraday',  # OVERRIDE: Aggressive intraday
             'risk_level': 'aggressive',  # OVERRIDE: Maximum aggression
             'data_warning_threshold': 1800,  # Warn if older than 30 minutes
+            'quote_cache_ttl': 60,  # Reuse quotes for one cycle (data is delayed anyway)
+            'quote_fresh_max_age': 15,  # Max cached quote age for execution reads
             'execution_buffer_pct': 2.0,  # 2% execution buffer for delays
             'strategies': {
                 'crypto': {
@@ -144,6 +146,8 @@ class DataModeManager:
             'strategy_focus': 'intraday_trading',
             'risk_level': 'aggressive',
             'data_warning_threshold': 300,  # Warn if older than 5 minutes
+            'quote_cache_ttl': 10,  # Short reuse window for real-time quotes
+            'quote_fresh_max_age': 2,  # Max cached quote age for execution reads
             'execution_buffer_pct': 0.5,  # 0.5% execution buffer
             'strategies': {
                 'crypto': {
@@ -213,6 +217,13 @@ class DataModeManager:
         warning_threshold = self.config['data_warning_threshold']
         return quote_age_seconds > warning_threshold
     
+    def get_quote_cache_settings(self) -> Dict[str, float]:
+        """Quote cache TTL and execution freshness bound for current data mode"""
+        return {
+            'ttl': self.config.get('quote_cache_ttl', 60),
+            'fresh_max_age': self.config.get('quote_fresh_max_age', 15)
+        }
+    
     def get_acceptable_timeframes(self) -> List[str]:
         """Get list of acceptable timeframes for current data mode"""
         return self.config['preferred_timeframes']
@@ -7,11 +7,20 @@ Maintains Firebase + Railway compatibility
 
 import logging
 import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from datetime import datetime, timezone, timedelta
-from typing import Dict, List, Optional, Union, Any
+from typing import Callable, Dict, List, Optional, Tuple, Union, Any
 import numpy as np
 import pandas as pd
 
+from utils.bar_archive import get_bar_archive
+from utils.historical_bar_cache import HistoricalBarCache
+from utils.quote_cache import QuoteCache, QuoteFreshness
+from utils.single_flight import get_single_flight
+from utils.http_pool import get_http_pool
+from utils.rate_limiter import RateLimitedClient, get_rate_limiter
+from utils.source_health import SourceHealthTracker
+
 # Primary data source (PRESERVE - Required for trading)
 try:
     from alpaca.trading.client import TradingClient
@@ -55,9 +64,14 @@ class EnhancedDataManager:
     
     def __init__(self, api_client=None, alpaca_api_key: str = None, alpaca_secret_key: str = None, 
                  alpha_vantage_key: str = None, finnhub_key: str = None,
-                 logger: logging.Logger = None):
+                 logger: logging.Logger = None, data_mode_manager=None,
+                 quote_cache_size: int = 500, hedge_requests: bool = False):
         self.logger = logger or logging.getLogger(__name__)
         
+        # Shared per-provider token buckets and keep-alive HTTP sessions (process-wide)
+        self.rate_limiter = get_rate_limiter()
+        self.http_pool = get_http_pool()
+        
         # Use injected API client if available (from modules)
         self.api_client = api_client
         
@@ -73,8 +87,10 @@ class EnhancedDataManager:
                 else:
                     # Initialize new client
                     self.trading_client = TradingClient(alpaca_api_key, alpaca_secret_key, paper=True)
-                    self.stock_data_client = StockHistoricalDataClient(alpaca_api_key, alpaca_secret_key)
-                    self.crypto_data_client = CryptoHistoricalDataClient(alpaca_api_key, alpaca_secret_key)
+                    self.stock_data_client = RateLimitedClient(
+                        StockHistoricalDataClient(alpaca_api_key, alpaca_secret_key), 'alpaca', self.rate_limiter)
+                    self.crypto_data_client = RateLimitedClient(
+                        CryptoHistoricalDataClient(alpaca_api_key, alpaca_secret_key), 'alpaca', self.rate_limiter)
                     self.alpaca_available = True
                     self.logger.info("✅ Alpaca API initialized (PRIMARY)")
             except Exception as e:
@@ -99,87 +115,187 @@ class EnhancedDataManager:
         self.finnhub_available = False
         if FINNHUB_AVAILABLE and finnhub_key:
             try:
-                self.finnhub_client = finnhub.Client(api_key=finnhub_key)
+                client = finnhub.Client(api_key=finnhub_key)
+                if hasattr(client, '_session'):
+                    self.http_pool.adopt_session('finnhub', client._session)
+                self.finnhub_client = RateLimitedClient(client, 'finnhub', self.rate_limiter)
                 self.finnhub_key = finnhub_key
                 self.finnhub_available = True
                 self.logger.info("✅ Finnhub initialized (REAL-TIME ENRICHMENT)")
             except Exception as e:
                 self.logger.warning(f"⚠️ Finnhub initialization failed: {e}")
+        
+        # On-disk bar archive (enabled via BAR_ARCHIVE_DIR) for history that survives restarts
+        self.bar_archive = get_bar_archive(logger=self.logger)
+        if self.bar_archive:
+            self.logger.info(f"✅ Bar archive enabled at {self.bar_archive.root_dir}")
+        
+        # Daily/weekly bars: completed bars fetched once, only the forming bar refreshed intraday
+        self.historical_cache = HistoricalBarCache(
+            fetch_history=self._fetch_yfinance_history,
+            archive=self.bar_archive,
+            logger=self.logger
+        )
+        
+        # Real-time quote cache; TTLs follow the data mode (delayed vs real-time)
+        self.data_mode_manager = data_mode_manager
+        if self.data_mode_manager is None:
+            try:
+                from data_mode_manager import DataModeManager
+                self.data_mode_manager = DataModeManager(logger=self.logger)
+            except Exception as e:
+                self.logger.warning(f"⚠️ Data mode manager unavailable, using default quote TTLs: {e}")
+        self.quote_cache = QuoteCache(max_entries=quote_cache_size, logger=self.logger)
+        
+        # Coalesce identical concurrent requests from parallel modules (shared process-wide)
+        self.single_flight = get_single_flight()
+        
+        # Per-source latency/error tracking and circuit breakers for the quote fallback chains
+        self.source_health = SourceHealthTracker(logger=self.logger)
+        self.hedge_requests = hedge_requests
+        self._hedge_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix='edm-hedge') if hedge_requests else None
+    
+    def _quote_cache_settings(self) -> Dict[str, float]:
+        """Current quote TTL and execution freshness bound"""
+        if self.data_mode_manager is not None:
+            try:
+                return self.data_mode_manager.get_quote_cache_settings()
+            except Exception:
+                pass
+        return {'ttl': 60, 'fresh_max_age': 15}
     
     def get_latest_quote(self, symbol: str, fallback: bool = True) -> Optional[Dict[str, Any]]:
         """
         Get latest quote with fallback chain: Alpaca -> yfinance
         Returns standardized quote format
-        """
-        quote = None
-        source = "unknown"
         
-        # PRIMARY: Try Alpaca first (required for trading execution)
+        Sources are tried fastest-healthy-first (see _run_source_chain).
+        """
+        sources = []
         if self.alpaca_available:
-            try:
-                if '/' in symbol:  # Crypto format
-                    request = CryptoLatestQuoteRequest(symbol_or_symbols=[symbol])
-                    quotes = self.crypto_data_client.get_crypto_latest_quote(request)
-                    if symbol in quotes:
-                        alpaca_quote = quotes[symbol]
-                        quote = {
-                            'symbol': symbol,
-                            'bid': float(alpaca_quote.bid_price),
-                            'ask': float(alpaca_quote.ask_price),
-                            'timestamp': alpaca_quote.timestamp,
-                            'source': 'alpaca',
-                            'bid_size': alpaca_quote.bid_size,
-                            'ask_size': alpaca_quote.ask_size
-                        }
-                        source = "alpaca"
-                else:  # Stock format
-                    request = StockLatestQuoteRequest(symbol_or_symbols=[symbol])
-                    quotes = self.stock_data_client.get_stock_latest_quote(request)
-                    if symbol in quotes:
-                        alpaca_quote = quotes[symbol]
-                        quote = {
-                            'symbol': symbol,
-                            'bid': float(alpaca_quote.bid_price),
-                            'ask': float(alpaca_quote.ask_price),
-                            'timestamp': alpaca_quote.timestamp,
-                            'source': 'alpaca',
-                            'bid_size': alpaca_quote.bid_size,
-                            'ask_size': alpaca_quote.ask_size
-                        }
-                        source = "alpaca"
-            except Exception as e:
-                self.logger.warning(f"⚠️ Alpaca quote failed for {symbol}: {e}")
-        
-        # FALLBACK: Try yfinance if Alpaca failed and fallback enabled
-        if quote is None and fallback and self.yfinance_available:
-            try:
-                # Convert crypto symbols from Alpaca format to yfinance format
-                yf_symbol = self._convert_symbol_for_yfinance(symbol)
-                ticker = yf.Ticker(yf_symbol)
-                info = ticker.fast_info
-                
-                quote = {
-                    'symbol': symbol,
-                    'bid': float(info.get('bid', info.get('regularMarketPrice', 0))),
-                    'ask': float(info.get('ask', info.get('regularMarketPrice', 0))),
-                    'timestamp': datetime.now(timezone.utc),
-                    'source': 'yfinance',
-                    'last_price': float(info.get('regularMarketPrice', 0)),
-                    'volume': int(info.get('regularMarketVolume', 0))
-                }
-                source = "yfinance"
-                self.logger.info(f"📈 yfinance fallback used for {symbol}")
-                
-            except Exception as e:
-                self.logger.warning(f"⚠️ yfinance fallback failed for {symbol}: {e}")
+            sources.append(('alpaca', self._quote_from_alpaca))
+        if fallback and self.yfinance_available:
+            sources.append(('yfinance', self._quote_from_yfinance))
         
+        quote = self._run_source_chain(symbol, sources)
         if quote:
-            self.logger.debug(f"✅ Quote retrieved for {symbol} from {source}")
+            self.logger.debug(f"✅ Quote retrieved for {symbol} from {quote.get('source')}")
             return quote
         else:
             self.logger.error(f"❌ All data sources failed for {symbol}")
             return None
     
+    def _run_source_chain(self, symbol: str, sources: List[Tuple[str, Callable]]) -> Optional[Dict[str, Any]]:
+        """
+        Return the first quote produced by a fallback chain.
+        
+        The chain is reordered by rolling p50 latency, sources with an open
+        circuit breaker are skipped, and with hedge_requests enabled a second
+        source is started once the first has run longer than its own p95.
+        """
+        by_name = dict(sources)
+        ordered = self.source_health.order(list(by_name))
+        
+        def next_allowed() -> Optional[str]:
+            # Breakers are checked lazily so a half-open trial is only claimed when it is used
+            while ordered:
+                name = ordered.pop(0)
+                if self.source_health.allow(name):
+                    return name
+            return None
+        
+        name = next_allowed()
+        while name is not None:
+            hedge_after = self.source_health.latency_percentile(name, 95) if self.hedge_requests else None
+            if hedge_after is None:
+                quote = self._call_source(name, by_name[name], symbol)
+                if quote:
+                    return quote
+                name = next_allowed()
+                continue
+            
+            # Hedged request: give the leading source its p95, then race the next one
+            pending = {self._hedge_pool.submit(self._call_source, name, by_name[name], symbol)}
+            done, pending = wait(pending, timeout=hedge_after)
+            if not done:
+                hedge_name = next_allowed()
+                if hedge_name is not None:
+                    self.logger.debug(f"⏱️ {name} slower than p95 ({hedge_after:.2f}s) - hedging {symbol} to {hedge_name}")
+                    pending.add(self._hedge_pool.submit(self._call_source, hedge_name, by_name[hedge_name], symbol))
+            while True:
+                for future in done:
+                    quote = future.result()
+                    if quote:
+                        return quote
+                if not pending:
+                    break
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            name = next_allowed()
+        return None
+    
+    def _call_source(self, name: str, fetch: Callable, symbol: str) -> Optional[Dict[str, Any]]:
+        """Call one source, recording its latency and outcome (no data only counts against ordering)"""
+        start = time.monotonic()
+        try:
+            quote = fetch(symbol)
+        except Exception as e:
+            self.source_health.record_failure(name, time.monotonic() - start)
+            self.logger.warning(f"⚠️ {name} quote failed for {symbol}: {e}")
+            return None
+        if not quote:
+            # Nothing for this symbol (e.g. a crypto pair on a stock endpoint) is not an outage:
+            # it ranks the source lower but leaves its breaker, shared by every symbol, closed
+            self.source_health.record_empty(name, time.monotonic() - start)
+            self.logger.debug(f"{name} returned no quote for {symbol}")
+            return None
+        self.source_health.record_success(name, time.monotonic() - start)
+        return quote
+    
+    def _quote_from_alpaca(self, symbol: str) -> Optional[Dict[str, Any]]:
+        """Latest Alpaca quote (None if the symbol is not in the response)"""
+        if '/' in symbol:  # Crypto format
+            request = CryptoLatestQuoteRequest(symbol_or_symbols=[symbol])
+            quotes = self.crypto_data_client.get_crypto_latest_quote(request)
+        else:  # Stock format
+            request = StockLatestQuoteRequest(symbol_or_symbols=[symbol])
+            quotes = self.stock_data_client.get_stock_latest_quote(request)
+        if symbol not in quotes:
+            return None
+        alpaca_quote = quotes[symbol]
+        bid, ask = float(alpaca_quote.bid_price), float(alpaca_quote.ask_price)
+        return {
+            'symbol': symbol,
+            'price': (bid + ask) / 2 if bid and ask else (ask or bid),
+            'bid': bid,
+            'ask': ask,
+            'timestamp': alpaca_quote.timestamp,
+            'source': 'alpaca',
+            'bid_size': alpaca_quote.bid_size,
+            'ask_size': alpaca_quote.ask_size
+        }
+    
+    def _quote_from_yfinance(self, symbol: str) -> Optional[Dict[str, Any]]:
+        """yfinance fast_info quote"""
+        # Convert crypto symbols from Alpaca format to yfinance format
+        yf_symbol = self._convert_symbol_for_yfinance(symbol)
+        ticker = yf.Ticker(yf_symbol)
+        self.rate_limiter.acquire('yfinance', 'quote')
+        info = ticker.fast_info
+        
+        last_price = float(info.get('regularMarketPrice', 0))
+        quote = {
+            'symbol': symbol,
+            'price': last_price,
+            'bid': float(info.get('bid', info.get('regularMarketPrice', 0))),
+            'ask': float(info.get('ask', info.get('regularMarketPrice', 0))),
+            'timestamp': datetime.now(timezone.utc),
+            'source': 'yfinance',
+            'last_price': last_price,
+            'volume': int(info.get('regularMarketVolume', 0))
+        }
+        self.logger.info(f"📈 yfinance fallback used for {symbol}")
+        return quote
+    
     def _convert_symbol_for_yfinance(self, symbol: str) -> str:
         """Convert symbol from Alpaca format to yfinance format"""
         # Handle crypto symbols: BTCUSD -> BTC-USD
@@ -209,6 +325,15 @@ class EnhancedDataManager:
         data = None
         source = "unknown"
         
+        # ARCHIVE: Intraday bars kept current by the bar store need no request at all
+        # (daily/weekly bars go through the historical cache, which is archive-backed itself)
+        if self.bar_archive is not None and not self.historical_cache.supports(interval):
+            start = self._period_start(period)
+            archived = self._archived_dataframe(symbol, interval, start, current_only=True)
+            if archived is not None and archived.index[0] <= start + self._ARCHIVE_START_TOLERANCE:
+                self.logger.debug(f"💾 Bar archive served {symbol} {interval} history ({len(archived)} bars)")
+                return archived
+        
         # PRIMARY: Try Alpaca first
         if self.alpaca_available:
             try:
@@ -233,14 +358,20 @@ class EnhancedDataManager:
         # FALLBACK: Try yfinance
         if data is None and fallback and self.yfinance_available:
             try:
-                # Convert crypto symbols for yfinance compatibility
-                yf_symbol = self._convert_symbol_for_yfinance(symbol)
-                ticker = yf.Ticker(yf_symbol)
-                data = ticker.history(period=period, interval=interval)
-                
-                if not data.empty:
+                if self.historical_cache.supports(interval):
+                    data = self.historical_cache.get(symbol, interval, self._period_start(period))
+                else:
+                    # Convert crypto symbols for yfinance compatibility
+                    yf_symbol = self._convert_symbol_for_yfinance(symbol)
+                    ticker = yf.Ticker(yf_symbol)
+                    self.rate_limiter.acquire('yfinance', 'history')
+                    data = ticker.history(period=period, interval=interval)
                     # Standardize column names
                     data.columns = [col.lower().replace(' ', '_') for col in data.columns]
+                    if not data.empty:
+                        self._archive_historical_data(symbol, interval, data)
+                
+                if data is not None and not data.empty:
                     data['source'] = 'yfinance'
                     source = "yfinance"
                     self.logger.info(f"📈 yfinance historical data used for {symbol}")
@@ -248,132 +379,244 @@ class EnhancedDataManager:
             except Exception as e:
                 self.logger.warning(f"⚠️ yfinance historical data failed for {symbol}: {e}")
         
+        if (data is None or data.empty) and self.bar_archive is not None:
+            # LAST RESORT: Serve archived bars when every live source failed
+            archived = self._archived_dataframe(symbol, interval, self._period_start(period))
+            if archived is not None:
+                self.logger.info(f"💾 Bar archive used for {symbol} historical data ({len(archived)} bars)")
+                data = archived
+        
         return data
     
-    def get_real_time_quote(self, symbol: str) -> Optional[Dict[str, Any]]:
+    def _fetch_yfinance_history(self, symbol: str, interval: str, start: datetime) -> Optional[pd.DataFrame]:
+        """Fetch yfinance bars from a start date (used by the historical bar cache)"""
+        start_day = start.strftime('%Y-%m-%d')
+        
+        def fetch():
+            ticker = yf.Ticker(self._convert_symbol_for_yfinance(symbol))
+            self.rate_limiter.acquire('yfinance', 'history')
+            data = ticker.history(start=start_day, interval=interval)
+            if data is None or data.empty:
+                return None
+            data.columns = [col.lower().replace(' ', '_') for col in data.columns]
+            return data
+        
+        data = self.single_flight.do(('yfinance.history', symbol, interval, start_day), fetch)
+        # Waiters share the leader's frame; hand each caller its own copy
+        return data.copy() if data is not None else None
+    
+    # Interval names used by get_historical_data -> bar archive timeframes
+    _ARCHIVE_TIMEFRAMES = {'1m': '1Min', '5m': '5Min', '15m': '15Min', '1h': '1Hour',
+                           '60m': '1Hour', '1d': '1Day', '1wk': '1Week'}
+    # Archived history may start this much after a period's start (weekends, holidays, trading hours)
+    _ARCHIVE_START_TOLERANCE = timedelta(days=4)
+    
+    @staticmethod
+    def _period_start(period: str) -> datetime:
+        """Start of a yfinance-style period ('1mo', '3mo', '1y', ...) relative to now"""
+        days = {'1d': 1, '5d': 5, '1mo': 30, '3mo': 90, '6mo': 180, '1y': 365, '2y': 730}.get(period, 30)
+        return datetime.now(timezone.utc) - timedelta(days=days)
+    
+    def get_archived_history(self, symbol: str, interval: str = "1d", start: datetime = None,
+                             last_n: int = None, current_only: bool = False):
+        """
+        Read archived bars for a symbol.
+        
+        Args:
+            current_only: Return None unless the archive is up to date (BarArchive.is_current),
+                so callers fetch instead of trading on a stale last bar
+        
+        Returns:
+            utils.bar_store.BarHistory of read-only numpy arrays, or None if not archived
+        """
+        timeframe = self._ARCHIVE_TIMEFRAMES.get(interval)
+        if self.bar_archive is None or timeframe is None:
+            return None
+        try:
+            if current_only and not self.bar_archive.is_current(symbol, timeframe):
+                return None
+            return self.bar_archive.read_range(symbol, timeframe, start=start, last_n=last_n)
+        except Exception as e:
+            self.logger.warning(f"⚠️ Bar archive read failed for {symbol}: {e}")
+            return None
+    
+    def _archived_dataframe(self, symbol: str, interval: str, start: datetime,
+                            current_only: bool = False) -> Optional[pd.DataFrame]:
+        """Archived bars as a DataFrame in get_historical_data's column format"""
+        history = self.get_archived_history(symbol, interval, start=start, current_only=current_only)
+        if history is None or len(history) == 0:
+            return None
+        data = pd.DataFrame({
+            'open': history.open,
+            'high': history.high,
+            'low': history.low,
+            'close': history.close,
+            'volume': history.volume
+        }, index=pd.to_datetime(history.timestamps, unit='s', utc=True))
+        data['source'] = 'bar_archive'
+        return data
+    
+    def _archive_historical_data(self, symbol: str, interval: str, data: pd.DataFrame):
+        """Write fetched OHLCV bars through to the bar archive"""
+        timeframe = self._ARCHIVE_TIMEFRAMES.get(interval)
+        if self.bar_archive is None or timeframe is None:
+            return
+        try:
+            if not all(column in data.columns for column in ('open', 'high', 'low', 'close', 'volume')):
+                return
+            index = pd.DatetimeIndex(data.index)
+            index = index.tz_localize('UTC') if index.tz is None else index.tz_convert('UTC')
+            self.bar_archive.append(
+                symbol, timeframe,
+                list(index.to_pydatetime()),
+                data['open'].to_numpy(), data['high'].to_numpy(), data['low'].to_numpy(),
+                data['close'].to_numpy(), data['volume'].to_numpy()
+            )
+        except Exception as e:
+            self.logger.warning(f"⚠️ Bar archive write failed for {symbol}: {e}")
+    
+    def get_real_time_quote(self, symbol: str,
+                            freshness: QuoteFreshness = QuoteFreshness.CACHE_OK) -> Optional[Dict[str, Any]]:
         """
         Get real-time quote using Finnhub (preferred) -> Alpha Vantage -> Alpaca chain
         Returns standardized real-time quote format
+        
+        Args:
+            symbol: Symbol to quote
+            freshness: CACHE_OK serves any unexpired cached quote (scanning);
+                FRESH_REQUIRED only accepts quotes younger than the data mode's
+                quote_fresh_max_age (execution)
         """
-        quote = None
-        source = "unknown"
+        settings = self._quote_cache_settings()
+        max_age = settings['fresh_max_age'] if freshness == QuoteFreshness.FRESH_REQUIRED else None
+        cached = self.quote_cache.get(symbol, max_age=max_age)
+        if cached is not None:
+            return cached
         
-        # PRIMARY REAL-TIME: Try Finnhub first for most up-to-date data
+        quote = self.single_flight.do(('edm.real_time_quote', symbol), self._fetch_real_time_quote, symbol)
+        if quote:
+            self.quote_cache.put(symbol, quote, ttl=settings['ttl'])
+        return quote
+    
+    def _fetch_real_time_quote(self, symbol: str) -> Optional[Dict[str, Any]]:
+        """Walk the real-time source chain for one symbol (uncached)"""
+        sources = []
         if self.finnhub_available:
-            try:
-                # Convert symbol format for Finnhub (remove USD suffix for crypto)
-                fh_symbol = symbol.replace('USD', '') if 'USD' in symbol else symbol
-                
-                if 'USD' in symbol:  # Crypto symbol
-                    quote_data = self.finnhub_client.crypto_candles(fh_symbol + 'USDT', 'D', 
-                                                                   int(time.time()) - 86400, 
-                                                                   int(time.time()))
-                    if quote_data and quote_data.get('c') and len(quote_data['c']) > 0:
-                        latest_price = quote_data['c'][-1]  # Latest close price
-                        quote = {
-                            'symbol': symbol,
-                            'price': float(latest_price),
-                            'bid': float(latest_price) * 0.999,  # Estimate spread
-                            'ask': float(latest_price) * 1.001,
-                            'timestamp': datetime.now(timezone.utc),
-                            'source': 'finnhub_crypto',
-                            'real_time': True
-                        }
-                        source = "finnhub_crypto"
-                else:  # Stock symbol
-                    quote_data = self.finnhub_client.quote(symbol)
-                    if quote_data and quote_data.get('c'):
-                        quote = {
-                            'symbol': symbol,
-                            'price': float(quote_data['c']),
-                            'bid': float(quote_data.get('pc', quote_data['c'])),  # Previous close as bid fallback
-                            'ask': float(quote_data['c']),
-                            'timestamp': datetime.fromtimestamp(quote_data.get('t', time.time()), timezone.utc),
-                            'source': 'finnhub_stock',
-                            'real_time': True,
-                            'change': float(quote_data.get('d', 0)),
-                            'change_percent': float(quote_data.get('dp', 0))
-                        }
-                        source = "finnhub_stock"
-                        
-                self.logger.debug(f"✅ Finnhub real-time quote for {symbol}: ${quote['price']:.4f}")
-                        
-            except Exception as e:
-                self.logger.warning(f"⚠️ Finnhub real-time quote failed for {symbol}: {e}")
-        
-        # SECONDARY REAL-TIME: Try Alpha Vantage if Finnhub failed
-        if quote is None and self.alpha_vantage_available:
-            try:
-                if 'USD' in symbol:  # Crypto
-                    crypto_symbol = symbol.replace('USD', '')
-                    # Use Alpha Vantage crypto endpoint
-                    url = f"https://www.alphavantage.co/query?function=CURRENCY_EXCHANGE_RATE&from_currency={crypto_symbol}&to_currency=USD&apikey={self.av_key}"
-                    import requests
-                    response = requests.get(url, timeout=10)
-                    data = response.json()
-                    
-                    if 'Realtime Currency Exchange Rate' in data:
-                        rate_data = data['Realtime Currency Exchange Rate']
-                        price = float(rate_data['5. Exchange Rate'])
-                        quote = {
-                            'symbol': symbol,
-                            'price': price,
-                            'bid': price * 0.999,
-                            'ask': price * 1.001,
-                            'timestamp': datetime.now(timezone.utc),
-                            'source': 'alpha_vantage_crypto',
-                            'real_time': True
-                        }
-                        source = "alpha_vantage_crypto"
-                else:  # Stock
-                    # Use Alpha Vantage GLOBAL_QUOTE for real-time stock data
-                    url = f"https://www.alphavantage.co/query?function=GLOBAL_QUOTE&symbol={symbol}&apikey={self.av_key}"
-                    import requests
-                    response = requests.get(url, timeout=10)
-                    data = response.json()
-                    
-                    if 'Global Quote' in data:
-                        quote_data = data['Global Quote']
-                        price = float(quote_data['05. price'])
-                        quote = {
-                            'symbol': symbol,
-                            'price': price,
-                            'bid': price * 0.999,
-                            'ask': price * 1.001,
-                            'timestamp': datetime.now(timezone.utc),
-                            'source': 'alpha_vantage_stock',
-                            'real_time': True,
-                            'change': float(quote_data.get('09. change', 0)),
-                            'change_percent': quote_data.get('10. change percent', '0%').replace('%', '')
-                        }
-                        source = "alpha_vantage_stock"
-                        
-                self.logger.debug(f"✅ Alpha Vantage real-time quote for {symbol}: ${quote['price']:.4f}")
-                        
-            except Exception as e:
-                self.logger.warning(f"⚠️ Alpha Vantage real-time quote failed for {symbol}: {e}")
-        
-        # FALLBACK: Use existing get_latest_quote method
-        if quote is None:
-            quote = self.get_latest_quote(symbol, fallback=True)
-            if quote:
-                quote['real_time'] = False
-                source = quote.get('source', 'fallback')
+            sources.append(('finnhub', self._quote_from_finnhub))
+        if self.alpha_vantage_available:
+            sources.append(('alpha_vantage', self._quote_from_alpha_vantage))
+        # FALLBACK: Delayed sources share the same adaptive ordering
+        if self.alpaca_available:
+            sources.append(('alpaca', self._quote_from_alpaca))
+        if self.yfinance_available:
+            sources.append(('yfinance', self._quote_from_yfinance))
         
+        quote = self._run_source_chain(symbol, sources)
         if quote:
-            self.logger.debug(f"✅ Real-time quote retrieved for {symbol} from {source}")
+            quote.setdefault('real_time', False)
+            self.logger.debug(f"✅ Real-time quote retrieved for {symbol} from {quote['source']}")
             return quote
         else:
             self.logger.error(f"❌ All real-time data sources failed for {symbol}")
             return None
     
-    def get_enhanced_quote_data(self, symbol: str, include_fundamentals: bool = False) -> Optional[Dict[str, Any]]:
+    def _quote_from_finnhub(self, symbol: str) -> Optional[Dict[str, Any]]:
+        """Finnhub real-time quote (latest daily candle close for crypto)"""
+        quote = None
+        # Convert symbol format for Finnhub (remove USD suffix for crypto)
+        fh_symbol = symbol.replace('USD', '') if 'USD' in symbol else symbol
+        
+        if 'USD' in symbol:  # Crypto symbol
+            quote_data = self.finnhub_client.crypto_candles(fh_symbol + 'USDT', 'D', 
+                                                           int(time.time()) - 86400, 
+                                                           int(time.time()))
+            if quote_data and quote_data.get('c') and len(quote_data['c']) > 0:
+                latest_price = quote_data['c'][-1]  # Latest close price
+                quote = {
+                    'symbol': symbol,
+                    'price': float(latest_price),
+                    'bid': float(latest_price) * 0.999,  # Estimate spread
+                    'ask': float(latest_price) * 1.001,
+                    'timestamp': datetime.now(timezone.utc),
+                    'source': 'finnhub_crypto',
+                    'real_time': True
+                }
+        else:  # Stock symbol
+            quote_data = self.finnhub_client.quote(symbol)
+            if quote_data and quote_data.get('c'):
+                quote = {
+                    'symbol': symbol,
+                    'price': float(quote_data['c']),
+                    'bid': float(quote_data.get('pc', quote_data['c'])),  # Previous close as bid fallback
+                    'ask': float(quote_data['c']),
+                    'timestamp': datetime.fromtimestamp(quote_data.get('t', time.time()), timezone.utc),
+                    'source': 'finnhub_stock',
+                    'real_time': True,
+                    'change': float(quote_data.get('d', 0)),
+                    'change_percent': float(quote_data.get('dp', 0))
+                }
+        
+        if quote:
+            self.logger.debug(f"✅ Finnhub real-time quote for {symbol}: ${quote['price']:.4f}")
+        return quote
+    
+    def _quote_from_alpha_vantage(self, symbol: str) -> Optional[Dict[str, Any]]:
+        """Alpha Vantage real-time quote"""
+        quote = None
+        if 'USD' in symbol:  # Crypto
+            crypto_symbol = symbol.replace('USD', '')
+            # Use Alpha Vantage crypto endpoint
+            url = f"https://www.alphavantage.co/query?function=CURRENCY_EXCHANGE_RATE&from_currency={crypto_symbol}&to_currency=USD&apikey={self.av_key}"
+            self.rate_limiter.acquire('alpha_vantage')
+            response = self.http_pool.get(url, timeout=10)
+            data = response.json()
+            
+            if 'Realtime Currency Exchange Rate' in data:
+                rate_data = data['Realtime Currency Exchange Rate']
+                price = float(rate_data['5. Exchange Rate'])
+                quote = {
+                    'symbol': symbol,
+                    'price': price,
+                    'bid': price * 0.999,
+                    'ask': price * 1.001,
+                    'timestamp': datetime.now(timezone.utc),
+                    'source': 'alpha_vantage_crypto',
+                    'real_time': True
+                }
+        else:  # Stock
+            # Use Alpha Vantage GLOBAL_QUOTE for real-time stock data
+            url = f"https://www.alphavantage.co/query?function=GLOBAL_QUOTE&symbol={symbol}&apikey={self.av_key}"
+            self.rate_limiter.acquire('alpha_vantage')
+            response = self.http_pool.get(url, timeout=10)
+            data = response.json()
+            
+            if 'Global Quote' in data:
+                quote_data = data['Global Quote']
+                price = float(quote_data['05. price'])
+                quote = {
+                    'symbol': symbol,
+                    'price': price,
+                    'bid': price * 0.999,
+                    'ask': price * 1.001,
+                    'timestamp': datetime.now(timezone.utc),
+                    'source': 'alpha_vantage_stock',
+                    'real_time': True,
+                    'change': float(quote_data.get('09. change', 0)),
+                    'change_percent': quote_data.get('10. change percent', '0%').replace('%', '')
+                }
+        
+        if quote:
+            self.logger.debug(f"✅ Alpha Vantage real-time quote for {symbol}: ${quote['price']:.4f}")
+        return quote
+    
+    def get_enhanced_quote_data(self, symbol: str, include_fundamentals: bool = False,
+                                freshness: QuoteFreshness = QuoteFreshness.CACHE_OK) -> Optional[Dict[str, Any]]:
         """
         Get comprehensive quote data combining real-time price with technical indicators
         """
         try:
             # Get real-time quote
-            quote = self.get_real_time_quote(symbol)
+            quote = self.get_real_time_quote(symbol, freshness=freshness)
             if not quote:
                 return None
             
@@ -398,6 +641,7 @@ class EnhancedDataManager:
                 enhanced_data['volume_history'] = historical_data.get('volume', pd.Series()).tail(50).tolist()
                 enhanced_data['high_history'] = historical_data.get('high', pd.Series()).tail(50).tolist()
                 enhanced_data['low_history'] = historical_data.get('low', pd.Series()).tail(50).tolist()
+                enhanced_data['last_bar_time'] = historical_data.index[-1]
             
             # Add fundamental data if requested
             if include_fundamentals and not 'USD' in symbol:  # Stocks only
@@ -499,6 +743,7 @@ class EnhancedDataManager:
         
         try:
             ticker = yf.Ticker(symbol)
+            self.rate_limiter.acquire('yfinance', 'fundamentals')
             info = ticker.info
             
             fundamentals = {
@@ -580,6 +825,17 @@ class EnhancedDataManager:
         
         return health
     
+    def get_source_health(self) -> Dict[str, Dict]:
+        """Rolling p50/p95 latency, error rate and circuit state per quote source"""
+        return self.source_health.get_stats()
+    
+    def get_cache_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Quote and historical bar cache counters"""
+        return {
+            'quotes': self.quote_cache.get_stats(),
+            'historical': self.historical_cache.get_stats()
+        }
+    
     def get_enhanced_market_data(self, symbol: str) -> Dict[str, Any]:
         """
         Get comprehensive market data combining all sources
@@ -8,9 +8,13 @@ Maintains backward compatibility with existing technical_indicators.py
 import numpy as np
 import pandas as pd
 import logging
+from dataclasses import dataclass
 from typing import List, Dict, Optional, Union, Tuple, Any
 from datetime import datetime, timezone
 
+from utils.bar_store import BarHistory
+from utils.indicator_cache import IndicatorCache, get_indicator_cache
+
 # Professional technical analysis library
 try:
     import talib
@@ -28,45 +32,227 @@ except ImportError:
     print("⚠️ Custom indicators not available")
     CUSTOM_INDICATORS_AVAILABLE = False
 
-# Performance optimization
-try:
-    from numba import jit
-    NUMBA_AVAILABLE = True
-except ImportError:
-    print("⚠️ Numba not available for performance optimization")
-    NUMBA_AVAILABLE = False
-    # Create dummy decorator
-    def jit(*args, **kwargs):
-        def decorator(func):
-            return func
-        return decorator
+# Performance optimization: Numba-compiled kernels when installed, numpy otherwise
+from utils.indicator_kernels import KERNELS, KERNEL_BACKEND, NUMBA_AVAILABLE
+if not NUMBA_AVAILABLE:
+    print("⚠️ Numba not available for performance optimization - using numpy kernels")
+
+
+MOVING_AVERAGE_PERIODS = (5, 10, 20, 50, 200)
+
+
+def _classify_signals(rsi: Optional[float], macd_histogram: Optional[float], bb_position: Optional[float],
+                      moving_averages: Dict[int, float], current_price: float) -> Dict[str, str]:
+    """Per-indicator signal labels (only for indicators that could be computed)"""
+    signals = {}
+    if rsi is not None:
+        signals['rsi'] = 'oversold' if rsi < 30 else 'overbought' if rsi > 70 else 'neutral'
+    if macd_histogram is not None:
+        signals['macd'] = 'bullish' if macd_histogram > 0 else 'bearish'
+    if bb_position is not None:
+        signals['bollinger'] = 'oversold' if bb_position < 10 else 'overbought' if bb_position > 90 else 'neutral'
+    if moving_averages and len(moving_averages) >= 2:
+        short_ma = moving_averages.get(20, moving_averages.get(10, current_price))
+        long_ma = moving_averages.get(50, moving_averages.get(200, current_price))
+        if current_price > short_ma > long_ma:
+            signals['trend'] = 'bullish'
+        elif current_price < short_ma < long_ma:
+            signals['trend'] = 'bearish'
+        else:
+            signals['trend'] = 'neutral'
+    return signals
+
+
+def _overall_strength(signals: Dict[str, str]) -> str:
+    bullish = sum(1 for signal in signals.values() if signal == 'bullish')
+    bearish = sum(1 for signal in signals.values() if signal == 'bearish')
+    if bullish > bearish:
+        return 'bullish'
+    if bearish > bullish:
+        return 'bearish'
+    return 'neutral'
+
+
+def _comprehensive_scores(signals: Dict[str, str], rsi: Optional[float], macd_histogram: Optional[float],
+                          moving_averages: Dict[int, float], current_price: float) -> Tuple[float, float, float]:
+    """(combined_score, trend_strength, momentum_score), each clamped to 0.0-1.0"""
+    # Combined score based on signal strength
+    bullish_count = sum(1 for signal in signals.values() if signal == 'bullish')
+    bearish_count = sum(1 for signal in signals.values() if signal == 'bearish')
+    total_signals = len(signals)
+    if total_signals > 0:
+        combined_score = (bullish_count + 0.5 * (total_signals - bullish_count - bearish_count)) / total_signals
+    else:
+        combined_score = 0.5
+
+    # Trend strength from moving averages
+    trend_strength = 0.5
+    if moving_averages and 20 in moving_averages and 50 in moving_averages:
+        ma20 = moving_averages[20]
+        ma50 = moving_averages[50]
+        if current_price > ma20 > ma50:
+            trend_strength = 0.8  # Strong uptrend
+        elif current_price < ma20 < ma50:
+            trend_strength = 0.2  # Strong downtrend
+
+    # Momentum score from RSI, adjusted for MACD momentum
+    momentum_score = 0.5
+    if rsi is not None:
+        if rsi < 30:
+            momentum_score = 0.8  # Oversold bounce potential
+        elif rsi > 70:
+            momentum_score = 0.2  # Overbought weakness
+        else:
+            momentum_score = 0.5 + (50 - rsi) / 100  # Centered around 50
+    if macd_histogram is not None:
+        if macd_histogram > 0:
+            momentum_score = min(1.0, momentum_score + 0.1)
+        else:
+            momentum_score = max(0.0, momentum_score - 0.1)
+
+    clamp = lambda value: max(0.0, min(1.0, value))
+    return clamp(combined_score), clamp(trend_strength), clamp(momentum_score)
+
+
+def _optional(value: float) -> Optional[float]:
+    return None if np.isnan(value) else float(value)
+
+
+@dataclass(frozen=True)
+class TechnicalSnapshot:
+    """
+    Indicator values, signals and scores for one bar series at its last bar.
+
+    Indicators are None when the series is too short for them.
+    """
+    symbol: str
+    timeframe: str
+    bar_count: int
+    last_bar_time: datetime
+    close: float
+    rsi: Optional[float] = None
+    ema_fast: Optional[float] = None
+    ema_slow: Optional[float] = None
+    macd: Optional[float] = None
+    macd_signal: Optional[float] = None
+    macd_histogram: Optional[float] = None
+    bb_upper: Optional[float] = None
+    bb_middle: Optional[float] = None
+    bb_lower: Optional[float] = None
+    bb_bandwidth: Optional[float] = None
+    bb_position: Optional[float] = None
+    sma_5: Optional[float] = None
+    sma_10: Optional[float] = None
+    sma_20: Optional[float] = None
+    sma_50: Optional[float] = None
+    sma_200: Optional[float] = None
+    atr: Optional[float] = None
+    adx: Optional[float] = None
+    williams_r: Optional[float] = None
+    stoch_k: Optional[float] = None
+    stoch_d: Optional[float] = None
+    strength: str = 'neutral'
+    combined_score: float = 0.5
+    trend_strength: float = 0.5
+    momentum_score: float = 0.5
+
+    @property
+    def moving_averages(self) -> Dict[int, float]:
+        values = {period: getattr(self, f'sma_{period}') for period in MOVING_AVERAGE_PERIODS}
+        return {period: value for period, value in values.items() if value is not None}
+
+    @property
+    def advanced(self) -> Dict[str, float]:
+        values = {name: getattr(self, name) for name in ('atr', 'adx', 'williams_r', 'stoch_k', 'stoch_d')}
+        return {name: value for name, value in values.items() if value is not None}
+
+    @property
+    def signals(self) -> Dict[str, str]:
+        return _classify_signals(self.rsi, self.macd_histogram, self.bb_position, self.moving_averages, self.close)
+
+    def to_comprehensive(self, timeframe: str = None) -> Dict[str, Any]:
+        """The analyze_comprehensive dict (raw_indicators/raw_signals) for existing consumers"""
+        indicators = {}
+        if self.rsi is not None:
+            indicators['rsi'] = self.rsi
+        if self.macd is not None:
+            indicators['macd'] = {'macd': self.macd, 'signal': self.macd_signal, 'histogram': self.macd_histogram}
+        if self.bb_middle is not None:
+            indicators['bollinger_bands'] = {
+                'upper': self.bb_upper, 'middle': self.bb_middle, 'lower': self.bb_lower,
+                'bandwidth': self.bb_bandwidth, 'position': self.bb_position
+            }
+        if self.moving_averages:
+            indicators['moving_averages'] = self.moving_averages
+        if self.advanced:
+            indicators['advanced'] = self.advanced
+        signals = self.signals
+        return {
+            'combined_score': self.combined_score,
+            'trend_strength': self.trend_strength,
+            'momentum_score': self.momentum_score,
+            'signals_count': len(signals),
+            'indicators_count': len(indicators),
+            'analysis_quality': 'good' if len(indicators) >= 3 else 'limited',
+            'timeframe': timeframe or self.timeframe,
+            'raw_signals': signals,
+            'raw_indicators': indicators
+        }
 
 
 class EnhancedTechnicalIndicators:
     """
     Professional technical indicators combining TA-Lib with custom implementations
     Provides institutional-grade technical analysis with fallback support
+
+    Passing symbol and last_bar_time to the calculate_* methods memoizes the
+    result in the shared indicator cache until a newer bar arrives or the
+    last (still forming) bar's close changes.
     """
     
-    def __init__(self, logger: logging.Logger = None):
+    def __init__(self, logger: logging.Logger = None, indicator_cache: IndicatorCache = None):
         self.logger = logger or logging.getLogger(__name__)
         self.talib_available = TALIB_AVAILABLE
         self.custom_indicators = None
+        self.indicator_cache = indicator_cache if indicator_cache is not None else get_indicator_cache()
         
         # Initialize custom indicators as fallback
         if CUSTOM_INDICATORS_AVAILABLE:
             self.custom_indicators = CustomIndicators()
             self.logger.info("✅ Custom indicators available (FALLBACK)")
         
+        self.kernels = KERNELS
+        self.logger.info(f"⚡ Custom indicator kernels: {KERNEL_BACKEND}")
+        
         if self.talib_available:
             self.logger.info("✅ TA-Lib available (PROFESSIONAL)")
         else:
             self.logger.warning("⚠️ TA-Lib not available - using custom implementations")
     
-    def calculate_rsi(self, prices: Union[List[float], np.ndarray], period: int = 14) -> Optional[float]:
+    def _memoize(self, symbol: Optional[str], timeframe: str, last_bar_time: Any, prices,
+                 indicator: str, params: Tuple, compute):
+        """
+        Serve from the indicator cache when the series is identified, else compute.
+
+        The cache version is the last bar's time and close: the newest bar of a
+        daily series is today's forming bar, whose close moves all session.
+        """
+        if symbol is None or last_bar_time is None or len(prices) == 0:
+            return compute()
+        return self.indicator_cache.get_or_compute(symbol, timeframe, indicator, params,
+                                                   (last_bar_time, float(prices[-1])), compute)
+    
+    def calculate_rsi(self, prices: Union[List[float], np.ndarray], period: int = 14,
+                      symbol: str = None, timeframe: str = '1d', last_bar_time: Any = None) -> Optional[float]:
         """
         Calculate RSI using TA-Lib (preferred) or custom implementation
         """
+        if symbol is not None and last_bar_time is not None:
+            # TA-Lib's Wilder smoothing depends on the whole series, the custom RSI only on the window
+            params = (period, len(prices)) if self.talib_available else (period,)
+            return self._memoize(symbol, timeframe, last_bar_time, prices, 'rsi', params,
+                                 lambda: self.calculate_rsi(prices, period))
+        
         if len(prices) < period + 1:
             return None
         
@@ -84,11 +270,18 @@ class EnhancedTechnicalIndicators:
         return self._custom_rsi(prices_array, period)
     
     def calculate_macd(self, prices: Union[List[float], np.ndarray], 
-                      fastperiod: int = 12, slowperiod: int = 26, signalperiod: int = 9) -> Optional[Dict[str, float]]:
+                      fastperiod: int = 12, slowperiod: int = 26, signalperiod: int = 9,
+                      symbol: str = None, timeframe: str = '1d', last_bar_time: Any = None) -> Optional[Dict[str, float]]:
         """
         Calculate MACD using TA-Lib (preferred) or custom implementation
         Returns dict with macd, signal, and histogram values
         """
+        if symbol is not None and last_bar_time is not None:
+            # EMAs are seeded from the first bar, so the series length is part of the key
+            return self._memoize(symbol, timeframe, last_bar_time, prices, 'macd',
+                                 (fastperiod, slowperiod, signalperiod, len(prices)),
+                                 lambda: self.calculate_macd(prices, fastperiod, slowperiod, signalperiod))
+        
         if len(prices) < slowperiod + signalperiod:
             return None
         
@@ -114,10 +307,15 @@ class EnhancedTechnicalIndicators:
         return self._custom_macd(prices_array, fastperiod, slowperiod, signalperiod)
     
     def calculate_bollinger_bands(self, prices: Union[List[float], np.ndarray], 
-                                 period: int = 20, std_dev: float = 2.0) -> Optional[Dict[str, float]]:
+                                 period: int = 20, std_dev: float = 2.0,
+                                 symbol: str = None, timeframe: str = '1d', last_bar_time: Any = None) -> Optional[Dict[str, float]]:
         """
         Calculate Bollinger Bands using TA-Lib (preferred) or custom implementation
         """
+        if symbol is not None and last_bar_time is not None:
+            return self._memoize(symbol, timeframe, last_bar_time, prices, 'bollinger', (period, std_dev),
+                                 lambda: self.calculate_bollinger_bands(prices, period, std_dev))
+        
         if len(prices) < period:
             return None
         
@@ -143,10 +341,17 @@ class EnhancedTechnicalIndicators:
         return self._custom_bollinger_bands(prices_array, period, std_dev)
     
     def calculate_moving_averages(self, prices: Union[List[float], np.ndarray], 
-                                 periods: List[int] = [5, 10, 20, 50, 200]) -> Dict[int, float]:
+                                 periods: List[int] = [5, 10, 20, 50, 200],
+                                 symbol: str = None, timeframe: str = '1d', last_bar_time: Any = None) -> Dict[int, float]:
         """
         Calculate multiple moving averages using TA-Lib
         """
+        if symbol is not None and last_bar_time is not None:
+            # Which periods fit depends on how many bars were passed
+            return self._memoize(symbol, timeframe, last_bar_time, prices, 'moving_averages',
+                                 tuple(p for p in periods if p <= len(prices)),
+                                 lambda: self.calculate_moving_averages(prices, periods))
+        
         prices_array = np.array(prices, dtype=float)
         moving_averages = {}
         
@@ -175,13 +380,14 @@ class EnhancedTechnicalIndicators:
         Calculate advanced technical indicators using TA-Lib
         Requires OHLCV data for professional analysis
         """
-        if not self.talib_available:
-            return {}
-        
         high_array = np.array(high, dtype=float)
         low_array = np.array(low, dtype=float)
         close_array = np.array(close, dtype=float)
         
+        if not self.talib_available:
+            # FALLBACK: ATR, ADX, Williams %R and Stochastic from the custom kernels
+            return self._custom_advanced_indicators(high_array, low_array, close_array)
+        
         indicators = {}
         
         try:
@@ -231,27 +437,29 @@ class EnhancedTechnicalIndicators:
         
         return indicators
     
+    def _custom_advanced_indicators(self, high: np.ndarray, low: np.ndarray, close: np.ndarray) -> Dict[str, float]:
+        """
+        Custom ATR, ADX, Williams %R and Stochastic (Wilder smoothing, TA-Lib default periods)
+        """
+        indicators = {}
+        try:
+            values = {
+                'atr': self.kernels.atr(high, low, close, 14),
+                'adx': self.kernels.adx(high, low, close, 14),
+                'williams_r': self.kernels.williams_r(high, low, close, 14)
+            }
+            values['stoch_k'], values['stoch_d'] = self.kernels.stochastic(high, low, close, 5, 3, 3)
+            indicators = {name: float(value) for name, value in values.items() if not np.isnan(value)}
+        except Exception as e:
+            self.logger.warning(f"⚠️ Custom advanced indicators failed: {e}")
+        return indicators
+    
     def _custom_rsi(self, prices: np.ndarray, period: int = 14) -> Optional[float]:
         """
         High-performance custom RSI implementation with Numba optimization
         """
-        if len(prices) < period + 1:
-            return None
-        
-        deltas = np.diff(prices)
-        gains = np.where(deltas > 0, deltas, 0)
-        losses = np.where(deltas < 0, -deltas, 0)
-        
-        avg_gain = np.mean(gains[-period:])
-        avg_loss = np.mean(losses[-period:])
-        
-        if avg_loss == 0:
-            return 100.0
-        
-        rs = avg_gain / avg_loss
-        rsi = 100 - (100 / (1 + rs))
-        
-        return float(rsi)
+        rsi = self.kernels.rsi(prices, period)
+        return None if np.isnan(rsi) else float(rsi)
     
     def _custom_macd(self, prices: np.ndarray, fastperiod: int, slowperiod: int, signalperiod: int) -> Optional[Dict[str, float]]:
         """
@@ -293,9 +501,7 @@ class EnhancedTechnicalIndicators:
         if len(prices) < period:
             return None
         
-        recent_prices = prices[-period:]
-        middle = np.mean(recent_prices)
-        std = np.std(recent_prices)
+        middle, std = self.kernels.bollinger(prices, period)
         
         upper = middle + (std_dev * std)
         lower = middle - (std_dev * std)
@@ -316,22 +522,16 @@ class EnhancedTechnicalIndicators:
         """
         Calculate Exponential Moving Average
         """
-        if len(prices) < period:
-            return None
-        
-        multiplier = 2.0 / (period + 1)
-        ema = prices[0]
-        
-        for price in prices[1:]:
-            ema = (price * multiplier) + (ema * (1 - multiplier))
-        
-        return float(ema)
+        ema = self.kernels.ema(np.asarray(prices, dtype=float), period)
+        return None if np.isnan(ema) else float(ema)
     
     def get_comprehensive_analysis(self, high: List[float], low: List[float], 
-                                 close: List[float], volume: List[float] = None) -> Dict[str, Any]:
+                                 close: List[float], volume: List[float] = None,
+                                 symbol: str = None, timeframe: str = '1d', last_bar_time: Any = None) -> Dict[str, Any]:
         """
         Get comprehensive technical analysis combining all indicators
         """
+        series = {'symbol': symbol, 'timeframe': timeframe, 'last_bar_time': last_bar_time}
         analysis = {
             'timestamp': datetime.now(timezone.utc),
             'indicators': {},
@@ -339,43 +539,21 @@ class EnhancedTechnicalIndicators:
             'strength': 'neutral'
         }
         
-        # Basic indicators
-        rsi = self.calculate_rsi(close)
+        rsi = self.calculate_rsi(close, **series)
+        macd = self.calculate_macd(close, **series)
+        bb = self.calculate_bollinger_bands(close, **series)
+        mas = self.calculate_moving_averages(close, **series)
+        
         if rsi is not None:
             analysis['indicators']['rsi'] = rsi
-            analysis['signals']['rsi'] = 'oversold' if rsi < 30 else 'overbought' if rsi > 70 else 'neutral'
-        
-        # MACD
-        macd = self.calculate_macd(close)
         if macd:
             analysis['indicators']['macd'] = macd
-            analysis['signals']['macd'] = 'bullish' if macd['histogram'] > 0 else 'bearish'
-        
-        # Bollinger Bands
-        bb = self.calculate_bollinger_bands(close)
         if bb:
             analysis['indicators']['bollinger_bands'] = bb
-            if bb['position'] < 10:
-                analysis['signals']['bollinger'] = 'oversold'
-            elif bb['position'] > 90:
-                analysis['signals']['bollinger'] = 'overbought'
-            else:
-                analysis['signals']['bollinger'] = 'neutral'
-        
-        # Moving Averages
-        mas = self.calculate_moving_averages(close)
         if mas:
             analysis['indicators']['moving_averages'] = mas
-            current_price = close[-1]
-            if len(mas) >= 2:
-                short_ma = mas.get(20, mas.get(10, current_price))
-                long_ma = mas.get(50, mas.get(200, current_price))
-                if current_price > short_ma > long_ma:
-                    analysis['signals']['trend'] = 'bullish'
-                elif current_price < short_ma < long_ma:
-                    analysis['signals']['trend'] = 'bearish'
-                else:
-                    analysis['signals']['trend'] = 'neutral'
+        analysis['signals'] = _classify_signals(rsi, macd['histogram'] if macd else None,
+                                                bb['position'] if bb else None, mas, close[-1])
         
         # Advanced indicators (if TA-Lib available)
         advanced = self.calculate_advanced_indicators(high, low, close, volume)
@@ -383,24 +561,31 @@ class EnhancedTechnicalIndicators:
             analysis['indicators']['advanced'] = advanced
         
         # Overall strength assessment
-        bullish_signals = sum(1 for signal in analysis['signals'].values() if signal == 'bullish')
-        bearish_signals = sum(1 for signal in analysis['signals'].values() if signal == 'bearish')
-        
-        if bullish_signals > bearish_signals:
-            analysis['strength'] = 'bullish'
-        elif bearish_signals > bullish_signals:
-            analysis['strength'] = 'bearish'
-        else:
-            analysis['strength'] = 'neutral'
+        analysis['strength'] = _overall_strength(analysis['signals'])
         
         return analysis
     
     def analyze_comprehensive(self, symbol: str, price_data: List[float], 
-                            volume_data: List[float] = None, timeframe: str = 'intraday') -> Dict[str, Any]:
+                            volume_data: List[float] = None, timeframe: str = 'intraday',
+                            last_bar_time: Any = None, bar_timeframe: str = None) -> Dict[str, Any]:
         """
         Comprehensive analysis method expected by stocks module
         Compatible interface for modular integration
+
+        With last_bar_time (and bar_timeframe, the interval of price_data) the
+        result and its indicators are memoized until a newer bar arrives or the
+        last close changes.
         """
+        if last_bar_time is not None and price_data:
+            bar_timeframe = bar_timeframe or timeframe
+            return self._memoize(symbol, bar_timeframe, last_bar_time, price_data, 'comprehensive',
+                                 (timeframe, len(price_data), bool(volume_data)),
+                                 lambda: self._analyze_comprehensive(symbol, price_data, volume_data, timeframe,
+                                                                     last_bar_time, bar_timeframe))
+        return self._analyze_comprehensive(symbol, price_data, volume_data, timeframe)
+    
+    def _analyze_comprehensive(self, symbol: str, price_data: List[float], volume_data: List[float],
+                               timeframe: str, last_bar_time: Any = None, bar_timeframe: str = None) -> Dict[str, Any]:
         try:
             if not price_data or len(price_data) < 20:
                 # Return neutral analysis for insufficient data
@@ -425,61 +610,26 @@ class EnhancedTechnicalIndicators:
                 high=high_prices.tolist(),
                 low=low_prices.tolist(), 
                 close=close_prices.tolist(),
-                volume=volume_data
+                volume=volume_data,
+                symbol=symbol,
+                timeframe=bar_timeframe or timeframe,
+                last_bar_time=last_bar_time
             )
             
             # Convert to expected format for stocks module
             signals = analysis.get('signals', {})
             indicators = analysis.get('indicators', {})
             
-            # Calculate combined score based on signal strength
-            bullish_count = sum(1 for signal in signals.values() if signal == 'bullish')
-            bearish_count = sum(1 for signal in signals.values() if signal == 'bearish')
-            total_signals = len(signals)
-            
-            if total_signals > 0:
-                combined_score = (bullish_count + 0.5 * (total_signals - bullish_count - bearish_count)) / total_signals
-            else:
-                combined_score = 0.5
-            
-            # Calculate trend strength from moving averages
-            trend_strength = 0.5
-            if 'moving_averages' in indicators:
-                mas = indicators['moving_averages']
-                current_price = close_prices[-1]
-                if 20 in mas and 50 in mas:
-                    ma20 = mas[20]
-                    ma50 = mas[50]
-                    if current_price > ma20 > ma50:
-                        trend_strength = 0.8  # Strong uptrend
-                    elif current_price < ma20 < ma50:
-                        trend_strength = 0.2  # Strong downtrend
-                    else:
-                        trend_strength = 0.5  # Neutral/mixed
-            
-            # Calculate momentum score from RSI and MACD
-            momentum_score = 0.5
-            if 'rsi' in indicators:
-                rsi = indicators['rsi']
-                if rsi < 30:
-                    momentum_score = 0.8  # Oversold bounce potential
-                elif rsi > 70:
-                    momentum_score = 0.2  # Overbought weakness
-                else:
-                    momentum_score = 0.5 + (50 - rsi) / 100  # Centered around 50
-            
-            # Adjust for MACD momentum
-            if 'macd' in indicators:
-                macd_data = indicators['macd']
-                if macd_data['histogram'] > 0:
-                    momentum_score = min(1.0, momentum_score + 0.1)
-                else:
-                    momentum_score = max(0.0, momentum_score - 0.1)
+            macd = indicators.get('macd')
+            combined_score, trend_strength, momentum_score = _comprehensive_scores(
+                signals, indicators.get('rsi'), macd['histogram'] if macd else None,
+                indicators.get('moving_averages', {}), close_prices[-1]
+            )
             
             return {
-                'combined_score': max(0.0, min(1.0, combined_score)),
-                'trend_strength': max(0.0, min(1.0, trend_strength)),
-                'momentum_score': max(0.0, min(1.0, momentum_score)),
+                'combined_score': combined_score,
+                'trend_strength': trend_strength,
+                'momentum_score': momentum_score,
                 'signals_count': len(signals),
                 'indicators_count': len(indicators),
                 'analysis_quality': 'good' if len(indicators) >= 3 else 'limited',
@@ -501,6 +651,64 @@ class EnhancedTechnicalIndicators:
                 'error': str(e)
             }
 
+    def analyze_bars(self, bars: BarHistory) -> Optional[TechnicalSnapshot]:
+        """
+        Full indicator set from a bar-store record (utils.bar_store.BarHistory).
+
+        Reads the float64 OHLCV arrays in place (no list or array copies) and
+        uses the real highs and lows. Intermediates are shared: one recursive
+        pass yields the fast/slow EMAs, MACD and its signal line, and one
+        cumulative sum over the newest closes yields every SMA and the
+        Bollinger middle band. Memoized per series until a newer bar arrives.
+
+        Returns None for an empty record.
+        """
+        if len(bars) == 0:
+            return None
+        return self._memoize(bars.symbol, bars.timeframe, int(bars.timestamps[-1]), bars.close, 'snapshot', (len(bars),),
+                             lambda: self._snapshot(bars))
+    
+    def _snapshot(self, bars: BarHistory) -> TechnicalSnapshot:
+        close, high, low = bars.close, bars.high, bars.low
+        n = len(close)
+        current_price = float(close[-1])
+        values = {}
+        
+        values['rsi'] = _optional(self.kernels.rsi(close, 14))
+        ema_fast, ema_slow, macd, signal = self.kernels.macd(close, 12, 26, 9)
+        if not np.isnan(macd):
+            values.update(ema_fast=float(ema_fast), ema_slow=float(ema_slow), macd=float(macd),
+                          macd_signal=float(signal), macd_histogram=float(macd - signal))
+        
+        # window_sums[k - 1] is the sum of the newest k closes
+        window_sums = np.cumsum(close[:-max(MOVING_AVERAGE_PERIODS) - 1:-1])
+        for period in MOVING_AVERAGE_PERIODS:
+            if n >= period:
+                values[f'sma_{period}'] = float(window_sums[period - 1] / period)
+        
+        if n >= 20:
+            middle = values['sma_20']
+            std = float(np.sqrt(np.mean((close[-20:] - middle) ** 2)))
+            upper, lower = middle + 2.0 * std, middle - 2.0 * std
+            values.update(bb_upper=upper, bb_middle=middle, bb_lower=lower,
+                          bb_bandwidth=(upper - lower) / middle * 100 if middle else 0.0,
+                          bb_position=(current_price - lower) / (upper - lower) * 100 if upper > lower else 50.0)
+        
+        values.update(self._custom_advanced_indicators(high, low, close))
+        
+        moving_averages = {period: values[f'sma_{period}'] for period in MOVING_AVERAGE_PERIODS
+                           if f'sma_{period}' in values}
+        signals = _classify_signals(values['rsi'], values.get('macd_histogram'), values.get('bb_position'),
+                                    moving_averages, current_price)
+        combined_score, trend_strength, momentum_score = _comprehensive_scores(
+            signals, values['rsi'], values.get('macd_histogram'), moving_averages, current_price
+        )
+        return TechnicalSnapshot(
+            symbol=bars.symbol, timeframe=bars.timeframe, bar_count=n, last_bar_time=bars.last_timestamp,
+            close=current_price, strength=_overall_strength(signals), combined_score=combined_score,
+            trend_strength=trend_strength, momentum_score=momentum_score, **values
+        )
+
 
 # Singleton instance for modular system integration
 enhanced_technical_indicators = None
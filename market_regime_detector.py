@@ -2,16 +2,25 @@
 
 from typing import Dict, List, Optional, Tuple
 from datetime import datetime, timedelta
+from utils.regime_features import RegimeFeatureEngine
 from utils.technical_indicators import TechnicalIndicators
 
 class MarketRegimeDetector:
     """
     Enhanced market regime detection for Phase 3 Intelligence Layer.
     Detects Bull/Bear/Sideways trends and volatility regimes.
+
+    With a RegimeFeatureEngine (e.g. MLRegimeDetector.feature_engine), sector
+    rotation is scored from its running EW return statistics.
     """
     
-    def __init__(self):
+    # EW mean return / volatility thresholds for the engine-based sector trend
+    SECTOR_TREND_THRESHOLD = 0.05
+    SECTOR_STRONG_TREND_THRESHOLD = 0.25
+    
+    def __init__(self, feature_engine: Optional[RegimeFeatureEngine] = None):
         self.tech_indicators = TechnicalIndicators()
+        self.feature_engine = feature_engine
         self.vix_history = []  # VIX data for volatility regime
         self.market_indices = ['SPY', 'QQQ', 'IWM']  # Core market indicators
         self.sector_etfs = ['XLF', 'XLK', 'XLE', 'XLV', 'XLI']  # Sector rotation tracking
@@ -144,6 +153,11 @@ class MarketRegimeDetector:
         
         # Analyze each sector ETF
         for sector in self.sector_etfs:
+            engine_score = self._engine_sector_score(sector)
+            if engine_score is not None:
+                sector_performance[sector] = engine_score
+                continue
+            
             ma_data = self.tech_indicators.calculate_moving_averages(sector)
             if ma_data and 'trend' in ma_data:
                 # Score sector strength
@@ -177,13 +191,34 @@ class MarketRegimeDetector:
         else:
             phase = "neutral"  # Mixed sector performance
         
-        return {
+        result = {
             'rotation_phase': phase,
             'leading_sectors': leading_sectors,
             'lagging_sectors': lagging_sectors,
             'sector_scores': sector_performance,
             'overall_strength': round(avg_score, 2)
         }
+        if self.feature_engine is not None:
+            result['sector_correlation'] = round(self.feature_engine.average_correlation(self.sector_etfs), 2)
+        return result
+    
+    def _engine_sector_score(self, sector: str) -> Optional[int]:
+        """Sector score (-2..2) from the feature engine's EW mean return relative to volatility"""
+        if self.feature_engine is None:
+            return None
+        stats = self.feature_engine.symbol_stats(sector)
+        if not stats or stats['returns'] < RegimeFeatureEngine.MIN_RETURNS:
+            return None
+        trend = stats['mean_return'] / stats['volatility'] if stats['volatility'] > 0 else 0.0
+        if trend > self.SECTOR_STRONG_TREND_THRESHOLD:
+            return 2
+        if trend > self.SECTOR_TREND_THRESHOLD:
+            return 1
+        if trend < -self.SECTOR_STRONG_TREND_THRESHOLD:
+            return -2
+        if trend < -self.SECTOR_TREND_THRESHOLD:
+            return -1
+        return 0
     
     def get_comprehensive_regime_analysis(self) -> Dict:
         """
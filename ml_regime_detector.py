@@ -13,14 +13,23 @@ from sklearn.mixture import GaussianMixture
 import warnings
 warnings.filterwarnings('ignore')
 
+from utils.regime_features import RegimeFeatureEngine
+from utils.ring_buffer import PriceRingBuffer
+
 class MLRegimeDetector:
     """
     Machine learning enhanced market regime detection
     Uses multiple algorithms for robust regime identification
+
+    Regime features come from an incremental RegimeFeatureEngine (one update
+    per quote batch); pass the same engine to MarketRegimeDetector to share it.
     """
     
-    def __init__(self, lookback_period: int = 60):
+    def __init__(self, lookback_period: int = 60, history_capacity: int = 2000,
+                 feature_engine: Optional[RegimeFeatureEngine] = None):
         self.lookback_period = lookback_period  # Days of historical data
+        self.history_capacity = history_capacity  # Max points kept per symbol within the lookback
+        self.feature_engine = feature_engine if feature_engine is not None else RegimeFeatureEngine()
         
         # ML models for regime detection
         self.kmeans_model = KMeans(n_clusters=3, random_state=42, n_init=10)
@@ -41,110 +50,66 @@ class MLRegimeDetector:
         
         # Historical regime data
         self.regime_history = []
-        self.price_history = {}
+        self.price_history: Dict[str, PriceRingBuffer] = {}
+        
+        # Per-symbol updates buffered until their bar is complete (see update_price_history)
+        self._pending_bar: Dict[str, Tuple[float, float]] = {}
+        self._pending_bar_time = None
         
         print("🔍 ML Regime Detector initialized")
         print(f"   📊 Lookback period: {self.lookback_period} days")
         print(f"   🧠 Models: K-Means + Gaussian Mixture")
         print(f"   🎯 Confidence threshold: {self.confidence_threshold}")
     
-    def update_price_history(self, symbol: str, price: float, volume: float = 0):
-        """Update price history for regime analysis"""
-        if symbol not in self.price_history:
-            self.price_history[symbol] = []
+    def update_price_history(self, symbol: str, price: float, volume: float = 0, timestamp=None):
+        """
+        Update price history for regime analysis
         
-        # Add new price point
-        self.price_history[symbol].append({
-            'timestamp': datetime.now(),
-            'price': price,
-            'volume': volume
-        })
+        Updates are buffered and reach the feature engine as one multi-symbol
+        bar: the bar is complete when the timestamp changes or, without
+        timestamps, when a symbol already in the bar is updated again.
+        """
+        self._append_history(symbol, price, volume)
+        if self._pending_bar and (timestamp != self._pending_bar_time if timestamp is not None
+                                  else symbol in self._pending_bar):
+            self.flush_price_history()
+        self._pending_bar[symbol] = (price, volume)
+        self._pending_bar_time = timestamp
+    
+    def flush_price_history(self):
+        """Feed buffered per-symbol updates to the feature engine as one bar"""
+        if not self._pending_bar:
+            return
+        pending, self._pending_bar = self._pending_bar, {}
+        self._pending_bar_time = None
+        self.feature_engine.update({s: price for s, (price, _) in pending.items()},
+                                   {s: volume for s, (_, volume) in pending.items()})
+    
+    def _append_history(self, symbol: str, price: float, volume: float = 0):
+        if symbol not in self.price_history:
+            self.price_history[symbol] = PriceRingBuffer(self.history_capacity)
         
-        # Keep only recent data
+        # Add new price point (points older than the lookback are skipped on read)
+        self.price_history[symbol].append(price, volume, timestamp=datetime.now())
+    
+    def _recent(self, symbol: str, field: str = 'price') -> np.ndarray:
+        """View of a symbol's history within the lookback period"""
+        history = self.price_history.get(symbol)
+        if history is None:
+            return np.empty(0)
         cutoff_date = datetime.now() - timedelta(days=self.lookback_period)
-        self.price_history[symbol] = [
-            point for point in self.price_history[symbol]
-            if point['timestamp'] > cutoff_date
-        ]
+        return history.since(field, cutoff_date)
     
     def extract_regime_features(self, symbols: List[str]) -> Dict:
-        """Extract features for regime classification"""
-        features = {}
-        
-        if not self.price_history:
-            return self._default_features()
-        
-        # Calculate returns for all symbols
-        returns_data = {}
-        for symbol in symbols:
-            if symbol in self.price_history and len(self.price_history[symbol]) > 5:
-                prices = [point['price'] for point in self.price_history[symbol]]
-                returns = np.diff(np.log(prices))
-                returns_data[symbol] = returns
-        
-        if not returns_data:
-            return self._default_features()
-        
-        # Feature 1: Returns momentum
-        all_returns = np.concatenate(list(returns_data.values()))
-        if len(all_returns) > 0:
-            mean_return = np.mean(all_returns)
-            features['returns_momentum'] = np.tanh(mean_return * 100)  # Scale and bound
-        else:
-            features['returns_momentum'] = 0.0
-        
-        # Feature 2: Volatility level
-        volatility = np.std(all_returns) if len(all_returns) > 1 else 0.05
-        features['volatility_level'] = min(volatility * 10, 1.0)  # Normalize
-        
-        # Feature 3: Correlation structure
-        if len(returns_data) > 1:
-            returns_matrix = []
-            min_length = min(len(r) for r in returns_data.values())
-            
-            for symbol_returns in returns_data.values():
-                returns_matrix.append(symbol_returns[-min_length:] if min_length > 0 else [0])
-            
-            if min_length > 3:
-                correlation_matrix = np.corrcoef(returns_matrix)
-                # Average off-diagonal correlation as market coupling measure
-                mask = ~np.eye(correlation_matrix.shape[0], dtype=bool)
-                avg_correlation = np.mean(correlation_matrix[mask])
-                features['correlation_structure'] = np.clip(avg_correlation, -1, 1)
-            else:
-                features['correlation_structure'] = 0.0
-        else:
-            features['correlation_structure'] = 0.0
-        
-        # Feature 4: Volume pattern
-        volume_data = []
-        for symbol in symbols:
-            if symbol in self.price_history:
-                volumes = [point['volume'] for point in self.price_history[symbol] if point['volume'] > 0]
-                if volumes:
-                    volume_data.extend(volumes)
-        
-        if volume_data:
-            recent_volume = np.mean(volume_data[-5:]) if len(volume_data) >= 5 else np.mean(volume_data)
-            historical_volume = np.mean(volume_data[:-5]) if len(volume_data) > 5 else recent_volume
-            volume_ratio = recent_volume / max(historical_volume, 1)
-            features['volume_pattern'] = np.tanh((volume_ratio - 1) * 2)  # Bound to [-1, 1]
-        else:
-            features['volume_pattern'] = 0.0
-        
-        # Feature 5: Market breadth (% of symbols with positive returns)
-        recent_returns = []
-        for symbol_returns in returns_data.values():
-            if len(symbol_returns) > 0:
-                recent_returns.append(symbol_returns[-1])
-        
-        if recent_returns:
-            positive_pct = sum(1 for r in recent_returns if r > 0) / len(recent_returns)
-            features['breadth_indicators'] = (positive_pct - 0.5) * 2  # Scale to [-1, 1]
-        else:
-            features['breadth_indicators'] = 0.0
+        """
+        Extract features for regime classification
         
-        return features
+        Momentum, volatility, average correlation, breadth and volume pattern
+        are read from the engine's running EW state; nothing is rescanned.
+        """
+        self.flush_price_history()
+        features = self.feature_engine.features(symbols)
+        return features if features is not None else self._default_features()
     
     def _default_features(self) -> Dict:
         """Default features when no data available"""
@@ -284,12 +249,15 @@ class MLRegimeDetector:
         Integrates with Phase 4 market regime detector
         """
         
-        # Update price history with new quotes
+        # Update price history with new quotes; the batch is one bar for the feature engine
+        self.flush_price_history()
+        prices, volumes = {}, {}
         for quote in market_quotes:
             symbol = quote['symbol']
-            price = quote.get('ask', quote.get('price', 0))
-            volume = quote.get('volume', 0)
-            self.update_price_history(symbol, price, volume)
+            prices[symbol] = quote.get('ask', quote.get('price', 0))
+            volumes[symbol] = quote.get('volume', 0)
+            self._append_history(symbol, prices[symbol], volumes[symbol])
+        self.feature_engine.update(prices, volumes)
         
         # Extract features for regime analysis
         symbols = [quote['symbol'] for quote in market_quotes]
@@ -337,8 +305,9 @@ class MLRegimeDetector:
         momentum_scores = []
         for quote in quotes:
             symbol = quote['symbol']
-            if symbol in self.price_history and len(self.price_history[symbol]) > 2:
-                prices = [p['price'] for p in self.price_history[symbol][-3:]]
+            recent_prices = self._recent(symbol)
+            if len(recent_prices) > 2:
+                prices = recent_prices[-3:]
                 if len(prices) >= 2:
                     momentum = (prices[-1] - prices[0]) / prices[0]
                     momentum_scores.append(momentum)
@@ -7,6 +7,7 @@ common interface for analysis, execution, and monitoring.
 """
 
 from abc import ABC, abstractmethod
+import functools
 from typing import List, Dict, Any, Optional, Union
 from dataclasses import dataclass, field
 from datetime import datetime
@@ -15,6 +16,13 @@ from enum import Enum
 
 # Import ML data collection helpers
 from modular.ml_data_helpers import MLDataCollector, ParameterEffectivenessTracker, MLLearningEventLogger
+from modular.scheduler import ModuleCadence
+from utils.cancellation import CancellationToken, current_token, to_thread
+from utils.symbol_fanout import DEFAULT_SYMBOL_CONCURRENCY, SymbolFanOut
+from utils.symbol_locks import get_symbol_locks
+
+# How long an exit waits for the scan to finish ordering the same symbol
+EXIT_LOCK_TIMEOUT_SECONDS = 2.0
 
 
 class TradeAction(Enum):
@@ -272,6 +280,27 @@ def _execute_partial_profit_taking(self, symbol, quantity, reason):
         return None
 
 
+def guarded_exit(exit_method):
+    """
+    Decorator for a module's exit method(position, ...): holds the position's
+    symbol lock while the exit is placed so the position monitor and the
+    opportunity scan never order the same symbol at once. An exit that cannot
+    get the lock in time is deferred to the next monitor pass (returns None).
+    """
+    @functools.wraps(exit_method)
+    def wrapper(self, position, *args, **kwargs):
+        symbol = position.get('symbol') if isinstance(position, dict) else None
+        if not symbol:
+            return exit_method(self, position, *args, **kwargs)
+        locks = get_symbol_locks()
+        with locks.hold(symbol, f"{self.module_name}:exit", EXIT_LOCK_TIMEOUT_SECONDS) as acquired:
+            if not acquired:
+                self.logger.info(f"⏳ {symbol} exit deferred: symbol busy ({locks.owner(symbol) or 'released'})")
+                return None
+            return exit_method(self, position, *args, **kwargs)
+    return wrapper
+
+
 class TradingModule(ABC):
     """
     Abstract base class for all trading modules.
@@ -307,6 +336,9 @@ class TradingModule(ABC):
         self._pending_opportunities: List[TradeOpportunity] = []
         self._performance_metrics: Dict[str, Any] = {}
         
+        # Per-cycle MarketDataSnapshot injected by the orchestrator (read-only)
+        self.market_data = None
+        
         # ML data collection tools
         self.ml_data_collector = MLDataCollector(self.module_name)
         self.parameter_tracker = ParameterEffectivenessTracker(firebase_db, self.module_name)
@@ -359,6 +391,22 @@ class TradingModule(ABC):
         """
         pass
     
+    # Async hooks for the orchestrator's asyncio execution mode. The defaults run the
+    # sync methods on the event loop's executor; I/O-bound modules override them natively
+    # and run their blocking calls through utils.cancellation.to_thread.
+    
+    async def analyze_opportunities_async(self) -> List[TradeOpportunity]:
+        """Async variant of analyze_opportunities()"""
+        return await to_thread(self.analyze_opportunities)
+    
+    async def execute_trades_async(self, opportunities: List[TradeOpportunity]) -> List[TradeResult]:
+        """Async variant of execute_trades()"""
+        return await to_thread(self.execute_trades, opportunities)
+    
+    async def monitor_positions_async(self) -> List[TradeResult]:
+        """Async variant of monitor_positions()"""
+        return await to_thread(self.monitor_positions)
+    
     # Common functionality implementations
     
     def validate_opportunity(self, opportunity: TradeOpportunity) -> bool:
@@ -409,6 +457,64 @@ class TradingModule(ABC):
             self.logger.error(f"Error validating opportunity {opportunity.symbol}: {e}")
             return False
     
+    @property
+    def cadence(self) -> Optional[ModuleCadence]:
+        """Scan/monitor/persist cadence for the orchestrator's scheduler (None: orchestrator default)"""
+        return None
+    
+    @property
+    def snapshot_symbols(self) -> List[str]:
+        """Symbols this module wants in the orchestrator's per-cycle market data snapshot"""
+        try:
+            return list(self.supported_symbols)
+        except Exception:
+            return []
+    
+    def set_market_data(self, snapshot):
+        """Attach the current cycle's MarketDataSnapshot (None clears it)"""
+        self.market_data = snapshot
+    
+    def get_snapshot_price(self, symbol: str) -> Optional[float]:
+        """Price from the current cycle's snapshot, None if unavailable"""
+        snapshot = self.market_data  # Read once: the position monitor thread races the cycle's publish/clear
+        if snapshot is None:
+            return None
+        try:
+            return snapshot.get_price(symbol)
+        except Exception as e:
+            self.logger.debug(f"Snapshot price lookup failed for {symbol}: {e}")
+            return None
+    
+    def get_snapshot_market_open(self) -> Optional[bool]:
+        """US market status from the current cycle's snapshot, None if unavailable"""
+        snapshot = self.market_data
+        if snapshot is None:
+            return None
+        return snapshot.is_market_open
+    
+    def get_cycle_regime(self):
+        """The orchestrator's market regime for the current cycle (CycleRegime), None if unavailable"""
+        snapshot = self.market_data
+        if snapshot is None:
+            return None
+        return getattr(snapshot, 'regime', None)
+    
+    @property
+    def cancel_token(self) -> CancellationToken:
+        """Cancellation token of the current run: check it between symbols and stages"""
+        return current_token()
+    
+    @property
+    def symbol_fanout(self) -> SymbolFanOut:
+        """Persistent worker pool for per-symbol analysis (custom_params['symbol_concurrency'] workers)"""
+        fanout = getattr(self, '_symbol_fanout', None)
+        if fanout is None:
+            params = getattr(self.config, 'custom_params', None)
+            concurrency = params.get('symbol_concurrency', DEFAULT_SYMBOL_CONCURRENCY) if isinstance(params, dict) else DEFAULT_SYMBOL_CONCURRENCY
+            fanout = SymbolFanOut(self.module_name, concurrency, logger=self.logger)
+            self._symbol_fanout = fanout
+        return fanout
+    
     def save_opportunity(self, opportunity: TradeOpportunity):
         """Save opportunity to Firebase for ML analysis"""
         try:
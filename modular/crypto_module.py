@@ -12,13 +12,19 @@ from dataclasses import dataclass
 from enum import Enum
 import time
 import dataclasses
+from types import SimpleNamespace
 
 from modular.base_module import (
     TradingModule, ModuleConfig, TradeOpportunity, TradeResult,
-    TradeAction, TradeStatus, ExitReason
+    TradeAction, TradeStatus, ExitReason, guarded_exit
 )
+from modular.scheduler import Calendar, ModuleCadence, PhaseCadence
 from utils.technical_indicators import TechnicalIndicators
 from utils.pattern_recognition import PatternRecognition
+from utils.bar_store import BarStore, BarHistory
+from utils.bar_archive import get_bar_archive
+from utils.crypto_indicator_engine import CryptoIndicatorEngine, SymbolIndicators
+from modular.market_data_snapshot import entity_value, format_crypto_symbol
 
 
 class TradingSession(Enum):
@@ -162,6 +168,29 @@ class CryptoModule(TradingModule):
             'volume': 0.30
         }
         
+        # Per-cycle batched market snapshot (filled once per analyze_opportunities call)
+        self._cycle_snapshots: Dict[str, Dict] = {}
+        self._cycle_market_data: Dict[str, Dict] = {}
+        self._cycle_indicators: Dict[str, SymbolIndicators] = {}
+        
+        # Vectorized indicator engine: one pass over the whole universe per cycle
+        self.indicator_engine = CryptoIndicatorEngine(
+            ma_period=self.crypto_trading_config['moving_average_period'],
+            oversold_threshold=self.crypto_trading_config['oversold_threshold'],
+            logger=self.logger
+        )
+        self.snapshot_history_hours = config.custom_params.get('snapshot_history_hours', 30)
+        
+        # Incremental hourly bar store: only bars newer than the last stored bar are downloaded
+        # (warm-started from the on-disk bar archive when BAR_ARCHIVE_DIR is configured)
+        self.bar_timeframe = '1Hour'
+        self.bar_store = BarStore(
+            fetch_bars=self._fetch_crypto_bars_since,
+            history_depth=max(config.custom_params.get('bar_history_depth', 200), self.snapshot_history_hours),
+            logger=self.logger,
+            archive=get_bar_archive(config.custom_params.get('bar_archive_dir'), logger=self.logger)
+        )
+        
         # Performance tracking - REAL profitability metrics
         self._crypto_positions = {}
         # EMERGENCY FIX: Clear any stale position data on initialization
@@ -209,6 +238,15 @@ class CryptoModule(TradingModule):
     def module_name(self) -> str:
         return "crypto"
     
+    @property
+    def cadence(self) -> ModuleCadence:
+        """24/7: fast scans, exits checked every few seconds, results saved every few minutes"""
+        return ModuleCadence(
+            scan=PhaseCadence(30, Calendar.ALWAYS, priority=10),
+            monitor=PhaseCadence(5, Calendar.ALWAYS, priority=0),
+            persist=PhaseCadence(120, Calendar.ALWAYS, priority=50)
+        )
+    
     @property
     def supported_symbols(self) -> List[str]:
         """Get all supported cryptocurrency symbols"""
@@ -264,15 +302,34 @@ class CryptoModule(TradingModule):
             self.logger.info(f"Analyzing {len(active_symbols)} cryptos for 24/7 opportunities")
             self.logger.info(f"🎯 Confidence threshold: {crypto_config['min_confidence']:.2f}, Session: {current_session.value}")
             
-            # Analyze each active symbol
+            # BATCHED DATA: One multi-symbol fetch for the whole universe instead of 4-6 calls per symbol
+            self._cycle_snapshots = self._fetch_crypto_snapshots(active_symbols)
+            
+            # Add stale data check before analysis
+            fresh_symbols = []
             for symbol in active_symbols:
+                if self._is_quote_data_stale(symbol):
+                    self.logger.warning(f"⚠️ {symbol}: Skipping due to stale quote data")
+                else:
+                    fresh_symbols.append(symbol)
+            
+            # VECTORIZED INDICATORS: Compute the signal stack for all symbols in one pass
+            self._prepare_cycle_indicators(fresh_symbols)
+            
+            # Analyze each active symbol (concurrently, results in symbol order)
+            results = self.symbol_fanout.map(
+                lambda symbol: self._analyze_crypto_symbol(symbol, current_session), fresh_symbols
+            )
+            
+            for result in results:
+                symbol = result.symbol
+                if result.skipped:  # Budget ran out before this symbol (reported by the orchestrator)
+                    continue
+                if not result.ok:
+                    self.logger.error(f"Error analyzing crypto {symbol}: {result.error}")
+                    continue
                 try:
-                    # Add stale data check before analysis
-                    if self._is_quote_data_stale(symbol):
-                        self.logger.warning(f"⚠️ {symbol}: Skipping due to stale quote data")
-                        continue
-
-                    analysis = self._analyze_crypto_symbol(symbol, current_session)
+                    analysis = result.value
                     
                     if analysis:
                         # Log detailed analysis results for debugging
@@ -307,6 +364,11 @@ class CryptoModule(TradingModule):
         except Exception as e:
             self.logger.error(f"Error in crypto opportunity analysis: {e}")
             return opportunities
+        finally:
+            # Snapshot and indicators are only valid for this analysis pass
+            self._cycle_snapshots = {}
+            self._cycle_market_data = {}
+            self._cycle_indicators = {}
     
     def execute_trades(self, opportunities: List[TradeOpportunity]) -> List[TradeResult]:
         """
@@ -476,16 +538,17 @@ class CryptoModule(TradingModule):
             if not current_price or current_price <= 0:
                 return None
             
-            # Get historical data for analysis
-            market_data = self._get_crypto_market_data(symbol)
+            # Get historical data for analysis (prefetched for this cycle when available)
+            market_data = self._cycle_market_data.get(symbol) or self._get_crypto_market_data(symbol)
             if not market_data:
                 return None
             
             # RESEARCH-BACKED APPROACH: Multiple technical indicators with directional bias
-            rsi_analysis = self._calculate_rsi_signals(symbol, market_data)
-            macd_analysis = self._calculate_macd_signals(symbol, market_data)
-            bollinger_analysis = self._calculate_bollinger_signals(symbol, market_data)
-            volume_analysis = self._calculate_volume_confirmation(symbol, market_data)
+            indicators = self._cycle_indicators.get(symbol) or self._compute_indicators({symbol: market_data})[symbol]
+            rsi_analysis = indicators.rsi
+            macd_analysis = indicators.macd
+            bollinger_analysis = indicators.bollinger
+            volume_analysis = indicators.volume
             
             # RESILIENT ANALYSIS: Log failed indicators but continue with available data
             failed_indicators = []
@@ -577,93 +640,30 @@ class CryptoModule(TradingModule):
     
     # RESEARCH-BACKED TECHNICAL INDICATORS (Based on 2024 crypto trading research)
     
+    def _prepare_cycle_indicators(self, symbols: List[str]):
+        """Fetch market data for all symbols and compute their indicators in one vectorized pass"""
+        try:
+            market_data = {}
+            for result in self.symbol_fanout.map(self._get_crypto_market_data, symbols):
+                if result.ok and result.value:
+                    market_data[result.symbol] = result.value
+            self._cycle_market_data = market_data
+            self._cycle_indicators = self._compute_indicators(market_data)
+        except Exception as e:
+            self.logger.error(f"❌ Vectorized indicator pass failed - falling back to per-symbol analysis: {e}")
+            self._cycle_market_data = {}
+            self._cycle_indicators = {}
+    
+    def _compute_indicators(self, market_data: Dict[str, Dict]) -> Dict[str, SymbolIndicators]:
+        """Run the indicator engine with the current mean reversion settings"""
+        self.indicator_engine.ma_period = self.crypto_trading_config['moving_average_period']
+        self.indicator_engine.oversold_threshold = self.crypto_trading_config['oversold_threshold']
+        return self.indicator_engine.analyze(market_data)
+    
     def _calculate_rsi_signals(self, symbol: str, market_data: Dict) -> Optional[Dict]:
         """Calculate RSI-based buy/sell signals with mean reversion using real market data"""
         try:
-            prices = market_data.get('price_history', [])
-            if len(prices) < 14:
-                return None
-            
-            # Calculate RSI (14-period standard) with proper real data
-            price_changes = [prices[i] - prices[i-1] for i in range(1, len(prices))]
-            gains = [change if change > 0 else 0 for change in price_changes]
-            losses = [-change if change < 0 else 0 for change in price_changes]
-            
-            # Calculate average gains and losses
-            avg_gain = sum(gains[-14:]) / 14
-            avg_loss = sum(losses[-14:]) / 14
-            
-            if avg_loss == 0:
-                rsi = 100
-            else:
-                rs = avg_gain / avg_loss
-                rsi = 100 - (100 / (1 + rs))
-            
-            # MEAN REVERSION STRATEGY: Calculate deviation from moving average
-            ma_period = self.crypto_trading_config['moving_average_period']
-            if len(prices) >= ma_period:
-                moving_average = sum(prices[-ma_period:]) / ma_period
-                current_price = prices[-1]
-                deviation_pct = (current_price - moving_average) / moving_average
-                
-                # Mean reversion logic: favor opposite direction of deviation
-                if deviation_pct <= self.crypto_trading_config['oversold_threshold']:
-                    # Price significantly below MA - STRONG BUY signal
-                    mean_reversion_buy_boost = 0.3
-                    mean_reversion_sell_penalty = -0.3
-                    signal_context = f"mean_reversion_oversold_{deviation_pct:.1%}"
-                elif deviation_pct >= -self.crypto_trading_config['oversold_threshold']:
-                    # Price significantly above MA - SELL signal
-                    mean_reversion_buy_boost = -0.2
-                    mean_reversion_sell_penalty = 0.2
-                    signal_context = f"mean_reversion_overbought_{deviation_pct:.1%}"
-                else:
-                    # Price near MA - neutral
-                    mean_reversion_buy_boost = 0.0
-                    mean_reversion_sell_penalty = 0.0
-                    signal_context = f"mean_reversion_neutral_{deviation_pct:.1%}"
-            else:
-                # Not enough data for mean reversion
-                mean_reversion_buy_boost = 0.0
-                mean_reversion_sell_penalty = 0.0
-                signal_context = "insufficient_data_for_mean_reversion"
-            
-            # Combine RSI with mean reversion
-            if rsi <= 30:
-                # Strong oversold RSI + mean reversion
-                buy_strength = min(0.95, 0.85 + mean_reversion_buy_boost)
-                sell_strength = max(0.05, 0.15 + mean_reversion_sell_penalty)
-                signal = 'strong_buy'
-            elif rsi <= 45:
-                # Moderate oversold + mean reversion
-                buy_strength = min(0.85, 0.70 + mean_reversion_buy_boost)
-                sell_strength = max(0.15, 0.30 + mean_reversion_sell_penalty)
-                signal = 'buy'
-            elif rsi <= 55:
-                # Neutral RSI - let mean reversion dominate
-                buy_strength = max(0.30, min(0.70, 0.50 + mean_reversion_buy_boost))
-                sell_strength = max(0.30, min(0.70, 0.50 + mean_reversion_sell_penalty))
-                signal = 'neutral'
-            elif rsi <= 70:
-                # Moderate overbought + mean reversion
-                buy_strength = max(0.15, 0.40 + mean_reversion_buy_boost)
-                sell_strength = min(0.85, 0.60 + mean_reversion_sell_penalty)
-                signal = 'weak_sell'
-            else:
-                # Strong overbought RSI + mean reversion
-                buy_strength = max(0.05, 0.25 + mean_reversion_buy_boost)
-                sell_strength = min(0.95, 0.75 + mean_reversion_sell_penalty)
-                signal = 'sell'
-            
-            return {
-                'rsi_value': rsi,
-                'signal': signal,
-                'buy_strength': buy_strength,
-                'sell_strength': sell_strength,
-                'mean_reversion_context': signal_context,
-                'ma_deviation': deviation_pct if len(prices) >= ma_period else None
-            }
-            
+            return self._compute_indicators({symbol: market_data})[symbol].rsi
         except Exception as e:
             self.logger.error(f"❌ {symbol}: RSI+MeanReversion calculation failed: {e}")
             return None
@@ -671,66 +671,7 @@ class CryptoModule(TradingModule):
     def _calculate_macd_signals(self, symbol: str, market_data: Dict) -> Optional[Dict]:
         """Calculate MACD signals for trend confirmation"""
         try:
-            prices = market_data.get('price_history', [])
-            if len(prices) < 26:
-                # FALLBACK: Use shorter EMA periods if insufficient data for standard MACD
-                if len(prices) >= 21:
-                    self.logger.warning(f"MACD fallback: Using EMA-9/21 instead of EMA-12/26 (have {len(prices)} bars)")
-                    ema_9 = self._calculate_ema(prices, 9)
-                    ema_21 = self._calculate_ema(prices, 21)
-                    if ema_9 and ema_21:
-                        macd_line = ema_9 - ema_21
-                        signal = 'bullish' if macd_line > 0 else 'bearish'
-                        strength = 0.6 if macd_line > 0 else 0.4  # Reduced confidence for fallback
-                        return {
-                            'macd_line': macd_line,
-                            'macd_signal': signal,
-                            'buy_strength': strength if signal == 'bullish' else 1 - strength,
-                            'sell_strength': 1 - strength if signal == 'bullish' else strength,
-                            'confidence': 0.5,  # Lower confidence for fallback method
-                            'fallback_method': True
-                        }
-                return None
-            
-            # Calculate EMAs
-            ema_12 = self._calculate_ema(prices, 12)
-            ema_26 = self._calculate_ema(prices, 26)
-            
-            if ema_12 is None or ema_26 is None:
-                return None
-            
-            # MACD line
-            macd_line = ema_12 - ema_26
-            
-            # DYNAMIC MACD interpretation based on actual MACD value
-            # Convert MACD line to strength based on magnitude relative to current price
-            current_price = market_data.get('current_price', 1)
-            macd_percentage = (macd_line / current_price) * 100  # Convert to percentage
-            
-            # Scale MACD strength based on percentage magnitude
-            # Strong signals when MACD is >1% or <-1% of price
-            abs_macd_pct = abs(macd_percentage)
-            
-            if macd_line > 0:
-                # Bullish MACD - stronger signal with higher positive values
-                signal = 'bullish'
-                # Scale from 0.5 (barely positive) to 0.9 (strongly positive >2%)
-                buy_strength = 0.5 + min(abs_macd_pct / 2.0, 0.4)  # 0.5 -> 0.9
-                sell_strength = 1 - buy_strength
-            else:
-                # Bearish MACD - stronger signal with higher negative values
-                signal = 'bearish'
-                # Scale from 0.5 (barely negative) to 0.9 (strongly negative <-2%)
-                sell_strength = 0.5 + min(abs_macd_pct / 2.0, 0.4)  # 0.5 -> 0.9
-                buy_strength = 1 - sell_strength
-            
-            return {
-                'macd_line': macd_line,
-                'macd_signal': signal,
-                'buy_strength': buy_strength,
-                'sell_strength': sell_strength
-            }
-            
+            return self._compute_indicators({symbol: market_data})[symbol].macd
         except Exception as e:
             self.logger.error(f"❌ {symbol}: MACD calculation failed: {e}")
             return None
@@ -738,72 +679,7 @@ class CryptoModule(TradingModule):
     def _calculate_bollinger_signals(self, symbol: str, market_data: Dict) -> Optional[Dict]:
         """Calculate Bollinger Bands signals for volatility breakouts"""
         try:
-            prices = market_data.get('price_history', [])
-            current_price = market_data.get('current_price', 0)
-            
-            if len(prices) < 20 or current_price <= 0:
-                return None
-            
-            # Calculate 20-period SMA and standard deviation
-            sma_20 = sum(prices[-20:]) / 20
-            variance = sum([(price - sma_20) ** 2 for price in prices[-20:]]) / 20
-            std_dev = variance ** 0.5
-            
-            # Bollinger Bands
-            upper_band = sma_20 + (2 * std_dev)
-            lower_band = sma_20 - (2 * std_dev)
-            
-            # DYNAMIC Bollinger Bands interpretation based on exact price position
-            # Calculate where price sits within the bands (0 = lower band, 1 = upper band)
-            band_range = upper_band - lower_band
-            if band_range > 0:
-                # Price position within bands (0.0 = at lower band, 1.0 = at upper band)
-                band_position = (current_price - lower_band) / band_range
-                
-                if current_price > upper_band:
-                    # Above upper band - overbought territory
-                    excess_pct = (current_price - upper_band) / upper_band
-                    position = 'above_upper'
-                    buy_strength = max(0.1, 0.3 - min(excess_pct * 2, 0.2))  # 0.1-0.3 range
-                    sell_strength = 1 - buy_strength
-                elif current_price < lower_band:
-                    # Below lower band - oversold territory  
-                    deficit_pct = (lower_band - current_price) / lower_band
-                    position = 'below_lower'
-                    buy_strength = min(0.9, 0.7 + min(deficit_pct * 2, 0.2))  # 0.7-0.9 range
-                    sell_strength = 1 - buy_strength
-                else:
-                    # Within bands - proportional to position
-                    position = 'within_bands'
-                    # Linear scale with peak buy strength near lower band
-                    if band_position <= 0.5:
-                        # Lower half - increasing buy strength as we approach lower band
-                        buy_strength = 0.5 + (0.5 - band_position) * 0.6  # 0.5 -> 0.8
-                    else:
-                        # Upper half - decreasing buy strength as we approach upper band
-                        buy_strength = 0.5 - (band_position - 0.5) * 0.6  # 0.5 -> 0.2
-                    
-                    sell_strength = 1 - buy_strength
-            else:
-                # Fallback if band calculation fails
-                position = 'neutral'
-                buy_strength = 0.5
-                sell_strength = 0.5
-            
-            # Volatility score for compatibility
-            band_width = (upper_band - lower_band) / sma_20
-            volatility_score = min(band_width / 0.1, 1.0)  # Normalize to 0-1
-            
-            return {
-                'position': position,
-                'upper_band': upper_band,
-                'lower_band': lower_band,
-                'sma_20': sma_20,
-                'buy_strength': buy_strength,
-                'sell_strength': sell_strength,
-                'volatility_score': volatility_score
-            }
-            
+            return self._compute_indicators({symbol: market_data})[symbol].bollinger
         except Exception as e:
             self.logger.error(f"❌ {symbol}: Bollinger Bands calculation failed: {e}")
             return None
@@ -811,37 +687,7 @@ class CryptoModule(TradingModule):
     def _calculate_volume_confirmation(self, symbol: str, market_data: Dict) -> Optional[Dict]:
         """Calculate volume-based confirmation signals"""
         try:
-            volume_24h = market_data.get('volume_24h', 0)
-            avg_volume = market_data.get('avg_volume_7d', volume_24h)
-            
-            if avg_volume <= 0:
-                return None
-            
-            volume_ratio = volume_24h / avg_volume
-            
-            # Research-backed volume interpretation
-            if volume_ratio >= 2.0:
-                confirmation = 'strong'
-                strength_multiplier = 1.2
-            elif volume_ratio >= 1.5:
-                confirmation = 'moderate'
-                strength_multiplier = 1.1
-            elif volume_ratio >= 0.8:
-                confirmation = 'neutral'
-                strength_multiplier = 1.0
-            else:
-                confirmation = 'weak'
-                strength_multiplier = 0.8
-            
-            volume_score = min(volume_ratio / 2.0, 1.0)  # Normalize
-            
-            return {
-                'volume_ratio': volume_ratio,
-                'confirmation': confirmation,
-                'strength_multiplier': strength_multiplier,
-                'volume_score': volume_score
-            }
-            
+            return self._compute_indicators({symbol: market_data})[symbol].volume
         except Exception as e:
             self.logger.error(f"❌ {symbol}: Volume confirmation calculation failed: {e}")
             return None
@@ -1465,6 +1311,7 @@ class CryptoModule(TradingModule):
             self.logger.error(f"Error analyzing crypto exit: {e}")
             return None
     
+    @guarded_exit
     def _execute_crypto_exit(self, position: Dict, exit_reason: str) -> Optional[TradeResult]:
         """Execute crypto position exit with ML-enhanced exit analysis"""
         try:
@@ -1725,9 +1572,120 @@ class CryptoModule(TradingModule):
     
     # Utility methods
     
+    def _fetch_crypto_snapshots(self, symbols: List[str]) -> Dict[str, Dict]:
+        """
+        Fetch latest bar, trade, quote and recent hourly bars for all symbols in batched calls.
+        
+        Uses one multi-symbol snapshot request (falling back to batched latest bars/trades/quotes)
+        plus one multi-symbol bars request, so REST calls per cycle do not grow with the universe.
+        
+        Args:
+            symbols: Crypto symbols in module format (e.g. BTCUSD)
+            
+        Returns:
+            Dict keyed by module symbol with price, price_source, quote_time and bars
+        """
+        snapshots = {}
+        if not symbols:
+            return snapshots
+        
+        formatted_map = {format_crypto_symbol(symbol): symbol for symbol in symbols}
+        formatted_symbols = list(formatted_map.keys())
+        
+        latest_bars, latest_trades, latest_quotes = {}, {}, {}
+        
+        # Reuse the orchestrator's cycle snapshot for symbols it already covers
+        if self.market_data is not None:
+            for formatted_symbol in formatted_symbols:
+                shared_quote = self.market_data.get_quote(formatted_symbol)
+                shared_bar = self.market_data.get_bar(formatted_symbol)
+                if shared_quote or shared_bar:
+                    latest_bars[formatted_symbol] = shared_bar
+                    # The snapshot keeps the last trade price on the quote; its .price is the ask
+                    if shared_quote is not None and shared_quote.last_price:
+                        latest_trades[formatted_symbol] = SimpleNamespace(p=shared_quote.last_price)
+                    latest_quotes[formatted_symbol] = shared_quote
+        
+        missing_symbols = [s for s in formatted_symbols if s not in latest_quotes]
+        if missing_symbols:
+            try:
+                raw_snapshots = self.api.get_crypto_snapshots(missing_symbols) or {}
+                for formatted_symbol, snap in raw_snapshots.items():
+                    latest_bars[formatted_symbol] = entity_value(snap, 'minute_bar', 'latest_bar')
+                    latest_trades[formatted_symbol] = entity_value(snap, 'latest_trade')
+                    latest_quotes[formatted_symbol] = entity_value(snap, 'latest_quote')
+            except Exception as e:
+                self.logger.warning(f"⚠️ Batched crypto snapshots failed: {e} - using batched latest bars/trades/quotes")
+                for name, target in (('get_latest_crypto_bars', latest_bars),
+                                     ('get_latest_crypto_trades', latest_trades),
+                                     ('get_latest_crypto_quotes', latest_quotes)):
+                    try:
+                        target.update(getattr(self.api, name)(missing_symbols) or {})
+                    except Exception as batch_error:
+                        self.logger.warning(f"⚠️ Batched {name} failed: {batch_error}")
+        
+        # Incremental history refresh: one request for the universe, only bars since the last stored bar
+        self.bar_store.update(symbols, self.bar_timeframe)
+        
+        for formatted_symbol, symbol in formatted_map.items():
+            bar = latest_bars.get(formatted_symbol)
+            trade = latest_trades.get(formatted_symbol)
+            quote = latest_quotes.get(formatted_symbol)
+            
+            # Same priority as the per-symbol path: bar close -> trade price -> ask/bid
+            price, price_source = 0.0, None
+            for source, entity, attrs in (('bars', bar, ('c', 'close')),
+                                          ('trades', trade, ('p', 'price', 'last_price')),
+                                          ('quotes', quote, ('ap', 'ask_price')),
+                                          ('quotes', quote, ('bp', 'bid_price'))):
+                try:
+                    value = float(entity_value(entity, *attrs) or 0)
+                except (ValueError, TypeError):
+                    value = 0.0
+                if value > 0:
+                    price, price_source = value, source
+                    break
+            
+            if price <= 0 and quote is None:
+                continue
+            
+            snapshots[symbol] = {
+                'price': price,
+                'price_source': price_source,
+                'bar_time': entity_value(bar, 't', 'timestamp'),
+                'quote_time': entity_value(quote, 'timestamp', 't'),
+                'bars': self.bar_store.get_history(symbol, self.bar_timeframe, self.snapshot_history_hours)
+            }
+        
+        self.logger.info(f"📦 Crypto snapshot: {len(snapshots)}/{len(symbols)} symbols loaded in batched requests")
+        return snapshots
+    
+    def _fetch_crypto_bars_since(self, symbols: List[str], timeframe: str, start: datetime) -> Dict[str, List]:
+        """Bar store fetcher: one multi-symbol get_crypto_bars request, grouped by module symbol"""
+        formatted_map = {format_crypto_symbol(symbol): symbol for symbol in symbols}
+        history = {symbol: [] for symbol in symbols}
+        
+        bars = self.api.get_crypto_bars(
+            list(formatted_map.keys()),
+            start=start.strftime('%Y-%m-%dT%H:%M:%SZ'),
+            timeframe=timeframe
+        )
+        single_symbol = symbols[0] if len(symbols) == 1 else None
+        for bar in bars or []:
+            bar_symbol = formatted_map.get(entity_value(bar, 'S', 'symbol'), single_symbol)
+            if bar_symbol in history:
+                history[bar_symbol].append(bar)
+        return history
+    
     def _get_crypto_price(self, symbol: str) -> float:
         """Get current cryptocurrency price using correct Alpaca API methods"""
         try:
+            # Use this cycle's batched snapshot when available
+            snapshot = self._cycle_snapshots.get(symbol)
+            if snapshot and snapshot.get('price', 0) > 0:
+                self.logger.debug(f"✅ {symbol}: Price from batched snapshot ({snapshot['price_source']}): ${snapshot['price']}")
+                return snapshot['price']
+            
             # Convert symbol format: BTCUSD -> BTC/USD (Alpaca crypto format)
             if '/' not in symbol and 'USD' in symbol:
                 base_symbol = symbol.replace('USD', '')
@@ -1817,6 +1775,11 @@ class CryptoModule(TradingModule):
     def _get_crypto_market_data(self, symbol: str) -> Optional[Dict]:
         """Get cryptocurrency market data using enhanced real-time data sources"""
         try:
+            # BATCHED: Build market data from this cycle's snapshot bars when available
+            snapshot = self._cycle_snapshots.get(symbol)
+            if snapshot and snapshot.get('bars') and snapshot.get('price', 0) > 0:
+                return self._build_crypto_market_data(symbol, snapshot['price'], snapshot['bars'])
+            
             # PRIMARY: Use enhanced data manager for real-time data if available
             if hasattr(self, 'enhanced_data_manager') and self.enhanced_data_manager:
                 enhanced_data = self.enhanced_data_manager.get_enhanced_quote_data(symbol, include_fundamentals=False)
@@ -1837,85 +1800,73 @@ class CryptoModule(TradingModule):
             if not current_price:
                 return None
             
-            # Convert symbol format for API calls
-            if '/' not in symbol and 'USD' in symbol:
-                base_symbol = symbol.replace('USD', '')
-                formatted_symbol = f"{base_symbol}/USD"
-            else:
-                formatted_symbol = symbol
+            # Get real hourly bars from the incremental bar store (only missing bars are downloaded)
+            self.bar_store.update([symbol], self.bar_timeframe)
+            history = self.bar_store.get_history(symbol, self.bar_timeframe, self.snapshot_history_hours)
             
-            # Get real historical bars for 24h data
-            try:
-                from datetime import datetime, timedelta, timezone
-                
-                # FIXED: Get 30h of hourly bars to ensure 26+ data points for MACD
-                # MACD requires 26 periods minimum, so request extra hours to handle gaps
-                start_time = datetime.now(timezone.utc) - timedelta(hours=30)  # 30 hours for safety
-                start_time_str = start_time.strftime('%Y-%m-%dT%H:%M:%SZ')  # RFC3339 format
-                
-                bars = self.api.get_crypto_bars(
-                    formatted_symbol,
-                    start=start_time_str,
-                    timeframe='1Hour',
-                    limit=30  # Request 30 bars explicitly to ensure we get enough data
-                )
-                
-                if bars and len(bars) > 0:
-                    # Calculate real 24h metrics from bars
-                    prices = [float(bar.c) for bar in bars]  # Close prices
-                    volumes = [float(bar.v) for bar in bars]  # Volumes
-                    
-                    # COMPREHENSIVE ANALYSIS: Require sufficient data or use fallback methods
-                    if not prices:
-                        self.logger.error(f"❌ {symbol}: No price data available from API")
-                        return None
-                    elif len(prices) < 21:  # Minimum for any technical analysis
-                        self.logger.error(f"❌ {symbol}: Insufficient price history ({len(prices)}/21+ bars needed) - skipping analysis")
-                        return None
-                    elif len(prices) < 26:  # Log warning but continue with fallback
-                        self.logger.warning(f"⚠️ {symbol}: Limited price history ({len(prices)}/26 bars) - using fallback MACD calculation")
-                    
-                    if not volumes:
-                        self.logger.error(f"❌ {symbol}: No volume data available")
-                        return None
-                    
-                    price_24h_ago = prices[0]
-                    high_24h = max(float(bar.h) for bar in bars)
-                    low_24h = min(float(bar.l) for bar in bars)
-                    volume_24h = sum(volumes)
-                    
-                    # Calculate mean reversion metrics ONLY from real data
-                    ma_20 = sum(prices[-20:]) / 20  # Exactly 20 periods
-                    avg_volume = sum(volumes) / len(volumes)
-                    volume_ratio = volume_24h / avg_volume
-                    
-                    self.logger.info(f"📊 {symbol}: Real data from {len(prices)} bars - High: ${high_24h:.4f}, Low: ${low_24h:.4f}, Vol: {volume_24h:.0f}")
-                    
-                    # Return market data with calculated values
-                    return {
-                        'current_price': current_price,
-                        'price_24h_ago': price_24h_ago,
-                        'high_24h': high_24h,
-                        'low_24h': low_24h,
-                        'volume_24h': volume_24h,
-                        'avg_volume_7d': avg_volume,  # Use real calculated average
-                        'ma_20': ma_20,  # 20-day moving average for mean reversion
-                        'volume_ratio': volume_ratio,  # Volume ratio for mean reversion
-                        'price_history': prices  # Full price history for technical indicators
-                    }
-                else:
-                    # NEVER USE SIMULATED DATA - return None for missing data
-                    self.logger.error(f"❌ {symbol}: No real market data available from Alpaca API")
-                    return None
-                
-            except Exception as api_error:
-                self.logger.error(f"❌ {symbol}: Crypto bars API failed: {api_error}")
-                return None
+            if history is not None and len(history) > 0:
+                return self._build_crypto_market_data(symbol, current_price, history)
+            
+            # NEVER USE SIMULATED DATA - return None for missing data
+            self.logger.error(f"❌ {symbol}: No real market data available from Alpaca API")
+            return None
             
         except Exception as e:
             self.logger.error(f"❌ {symbol}: Error getting market data: {e}")
             return None
     
+    def _build_crypto_market_data(self, symbol: str, current_price: float, history: BarHistory) -> Optional[Dict]:
+        """Calculate 24h metrics and indicator history from bar store views of hourly crypto bars"""
+        try:
+            # Real 24h metrics from numpy views (no per-bar Python objects)
+            prices = history.close
+            volumes = history.volume
+            
+            # COMPREHENSIVE ANALYSIS: Require sufficient data or use fallback methods
+            if len(prices) == 0:
+                self.logger.error(f"❌ {symbol}: No price data available from API")
+                return None
+            elif len(prices) < 21:  # Minimum for any technical analysis
+                self.logger.error(f"❌ {symbol}: Insufficient price history ({len(prices)}/21+ bars needed) - skipping analysis")
+                return None
+            elif len(prices) < 26:  # Log warning but continue with fallback
+                self.logger.warning(f"⚠️ {symbol}: Limited price history ({len(prices)}/26 bars) - using fallback MACD calculation")
+            
+            if len(volumes) == 0:
+                self.logger.error(f"❌ {symbol}: No volume data available")
+                return None
+            
+            price_24h_ago = float(prices[0])
+            high_24h = float(history.high.max())
+            low_24h = float(history.low.min())
+            volume_24h = float(volumes.sum())
+            
+            # Calculate mean reversion metrics ONLY from real data
+            ma_20 = float(prices[-20:].sum()) / 20  # Exactly 20 periods
+            avg_volume = volume_24h / len(volumes)
+            volume_ratio = volume_24h / avg_volume if avg_volume > 0 else 0.0
+            
+            self.logger.info(f"📊 {symbol}: Real data from {len(prices)} bars - High: ${high_24h:.4f}, Low: ${low_24h:.4f}, Vol: {volume_24h:.0f}")
+            
+            # Return market data with calculated values
+            return {
+                'current_price': current_price,
+                'price_24h_ago': price_24h_ago,
+                'high_24h': high_24h,
+                'low_24h': low_24h,
+                'volume_24h': volume_24h,
+                'avg_volume_7d': avg_volume,  # Use real calculated average
+                'ma_20': ma_20,  # 20-day moving average for mean reversion
+                'volume_ratio': volume_ratio,  # Volume ratio for mean reversion
+                'price_history': prices,  # Read-only numpy views for technical indicators
+                'volume_history': volumes,
+                'high_history': history.high,
+                'low_history': history.low
+            }
+        except Exception as e:
+            self.logger.error(f"❌ {symbol}: Error building market data from bars: {e}")
+            return None
+    
     def _calculate_crypto_quantity(self, symbol: str, price: float) -> float:
         """Calculate crypto quantity based on portfolio allocation"""
         try:
@@ -2039,6 +1990,9 @@ class CryptoModule(TradingModule):
     def _is_stock_market_open(self) -> bool:
         """Check if US stock market is currently open"""
         try:
+            snapshot_open = self.get_snapshot_market_open()
+            if snapshot_open is not None:
+                return snapshot_open
             clock = self.api.get_clock()
             return getattr(clock, 'is_open', False)
         except Exception as e:
@@ -2173,25 +2127,27 @@ class CryptoModule(TradingModule):
         """Checks if the last quote data for a symbol is older than a threshold (e.g., 30 minutes)."""
         try:
             # Format symbol for Alpaca API (e.g., BTCUSD -> BTC/USD)
-            if '/' not in symbol and 'USD' in symbol:
-                base_symbol = symbol.replace('USD', '')
-                formatted_symbol = f"{base_symbol}/USD"
+            formatted_symbol = format_crypto_symbol(symbol)
+
+            snapshot = self._cycle_snapshots.get(symbol)
+            if snapshot and snapshot.get('quote_time') is not None:
+                # Quote timestamp already fetched in this cycle's batched snapshot
+                quote_time = snapshot['quote_time']
             else:
-                formatted_symbol = symbol
+                latest_quotes_dict = self.api.get_latest_crypto_quotes([formatted_symbol])
+                
+                if not latest_quotes_dict or formatted_symbol not in latest_quotes_dict:
+                    self.logger.warning(f"No quote data returned for {formatted_symbol} from get_latest_crypto_quotes.")
+                    return True # Treat as stale if no data
 
-            latest_quotes_dict = self.api.get_latest_crypto_quotes([formatted_symbol])
-            
-            if not latest_quotes_dict or formatted_symbol not in latest_quotes_dict:
-                self.logger.warning(f"No quote data returned for {formatted_symbol} from get_latest_crypto_quotes.")
-                return True # Treat as stale if no data
+                quote = latest_quotes_dict[formatted_symbol]
+                
+                if not quote or not hasattr(quote, 'timestamp'):
+                    self.logger.warning(f"No valid quote object or timestamp for {formatted_symbol}.")
+                    return True # Treat as stale if no valid quote object or timestamp
 
-            quote = latest_quotes_dict[formatted_symbol]
-            
-            if not quote or not hasattr(quote, 'timestamp'):
-                self.logger.warning(f"No valid quote object or timestamp for {formatted_symbol}.")
-                return True # Treat as stale if no valid quote object or timestamp
+                quote_time = quote.timestamp
 
-            quote_time = quote.timestamp
             # Alpaca SDK's CryptoQuote timestamp should be a timezone-aware datetime object (UTC)
             if quote_time.tzinfo is None:
                 # If somehow it's naive, assume UTC as Alpaca operates in UTC
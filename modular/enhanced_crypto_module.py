@@ -702,6 +702,10 @@ class EnhancedCryptoModule(TradingModule):
     def _get_fallback_price(self, symbol: str) -> Optional[float]:
         """Fallback price retrieval for compatibility"""
         try:
+            snapshot_price = self.get_snapshot_price(symbol)
+            if snapshot_price:
+                return snapshot_price
+            
             # Implement basic price retrieval (placeholder)
             return 50000.0  # Placeholder price
         except Exception:
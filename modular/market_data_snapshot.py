@@ -0,0 +1,252 @@
+"""
+Per-Cycle Market Data Snapshot
+
+Immutable, read-only view of quotes, latest bars and the market clock that the
+orchestrator builds once at the start of every trading cycle. Modules and the
+order executor read prices from the snapshot instead of re-quoting the same
+symbols, so every decision in a cycle sees the same prices.
+"""
+
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from types import MappingProxyType
+from typing import Dict, List, Any, Optional, Iterable, Mapping
+import logging
+
+
+def is_crypto_symbol(symbol: str) -> bool:
+    """Crypto symbols are BTCUSD / BTC/USD style pairs (same heuristic as the order executor)"""
+    return '/' in symbol or ('USD' in symbol and len(symbol) <= 7)
+
+
+def normalize_symbol(symbol: str) -> str:
+    """Snapshot key for a symbol: BTC/USD -> BTCUSD, stocks unchanged"""
+    return symbol.replace('/', '').upper()
+
+
+def format_crypto_symbol(symbol: str) -> str:
+    """Convert symbol format: BTCUSD -> BTC/USD (Alpaca crypto format)"""
+    if '/' not in symbol and 'USD' in symbol:
+        return f"{symbol.replace('USD', '')}/USD"
+    return symbol
+
+
+def entity_value(entity, *attrs):
+    """Read the first available attribute from an Alpaca entity (raw or mapped name)"""
+    if entity is None:
+        return None
+    for attr in attrs:
+        value = getattr(entity, attr, None)
+        if value is not None:
+            return value
+    return None
+
+
+def _as_utc(timestamp) -> Optional[datetime]:
+    """Coerce an Alpaca timestamp to a timezone-aware UTC datetime"""
+    if timestamp is None or not hasattr(timestamp, 'tzinfo'):
+        return None
+    return timestamp.replace(tzinfo=timezone.utc) if timestamp.tzinfo is None else timestamp
+
+
+@dataclass(frozen=True)
+class SnapshotQuote:
+    """Latest quote/trade view of one symbol"""
+    symbol: str
+    ask_price: Optional[float] = None
+    bid_price: Optional[float] = None
+    last_price: Optional[float] = None
+    timestamp: Optional[datetime] = None
+
+    @property
+    def price(self) -> Optional[float]:
+        """Execution-side price: ask, then bid, then last trade"""
+        for value in (self.ask_price, self.bid_price, self.last_price):
+            if value and value > 0:
+                return value
+        return None
+
+    def age_seconds(self, now: Optional[datetime] = None) -> Optional[float]:
+        """Quote age in seconds, None if the timestamp is unknown"""
+        if self.timestamp is None:
+            return None
+        return ((now or datetime.now(timezone.utc)) - self.timestamp).total_seconds()
+
+
+@dataclass(frozen=True)
+class SnapshotBar:
+    """Latest OHLCV bar of one symbol"""
+    symbol: str
+    open: float
+    high: float
+    low: float
+    close: float
+    volume: float
+    timestamp: Optional[datetime] = None
+
+
+@dataclass(frozen=True)
+class SnapshotClock:
+    """Market clock captured at snapshot time"""
+    is_open: bool
+    next_open: Any = None
+    next_close: Any = None
+
+
+@dataclass(frozen=True)
+class MarketDataSnapshot:
+    """
+    Immutable market data for one trading cycle.
+
+    Lookups accept both module (BTCUSD) and Alpaca (BTC/USD) symbol formats.
+    A symbol missing from the snapshot returns None so callers can fall back
+    to their own API path.
+    """
+    cycle_id: int
+    created_at: datetime
+    quotes: Mapping[str, SnapshotQuote] = field(default_factory=lambda: MappingProxyType({}))
+    bars: Mapping[str, SnapshotBar] = field(default_factory=lambda: MappingProxyType({}))
+    clock: Optional[SnapshotClock] = None
+    regime: Any = None  # modular.market_regime.CycleRegime attached by the orchestrator
+
+    def get_quote(self, symbol: str) -> Optional[SnapshotQuote]:
+        """Get the snapshot quote for a symbol"""
+        return self.quotes.get(normalize_symbol(symbol))
+
+    def get_bar(self, symbol: str) -> Optional[SnapshotBar]:
+        """Get the latest snapshot bar for a symbol"""
+        return self.bars.get(normalize_symbol(symbol))
+
+    def get_price(self, symbol: str) -> Optional[float]:
+        """Get the snapshot price for a symbol (quote first, then latest bar close)"""
+        quote = self.get_quote(symbol)
+        if quote and quote.price:
+            return quote.price
+        bar = self.get_bar(symbol)
+        if bar and bar.close > 0:
+            return bar.close
+        return None
+
+    def has_symbol(self, symbol: str) -> bool:
+        """Check whether the snapshot holds any data for a symbol"""
+        key = normalize_symbol(symbol)
+        return key in self.quotes or key in self.bars
+
+    @property
+    def is_market_open(self) -> Optional[bool]:
+        """US market status at snapshot time, None if the clock was unavailable"""
+        return self.clock.is_open if self.clock else None
+
+    @property
+    def age_seconds(self) -> float:
+        """Seconds since the snapshot was built"""
+        return (datetime.now(timezone.utc) - self.created_at).total_seconds()
+
+    @property
+    def symbols(self) -> List[str]:
+        """All symbols covered by the snapshot"""
+        return sorted(set(self.quotes) | set(self.bars))
+
+
+class MarketDataSnapshotBuilder:
+    """
+    Builds a MarketDataSnapshot with batched multi-symbol Alpaca requests.
+
+    One stock snapshot request, one crypto snapshot request and one clock
+    request per cycle, regardless of how many modules or symbols are active.
+    """
+
+    def __init__(self, api_client, logger: Optional[logging.Logger] = None):
+        self.api = api_client
+        self.logger = logger or logging.getLogger(self.__class__.__name__)
+
+    def build(self, symbols: Iterable[str], cycle_id: int = 0) -> MarketDataSnapshot:
+        """
+        Build an immutable snapshot for the given symbols.
+
+        Args:
+            symbols: Stock and crypto symbols requested by the active modules
+            cycle_id: Orchestrator cycle number
+
+        Returns:
+            MarketDataSnapshot (possibly partial if some requests failed)
+        """
+        unique_symbols = sorted({symbol for symbol in symbols if symbol})
+        crypto_symbols = [s for s in unique_symbols if is_crypto_symbol(s)]
+        stock_symbols = [s for s in unique_symbols if not is_crypto_symbol(s)]
+
+        quotes: Dict[str, SnapshotQuote] = {}
+        bars: Dict[str, SnapshotBar] = {}
+
+        if stock_symbols:
+            self._load_snapshots('get_snapshots', stock_symbols, quotes, bars)
+        if crypto_symbols:
+            formatted = [format_crypto_symbol(s) for s in crypto_symbols]
+            self._load_snapshots('get_crypto_snapshots', formatted, quotes, bars)
+
+        snapshot = MarketDataSnapshot(
+            cycle_id=cycle_id,
+            created_at=datetime.now(timezone.utc),
+            quotes=MappingProxyType(quotes),
+            bars=MappingProxyType(bars),
+            clock=self._load_clock()
+        )
+
+        self.logger.info(f"📸 Market data snapshot #{cycle_id}: {len(quotes)} quotes, {len(bars)} bars "
+                         f"for {len(unique_symbols)} symbols (market open: {snapshot.is_market_open})")
+        return snapshot
+
+    def _load_snapshots(self, method_name: str, request_symbols: List[str],
+                        quotes: Dict[str, SnapshotQuote], bars: Dict[str, SnapshotBar]):
+        """Load one batched snapshot request into the quote and bar maps"""
+        try:
+            raw_snapshots = getattr(self.api, method_name)(request_symbols) or {}
+            for raw_symbol, snap in raw_snapshots.items():
+                if snap is None:
+                    continue
+                key = normalize_symbol(raw_symbol)
+
+                quote = entity_value(snap, 'latest_quote')
+                trade = entity_value(snap, 'latest_trade')
+                quotes[key] = SnapshotQuote(
+                    symbol=key,
+                    ask_price=self._to_float(entity_value(quote, 'ap', 'ask_price')),
+                    bid_price=self._to_float(entity_value(quote, 'bp', 'bid_price')),
+                    last_price=self._to_float(entity_value(trade, 'p', 'price')),
+                    timestamp=_as_utc(entity_value(quote, 'timestamp', 't') or entity_value(trade, 'timestamp', 't'))
+                )
+
+                bar = entity_value(snap, 'minute_bar', 'latest_bar')
+                close = self._to_float(entity_value(bar, 'c', 'close'))
+                if close:
+                    bars[key] = SnapshotBar(
+                        symbol=key,
+                        open=self._to_float(entity_value(bar, 'o', 'open')) or close,
+                        high=self._to_float(entity_value(bar, 'h', 'high')) or close,
+                        low=self._to_float(entity_value(bar, 'l', 'low')) or close,
+                        close=close,
+                        volume=self._to_float(entity_value(bar, 'v', 'volume')) or 0.0,
+                        timestamp=_as_utc(entity_value(bar, 'timestamp', 't'))
+                    )
+        except Exception as e:
+            self.logger.warning(f"⚠️ Snapshot request {method_name} failed for {len(request_symbols)} symbols: {e}")
+
+    def _load_clock(self) -> Optional[SnapshotClock]:
+        """Capture the market clock once for the cycle"""
+        try:
+            clock = self.api.get_clock()
+            return SnapshotClock(
+                is_open=bool(getattr(clock, 'is_open', False)),
+                next_open=getattr(clock, 'next_open', None),
+                next_close=getattr(clock, 'next_close', None)
+            )
+        except Exception as e:
+            self.logger.warning(f"⚠️ Snapshot clock request failed: {e}")
+            return None
+
+    @staticmethod
+    def _to_float(value) -> Optional[float]:
+        try:
+            return float(value) if value is not None else None
+        except (ValueError, TypeError):
+            return None
@@ -24,6 +24,9 @@ from modular.base_module import (
     TradingModule, ModuleConfig, TradeOpportunity, TradeResult, 
     TradeAction, TradeStatus, ExitReason
 )
+from modular.scheduler import Calendar, ModuleCadence, PhaseCadence
+from utils.cancellation import to_thread
+from utils.rate_limiter import get_rate_limiter
 
 
 @dataclass
@@ -66,7 +69,7 @@ class OpenAIAnalyzer:
         self.web_search_model = web_search_model
         self.request_count = 0
         self.last_request_time = 0
-        self.rate_limit_delay = 2  # Increased for reasoning models
+        self.rate_limiter = get_rate_limiter()
         
         # Validate model choice for financial analysis - Updated for 2025 models
         recommended_models = ["o4-mini", "o3-mini", "o1-mini", "gpt-4o", "gpt-4-turbo"]
@@ -76,7 +79,6 @@ class OpenAIAnalyzer:
         # Model-specific configuration
         self.is_reasoning_model = model.startswith(('o3', 'o4', 'o1'))
         if self.is_reasoning_model:
-            self.rate_limit_delay = 3  # Reasoning models need more time
             self.logger.info(f"Using reasoning model {model} - enhanced for complex financial analysis")
         
         # Web search capability
@@ -100,13 +102,8 @@ class OpenAIAnalyzer:
             self.logger.info(f"🤖 OPENAI REQUEST [{debug_context}]: Model={self.model}, Messages={len(messages)}")
             self.logger.debug(f"🤖 Request content preview: {str(messages)[:200]}...")
             
-            # Rate limiting - more conservative for production
-            current_time = time.time()
-            time_since_last = current_time - self.last_request_time
-            if time_since_last < self.rate_limit_delay:
-                sleep_time = self.rate_limit_delay - time_since_last
-                self.logger.debug(f"🤖 Rate limiting: sleeping {sleep_time:.2f}s")
-                await asyncio.sleep(sleep_time)
+            # Rate limiting - shared OpenAI token bucket (waits only when the budget is used up)
+            await self.rate_limiter.acquire_async('openai', self.model)
             
             self.request_count += 1
             self.last_request_time = time.time()
@@ -140,7 +137,7 @@ class OpenAIAnalyzer:
             
             # Make API call
             self.logger.debug(f"🤖 Making API call to {self.model}...")
-            response = self.client.chat.completions.create(**api_params)
+            response = await to_thread(self.client.chat.completions.create, **api_params)
             
             # Process response
             response_content = response.choices[0].message.content
@@ -387,7 +384,7 @@ class OpenAIAnalyzer:
             if "search" not in self.web_search_model:
                 api_params["temperature"] = 0.3
             
-            response = self.client.chat.completions.create(**api_params)
+            response = await to_thread(self.client.chat.completions.create, **api_params)
             result = response.choices[0].message.content
             
             try:
@@ -485,6 +482,15 @@ class MarketIntelligenceModule(TradingModule):
     def module_name(self) -> str:
         return "market_intelligence"
     
+    @property
+    def cadence(self) -> ModuleCadence:
+        """Signals refresh on the intelligence cycle; risk signals are checked hourly"""
+        return ModuleCadence(
+            scan=PhaseCadence(self.intelligence_cycle_hours * 3600, Calendar.ALWAYS, priority=40),
+            monitor=PhaseCadence(3600, Calendar.ALWAYS, priority=40),
+            persist=PhaseCadence(3600, Calendar.ALWAYS, priority=50)
+        )
+    
     @property
     def supported_symbols(self) -> List[str]:
         # Intelligence module analyzes all symbols but doesn't trade directly
@@ -519,10 +525,12 @@ class MarketIntelligenceModule(TradingModule):
             intelligence.pre_market_analysis['regime'] = regime_analysis
             intelligence.pre_market_analysis['market_news'] = market_news
             
-            # 2. Position risk analysis
+            # 2. Position risk analysis (concurrently - the OpenAI token bucket paces the requests)
             positions = await self._get_current_positions()
-            for symbol, position_data in positions.items():
-                risk_analysis = await self.ai_analyzer.analyze_position_risk(position_data)
+            risk_analyses = await asyncio.gather(
+                *(self.ai_analyzer.analyze_position_risk(position_data) for position_data in positions.values())
+            )
+            for symbol, risk_analysis in zip(positions, risk_analyses):
                 
                 # QA Rule 4: Ensure complete data structure
                 if not risk_analysis:
@@ -604,6 +612,18 @@ class MarketIntelligenceModule(TradingModule):
             self.logger.error(f"Error analyzing opportunities: {e}")
             return opportunities
     
+    async def analyze_opportunities_async(self) -> List[TradeOpportunity]:
+        """Refresh the intelligence signals when the cycle is due, then convert them (async mode)"""
+        if self.should_run_intelligence_cycle():
+            await self.run_daily_intelligence_cycle()
+        return self.analyze_opportunities()
+    
+    async def execute_trades_async(self, opportunities: List[TradeOpportunity]) -> List[TradeResult]:
+        return self.execute_trades(opportunities)
+    
+    async def monitor_positions_async(self) -> List[TradeResult]:
+        return self.monitor_positions()
+    
     def execute_trades(self, opportunities: List[TradeOpportunity]) -> List[TradeResult]:
         """Intelligence module doesn't execute trades directly"""
         # Intelligence module provides signals but doesn't execute
@@ -681,10 +701,20 @@ class MarketIntelligenceModule(TradingModule):
                 'sector_performance': {}
             }
             
+            # Quantitative regime shared by the trading modules this cycle
+            cycle_regime = self.get_cycle_regime()
+            if cycle_regime is not None:
+                market_data['quant_regime'] = cycle_regime.to_dict()
+                market_data['sector_performance'] = {
+                    'rotation_phase': cycle_regime.rotation_phase,
+                    'leading_sectors': list(cycle_regime.leading_sectors),
+                    'lagging_sectors': list(cycle_regime.lagging_sectors)
+                }
+            
             # Add portfolio information if available - QA Rule 1: Check attribute existence
             if hasattr(self.risk_manager, 'get_portfolio_summary'):
                 try:
-                    portfolio = self.risk_manager.get_portfolio_summary()
+                    portfolio = await to_thread(self.risk_manager.get_portfolio_summary)
                     if portfolio and isinstance(portfolio, dict):
                         market_data.update(portfolio)
                 except Exception as e:
@@ -704,7 +734,7 @@ class MarketIntelligenceModule(TradingModule):
             # Get positions from risk manager - QA Rule 1: Check attribute existence  
             if hasattr(self.risk_manager, 'get_all_positions'):
                 try:
-                    risk_positions = self.risk_manager.get_all_positions()
+                    risk_positions = await to_thread(self.risk_manager.get_all_positions)
                     if risk_positions and isinstance(risk_positions, dict):
                         for symbol, position in risk_positions.items():
                             # QA Rule 5: Defensive programming with .get() for all position fields
@@ -860,7 +890,7 @@ class MarketIntelligenceModule(TradingModule):
                     'api_requests': self.ai_analyzer.request_count
                 }
                 
-                self.firebase_db.save_market_intelligence(intelligence_data)
+                await to_thread(self.firebase_db.save_market_intelligence, intelligence_data)
                 self.logger.debug("Market intelligence data saved to Firebase")
             
         except Exception as e:
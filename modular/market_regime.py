@@ -0,0 +1,158 @@
+"""
+Per-Cycle Market Regime
+
+One regime assessment per trading cycle, built by the orchestrator from the
+cycle's MarketDataSnapshot before any module runs and attached to the
+snapshot. Modules read the same regime label, volatility regime and sector
+rotation instead of each deriving their own (and re-fetching SPY/QQQ/sector
+ETF data per symbol).
+"""
+
+from dataclasses import dataclass, field, replace
+from datetime import datetime, timezone
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+import logging
+
+
+# Index and sector ETFs the regime is computed from (added to every cycle snapshot)
+REGIME_INDEX_SYMBOLS = ('SPY', 'QQQ', 'IWM')
+REGIME_SECTOR_SYMBOLS = ('XLF', 'XLK', 'XLE', 'XLV', 'XLI')
+
+# Stocks module vocabulary for the same labels
+_TREND_LABELS = {'bullish': 'bull', 'bearish': 'bear', 'sideways': 'sideways'}
+
+
+@dataclass(frozen=True)
+class CycleRegime:
+    """Market regime assessment shared by every module for one cycle"""
+    cycle_id: int
+    created_at: datetime
+    regime: str = 'sideways'                 # bullish / bearish / sideways
+    confidence: float = 0.5
+    trend: str = 'unknown'                   # Index moving-average assessment: bullish / bearish / neutral
+    volatility_regime: str = 'unknown'       # low / medium / high / extreme (needs VIX data)
+    volatility_level: float = 0.5
+    rotation_phase: str = 'unknown'          # risk_on / risk_off / neutral
+    leading_sectors: Tuple[str, ...] = ()
+    lagging_sectors: Tuple[str, ...] = ()
+    features: Mapping[str, float] = field(default_factory=lambda: MappingProxyType({}))
+    symbols_analyzed: int = 0
+
+    @property
+    def trend_label(self) -> str:
+        """Regime in the bull / bear / sideways vocabulary"""
+        return _TREND_LABELS.get(self.regime, 'sideways')
+
+    def sector_context(self, symbol: str) -> Dict[str, Any]:
+        """Sector rotation signal for a symbol (sector ETFs directly, other symbols by rotation phase)"""
+        if symbol in self.leading_sectors:
+            signal = 'positive'
+        elif symbol in self.lagging_sectors:
+            signal = 'negative'
+        else:
+            signal = {'risk_on': 'positive', 'risk_off': 'negative'}.get(self.rotation_phase, 'neutral')
+        return {
+            'rotation_signal': signal,
+            'rotation_phase': self.rotation_phase,
+            'leading_sectors': list(self.leading_sectors),
+            'market_regime': self.regime
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'cycle_id': self.cycle_id,
+            'regime': self.regime,
+            'confidence': self.confidence,
+            'trend': self.trend,
+            'volatility_regime': self.volatility_regime,
+            'volatility_level': self.volatility_level,
+            'rotation_phase': self.rotation_phase,
+            'leading_sectors': list(self.leading_sectors),
+            'lagging_sectors': list(self.lagging_sectors),
+            'features': dict(self.features),
+            'symbols_analyzed': self.symbols_analyzed
+        }
+
+
+class CycleRegimeBuilder:
+    """
+    Builds a CycleRegime from a MarketDataSnapshot.
+
+    Keeps one MLRegimeDetector and one MarketRegimeDetector sharing a
+    RegimeFeatureEngine across cycles; each build feeds them the snapshot's
+    index and sector ETF bars as one bar, so no extra requests are made.
+    Only completed bars newer than the last ones fed are used, so the
+    detectors' histories do not depend on how often cycles run; a cycle
+    with no new bar (e.g. overnight) reuses the previous regime.
+    """
+
+    symbols: Tuple[str, ...] = REGIME_INDEX_SYMBOLS + REGIME_SECTOR_SYMBOLS
+
+    def __init__(self, logger: Optional[logging.Logger] = None):
+        from market_regime_detector import MarketRegimeDetector
+        from ml_regime_detector import MLRegimeDetector
+
+        self.logger = logger or logging.getLogger(self.__class__.__name__)
+        self.ml_detector = MLRegimeDetector()
+        self.market_detector = MarketRegimeDetector(feature_engine=self.ml_detector.feature_engine)
+        self._last_bar_times: Dict[str, datetime] = {}
+        self._last_regime: Optional[CycleRegime] = None
+
+    def build(self, snapshot, cycle_id: int = 0) -> CycleRegime:
+        """
+        Regime for the cycle: the previous regime when no regime symbol has a new
+        bar, a neutral one when there is no previous regime either.
+
+        Args:
+            snapshot: The cycle's MarketDataSnapshot
+            cycle_id: Orchestrator cycle number
+        """
+        quotes = self._regime_quotes(snapshot)
+        if not quotes:
+            if self._last_regime is not None:
+                return replace(self._last_regime, cycle_id=cycle_id)
+            return CycleRegime(cycle_id=cycle_id, created_at=datetime.now(timezone.utc))
+
+        for quote in quotes:
+            self.market_detector.add_market_data(quote['symbol'], quote['price'], int(quote['volume']))
+        ml_result = self.ml_detector.detect_regime_with_ml(quotes)
+        analysis = self.market_detector.get_comprehensive_regime_analysis()
+
+        overall = analysis.get('overall_assessment', {})
+        volatility = analysis.get('volatility', {})
+        rotation = analysis.get('sector_rotation', {})
+        features = ml_result.get('features', {})
+
+        regime = CycleRegime(
+            cycle_id=cycle_id,
+            created_at=datetime.now(timezone.utc),
+            regime=ml_result.get('regime', 'sideways'),
+            confidence=float(ml_result.get('confidence', 0.5)),
+            trend=overall.get('regime', 'unknown') if overall.get('indices_analyzed') else 'unknown',
+            volatility_regime=volatility.get('volatility_regime', 'unknown'),
+            volatility_level=float(features.get('volatility_level', 0.5)),
+            rotation_phase=rotation.get('rotation_phase', 'unknown'),
+            leading_sectors=tuple(rotation.get('leading_sectors', [])),
+            lagging_sectors=tuple(rotation.get('lagging_sectors', [])),
+            features=MappingProxyType({k: float(v) for k, v in features.items()}),
+            symbols_analyzed=len(quotes)
+        )
+        self._last_regime = regime
+        self.logger.info(f"🧭 Cycle #{cycle_id} regime: {regime.regime} ({regime.confidence:.2f}), "
+                         f"trend {regime.trend}, rotation {regime.rotation_phase}")
+        return regime
+
+    def _regime_quotes(self, snapshot) -> List[Dict[str, Any]]:
+        """Index and sector ETF bars from the snapshot that are newer than the last ones fed"""
+        quotes = []
+        for symbol in self.symbols:
+            bar = snapshot.get_bar(symbol)
+            if bar is None or bar.timestamp is None or not bar.close:
+                continue
+            last_time = self._last_bar_times.get(symbol)
+            if last_time is not None and bar.timestamp <= last_time:
+                continue
+            self._last_bar_times[symbol] = bar.timestamp
+            quotes.append({'symbol': symbol, 'price': bar.close, 'volume': bar.volume})
+        return quotes
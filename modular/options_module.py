@@ -8,15 +8,19 @@ strategy selection, and multi-leg execution.
 
 import os
 import time
-import requests
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
 
 from modular.base_module import (
     TradingModule, ModuleConfig, TradeOpportunity, TradeResult,
-    TradeAction, TradeStatus, ExitReason
+    TradeAction, TradeStatus, ExitReason, guarded_exit
 )
+from modular.scheduler import Calendar, ModuleCadence, PhaseCadence
+from utils.http_pool import get_http_pool
+from utils.indicator_cache import get_indicator_cache
+from utils.pattern_recognition import PatternRecognition
+from utils.rate_limiter import get_rate_limiter
 
 
 @dataclass
@@ -78,6 +82,12 @@ class OptionsModule(TradingModule):
         super().__init__(config, firebase_db, risk_manager, order_executor, logger)
         
         self.api = api_client
+        # Shared token buckets pace Alpaca requests (API client calls are limited by the client wrapper)
+        self.rate_limiter = get_rate_limiter()
+        # Keep-alive sessions for direct REST calls (options contracts endpoint)
+        self.http_pool = get_http_pool()
+        # Support/resistance, breakout and mean reversion patterns on the underlying
+        self.pattern_recognition = PatternRecognition()
         
         # INSTITUTIONAL OPTIONS CONFIGURATION - Research-backed risk management
         self.max_options_allocation = 0.15  # REDUCED from 30% to 15% (institutional standard)
@@ -128,6 +138,15 @@ class OptionsModule(TradingModule):
     def module_name(self) -> str:
         return "options"
     
+    @property
+    def cadence(self) -> ModuleCadence:
+        """Options setups change slowly: scans every 15 minutes, exit checks every 30 seconds, market hours only"""
+        return ModuleCadence(
+            scan=PhaseCadence(900, Calendar.MARKET_HOURS, priority=30),
+            monitor=PhaseCadence(30, Calendar.MARKET_HOURS, priority=0),
+            persist=PhaseCadence(900, Calendar.ALWAYS, priority=50)
+        )
+    
     @property
     def supported_symbols(self) -> List[str]:
         return self._supported_symbols.copy()
@@ -144,8 +163,10 @@ class OptionsModule(TradingModule):
         try:
             # Check if US market is open (options follow stock market hours)
             try:
-                market_clock = self.api.get_clock()
-                if not market_clock.is_open:
+                market_open = self.get_snapshot_market_open()
+                if market_open is None:
+                    market_open = self.api.get_clock().is_open
+                if not market_open:
                     # Options can only trade during market hours, regardless of GLOBAL_TRADING
                     self.logger.info("🕐 US market closed - options trading disabled (options only trade during market hours)")
                     return opportunities
@@ -165,15 +186,17 @@ class OptionsModule(TradingModule):
             # Get market regime and confidence from ML/intelligence systems
             market_regime = self._get_market_regime()
             
-            # Analyze each supported symbol
-            for symbol in self._supported_symbols[:5]:  # Limit to top 5 to avoid rate limits
+            # Analyze each supported symbol, stopping when the module's budget runs out
+            symbols = self._supported_symbols[:5]  # Limit to top 5 to avoid rate limits
+            token = self.cancel_token
+            for index, symbol in enumerate(symbols):
+                if token.should_stop(symbols[index:]):
+                    self.logger.warning(f"⏱️ Options budget spent - skipping {len(symbols) - index} symbols")
+                    break
                 try:
                     opportunity = self._analyze_symbol_options(symbol, market_regime)
                     if opportunity:
                         opportunities.append(opportunity)
-                        
-                    # Rate limiting between symbols
-                    time.sleep(0.5)
                     
                 except Exception as e:
                     self.logger.error(f"Error analyzing options for {symbol}: {e}")
@@ -220,9 +243,6 @@ class OptionsModule(TradingModule):
                         'strategy': opportunity.strategy
                     }
                 
-                # Rate limiting between executions
-                time.sleep(1.0)
-                
             except Exception as e:
                 error_result = TradeResult(
                     opportunity=opportunity,
@@ -352,7 +372,8 @@ class OptionsModule(TradingModule):
                 'expiration_date': expiration_date
             }
             
-            response = requests.get(url, headers=headers, params=params, timeout=10)
+            self.rate_limiter.acquire('alpaca', 'options_contracts')
+            response = self.http_pool.get(url, headers=headers, params=params, timeout=10)
             
             if response.status_code == 200:
                 contracts_data = response.json()
@@ -394,7 +415,7 @@ class OptionsModule(TradingModule):
                         bid=0.0
                     )
                     
-                    # Get pricing (with rate limiting)
+                    # Get pricing (quote requests are paced by the shared Alpaca rate limiter)
                     self._add_contract_pricing(contract_info, underlying_price)
                     
                     if contract['type'] == 'call':
@@ -402,8 +423,6 @@ class OptionsModule(TradingModule):
                     else:
                         puts.append(contract_info)
                     
-                    time.sleep(0.25)  # Rate limiting
-                    
                 except Exception as e:
                     self.logger.debug(f"Error processing contract {contract.get('symbol', 'unknown')}: {e}")
             
@@ -458,12 +477,16 @@ class OptionsModule(TradingModule):
             if bars.empty:
                 return 0.5  # Neutral if no data
             
-            # Calculate real RSI
-            price_changes = bars['close'].diff()
-            gains = price_changes.where(price_changes > 0, 0).rolling(14).mean()
-            losses = (-price_changes.where(price_changes < 0, 0)).rolling(14).mean()
-            rs = gains / losses
-            rsi = 100 - (100 / (1 + rs)).iloc[-1]
+            # Calculate real RSI (memoized until a new daily bar arrives or today's close moves)
+            def compute_rsi():
+                price_changes = bars['close'].diff()
+                gains = price_changes.where(price_changes > 0, 0).rolling(14).mean()
+                losses = (-price_changes.where(price_changes < 0, 0)).rolling(14).mean()
+                rs = gains / losses
+                return 100 - (100 / (1 + rs)).iloc[-1]
+            
+            rsi = get_indicator_cache().get_or_compute(symbol, '1d', 'rsi_rolling', (14,),
+                                                       (bars.index[-1], float(bars['close'].iloc[-1])), compute_rsi)
             
             # Calculate real momentum
             price_20_days_ago = bars['close'].iloc[0]
@@ -520,6 +543,13 @@ class OptionsModule(TradingModule):
             recent_low = lows.min()
             price_position = (current_price - recent_low) / (recent_high - recent_low) if recent_high > recent_low else 0.5
             
+            # Blend in detected pattern signals (breakouts, mean reversion) on the same bars
+            patterns = self.pattern_recognition.analyze_patterns(
+                symbol, bars['close'].to_numpy(), bars['volume'].to_numpy() if 'volume' in bars else None
+            )
+            if patterns['trading_signals']:
+                price_position = (price_position + patterns['confidence']) / 2
+            
             # Higher position = higher bullish confidence
             return max(0.2, min(0.8, price_position))
             
@@ -1112,6 +1142,7 @@ class OptionsModule(TradingModule):
             self.logger.error(f"Error analyzing position exit: {e}")
             return None
     
+    @guarded_exit
     def _execute_position_exit(self, position: Dict, exit_reason: str) -> Optional[TradeResult]:
         """Execute position exit with ML-enhanced exit analysis"""
         try:
@@ -1408,6 +1439,10 @@ class OptionsModule(TradingModule):
     def _get_underlying_price(self, symbol: str) -> float:
         """Get current underlying stock price"""
         try:
+            snapshot_price = self.get_snapshot_price(symbol)
+            if snapshot_price:
+                return snapshot_price
+            
             quote = self.api.get_latest_quote(symbol)
             if quote and hasattr(quote, 'ask_price'):
                 return float(quote.ask_price)
@@ -1470,9 +1505,11 @@ class OptionsModule(TradingModule):
             return None
     
     def _get_market_regime(self) -> str:
-        """Get current market regime (simplified)"""
-        # In production, this would integrate with market_regime_detector
-        return 'bullish'  # Simplified for now
+        """Get current market regime (the orchestrator's cycle regime when available)"""
+        cycle_regime = self.get_cycle_regime()
+        if cycle_regime is not None:
+            return cycle_regime.regime
+        return 'bullish'  # Simplified fallback outside orchestrated cycles
     
     def _calculate_options_allocation(self) -> float:
         """Calculate current options allocation percentage"""
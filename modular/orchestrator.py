@@ -6,17 +6,25 @@ centralized cycle management, performance monitoring, and ML optimization integr
 """
 
 import asyncio
+import dataclasses
+import threading
 import time
-from typing import Dict, List, Any, Optional
+from typing import Dict, FrozenSet, List, Any, Optional
 from datetime import datetime, timedelta
 import logging
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor, wait
 
 from modular.base_module import (
     TradingModule, ModuleRegistry, ModuleHealth, ModuleHealthStatus,
     TradeOpportunity, TradeResult, ModuleConfig
 )
 from modular.ml_optimizer import MLParameterOptimizationEngine
+from modular.market_data_snapshot import MarketDataSnapshot, MarketDataSnapshotBuilder
+from modular.market_regime import CycleRegimeBuilder
+from modular.scheduler import ALL_PHASES, CadenceScheduler, MarketHours, ModuleCadence, Phase
+from utils.cancellation import CancellationToken, cancellation_scope, to_thread
+from utils.http_pool import get_http_pool
+from utils.symbol_locks import get_symbol_locks
 
 
 class ModularOrchestrator:
@@ -36,7 +44,8 @@ class ModularOrchestrator:
                  risk_manager,
                  order_executor,
                  ml_optimizer=None,
-                 logger: Optional[logging.Logger] = None):
+                 logger: Optional[logging.Logger] = None,
+                 api_client=None):
         """
         Initialize the modular orchestrator.
         
@@ -46,6 +55,8 @@ class ModularOrchestrator:
             order_executor: Order execution service
             ml_optimizer: ML optimization service (optional)
             logger: Optional logger instance
+            api_client: Alpaca API client for the per-cycle market data snapshot
+                        (defaults to the order executor's client)
         """
         self.firebase_db = firebase_db
         self.risk_manager = risk_manager
@@ -81,6 +92,8 @@ class ModularOrchestrator:
         self._cycle_count = 0
         self._last_cycle_time = None
         self._cycle_delay = 120  # Default 2 minutes
+        self._last_optimization_time: Optional[float] = None  # time.monotonic() of the last run
+        self._last_rebalance_time: Optional[float] = None
         
         # Performance tracking
         self._orchestrator_metrics = {
@@ -98,18 +111,238 @@ class ModularOrchestrator:
         # Configuration
         self._config = {
             'max_concurrent_modules': 3,
-            'cycle_timeout_seconds': 300,  # 5 minutes
+            'cycle_timeout_seconds': 300,  # 5 minutes - longest wait for a cycle's modules
             'health_check_interval': 600,  # 10 minutes
             'optimization_interval': 1800,  # 30 minutes
-            'enable_parallel_execution': True
+            'rebalance_interval': 1200,     # 20 minutes (ten default-length cycles)
+            'enable_parallel_execution': True,
+            'enable_async_execution': False,   # Drive modules on one asyncio event loop
+            'module_timeout_seconds': 240,     # Per-module time budget (custom_params['budget_seconds'] overrides)
+            'cancel_grace_seconds': 15,        # Wind-down time past the budget before a module is abandoned
+            'enable_cadence_scheduler': True,  # Per-module phase cadences instead of one cycle delay
+            'default_interval_seconds': 120,   # Cadence of modules that do not declare one
+            'max_idle_seconds': 60,            # Longest scheduler sleep (keeps the loop responsive)
+            'enable_position_monitor': True,   # Monitor phases on their own fast thread, apart from scans
+            'enable_market_data_snapshot': True,
+            'enable_cycle_regime': True
         }
         
+        # Per-cycle shared market data snapshot
+        snapshot_api = api_client if api_client is not None else getattr(order_executor, 'api', None)
+        self._snapshot_builder = MarketDataSnapshotBuilder(snapshot_api, self.logger) if snapshot_api is not None else None
+        self._market_data_snapshot: Optional[MarketDataSnapshot] = None
+        
+        # One market regime per cycle, attached to the snapshot
+        try:
+            self._regime_builder = CycleRegimeBuilder(self.logger) if self._snapshot_builder is not None else None
+        except Exception as e:
+            self.logger.warning(f"⚠️ Cycle regime builder unavailable: {e} - modules will assess the regime themselves")
+            self._regime_builder = None
+        
+        # One pooled connection per concurrently running module and host (grown for symbol workers on registration)
+        get_http_pool().resize(self._config['max_concurrent_modules'])
+        
+        # Persistent module workers: run modules in thread mode and adapt sync modules in async mode.
+        # Grown to one worker per registered module: a module has at most one run in flight, so a
+        # run abandoned on a hung provider only ever holds its own module's worker.
+        self._module_executor = ThreadPoolExecutor(max_workers=self._config['max_concurrent_modules'],
+                                                   thread_name_prefix='module')
+        self._module_workers = self._config['max_concurrent_modules']
+        # The orchestrator's own blocking work in async mode (validation, persistence) never queues
+        # behind module hooks
+        self._io_executor = ThreadPoolExecutor(max_workers=self._config['max_concurrent_modules'],
+                                               thread_name_prefix='orchestrator-io')
+        self._event_loop: Optional[asyncio.AbstractEventLoop] = None
+        
+        # Modules whose run is still in flight (an abandoned run blocks the module's next one)
+        self._running_modules: Dict[str, CancellationToken] = {}
+        self._running_lock = threading.Lock()
+        
+        # Per-module phase deadlines; results wait for the module's persist phase
+        market_hours = MarketHours(snapshot_api, self.logger)
+        self._scheduler = CadenceScheduler(market_hours, self.logger)
+        self._unsaved: Dict[str, Dict[str, List]] = {}
+        self._unsaved_lock = threading.Lock()
+        
+        # Fast position monitor: monitor phases on a background thread so exits never wait for a slow scan
+        self._monitor_scheduler = CadenceScheduler(market_hours, self.logger)
+        self._monitor_thread: Optional[threading.Thread] = None
+        self._monitor_stop = threading.Event()
+        self._monitor_executor: Optional[ThreadPoolExecutor] = None
+        
         self.logger.info("Modular Trading Orchestrator initialized")
     
     def register_module(self, module: TradingModule):
         """Register a trading module with the orchestrator"""
         self.registry.register_module(module)
         self.logger.info(f"Registered module: {module.module_name}")
+        self._resize_module_executor()
+        self._resize_http_pool()
+        self._schedule_module(module)
+    
+    def _module_cadence(self, module: TradingModule) -> ModuleCadence:
+        """The module's declared cadence (or the default) with custom_params interval overrides"""
+        cadence = module.cadence or ModuleCadence.uniform(self._config['default_interval_seconds'])
+        params = getattr(module.config, 'custom_params', None)
+        return cadence.with_overrides(params) if isinstance(params, dict) else cadence
+    
+    def _schedule_module(self, module: TradingModule):
+        """(Re)schedule a module's phases; its monitor phase goes to the position monitor while that runs"""
+        cadence = self._module_cadence(module)
+        if self.position_monitor_running:
+            self._scheduler.add_module(module.module_name, cadence, phases=frozenset({Phase.SCAN, Phase.PERSIST}))
+            self._monitor_scheduler.add_module(module.module_name, cadence, phases=frozenset({Phase.MONITOR}))
+        else:
+            self._scheduler.add_module(module.module_name, cadence)
+            self._monitor_scheduler.remove_module(module.module_name)
+    
+    def set_cadence_scheduling(self, enabled: bool, default_interval_seconds: Optional[float] = None):
+        """Switch the trading loop between per-module cadences and one global cycle delay"""
+        self._config['enable_cadence_scheduler'] = enabled
+        if default_interval_seconds is not None:
+            self._config['default_interval_seconds'] = default_interval_seconds
+            for module in self.registry._modules.values():
+                self._schedule_module(module)
+        self.logger.info(f"Cadence scheduling {'enabled' if enabled else 'disabled'} "
+                         f"(default interval {self._config['default_interval_seconds']}s)")
+    
+    @property
+    def cadence_scheduling_enabled(self) -> bool:
+        return self._config['enable_cadence_scheduler']
+    
+    def run_due_work(self, now: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """
+        Run the module phases whose deadline has passed as one cycle.
+        
+        Returns the cycle results, or None when nothing was due.
+        """
+        tasks = self._scheduler.pop_due(now)
+        if not tasks:
+            return None
+        due: Dict[str, set] = {}
+        for task in tasks:  # By priority: modules run in order of their most urgent phase
+            due.setdefault(task.module_name, set()).add(task.phase)
+        # A persist phase with nothing buffered is not worth a cycle
+        with self._unsaved_lock:
+            due = {name: phases for name, phases in due.items() if phases != {Phase.PERSIST} or name in self._unsaved}
+        if not due:
+            return None
+        self.logger.info("⏰ Due: " + ", ".join(
+            f"{name} ({'/'.join(sorted(p.value for p in phases))})" for name, phases in due.items()))
+        return self.run_single_cycle(due={name: frozenset(phases) for name, phases in due.items()})
+    
+    def seconds_until_due(self, now: Optional[float] = None) -> float:
+        """Sleep before the next deadline, capped at max_idle_seconds"""
+        wait = self._scheduler.seconds_until_due(now)
+        idle = self._config['max_idle_seconds']
+        return idle if wait is None else min(wait, idle)
+    
+    def get_schedule(self) -> Dict[str, Dict[str, str]]:
+        """Next deadline per module and phase"""
+        schedule = self._scheduler.get_status()
+        for module_name, phases in self._monitor_scheduler.get_status().items():
+            schedule.setdefault(module_name, {}).update(phases)
+        return schedule
+    
+    @property
+    def position_monitor_running(self) -> bool:
+        return self._monitor_thread is not None and self._monitor_thread.is_alive()
+    
+    def start_position_monitor(self):
+        """
+        Run every module's monitor phase on a background thread at its own (fast) cadence.
+        
+        Exits no longer wait behind a slow opportunity scan; the scan loop keeps
+        the scan and persist phases. Both sides take per-symbol locks before
+        ordering, so they never act on the same symbol at once.
+        """
+        if self.position_monitor_running or not self._config['enable_position_monitor']:
+            return
+        self._monitor_stop.clear()
+        self._monitor_executor = ThreadPoolExecutor(max_workers=self._config['max_concurrent_modules'],
+                                                    thread_name_prefix='monitor')
+        self._monitor_thread = threading.Thread(target=self._run_position_monitor, name='position-monitor', daemon=True)
+        self._monitor_thread.start()
+        for module in self.registry._modules.values():
+            self._schedule_module(module)
+        self.logger.info("👁️ Position monitor started")
+    
+    def stop_position_monitor(self, timeout: float = 10.0):
+        """Stop the monitor thread and hand monitor phases back to the scan loop"""
+        if self._monitor_thread is None:
+            return
+        self._monitor_stop.set()
+        self._monitor_thread.join(timeout)
+        self._monitor_thread = None
+        if self._monitor_executor is not None:
+            self._monitor_executor.shutdown(wait=False)
+            self._monitor_executor = None
+        for module in self.registry._modules.values():
+            self._schedule_module(module)
+        self.logger.info("👁️ Position monitor stopped")
+    
+    def _run_position_monitor(self):
+        """Position monitor loop: run due monitor phases, then sleep until the next one"""
+        while not self._monitor_stop.is_set():
+            try:
+                if not self._emergency_stop:
+                    self.run_due_monitors()
+            except Exception as e:
+                self.logger.error(f"❌ Position monitor error: {e}")
+            wait_seconds = self._monitor_scheduler.seconds_until_due()
+            idle = self._config['max_idle_seconds']
+            self._monitor_stop.wait(idle if wait_seconds is None else min(wait_seconds, idle))
+    
+    def run_due_monitors(self, now: Optional[float] = None) -> Dict[str, Dict[str, Any]]:
+        """Run the monitor phases that are due (in parallel), returning module results"""
+        active = {module.module_name: module for module in self.registry.get_active_modules()}
+        modules = [active[task.module_name] for task in self._monitor_scheduler.pop_due(now)
+                   if task.module_name in active]
+        if not modules:
+            return {}
+        executor = self._monitor_executor
+        if executor is None:
+            return {module.module_name: self._monitor_module(module) for module in modules}
+        futures = {executor.submit(self._monitor_module, module): module.module_name for module in modules}
+        wait(futures)
+        return {name: future.result() for future, name in futures.items()}
+    
+    def _monitor_module(self, module: TradingModule) -> Dict[str, Any]:
+        """One monitor pass; exits are buffered for the module's persist phase"""
+        result = self._new_module_result()
+        start = time.time()
+        try:
+            exit_results = module.monitor_positions()
+            if exit_results:
+                self._finish_module_cycle(module, result, [], [], exit_results, persist=False)
+            result['success'] = True
+        except Exception as e:
+            result['error'] = str(e)
+            self.logger.error(f"Error monitoring {module.module_name}: {e}")
+        result['duration_seconds'] = time.time() - start
+        return result
+    
+    def _resize_module_executor(self):
+        """One module worker per registered module (at least max_concurrent_modules)"""
+        workers = max(self._config['max_concurrent_modules'], len(self.registry._modules))
+        if workers <= self._module_workers:
+            return
+        old_executor = self._module_executor
+        self._module_executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='module')
+        self._module_workers = workers
+        if self._event_loop is not None and not self._event_loop.is_closed():
+            self._event_loop.set_default_executor(self._module_executor)
+        old_executor.shutdown(wait=False)  # Runs already submitted finish on the old workers
+    
+    def _resize_http_pool(self):
+        """One pooled connection per host for every symbol worker of the modules that can run at once"""
+        workers = []
+        for module in self.registry._modules.values():
+            concurrency = getattr(getattr(module, 'symbol_fanout', None), 'max_concurrency', 1)
+            workers.append(concurrency if isinstance(concurrency, int) else 1)
+        max_modules = self._module_workers
+        concurrent_workers = sum(sorted(workers, reverse=True)[:max_modules])
+        get_http_pool().resize(max(max_modules, concurrent_workers))
     
     def start_trading_loop(self, cycle_delay: int = 120):
         """
@@ -119,6 +352,9 @@ class ModularOrchestrator:
             cycle_delay: Delay between cycles in seconds
         """
         self._cycle_delay = cycle_delay
+        if self._config['enable_cadence_scheduler']:
+            self.set_cadence_scheduling(True, default_interval_seconds=cycle_delay)
+            return self._run_scheduled_loop()
         self.logger.info(f"Starting trading loop with {cycle_delay}s cycle delay")
         
         try:
@@ -152,10 +388,30 @@ class ModularOrchestrator:
         finally:
             self._cleanup()
     
-    def run_single_cycle(self) -> Dict[str, Any]:
+    def _run_scheduled_loop(self):
+        """Trading loop that sleeps until the next module phase is due"""
+        self.logger.info("Starting trading loop with per-module cadences")
+        self.start_position_monitor()
+        try:
+            while True:
+                if self.run_due_work() is not None:
+                    self._run_periodic_maintenance()
+                time.sleep(self.seconds_until_due())
+        except KeyboardInterrupt:
+            self.logger.info("Trading loop interrupted by user")
+        except Exception as e:
+            self.logger.error(f"Trading loop error: {e}")
+            raise
+        finally:
+            self._cleanup()
+    
+    def run_single_cycle(self, due: Optional[Dict[str, FrozenSet[Phase]]] = None) -> Dict[str, Any]:
         """
         Run a single trading cycle and return results.
         
+        Args:
+            due: Phases to run per module (every phase of every active module when None)
+        
         Returns:
             Dictionary with cycle results and metrics
         """
@@ -163,7 +419,7 @@ class ModularOrchestrator:
         self.logger.info(f"Starting trading cycle {self._cycle_count + 1}")
         
         try:
-            results = self._run_trading_cycle()
+            results = self._run_trading_cycle(due)
             cycle_duration = time.time() - cycle_start
             
             # Update orchestrator metrics after cycle completion
@@ -189,8 +445,8 @@ class ModularOrchestrator:
                 }
             }
     
-    def _run_trading_cycle(self) -> Dict[str, Any]:
-        """Execute a complete trading cycle across all modules"""
+    def _run_trading_cycle(self, due: Optional[Dict[str, FrozenSet[Phase]]] = None) -> Dict[str, Any]:
+        """Execute a trading cycle across all modules (or only the due phases of due modules)"""
         self._cycle_count += 1
         
         # CRITICAL SAFETY: Check emergency stop only
@@ -220,16 +476,28 @@ class ModularOrchestrator:
         
         # Get active modules
         active_modules = self.registry.get_active_modules()
+        if due is not None:
+            by_name = {module.module_name: module for module in active_modules}
+            active_modules = [by_name[name] for name in due if name in by_name]
         if not active_modules:
-            self.logger.warning("No active modules found")
+            if due is None:
+                self.logger.warning("No active modules found")
             return cycle_results
         
         try:
-            # Execute modules in parallel or sequential
-            if self._config['enable_parallel_execution']:
-                module_results = self._run_modules_parallel(active_modules)
+            # Build one shared snapshot of quotes, bars and clock for every module that scans
+            self._publish_market_data_snapshot([
+                module for module in active_modules
+                if due is None or Phase.SCAN in due[module.module_name]
+            ])
+            
+            # Execute modules on the event loop, in parallel threads or sequentially
+            if self._config['enable_async_execution']:
+                module_results = self._run_modules_async(active_modules, due)
+            elif self._config['enable_parallel_execution']:
+                module_results = self._run_modules_parallel(active_modules, due)
             else:
-                module_results = self._run_modules_sequential(active_modules)
+                module_results = self._run_modules_sequential(active_modules, due)
             
             # Process results
             for module_name, result in module_results.items():
@@ -267,42 +535,269 @@ class ModularOrchestrator:
             cycle_results['success'] = False
             cycle_results['error'] = str(e)
             return cycle_results
+        finally:
+            # Snapshot is only valid for the cycle that built it
+            self._clear_market_data_snapshot(active_modules)
     
-    def _run_modules_parallel(self, modules: List[TradingModule]) -> Dict[str, Any]:
-        """Run multiple modules in parallel"""
-        results = {}
+    def _publish_market_data_snapshot(self, modules: List[TradingModule]):
+        """Build the cycle's MarketDataSnapshot and inject it into modules and the executor"""
+        if not modules or not self._config.get('enable_market_data_snapshot', True) or self._snapshot_builder is None:
+            return
         
-        with ThreadPoolExecutor(max_workers=self._config['max_concurrent_modules']) as executor:
-            # Submit all module tasks
-            future_to_module = {
-                executor.submit(self._run_single_module, module): module.module_name
-                for module in modules
-            }
-            
-            # Collect results with timeout
-            for future in as_completed(future_to_module, timeout=self._config['cycle_timeout_seconds']):
-                module_name = future_to_module[future]
+        try:
+            symbols = set()
+            for module in modules:
                 try:
-                    results[module_name] = future.result()
+                    symbols.update(module.snapshot_symbols)
                 except Exception as e:
-                    self.logger.error(f"Module {module_name} failed: {e}")
-                    results[module_name] = {
-                        'success': False,
-                        'error': str(e),
-                        'opportunities_count': 0,
-                        'trades_count': 0,
-                        'successful_trades': 0
-                    }
+                    self.logger.warning(f"⚠️ Could not get snapshot symbols for {module.module_name}: {e}")
+            
+            if self._regime_builder is not None and self._config.get('enable_cycle_regime', True):
+                symbols.update(self._regime_builder.symbols)
+            
+            snapshot = self._snapshot_builder.build(symbols, cycle_id=self._cycle_count)
+        except Exception as e:
+            self.logger.warning(f"⚠️ Market data snapshot failed: {e} - modules will query the API directly")
+            return
+        
+        snapshot = self._attach_cycle_regime(snapshot)
+        self._market_data_snapshot = snapshot
+        for module in modules:
+            module.set_market_data(snapshot)
+        if hasattr(self.order_executor, 'set_market_data'):
+            self.order_executor.set_market_data(snapshot)
+    
+    def _attach_cycle_regime(self, snapshot: MarketDataSnapshot) -> MarketDataSnapshot:
+        """Compute the cycle's market regime once and attach it to the snapshot"""
+        if self._regime_builder is None or not self._config.get('enable_cycle_regime', True):
+            return snapshot
+        try:
+            regime = self._regime_builder.build(snapshot, cycle_id=self._cycle_count)
+        except Exception as e:
+            self.logger.warning(f"⚠️ Cycle regime failed: {e} - modules will assess the regime themselves")
+            return snapshot
+        return dataclasses.replace(snapshot, regime=regime)
+    
+    def _clear_market_data_snapshot(self, modules: List[TradingModule]):
+        """Detach the cycle snapshot from modules and the executor"""
+        if self._market_data_snapshot is None:
+            return
+        self._market_data_snapshot = None
+        for module in modules:
+            module.set_market_data(None)
+        if hasattr(self.order_executor, 'set_market_data'):
+            self.order_executor.set_market_data(None)
+    
+    @staticmethod
+    def _phases_for(module: TradingModule, due: Optional[Dict[str, FrozenSet[Phase]]]) -> FrozenSet[Phase]:
+        return ALL_PHASES if due is None else due.get(module.module_name, ALL_PHASES)
+    
+    def _run_modules_parallel(self, modules: List[TradingModule],
+                              due: Optional[Dict[str, FrozenSet[Phase]]] = None) -> Dict[str, Any]:
+        """
+        Run multiple modules in parallel, each within its own time budget.
+        
+        Modules stop starting new work when their budget runs out and return
+        partial results. One still running after the grace period is
+        abandoned: its token is cancelled, it is reported as failed and the
+        cycle goes on without waiting for it.
+        """
+        results = {}
+        
+        # Submit all module tasks
+        future_to_module = {}
+        for module in modules:
+            token = self._new_module_token(module)
+            future = self._module_executor.submit(self._run_single_module, module, self._phases_for(module, due), token)
+            future_to_module[future] = (module, token)
+        
+        # Collect results until the last budget plus grace (capped by the cycle timeout)
+        timeout = min(self._config['cycle_timeout_seconds'],
+                      max((token.budget_seconds for _, token in future_to_module.values()), default=0)
+                      + self._config['cancel_grace_seconds'])
+        done, _ = wait(future_to_module, timeout=timeout)
+        for future, (module, token) in future_to_module.items():
+            module_name = module.module_name
+            if future not in done:
+                token.cancel("abandoned")
+                results[module_name] = self._abandoned_result(module, token)
+                continue
+            try:
+                results[module_name] = future.result()
+            except Exception as e:
+                self.logger.error(f"Module {module_name} failed: {e}")
+                results[module_name] = {
+                    'success': False,
+                    'error': str(e),
+                    'opportunities_count': 0,
+                    'trades_count': 0,
+                    'successful_trades': 0
+                }
         
         return results
     
-    def _run_modules_sequential(self, modules: List[TradingModule]) -> Dict[str, Any]:
+    def _module_budget(self, module: TradingModule) -> float:
+        """Seconds a module run may take: custom_params['budget_seconds'] or module_timeout_seconds"""
+        params = getattr(module.config, 'custom_params', None)
+        budget = params.get('budget_seconds') if isinstance(params, dict) else None
+        return float(budget if budget is not None else self._config['module_timeout_seconds'])
+    
+    def _new_module_token(self, module: TradingModule) -> CancellationToken:
+        return CancellationToken(self._module_budget(module), module.module_name)
+    
+    def _abandoned_result(self, module: TradingModule, token: CancellationToken) -> Dict[str, Any]:
+        result = self._new_module_result()
+        result['error'] = f"timed out after {token.budget_seconds + self._config['cancel_grace_seconds']:g}s"
+        result['skipped_symbols'] = token.skipped
+        result['partial'] = True
+        self.logger.error(f"⏱️ {module.module_name}: abandoned - {result['error']} "
+                          f"(its run winds down in the background; the next run waits for it)")
+        return result
+    
+    def _record_budget(self, module: TradingModule, result: Dict[str, Any], token: CancellationToken):
+        """Report the symbols a module skipped because its budget ran out"""
+        result['skipped_symbols'] = token.skipped
+        result['partial'] = token.cancelled or bool(result['skipped_symbols'])
+        if result['partial']:
+            skipped = result['skipped_symbols']
+            self.logger.warning(f"⏱️ {module.module_name}: {token.budget_seconds:g}s budget spent - partial results, "
+                                f"{len(skipped)} symbols skipped{': ' + ', '.join(skipped[:10]) if skipped else ''}")
+    
+    def _claim_module_run(self, module: TradingModule, token: CancellationToken) -> Optional[CancellationToken]:
+        """Mark the module as running; returns the token of a run still in flight instead"""
+        with self._running_lock:
+            running = self._running_modules.get(module.module_name)
+            if running is not None:
+                return running
+            self._running_modules[module.module_name] = token
+            return None
+    
+    def _release_module_run(self, module: TradingModule, token: CancellationToken):
+        with self._running_lock:
+            if self._running_modules.get(module.module_name) is token:
+                del self._running_modules[module.module_name]
+    
+    def _get_event_loop(self) -> asyncio.AbstractEventLoop:
+        """The orchestrator's event loop; sync module methods run on the shared module executor"""
+        if self._event_loop is None or self._event_loop.is_closed():
+            self._event_loop = asyncio.new_event_loop()
+            self._event_loop.set_default_executor(self._module_executor)
+        return self._event_loop
+    
+    def _run_modules_async(self, modules: List[TradingModule],
+                           due: Optional[Dict[str, FrozenSet[Phase]]] = None) -> Dict[str, Any]:
+        """Run every module concurrently on the orchestrator's event loop"""
+        return self._get_event_loop().run_until_complete(self.run_modules_async(modules, due))
+    
+    async def run_modules_async(self, modules: List[TradingModule],
+                                due: Optional[Dict[str, FrozenSet[Phase]]] = None) -> Dict[str, Any]:
+        """
+        Run one cycle of every module concurrently with asyncio.gather.
+        
+        Each module gets its time budget and returns partial results when it
+        runs out; a module still running after the grace period is cancelled
+        and reported as failed without affecting the others. Sync modules
+        adapted through the executor cannot be interrupted mid-call: their
+        worker thread finishes in the background, and the module (with the
+        symbols it is ordering) stays claimed until it does.
+        """
+        results = await asyncio.gather(*(self._run_single_module_async(module, self._phases_for(module, due))
+                                         for module in modules))
+        return {module.module_name: result for module, result in zip(modules, results)}
+    
+    async def _run_single_module_async(self, module: TradingModule,
+                                       phases: FrozenSet[Phase] = ALL_PHASES) -> Dict[str, Any]:
+        """Run the phases of a single module within its budget (cancelled after the grace period)"""
+        module_start = time.time()
+        result = self._new_module_result()
+        token = self._new_module_token(module)
+        in_flight = self._claim_module_run(module, token)
+        if in_flight is not None:
+            return self._busy_result(module, in_flight)
+        timeout = token.budget_seconds + self._config['cancel_grace_seconds']
+        try:
+            with cancellation_scope(token):  # Copied into to_thread calls: sync hooks see the token
+                await asyncio.wait_for(self._module_cycle_async(module, result, phases), timeout=timeout)
+            result['success'] = True
+            self._record_budget(module, result, token)
+        except asyncio.TimeoutError:
+            token.cancel("abandoned")
+            result['error'] = f"timed out after {timeout:g}s"
+            result['skipped_symbols'] = token.skipped
+            result['partial'] = True
+            self.logger.error(f"⏱️ {module.module_name}: cycle cancelled - {result['error']}")
+        except Exception as e:
+            result['error'] = str(e)
+            self.logger.error(f"Error running {module.module_name}: {e}")
+        finally:
+            # A cancelled coroutine may leave a hook running in its worker thread: the module
+            # stays claimed until that thread returns, so its next run cannot overlap it
+            token.when_idle(lambda: self._release_module_run(module, token))
+        result['duration_seconds'] = time.time() - module_start
+        return result
+    
+    async def _module_cycle_async(self, module: TradingModule, result: Dict[str, Any],
+                                  phases: FrozenSet[Phase] = ALL_PHASES):
+        """Analyze, execute, monitor and save one module through its async hooks"""
+        self.logger.info(f"🔄 EXECUTING MODULE (async): {module.module_name}")
+        
+        opportunities, trade_results = [], []
+        if Phase.SCAN in phases:
+            opportunities = await module.analyze_opportunities_async()
+            result['opportunities_count'] = len(opportunities)
+            self.logger.info(f"📊 {module.module_name}: Found {len(opportunities)} opportunities")
+            
+            valid_opportunities = await to_thread(
+                lambda: [opp for opp in opportunities if module.validate_opportunity(opp)],
+                executor=self._io_executor
+            )
+            
+            if valid_opportunities and not self._stage_aborted(module, "execution"):
+                if self._has_native_hook(module, 'execute_trades_async'):
+                    trade_results = await self._execute_opportunities_async(module, valid_opportunities)
+                else:
+                    # Symbol locks are taken and released in the thread that places the orders
+                    trade_results = await to_thread(self._execute_opportunities, module, valid_opportunities)
+        
+        exit_results = []
+        if Phase.MONITOR in phases and not self._stage_aborted(module, "monitoring"):
+            exit_results = await module.monitor_positions_async()
+        
+        # Firebase writes are blocking - keep them off the event loop
+        await to_thread(self._finish_module_cycle, module, result, opportunities, trade_results,
+                        exit_results, Phase.PERSIST in phases, executor=self._io_executor)
+    
+    @staticmethod
+    def _has_native_hook(module: TradingModule, hook: str) -> bool:
+        """Whether the module overrides an async hook instead of using the to_thread default"""
+        return getattr(type(module), hook) is not getattr(TradingModule, hook)
+    
+    async def _execute_opportunities_async(self, module: TradingModule,
+                                           opportunities: List[TradeOpportunity]) -> List[TradeResult]:
+        """
+        Execute through a native async hook. The symbol locks outlive a
+        cancelled await: they are released only once none of the run's
+        to_thread calls (which may still be placing orders) is running.
+        """
+        locks = get_symbol_locks()
+        held = locks.acquire_many([opp.symbol for opp in opportunities], f"{module.module_name}:scan")
+        try:
+            opportunities = self._held_opportunities(module, opportunities, held)
+            if not opportunities:
+                return []
+            self.logger.info(f"🚀 {module.module_name}: Executing {len(opportunities)} valid trades...")
+            return await module.execute_trades_async(opportunities)
+        finally:
+            module.cancel_token.when_idle(lambda: locks.release_many(held))
+    
+    def _run_modules_sequential(self, modules: List[TradingModule],
+                                due: Optional[Dict[str, FrozenSet[Phase]]] = None) -> Dict[str, Any]:
         """Run modules sequentially"""
         results = {}
         
         for module in modules:
             try:
-                results[module.module_name] = self._run_single_module(module)
+                results[module.module_name] = self._run_single_module(module, self._phases_for(module, due))
             except Exception as e:
                 self.logger.error(f"Module {module.module_name} failed: {e}")
                 results[module.module_name] = {
@@ -315,77 +810,64 @@ class ModularOrchestrator:
         
         return results
     
-    def _run_single_module(self, module: TradingModule) -> Dict[str, Any]:
-        """Run a complete cycle for a single module"""
+    def _run_single_module(self, module: TradingModule, phases: FrozenSet[Phase] = ALL_PHASES,
+                           token: Optional[CancellationToken] = None) -> Dict[str, Any]:
+        """Run a complete cycle (or the given phases) for a single module within its time budget"""
         module_start = time.time()
-        result = {
-            'success': False,
-            'opportunities_count': 0,
-            'trades_count': 0,
-            'trades_passed': 0,        # Orders successfully executed
-            'successful_trades': 0,    # Profitable trades only
-            'exits_count': 0,
-            'duration_seconds': 0.0
-        }
+        result = self._new_module_result()
+        token = token or self._new_module_token(module)
+        in_flight = self._claim_module_run(module, token)
+        if in_flight is not None:
+            return self._busy_result(module, in_flight)
         
+        try:
+            with cancellation_scope(token):
+                return self._module_cycle(module, result, phases, token, module_start)
+        finally:
+            self._release_module_run(module, token)
+    
+    def _module_cycle(self, module: TradingModule, result: Dict[str, Any], phases: FrozenSet[Phase],
+                      token: CancellationToken, module_start: float) -> Dict[str, Any]:
+        """Analyze, execute, monitor and save one module (checking the token between stages)"""
         try:
             # EXPLICIT MODULE EXECUTION LOGGING
             self.logger.info(f"🔄 EXECUTING MODULE: {module.module_name}")
             
-            # 1. Analyze opportunities
-            self.logger.info(f"📊 {module.module_name}: Starting opportunity analysis...")
-            opportunities = module.analyze_opportunities()
-            result['opportunities_count'] = len(opportunities)
-            self.logger.info(f"📊 {module.module_name}: Found {len(opportunities)} opportunities")
-            
-            # 2. Validate and filter opportunities
-            valid_opportunities = [
-                opp for opp in opportunities 
-                if module.validate_opportunity(opp)
-            ]
-            
-            # 3. Execute valid trades
-            trade_results = []
-            if valid_opportunities:
-                self.logger.info(f"🚀 {module.module_name}: Executing {len(valid_opportunities)} valid trades...")
-                trade_results = module.execute_trades(valid_opportunities)
-                result['trades_count'] = len(trade_results)
-                result['trades_passed'] = sum(1 for tr in trade_results if tr.passed)
-                result['successful_trades'] = sum(1 for tr in trade_results if tr.success)
-                self.logger.info(f"✅ {module.module_name}: {result['trades_passed']} passed, {result['successful_trades']} profitable")
-            else:
-                self.logger.info(f"⚠️ {module.module_name}: No valid opportunities to execute")
+            opportunities, trade_results = [], []
+            if Phase.SCAN in phases:
+                # 1. Analyze opportunities
+                self.logger.info(f"📊 {module.module_name}: Starting opportunity analysis...")
+                opportunities = module.analyze_opportunities()
+                result['opportunities_count'] = len(opportunities)
+                self.logger.info(f"📊 {module.module_name}: Found {len(opportunities)} opportunities")
+                
+                # 2. Validate and filter opportunities
+                valid_opportunities = [
+                    opp for opp in opportunities 
+                    if module.validate_opportunity(opp)
+                ]
+                
+                # 3. Execute valid trades (symbols the position monitor is exiting are skipped)
+                if valid_opportunities and self._stage_aborted(module, "execution"):
+                    valid_opportunities = []
+                if valid_opportunities:
+                    trade_results = self._execute_opportunities(module, valid_opportunities)
+                else:
+                    self.logger.info(f"⚠️ {module.module_name}: No valid opportunities to execute")
             
             # 4. Monitor existing positions for exits
-            self.logger.info(f"👁️ {module.module_name}: Monitoring positions for exits...")
-            exit_results = module.monitor_positions()
-            result['exits_count'] = len(exit_results)
-            self.logger.info(f"🚪 {module.module_name}: {len(exit_results)} exit actions taken")
-            
-            # Include exit results in trade counting
-            if exit_results:
-                all_trades = trade_results + exit_results
-                result['trades_count'] = len(all_trades)
-                result['trades_passed'] = sum(1 for tr in all_trades if tr.passed)
-                result['successful_trades'] = sum(1 for tr in all_trades if tr.success)
-            
-            # 5. Save results
-            for opp in opportunities:
-                module.save_opportunity(opp)
+            exit_results = []
+            if Phase.MONITOR in phases and not self._stage_aborted(module, "monitoring"):
+                self.logger.info(f"👁️ {module.module_name}: Monitoring positions for exits...")
+                exit_results = module.monitor_positions()
             
-            for trade_result in trade_results + exit_results:
-                module.save_result(trade_result)
-            
-            # 6. Update module health
-            self.registry.update_health(module.module_name, ModuleHealthStatus.HEALTHY)
+            # 5. Count and save results, update module health
+            self._finish_module_cycle(module, result, opportunities, trade_results, exit_results,
+                                      Phase.PERSIST in phases)
             
             result['success'] = True
+            self._record_budget(module, result, token)
             result['duration_seconds'] = time.time() - module_start
-            
-            self.logger.info(f"📊 {module.module_name}: {result['opportunities_count']} opps, "
-                            f"{result['trades_count']} trades ({result['trades_passed']} passed, "
-                            f"{result['successful_trades']} profitable), {result['exits_count']} exits")
-            
             return result
             
         except Exception as e:
@@ -394,6 +876,93 @@ class ModularOrchestrator:
             self.logger.error(f"Error running {module.module_name}: {e}")
             return result
     
+    def _execute_opportunities(self, module: TradingModule,
+                               opportunities: List[TradeOpportunity]) -> List[TradeResult]:
+        """Execute the opportunities whose symbols the scan can lock, holding the locks while ordering"""
+        with get_symbol_locks().hold_many([opp.symbol for opp in opportunities],
+                                          f"{module.module_name}:scan") as held:
+            opportunities = self._held_opportunities(module, opportunities, held)
+            if not opportunities:
+                return []
+            self.logger.info(f"🚀 {module.module_name}: Executing {len(opportunities)} valid trades...")
+            return module.execute_trades(opportunities)
+    
+    def _held_opportunities(self, module: TradingModule, opportunities: List[TradeOpportunity],
+                            held: set) -> List[TradeOpportunity]:
+        """Opportunities whose symbol lock the scan holds; the rest wait for the next scan"""
+        skipped = [opp.symbol for opp in opportunities if opp.symbol not in held]
+        if skipped:
+            self.logger.info(f"⏳ {module.module_name}: skipping {', '.join(skipped)} - position exit in progress")
+        return [opp for opp in opportunities if opp.symbol in held]
+    
+    def _stage_aborted(self, module: TradingModule, stage: str) -> bool:
+        """
+        Check between stages. A spent budget only stops new symbols: the
+        opportunities and exits already found still go through. Only an
+        explicit cancellation (the run was abandoned) drops the later stages.
+        """
+        token = module.cancel_token
+        if token.aborted:
+            self.logger.warning(f"⏱️ {module.module_name}: {stage} skipped - run {token.reason}")
+            return True
+        return False
+    
+    def _busy_result(self, module: TradingModule, in_flight: CancellationToken) -> Dict[str, Any]:
+        """Result for a module whose previous (abandoned) run has not finished yet"""
+        result = self._new_module_result()
+        result['error'] = f"previous run still in flight ({in_flight.reason or 'running'})"
+        self.logger.warning(f"⏱️ {module.module_name}: skipped - {result['error']}")
+        return result
+    
+    @staticmethod
+    def _new_module_result() -> Dict[str, Any]:
+        return {
+            'success': False,
+            'opportunities_count': 0,
+            'trades_count': 0,
+            'trades_passed': 0,        # Orders successfully executed
+            'successful_trades': 0,    # Profitable trades only
+            'exits_count': 0,
+            'skipped_symbols': [],     # Left unanalyzed when the module's budget ran out
+            'partial': False,          # Budget ran out: results cover only part of the module's symbols
+            'duration_seconds': 0.0
+        }
+    
+    def _finish_module_cycle(self, module: TradingModule, result: Dict[str, Any],
+                             opportunities: List[TradeOpportunity], trade_results: List[TradeResult],
+                             exit_results: List[TradeResult], persist: bool = True):
+        """Count trades and exits into the module result, save them (when persisting) and mark the module healthy"""
+        all_trades = trade_results + exit_results
+        result['trades_count'] = len(all_trades)
+        result['trades_passed'] = sum(1 for tr in all_trades if tr.passed)
+        result['successful_trades'] = sum(1 for tr in all_trades if tr.success)
+        result['exits_count'] = len(exit_results)
+        self.logger.info(f"🚪 {module.module_name}: {len(exit_results)} exit actions taken")
+        
+        with self._unsaved_lock:
+            unsaved = self._unsaved.setdefault(module.module_name, {'opportunities': [], 'results': []})
+            unsaved['opportunities'].extend(opportunities)
+            unsaved['results'].extend(all_trades)
+        if persist:
+            self._persist_module_results(module)
+        
+        self.registry.update_health(module.module_name, ModuleHealthStatus.HEALTHY)
+        
+        self.logger.info(f"📊 {module.module_name}: {result['opportunities_count']} opps, "
+                        f"{result['trades_count']} trades ({result['trades_passed']} passed, "
+                        f"{result['successful_trades']} profitable), {result['exits_count']} exits")
+    
+    def _persist_module_results(self, module: TradingModule):
+        """Save a module's opportunities and results buffered since its last persist phase"""
+        with self._unsaved_lock:
+            unsaved = self._unsaved.pop(module.module_name, None)
+        if not unsaved:
+            return
+        for opp in unsaved['opportunities']:
+            module.save_opportunity(opp)
+        for trade_result in unsaved['results']:
+            module.save_result(trade_result)
+    
     def _save_cycle_results(self, cycle_results: Dict[str, Any]):
         """Save cycle results to Firebase"""
         try:
@@ -417,25 +986,39 @@ class ModularOrchestrator:
             (datetime.now() - self._orchestrator_metrics['start_time']).total_seconds() / 3600
         )
     
-    def _run_periodic_maintenance(self):
-        """Run periodic maintenance tasks"""
-        now = datetime.now()
+    def _run_periodic_maintenance(self, now: Optional[float] = None):
+        """
+        Run periodic maintenance tasks.
+        
+        ML optimization and rebalancing are keyed on elapsed time (monotonic
+        seconds), not cycle counts, so their cadence does not depend on how
+        often the loop runs cycles.
+        """
+        current_time = datetime.now()
+        now = time.monotonic() if now is None else now
         
         # Health checks
         if (self._last_cycle_time is None or 
-            (now - self._last_cycle_time).total_seconds() >= self._config['health_check_interval']):
+            (current_time - self._last_cycle_time).total_seconds() >= self._config['health_check_interval']):
             self._run_health_checks()
         
+        # Intervals count from the first maintenance pass
+        if self._last_optimization_time is None:
+            self._last_optimization_time = now
+        if self._last_rebalance_time is None:
+            self._last_rebalance_time = now
+        
         # ML optimization
-        if (self.ml_optimizer and 
-            self._cycle_count % (self._config['optimization_interval'] // self._cycle_delay) == 0):
+        if self.ml_optimizer and now - self._last_optimization_time >= self._config['optimization_interval']:
             self._run_ml_optimization()
+            self._last_optimization_time = now
         
-        # Portfolio rebalancing (run every 10 cycles for diversification)
-        if (self.portfolio_rebalancer and self._cycle_count % 10 == 0):
+        # Portfolio rebalancing for diversification
+        if self.portfolio_rebalancer and now - self._last_rebalance_time >= self._config['rebalance_interval']:
             self._run_portfolio_rebalancing()
+            self._last_rebalance_time = now
         
-        self._last_cycle_time = now
+        self._last_cycle_time = current_time
     
     def _run_health_checks(self):
         """Run health checks on all modules"""
@@ -651,6 +1234,11 @@ class ModularOrchestrator:
         else:
             self.logger.warning(f"Module not found: {module_name}")
     
+    def set_async_execution(self, enabled: bool):
+        """Switch between the asyncio execution mode and thread/sequential execution"""
+        self._config['enable_async_execution'] = enabled
+        self.logger.info(f"Async module execution {'enabled' if enabled else 'disabled'}")
+    
     def disable_module(self, module_name: str):
         """Disable a trading module"""
         module = self.registry.get_module(module_name)
@@ -669,6 +1257,8 @@ class ModularOrchestrator:
                     setattr(module.config, key, value)
                 else:
                     module.config.custom_params[key] = value
+            if any(key.endswith('_interval_seconds') for key in config_updates):
+                self._schedule_module(module)
             self.logger.info(f"Updated config for {module_name}: {config_updates}")
         else:
             self.logger.warning(f"Module not found: {module_name}")
@@ -715,15 +1305,31 @@ class ModularOrchestrator:
             if hasattr(self, '_running'):
                 self._running = False
             
+            # Stop exit monitoring and tell in-flight module runs to wind down before the modules go away
+            self.stop_position_monitor()
+            with self._running_lock:
+                for token in self._running_modules.values():
+                    token.cancel("shutdown")
+            
             # Shutdown all modules
             for module_name, module in self.registry._modules.items():
                 try:
+                    self._persist_module_results(module)
                     if hasattr(module, 'shutdown'):
                         module.shutdown()
+                    fanout = getattr(module, '_symbol_fanout', None)
+                    if fanout is not None:
+                        fanout.shutdown()
                     self.logger.info(f"✅ Shutdown module: {module_name}")
                 except Exception as e:
                     self.logger.error(f"❌ Error shutting down module {module_name}: {e}")
             
+            # Stop the event loop and module workers
+            if self._event_loop is not None and not self._event_loop.is_closed():
+                self._event_loop.close()
+            self._module_executor.shutdown(wait=False)
+            self._io_executor.shutdown(wait=False)
+            
             # Shutdown ML optimizer
             if self.ml_optimizer and hasattr(self.ml_optimizer, 'shutdown'):
                 try:
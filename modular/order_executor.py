@@ -49,6 +49,10 @@ class ModularOrderExecutor:
         self.pending_orders = {}
         self.executed_orders = {}
         
+        # Per-cycle MarketDataSnapshot injected by the orchestrator
+        self.market_data = None
+        self.snapshot_max_age_seconds = 120  # Same stricter threshold used for execution quotes
+        
         # CRITICAL SAFETY: Initialize comprehensive trade history tracker with Firebase
         # This prevents the rapid-fire trading that caused $36,462 loss
         self.trade_tracker = TradeHistoryTracker(
@@ -210,9 +214,35 @@ class ModularOrderExecutor:
             self.logger.warning(f"Could not check pending orders: {e}")
             return False
     
+    def set_market_data(self, snapshot):
+        """Attach the current cycle's MarketDataSnapshot (None clears it)."""
+        self.market_data = snapshot
+    
+    def _get_snapshot_price(self, symbol: str) -> Optional[float]:
+        """Price from the cycle snapshot if the quote is fresh enough for execution."""
+        if self.market_data is None:
+            return None
+        try:
+            quote = self.market_data.get_quote(symbol)
+            if quote is None or not quote.price:
+                return None
+            age_seconds = quote.age_seconds()
+            if age_seconds is not None and age_seconds > self.snapshot_max_age_seconds:
+                self.logger.debug(f"Snapshot quote for {symbol} is {age_seconds:.0f}s old - re-quoting")
+                return None
+            return quote.price
+        except Exception as e:
+            self.logger.debug(f"Snapshot price lookup failed for {symbol}: {e}")
+            return None
+    
     def _get_current_price(self, symbol: str) -> Optional[float]:
         """Get current market price for a symbol."""
         try:
+            # Reuse the price every module saw this cycle instead of re-quoting
+            snapshot_price = self._get_snapshot_price(symbol)
+            if snapshot_price:
+                return snapshot_price
+            
             # Handle crypto symbols differently
             if 'USD' in symbol and len(symbol) <= 7:
                 # Crypto symbol - convert format
@@ -349,8 +379,11 @@ class ModularOrderExecutor:
     def _is_market_open(self) -> bool:
         """Check if US stock market is currently open."""
         try:
-            clock = self.api.get_clock()
-            is_open = getattr(clock, 'is_open', False)
+            if self.market_data is not None and self.market_data.is_market_open is not None:
+                is_open = self.market_data.is_market_open
+            else:
+                clock = self.api.get_clock()
+                is_open = getattr(clock, 'is_open', False)
             
             if not is_open:
                 self.logger.warning(f"🚨 MARKET CLOSED: Cannot execute stock orders outside market hours")
@@ -0,0 +1,232 @@
+"""
+Per-Module Cadence Scheduler
+
+Deadline-based scheduling of module work instead of one global cycle delay.
+Every module declares a ModuleCadence: an interval, an active calendar and a
+priority for each of its phases (scan for new trades, monitor positions,
+persist results). The orchestrator sleeps until the earliest deadline and
+runs only the phases that are due, so stocks and options stay idle outside
+market hours while crypto keeps its own (faster) cadence around the clock.
+"""
+
+import heapq
+import itertools
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from enum import Enum
+from typing import Any, Dict, FrozenSet, List, Mapping, Optional, Tuple
+
+
+class Phase(Enum):
+    SCAN = "scan"        # analyze_opportunities + execute_trades
+    MONITOR = "monitor"  # monitor_positions
+    PERSIST = "persist"  # save buffered opportunities and results
+
+
+ALL_PHASES = frozenset(Phase)
+
+
+class Calendar(Enum):
+    ALWAYS = "always"              # 24/7 (crypto, intelligence)
+    MARKET_HOURS = "market_hours"  # US equity session only
+
+
+@dataclass(frozen=True)
+class PhaseCadence:
+    """When one phase of a module runs"""
+    interval_seconds: float
+    calendar: Calendar = Calendar.ALWAYS
+    priority: int = 100  # Lower runs first when several phases are due together
+
+
+@dataclass(frozen=True)
+class ModuleCadence:
+    """Cadence of each phase of a module"""
+    scan: PhaseCadence
+    monitor: PhaseCadence
+    persist: PhaseCadence
+
+    @classmethod
+    def uniform(cls, interval_seconds: float, calendar: Calendar = Calendar.ALWAYS,
+                priority: int = 100) -> 'ModuleCadence':
+        """Every phase on the same interval (the legacy global cycle)"""
+        cadence = PhaseCadence(interval_seconds, calendar, priority)
+        return cls(scan=cadence, monitor=cadence, persist=cadence)
+
+    def for_phase(self, phase: Phase) -> PhaseCadence:
+        return getattr(self, phase.value)
+
+    def with_overrides(self, params: Mapping[str, Any]) -> 'ModuleCadence':
+        """Apply '<phase>_interval_seconds' overrides (e.g. from ModuleConfig.custom_params)"""
+        phases = {}
+        for phase in Phase:
+            cadence = self.for_phase(phase)
+            interval = params.get(f"{phase.value}_interval_seconds")
+            phases[phase.value] = cadence if interval is None else PhaseCadence(
+                float(interval), cadence.calendar, cadence.priority)
+        return ModuleCadence(**phases)
+
+
+class MarketHours:
+    """
+    US equity session for MARKET_HOURS phases.
+
+    Uses the broker clock when an API client is available (holiday aware),
+    cached until the next open/close transition so a closed market costs one
+    request per session; otherwise regular hours, 9:30-16:00 ET on weekdays.
+    """
+
+    def __init__(self, api=None, logger: Optional[logging.Logger] = None):
+        self.api = api
+        self.logger = logger or logging.getLogger(self.__class__.__name__)
+        self._clock: Optional[Tuple[bool, float, float]] = None  # (is_open, next_open, valid_until)
+
+    def session(self, now: float) -> Tuple[bool, float]:
+        """(is_open, next open as epoch seconds - now while open) at now"""
+        if self.api is not None:
+            if self._clock is None or now >= self._clock[2]:
+                self._clock = self._load_clock(now)
+            if self._clock is not None:
+                is_open, next_open, _ = self._clock
+                return is_open, now if is_open else next_open
+        return self.regular_hours(now)
+
+    def _load_clock(self, now: float) -> Optional[Tuple[bool, float, float]]:
+        try:
+            clock = self.api.get_clock()
+            is_open = bool(getattr(clock, 'is_open', False))
+            next_open = self._epoch(getattr(clock, 'next_open', None))
+            next_close = self._epoch(getattr(clock, 'next_close', None))
+            valid_until = next_close if is_open else next_open
+            if valid_until is None or (not is_open and next_open is None):
+                return None
+            return is_open, next_open if next_open is not None else now, valid_until
+        except Exception as e:
+            self.logger.warning(f"⚠️ Market clock unavailable for scheduling: {e} - using regular hours")
+            return None
+
+    @staticmethod
+    def _epoch(value) -> Optional[float]:
+        if value is None:
+            return None
+        if isinstance(value, datetime):
+            return value.timestamp()
+        try:
+            return datetime.fromisoformat(str(value)).timestamp()
+        except ValueError:
+            return None
+
+    @staticmethod
+    def regular_hours(now: float) -> Tuple[bool, float]:
+        """Regular session without holidays: 9:30-16:00 America/New_York, Monday-Friday"""
+        import pytz
+        et = pytz.timezone('America/New_York')
+        local = datetime.fromtimestamp(now, et)
+        day = local.date()
+        if local.weekday() < 5:
+            session_open = et.localize(datetime(day.year, day.month, day.day, 9, 30))
+            session_close = et.localize(datetime(day.year, day.month, day.day, 16, 0))
+            if session_open <= local < session_close:
+                return True, now
+            if local < session_open:
+                return False, session_open.timestamp()
+        day += timedelta(days=1)
+        while day.weekday() >= 5:
+            day += timedelta(days=1)
+        return False, et.localize(datetime(day.year, day.month, day.day, 9, 30)).timestamp()
+
+
+@dataclass(order=True)
+class ScheduledPhase:
+    """One module phase and its next deadline"""
+    due: float
+    priority: int
+    sequence: int
+    module_name: str = field(compare=False)
+    phase: Phase = field(compare=False)
+    cadence: PhaseCadence = field(compare=False)
+
+
+class CadenceScheduler:
+    """Min-heap of module phase deadlines (thread-safe)"""
+
+    def __init__(self, market_hours: Optional[MarketHours] = None, logger: Optional[logging.Logger] = None):
+        self.market_hours = market_hours or MarketHours()
+        self.logger = logger or logging.getLogger(self.__class__.__name__)
+        self._heap: List[ScheduledPhase] = []
+        self._cadences: Dict[str, ModuleCadence] = {}
+        self._sequence = itertools.count()
+        self._lock = threading.RLock()
+
+    def add_module(self, module_name: str, cadence: ModuleCadence, now: Optional[float] = None,
+                   phases: FrozenSet[Phase] = ALL_PHASES):
+        """Schedule the given phases of a module, first run due immediately (replaces an earlier cadence)"""
+        now = time.time() if now is None else now
+        with self._lock:
+            self._cadences[module_name] = cadence
+            self._heap = [task for task in self._heap if task.module_name != module_name]
+            heapq.heapify(self._heap)
+            for phase in Phase:
+                if phase in phases:
+                    self._push(module_name, phase, cadence.for_phase(phase), now)
+
+    def remove_module(self, module_name: str):
+        with self._lock:
+            self._cadences.pop(module_name, None)
+            self._heap = [task for task in self._heap if task.module_name != module_name]
+            heapq.heapify(self._heap)
+
+    def _push(self, module_name: str, phase: Phase, cadence: PhaseCadence, due: float):
+        heapq.heappush(self._heap, ScheduledPhase(due, cadence.priority, next(self._sequence),
+                                                  module_name, phase, cadence))
+
+    def next_due(self) -> Optional[float]:
+        """Earliest deadline (epoch seconds), None when nothing is scheduled"""
+        with self._lock:
+            return self._heap[0].due if self._heap else None
+
+    def seconds_until_due(self, now: Optional[float] = None) -> Optional[float]:
+        due = self.next_due()
+        if due is None:
+            return None
+        return max(0.0, due - (time.time() if now is None else now))
+
+    def pop_due(self, now: Optional[float] = None) -> List[ScheduledPhase]:
+        """
+        Phases whose deadline has passed, by priority; each is rescheduled.
+
+        MARKET_HOURS phases that fall due while the market is closed are
+        deferred to the next open instead of running. Deadlines advance by
+        whole intervals; a phase that fell more than one interval behind runs
+        once and restarts its cadence from now rather than catching up.
+        """
+        now = time.time() if now is None else now
+        due: List[ScheduledPhase] = []
+        session = None
+        with self._lock:
+            while self._heap and self._heap[0].due <= now:
+                task = heapq.heappop(self._heap)
+                cadence = task.cadence
+                if cadence.calendar is Calendar.MARKET_HOURS:
+                    session = session or self.market_hours.session(now)
+                    is_open, next_open = session
+                    if not is_open:
+                        self._push(task.module_name, task.phase, cadence, max(next_open, now + 1))
+                        self.logger.debug(f"💤 {task.module_name} {task.phase.value} deferred to market open")
+                        continue
+                next_due = task.due + cadence.interval_seconds
+                self._push(task.module_name, task.phase, cadence, next_due if next_due > now else now + cadence.interval_seconds)
+                due.append(task)
+        return sorted(due, key=lambda task: (task.priority, task.sequence))
+
+    def get_status(self) -> Dict[str, Dict[str, str]]:
+        """Next deadline per module and phase"""
+        status: Dict[str, Dict[str, str]] = {}
+        with self._lock:
+            heap = sorted(self._heap)
+        for task in heap:
+            status.setdefault(task.module_name, {})[task.phase.value] = datetime.fromtimestamp(task.due).isoformat()
+        return status
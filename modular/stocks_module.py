@@ -17,9 +17,11 @@ import os
 
 from modular.base_module import (
     TradingModule, ModuleConfig, TradeOpportunity, TradeResult,
-    TradeAction, TradeStatus, ExitReason
+    TradeAction, TradeStatus, ExitReason, guarded_exit
 )
-from utils.pattern_recognition import PatternRecognition
+from modular.scheduler import Calendar, ModuleCadence, PhaseCadence
+from utils.bar_store import BarHistory
+from utils.pattern_recognition import PatternRecognition, pattern_confidence
 from utils.news_sentiment import NewsSentimentAnalyzer
 
 # Enhanced ML/AI Integration (Phase 2)
@@ -133,6 +135,10 @@ class StocksModule(TradingModule):
             self.enhanced_technical_indicators = None
             self.enhanced_ml_framework = None
         
+        # Daily-bar pattern recognition, run for the whole universe once per cycle
+        self.pattern_recognition = PatternRecognition()
+        self._cycle_patterns: Dict[str, Dict] = {}
+        
         # AGGRESSIVE RECOVERY STOCKS CONFIGURATION - Targeting 5-10% monthly returns
         self.max_stock_allocation = 0.50  # INCREASED for aggressive recovery (portfolio down -2.55%)
         self.aggressive_multiplier = 1.8  # INCREASED for recovery positioning
@@ -308,6 +314,15 @@ class StocksModule(TradingModule):
     def module_name(self) -> str:
         return "stocks"
     
+    @property
+    def cadence(self) -> ModuleCadence:
+        """Minute scans and exit checks every few seconds during regular trading hours only"""
+        return ModuleCadence(
+            scan=PhaseCadence(60, Calendar.MARKET_HOURS, priority=20),
+            monitor=PhaseCadence(5, Calendar.MARKET_HOURS, priority=0),
+            persist=PhaseCadence(300, Calendar.ALWAYS, priority=50)
+        )
+    
     @property
     def supported_symbols(self) -> List[str]:
         """Get all supported stock symbols (MARKET_TIER removed - trade all symbols)"""
@@ -355,14 +370,27 @@ class StocksModule(TradingModule):
             
             # Analyze symbols based on current tier and intraday strategy
             active_symbols = self._get_active_symbols()
+            self._prepare_cycle_patterns(active_symbols)
             
             self.logger.info(f"Analyzing {len(active_symbols)} stocks for intraday opportunities "
                            f"(regime: {market_regime}, strategy: {intraday_strategy_info['primary_strategy'].value}, "
                            f"heat: {heat_factor:.2f})")
             
-            for symbol in active_symbols:
+            # PARALLEL: Symbols are analyzed concurrently; opportunities are built in symbol order
+            results = self.symbol_fanout.map(
+                lambda symbol: self._analyze_stock_symbol_intraday(symbol, market_regime, intraday_strategy_info),
+                active_symbols
+            )
+            
+            for result in results:
+                symbol = result.symbol
+                if result.skipped:  # Budget ran out before this symbol (reported by the orchestrator)
+                    continue
+                if not result.ok:
+                    self.logger.error(f"Error analyzing stock {symbol}: {result.error}")
+                    continue
                 try:
-                    analysis = self._analyze_stock_symbol_intraday(symbol, market_regime, intraday_strategy_info)
+                    analysis = result.value
                     if analysis and analysis.is_tradeable:
                         # Apply intraday confidence threshold with time adjustment
                         adjusted_confidence_threshold = (
@@ -532,6 +560,11 @@ class StocksModule(TradingModule):
     def _get_real_stock_price(self, symbol: str) -> float:
         """Get real current stock price from Alpaca API with data freshness validation"""
         try:
+            # Use the orchestrator's cycle snapshot so every module sees the same price
+            snapshot_price = self.get_snapshot_price(symbol)
+            if snapshot_price:
+                return snapshot_price
+            
             quote = self.api.get_latest_quote(symbol)
             
             if quote:
@@ -624,18 +657,21 @@ class StocksModule(TradingModule):
             # Use enhanced technical indicators if available
             if self.enhanced_technical_indicators:
                 # Get historical price data for technical analysis
-                historical_data = self._get_historical_price_data(symbol, periods=50)
+                historical_data, last_bar_time = self._get_historical_closes(symbol, periods=50)
                 if historical_data and len(historical_data) >= 20:
+                    # Indicators are memoized per symbol until a new daily bar arrives
+                    series = {'symbol': symbol, 'timeframe': '1d', 'last_bar_time': last_bar_time}
+                    
                     # Calculate RSI
-                    rsi = self.enhanced_technical_indicators.calculate_rsi(historical_data)
+                    rsi = self.enhanced_technical_indicators.calculate_rsi(historical_data, **series)
                     rsi_score = self._rsi_to_score(rsi) if rsi else 0.5
                     
                     # Calculate MACD
-                    macd_data = self.enhanced_technical_indicators.calculate_macd(historical_data)
+                    macd_data = self.enhanced_technical_indicators.calculate_macd(historical_data, **series)
                     macd_score = self._macd_to_score(macd_data) if macd_data else 0.5
                     
                     # Calculate Bollinger Bands
-                    bb_data = self.enhanced_technical_indicators.calculate_bollinger_bands(historical_data)
+                    bb_data = self.enhanced_technical_indicators.calculate_bollinger_bands(historical_data, **series)
                     bb_score = self._bollinger_to_score(current_price, bb_data) if bb_data else 0.5
                     
                     # Weighted combination of indicators
@@ -650,15 +686,43 @@ class StocksModule(TradingModule):
     
     def _get_historical_price_data(self, symbol: str, periods: int = 50) -> Optional[List[float]]:
         """Get historical price data for technical analysis"""
+        return self._get_historical_closes(symbol, periods)[0]
+    
+    def _get_historical_closes(self, symbol: str, periods: int = 50) -> Tuple[Optional[List[float]], Any]:
+        """Daily closes for technical analysis and the timestamp of the last bar"""
+        bars = self._get_daily_bars(symbol, periods)
+        if bars is None:
+            return None, None
+        return bars['close'].tolist(), bars.index[-1]
+    
+    def _get_daily_bars(self, symbol: str, periods: int = 50, period: str = "3mo") -> Optional[Any]:
+        """Last `periods` daily OHLCV bars (from a `period` history request) as a DataFrame"""
         try:
             if self.enhanced_data_manager:
-                data = self.enhanced_data_manager.get_historical_data(symbol, period="3mo", interval="1d")
+                data = self.enhanced_data_manager.get_historical_data(symbol, period=period, interval="1d")
                 if data is not None and not data.empty:
-                    return data['close'].tail(periods).tolist()
+                    return data.tail(periods)
             return None
         except Exception:
             return None
     
+    def _get_bar_history(self, symbol: str, periods: int = 250) -> Optional[BarHistory]:
+        """
+        Daily OHLCV bars as numpy arrays, including today's forming bar.
+        
+        Read through the historical cache (archive-backed when BAR_ARCHIVE_DIR is
+        set) rather than the archive directly: the archive only holds completed
+        bars, so indicators would lag a day and depend on deployment config.
+        """
+        try:
+            data = self._get_daily_bars(symbol, periods, period="1y")
+            if data is None:
+                return None
+            return BarHistory.from_dataframe(symbol, '1Day', data)
+        except Exception as e:
+            self.logger.debug(f"Bar history unavailable for {symbol}: {e}")
+            return None
+    
     def _rsi_to_score(self, rsi: float) -> float:
         """Convert RSI to trading score (0.0-1.0)"""
         if rsi <= 30:  # Oversold - bullish
@@ -712,12 +776,42 @@ class StocksModule(TradingModule):
         except Exception:
             return 0.5
     
+    def _prepare_cycle_patterns(self, symbols: List[str]):
+        """
+        Run pattern recognition for every symbol's daily bars in one batch.
+        
+        Histories are fetched on the symbol fan-out under the module's budget;
+        the batch runs over whichever fetches finished in time.
+        """
+        self._cycle_patterns = {}
+        try:
+            histories = {}
+            results = self.symbol_fanout.map(
+                lambda symbol: self._get_daily_bars(symbol, PatternRecognition.max_data_points), symbols
+            )
+            for result in results:
+                bars = result.value
+                if result.ok and bars is not None:
+                    histories[result.symbol] = (bars['close'].to_numpy(),
+                                                bars['volume'].to_numpy() if 'volume' in bars else None)
+            if histories:
+                self._cycle_patterns = self.pattern_recognition.analyze_batch(histories)
+                self.logger.debug(f"🔍 Pattern analysis computed for {len(histories)} stocks")
+        except Exception as e:
+            self.logger.warning(f"⚠️ Batch pattern analysis failed: {e}")
+    
     def _calculate_basic_pattern_score(self, symbol: str, current_price: float) -> float:
         """Basic pattern analysis using real market data"""
         try:
-            # This would integrate with real pattern recognition
-            # For now, return neutral score - replace with actual pattern analysis
-            return 0.5
+            analysis = self._cycle_patterns.get(symbol)
+            if analysis is None:
+                bars = self._get_daily_bars(symbol, PatternRecognition.max_data_points)
+                if bars is None:
+                    return 0.5
+                analysis = self.pattern_recognition.analyze_patterns(
+                    symbol, bars['close'].to_numpy(), bars['volume'].to_numpy() if 'volume' in bars else None
+                )
+            return pattern_confidence(analysis)
         except Exception:
             return 0.5
     
@@ -978,7 +1072,7 @@ class StocksModule(TradingModule):
             
             # Create stocks-specific module parameters
             module_specific_params = self.ml_data_collector.create_stocks_module_params(
-                regime_type=market_regime.get('type', 'neutral'),
+                regime_type=market_regime,
                 leverage_factor=leverage_factor,
                 sector_momentum=self._get_sector_momentum(opportunity.symbol),
                 intelligence_weights_used=self.intelligence_weights,
@@ -1037,7 +1131,7 @@ class StocksModule(TradingModule):
             ml_trade_data_dict = ml_trade_data.to_dict()
             ml_trade_data_dict['asset_type'] = 'stock'
             ml_trade_data_dict['stock_strategy'] = strategy_name
-            ml_trade_data_dict['market_regime'] = market_regime.get('type', 'neutral')
+            ml_trade_data_dict['market_regime'] = market_regime
             ml_trade_data_dict['symbol_tier'] = self._get_symbol_tier(opportunity.symbol)
             
             # Save to Firebase with ML enhancements
@@ -1052,7 +1146,7 @@ class StocksModule(TradingModule):
                     'strategy': strategy_name,
                     'confidence': opportunity.confidence,
                     'executed': result.success,
-                    'regime': market_regime.get('type', 'neutral')
+                    'regime': market_regime
                 },
                 success=result.success,
                 profit_loss=0.0  # Will be updated on exit
@@ -1272,6 +1366,7 @@ class StocksModule(TradingModule):
             self.logger.error(f"Error analyzing intraday stock exit: {e}")
             return None
     
+    @guarded_exit
     def _execute_stock_exit(self, position: Dict, exit_reason: str) -> Optional[TradeResult]:
         """Execute stock position exit"""
         try:
@@ -1407,6 +1502,10 @@ class StocksModule(TradingModule):
                 self.logger.info(f"Market hours fallback: {now_et.strftime('%Y-%m-%d %H:%M %Z')}, weekday: {is_weekday}, hours: {is_trading_hours}")
                 return is_weekday and is_trading_hours
             
+            snapshot_open = self.get_snapshot_market_open()
+            if snapshot_open is not None:
+                return snapshot_open
+            
             clock = self.api.get_clock()
             is_open = getattr(clock, 'is_open', False)
             self.logger.info(f"Market status from Alpaca: {is_open} (clock: {clock})")
@@ -1445,8 +1544,11 @@ class StocksModule(TradingModule):
             return 240  # Default to 4 hours
     
     def _get_market_regime(self) -> str:
-        """Get current market regime"""
+        """Get current market regime (the orchestrator's cycle regime when available)"""
         try:
+            cycle_regime = self.get_cycle_regime()
+            if cycle_regime is not None:
+                return cycle_regime.trend_label
             if 'market_regime_detector' in self.intelligence_systems:
                 regime_data = self.intelligence_systems['market_regime_detector'].get_current_regime()
                 if regime_data:
@@ -1692,8 +1794,12 @@ class StocksModule(TradingModule):
             if self.enhanced_data_manager:
                 # Multi-source data with Alpaca as primary
                 enhanced_data = self.enhanced_data_manager.get_enhanced_quote_data(symbol, include_fundamentals=True)
-                market_data = self.enhanced_data_manager.get_market_context(symbol)
-                sector_data = self.enhanced_data_manager.get_sector_data(symbol)
+                # Sector rotation comes from the cycle regime; per-symbol lookups only without one
+                cycle_regime = self.get_cycle_regime()
+                if cycle_regime is not None:
+                    sector_data = cycle_regime.sector_context(symbol)
+                else:
+                    sector_data = self.enhanced_data_manager.get_sector_data(symbol)
             else:
                 # Fallback to basic analysis
                 return self._analyze_stock_symbol(symbol, market_regime)
@@ -1705,12 +1811,20 @@ class StocksModule(TradingModule):
             
             # PHASE 2: Enhanced Technical Analysis with TA-Lib
             if self.enhanced_technical_indicators:
-                technical_analysis = self.enhanced_technical_indicators.analyze_comprehensive(
-                    symbol=symbol,
-                    price_data=enhanced_data.get('price_history', []),
-                    volume_data=enhanced_data.get('volume_history', []),
-                    timeframe='intraday'
-                )
+                # Real daily OHLC bars when available, close-only price history otherwise
+                bars = self._get_bar_history(symbol)
+                snapshot = self.enhanced_technical_indicators.analyze_bars(bars) if bars is not None else None
+                if snapshot is not None and snapshot.bar_count >= 20:
+                    technical_analysis = snapshot.to_comprehensive(timeframe='intraday')
+                else:
+                    technical_analysis = self.enhanced_technical_indicators.analyze_comprehensive(
+                        symbol=symbol,
+                        price_data=enhanced_data.get('price_history', []),
+                        volume_data=enhanced_data.get('volume_history', []),
+                        timeframe='intraday',
+                        last_bar_time=enhanced_data.get('last_bar_time'),
+                        bar_timeframe='1d'
+                    )
                 
                 # Advanced indicators: RSI, MACD, Bollinger Bands, Williams %R, Stochastic
                 technical_score = technical_analysis.get('combined_score', 0.5)
@@ -1746,12 +1860,7 @@ class StocksModule(TradingModule):
                 regime_score = 0.5
             
             # PHASE 4: Enhanced Pattern Recognition
-            pattern_score = 0.5
-            if hasattr(self, 'pattern_recognition') and self.pattern_recognition:
-                pattern_analysis = self.pattern_recognition.analyze_patterns(
-                    symbol, enhanced_data.get('price_history', [])
-                )
-                pattern_score = pattern_analysis.get('confidence', 0.5)
+            pattern_score = self._calculate_basic_pattern_score(symbol, current_price)
             
             # PHASE 5: AI-Weighted Combined Confidence 
             # Adaptive weights based on market conditions and ML confidence
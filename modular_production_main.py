@@ -27,6 +27,11 @@ from firebase_database import FirebaseDatabase
 from production_config import ProductionConfig
 from production_health_check import HealthMonitor
 from data_mode_manager import DataModeManager
+from utils.single_flight import SingleFlightClient
+from utils.rate_limiter import RateLimitedClient
+from utils.bar_archive import get_bar_archive
+from utils.http_pool import get_http_pool
+from utils.indicator_cache import get_indicator_cache
 
 # Legacy fallback imports
 import alpaca_trade_api as tradeapi
@@ -96,6 +101,9 @@ class ProductionTradingSystem:
             if not self._initialize_modular_system():
                 return False
                 
+            # Open pooled connections before the first trading cycle
+            self._warm_up_http_pool()
+                
             # Initialize Health Monitoring
             self._initialize_health_monitoring()
             
@@ -127,6 +135,22 @@ class ProductionTradingSystem:
             logger.error(f"❌ Firebase initialization failed: {e}")
             return False
     
+    def _warm_up_http_pool(self):
+        """Open keep-alive connections to the REST hosts used every cycle."""
+        try:
+            pool = get_http_pool()
+            base_url = getattr(self, 'alpaca_base_url', 'https://paper-api.alpaca.markets')
+            # Direct REST calls (options contracts, Alpha Vantage, Finnhub) use the pool's own sessions
+            pool.warm_up([
+                base_url,
+                'https://www.alphavantage.co',
+                'https://finnhub.io',
+            ])
+            # Alpaca client calls go through its own (adopted) session
+            pool.warm_up([base_url, 'https://data.alpaca.markets'], adopted='alpaca')
+        except Exception as e:
+            logger.warning(f"⚠️ HTTP pool warm-up failed: {e}")
+    
     def _initialize_alpaca(self) -> bool:
         """Initialize Alpaca trading API."""
         try:
@@ -180,12 +204,19 @@ class ProductionTradingSystem:
             
             # Initialize Alpaca API for algorithmic trading
             logger.info("📡 Connecting to Alpaca API...")
-            self.alpaca_api = tradeapi.REST(
+            # Read calls are coalesced so parallel modules share identical in-flight requests;
+            # every request that does go out draws from the shared Alpaca rate limit budget
+            rest_client = tradeapi.REST(
                 api_key,
                 secret_key,
                 base_url,
                 api_version='v2'
             )
+            # Size the client's keep-alive pool like the rest of the shared HTTP pool
+            if hasattr(rest_client, '_session'):
+                get_http_pool().adopt_session('alpaca', rest_client._session)
+            self.alpaca_api = SingleFlightClient(RateLimitedClient(rest_client, 'alpaca'))
+            self.alpaca_base_url = base_url
             
             # Data quality depends on Alpaca subscription tier:
             # - Basic Plan (Free): IEX real-time data, 15-min delayed historical
@@ -241,7 +272,15 @@ class ProductionTradingSystem:
                 risk_manager=risk_mgr,
                 order_executor=order_executor,  # Now properly initialized
                 ml_optimizer=None,  # Will be initialized by orchestrator
-                logger=logger
+                logger=logger,
+                api_client=self.alpaca_api  # Shared per-cycle market data snapshot
+            )
+            if self.config.get_bool('ASYNC_EXECUTION', False):
+                self.orchestrator.set_async_execution(True)
+            # Per-module cadences; modules without one follow the data mode's cycle delay
+            self.orchestrator.set_cadence_scheduling(
+                self.config.get_bool('CADENCE_SCHEDULER', True),
+                default_interval_seconds=self.data_mode_manager.get_cycle_delay()
             )
             
             # Register trading modules
@@ -634,10 +673,25 @@ class ProductionTradingSystem:
         """Main trading loop with error handling and recovery."""
         logger.info("🔄 Starting main trading loop...")
         
+        # Exits get their own fast loop so they never wait behind a slow opportunity scan
+        if (self.orchestrator and self.orchestrator.cadence_scheduling_enabled
+                and self.config.get_bool('POSITION_MONITOR', True)):
+            self.orchestrator.start_position_monitor()
+        
         while self.running:
             try:
                 cycle_start = time.time()
                 
+                # Per-module cadences: run only the module phases that are due, then sleep until the next one
+                if self.orchestrator and self.orchestrator.cadence_scheduling_enabled:
+                    cycle_results = self.orchestrator.run_due_work()
+                    if cycle_results:
+                        self.cycle_count += 1
+                        logger.info(f"🎯 Cycle {self.cycle_count} completed: {cycle_results.get('summary', 'No summary')}")
+                    self.last_health_check = datetime.now()
+                    time.sleep(self.orchestrator.seconds_until_due())
+                    continue
+                
                 # Run orchestrator cycle
                 if self.orchestrator:
                     cycle_results = self.orchestrator.run_single_cycle()
@@ -750,6 +804,12 @@ class ProductionTradingSystem:
                 if trading_metrics:
                     metrics['trading'] = trading_metrics
             
+            # Keep-alive connection pool usage per host
+            metrics['http_pool'] = get_http_pool().get_stats()
+            
+            # Indicator memoization hit rates
+            metrics['indicator_cache'] = get_indicator_cache().get_stats()
+            
             return metrics
             
         except Exception as e:
@@ -786,6 +846,15 @@ class ProductionTradingSystem:
             except Exception as e:
                 logger.error(f"❌ Orchestrator shutdown error: {e}")
         
+        # Write out the bar archive index (appends only rewrite it every few seconds)
+        bar_archive = get_bar_archive()
+        if bar_archive:
+            try:
+                bar_archive.close()
+                logger.info("✅ Bar archive flushed")
+            except Exception as e:
+                logger.error(f"❌ Bar archive flush error: {e}")
+        
         # Close Firebase connection
         if self.firebase_db:
             try:
@@ -495,6 +495,129 @@ class TestCryptoModule(unittest.TestCase):
         # Should return empty list when allocation limit reached
         self.assertEqual(len(opportunities), 0)
     
+    def _build_batched_api(self, formatted_symbols):
+        """Build an API client whose crypto endpoints answer multi-symbol requests"""
+        from types import SimpleNamespace
+        from datetime import timedelta
+        
+        now = datetime.now(timezone.utc)
+        api = Mock()
+        api.get_crypto_snapshots.side_effect = lambda symbols: {
+            s: SimpleNamespace(
+                minute_bar=SimpleNamespace(c=100.0, t=now),
+                latest_trade=SimpleNamespace(p=100.0, t=now),
+                latest_quote=SimpleNamespace(ap=100.5, bp=99.5, timestamp=now)
+            ) for s in symbols
+        }
+        api.get_crypto_bars.side_effect = lambda symbols, **kwargs: [
+            SimpleNamespace(S=s, c=100.0 + i, h=101.0 + i, l=99.0 + i, v=1000.0,
+                            t=now - timedelta(hours=30 - i))
+            for s in symbols for i in range(30)
+        ]
+        return api
+    
+    def _count_market_data_calls(self, universe):
+        """Run one analysis pass over the given universe and count crypto market data calls"""
+        api = self._build_batched_api(universe)
+        self.crypto_module.api = api
+        self.crypto_module.enhanced_data_manager = None
+        self.crypto_module.crypto_universe = {'major': universe}
+        self.crypto_module.bar_store.clear()
+        self.mock_risk_manager.get_portfolio_summary.return_value = {'portfolio_value': 100000}
+        
+        with patch.object(self.crypto_module, '_get_current_crypto_allocation', return_value=0.0), \
+             patch.object(self.crypto_module, '_get_smart_allocation_limit', return_value=0.4), \
+             patch.object(self.crypto_module, '_is_stock_market_open', return_value=False), \
+             patch.object(self.crypto_module, '_analyze_crypto_symbol',
+                          wraps=self.crypto_module._analyze_crypto_symbol) as analyze_mock:
+            self.crypto_module.analyze_opportunities()
+        
+        self.assertEqual(analyze_mock.call_count, len(universe))
+        market_data_methods = {
+            'get_crypto_snapshots', 'get_crypto_bars', 'get_latest_crypto_bars',
+            'get_latest_crypto_trades', 'get_latest_crypto_quotes'
+        }
+        return sum(1 for call in api.method_calls if call[0] in market_data_methods)
+    
+    def test_analyze_opportunities_batched_snapshot_calls_constant(self):
+        """Test crypto market data REST calls per cycle do not grow with the symbol count"""
+        small_calls = self._count_market_data_calls(['BTCUSD', 'ETHUSD'])
+        large_calls = self._count_market_data_calls(
+            ['BTCUSD', 'ETHUSD', 'SOLUSD', 'DOTUSD', 'LINKUSD', 'AVAXUSD', 'UNIUSD', 'AAVEUSD']
+        )
+        
+        self.assertEqual(small_calls, 2)
+        self.assertEqual(small_calls, large_calls)
+        # Snapshot is scoped to a single analysis pass
+        self.assertEqual(self.crypto_module._cycle_snapshots, {})
+    
+    def test_analyze_opportunities_computes_indicators_in_one_pass(self):
+        """Test the indicator engine runs once per cycle for the whole universe"""
+        universe = ['BTCUSD', 'ETHUSD', 'SOLUSD', 'DOTUSD']
+        
+        with patch.object(self.crypto_module.indicator_engine, 'analyze',
+                          wraps=self.crypto_module.indicator_engine.analyze) as analyze_mock, \
+             patch.object(self.crypto_module, '_calculate_rsi_signals') as rsi_mock:
+            self._count_market_data_calls(universe)
+        
+        analyze_mock.assert_called_once()
+        self.assertEqual(set(analyze_mock.call_args[0][0]), set(universe))
+        rsi_mock.assert_not_called()
+        self.assertEqual(self.crypto_module._cycle_indicators, {})
+    
+    def test_fetch_crypto_snapshots_parses_batched_data(self):
+        """Test batched snapshot parsing feeds price, staleness and market data"""
+        self.crypto_module.api = self._build_batched_api(['BTCUSD', 'ETHUSD'])
+        self.crypto_module.enhanced_data_manager = None
+        
+        snapshots = self.crypto_module._fetch_crypto_snapshots(['BTCUSD', 'ETHUSD'])
+        self.crypto_module._cycle_snapshots = snapshots
+        
+        self.assertEqual(set(snapshots.keys()), {'BTCUSD', 'ETHUSD'})
+        self.assertEqual(snapshots['BTCUSD']['price'], 100.0)
+        self.assertEqual(snapshots['BTCUSD']['price_source'], 'bars')
+        self.assertEqual(len(snapshots['ETHUSD']['bars']), 30)
+        self.assertEqual(self.crypto_module._get_crypto_price('ETHUSD'), 100.0)
+        self.assertFalse(self.crypto_module._is_quote_data_stale('BTCUSD'))
+        
+        market_data = self.crypto_module._get_crypto_market_data('BTCUSD')
+        self.assertEqual(market_data['price_24h_ago'], 100.0)
+        self.assertEqual(len(market_data['price_history']), 30)
+        self.crypto_module.api.get_latest_crypto_quotes.assert_not_called()
+    
+    def test_fetch_crypto_snapshots_reuses_shared_trade_price(self):
+        """Test a shared cycle snapshot supplies the last trade price, not the ask, as the trade"""
+        from types import MappingProxyType
+        from modular.market_data_snapshot import MarketDataSnapshot, SnapshotQuote
+        
+        self.crypto_module.api = self._build_batched_api(['BTCUSD'])
+        quote = SnapshotQuote(symbol='BTCUSD', ask_price=101.0, bid_price=99.0, last_price=100.0,
+                              timestamp=datetime.now(timezone.utc))
+        self.crypto_module.set_market_data(MarketDataSnapshot(
+            cycle_id=1, created_at=datetime.now(timezone.utc), quotes=MappingProxyType({'BTCUSD': quote})
+        ))
+        
+        snapshots = self.crypto_module._fetch_crypto_snapshots(['BTCUSD'])
+        
+        self.assertEqual(snapshots['BTCUSD']['price'], 100.0)
+        self.assertEqual(snapshots['BTCUSD']['price_source'], 'trades')
+        self.crypto_module.api.get_crypto_snapshots.assert_not_called()
+    
+    def test_bar_store_fetches_only_new_bars(self):
+        """Test warm cycles request bars from the last stored bar instead of the full window"""
+        self.crypto_module.api = self._build_batched_api(['BTCUSD'])
+        
+        self.crypto_module._fetch_crypto_snapshots(['BTCUSD', 'ETHUSD'])
+        last_bar_time = self.crypto_module.bar_store.last_timestamp('BTCUSD')
+        self.assertIsNotNone(last_bar_time)
+        
+        self.crypto_module._fetch_crypto_snapshots(['BTCUSD', 'ETHUSD'])
+        warm_start = self.crypto_module.api.get_crypto_bars.call_args[1]['start']
+        
+        self.assertEqual(warm_start, last_bar_time.strftime('%Y-%m-%dT%H:%M:%SZ'))
+        self.assertEqual(self.crypto_module.api.get_crypto_bars.call_count, 2)
+        self.assertEqual(len(self.crypto_module.bar_store.get_history('BTCUSD')), 30)
+    
     def test_validate_opportunity_basic(self):
         """Test basic opportunity validation"""
         opportunity = TradeOpportunity(
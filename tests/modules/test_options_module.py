@@ -113,7 +113,7 @@ class TestOptionsModule(unittest.TestCase):
         self.assertEqual(strategy.quantities[0], 1)
         self.assertEqual(strategy.max_risk, 5.0)
     
-    @patch('modular.options_module.requests.get')
+    @patch('utils.http_pool.requests.Session.request')
     def test_get_options_chain_success(self, mock_requests):
         """Test successful options chain retrieval"""
         # Mock API response
@@ -154,7 +154,7 @@ class TestOptionsModule(unittest.TestCase):
         self.assertEqual(chain['calls'][0].strike, 150.0)
         self.assertEqual(chain['puts'][0].strike, 150.0)
     
-    @patch('modular.options_module.requests.get')
+    @patch('utils.http_pool.requests.Session.request')
     def test_get_options_chain_api_error(self, mock_requests):
         """Test options chain retrieval with API error"""
         mock_response = Mock()
@@ -170,6 +170,30 @@ class TestOptionsModule(unittest.TestCase):
         
         self.assertEqual(chain, {})
     
+    @patch('modular.options_module.time.sleep')
+    @patch('utils.http_pool.requests.Session.request')
+    def test_get_options_chain_uses_rate_limiter(self, mock_requests, mock_sleep):
+        """Test chain requests draw from the shared rate limiter instead of fixed sleeps"""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {'option_contracts': [
+            {'symbol': f'AAPL240119C00{150 + i}000', 'id': f'id_{i}', 'underlying_symbol': 'AAPL',
+             'strike_price': str(150 + i), 'expiration_date': '2024-01-19', 'type': 'call'}
+            for i in range(5)
+        ]}
+        mock_requests.return_value = mock_response
+        self.options_module.rate_limiter = Mock()
+        
+        with patch.dict(os.environ, {
+            'ALPACA_PAPER_API_KEY': 'test_key',
+            'ALPACA_PAPER_SECRET_KEY': 'test_secret'
+        }):
+            chain = self.options_module._get_options_chain('AAPL')
+        
+        self.assertEqual(len(chain['calls']), 5)
+        self.options_module.rate_limiter.acquire.assert_called_once_with('alpaca', 'options_contracts')
+        mock_sleep.assert_not_called()
+    
     def test_get_options_chain_no_credentials(self):
         """Test options chain retrieval without API credentials"""
         with patch.dict(os.environ, {}, clear=True):
@@ -326,6 +350,20 @@ class TestOptionsModule(unittest.TestCase):
         # Should be 1.5% (1500 options value / 100000 portfolio)
         self.assertAlmostEqual(allocation, 0.015, places=3)
     
+    def test_calculate_pattern_confidence_blends_pattern_signals(self):
+        """Test a mean reversion pattern pulls confidence away from the range position"""
+        import pandas as pd
+        closes = [100.0 + 0.2 * (i % 2) for i in range(23)] + [92.0]
+        bars = pd.DataFrame({'close': closes, 'high': [c + 0.5 for c in closes],
+                             'low': [c - 0.5 for c in closes], 'volume': [1000] * 24})
+        self.mock_api_client.get_bars.return_value = Mock(df=bars)
+        
+        confidence = self.options_module._calculate_pattern_confidence('AAPL', 92.0)
+        
+        # Range position alone is the floor (0.2); the oversold reversion signal lifts it
+        self.assertGreater(confidence, 0.2)
+        self.assertLessEqual(confidence, 0.8)
+    
     def test_analyze_opportunities_allocation_limit(self):
         """Test opportunity analysis with allocation limit reached"""
         # Mock high allocation
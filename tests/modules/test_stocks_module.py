@@ -93,6 +93,24 @@ class TestStocksModule(unittest.TestCase):
         self.assertIn('AAPL', self.stocks_module.supported_symbols)
         self.assertIn('SPY', self.stocks_module.supported_symbols)
     
+    def test_bar_history_includes_forming_bar(self):
+        """Test daily bar history comes from the historical cache, not completed archived bars only"""
+        import pandas as pd
+        
+        index = pd.date_range(end=pd.Timestamp.now(tz='UTC').normalize(), periods=30, freq='D')
+        data = pd.DataFrame({'open': 1.0, 'high': 2.0, 'low': 0.5, 'close': range(30), 'volume': 100.0},
+                            index=index)
+        manager = Mock()
+        manager.get_historical_data.return_value = data
+        self.stocks_module.enhanced_data_manager = manager
+        
+        bars = self.stocks_module._get_bar_history('AAPL', periods=20)
+        
+        self.assertEqual(len(bars), 20)
+        self.assertEqual(bars.close[-1], 29.0)
+        manager.get_historical_data.assert_called_once_with('AAPL', period='1y', interval='1d')
+        manager.get_archived_history.assert_not_called()
+    
     def test_stock_strategy_enum(self):
         """Test StockStrategy enum"""
         self.assertEqual(StockStrategy.LEVERAGED_ETFS.value, "leveraged_etfs")
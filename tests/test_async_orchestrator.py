@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Tests for the orchestrator's asyncio execution mode
+
+Tests that sync modules are adapted through the shared executor, that native
+async modules run concurrently on one event loop, and that a module that
+overruns its timeout is cancelled without affecting the others.
+"""
+
+import asyncio
+import threading
+import time
+import unittest
+from typing import List
+from unittest.mock import Mock
+
+from modular.base_module import ModuleConfig, TradeAction, TradeOpportunity, TradingModule
+from modular.orchestrator import ModularOrchestrator
+
+
+class SyncModule(TradingModule):
+    """Sync-only module returning one opportunity"""
+
+    def __init__(self, name):
+        self._name = name
+        self.analysis_threads = []
+        super().__init__(ModuleConfig(module_name=name, min_confidence=0.0), Mock(), Mock(), Mock())
+
+    @property
+    def module_name(self) -> str:
+        return self._name
+
+    @property
+    def supported_symbols(self) -> List[str]:
+        return ['SPY']
+
+    def analyze_opportunities(self):
+        self.analysis_threads.append(threading.current_thread().name)
+        return [TradeOpportunity(symbol='SPY', action=TradeAction.BUY, quantity=1, confidence=0.9, strategy='test')]
+
+    def validate_opportunity(self, opportunity):
+        return False
+
+    def execute_trades(self, opportunities):
+        return []
+
+    def monitor_positions(self):
+        return []
+
+
+class AsyncModule(SyncModule):
+    """Native async module whose analysis waits for delay seconds"""
+
+    def __init__(self, name, delay):
+        self.delay = delay
+        self.cancelled = False
+        super().__init__(name)
+
+    async def analyze_opportunities_async(self):
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        return []
+
+    async def monitor_positions_async(self):
+        return []
+
+
+class TestAsyncOrchestrator(unittest.TestCase):
+
+    def setUp(self):
+        self.orchestrator = ModularOrchestrator(firebase_db=Mock(), risk_manager=Mock(), order_executor=Mock())
+        self.orchestrator.set_async_execution(True)
+
+    def tearDown(self):
+        self.orchestrator.shutdown()
+
+    def test_sync_module_runs_on_shared_executor(self):
+        module = SyncModule('stocks')
+        self.orchestrator.register_module(module)
+
+        results = self.orchestrator.run_single_cycle()
+
+        self.assertTrue(results['modules']['stocks']['success'])
+        self.assertEqual(results['modules']['stocks']['opportunities_count'], 1)
+        self.assertTrue(module.analysis_threads[0].startswith('module'))
+
+    def test_async_modules_run_concurrently(self):
+        for i in range(3):
+            self.orchestrator.register_module(AsyncModule(f"async_{i}", delay=0.2))
+
+        start = time.monotonic()
+        results = self.orchestrator.run_single_cycle()
+
+        self.assertLess(time.monotonic() - start, 0.5)
+        self.assertTrue(all(r['success'] for r in results['modules'].values()))
+
+    def test_overrunning_module_is_cancelled(self):
+        self.orchestrator._config['module_timeout_seconds'] = 0.1
+        self.orchestrator._config['cancel_grace_seconds'] = 0
+        slow = AsyncModule('slow', delay=5)
+        fast = AsyncModule('fast', delay=0)
+        self.orchestrator.register_module(slow)
+        self.orchestrator.register_module(fast)
+
+        results = self.orchestrator.run_single_cycle()
+
+        self.assertFalse(results['modules']['slow']['success'])
+        self.assertIn('timed out', results['modules']['slow']['error'])
+        self.assertTrue(slow.cancelled)
+        self.assertTrue(results['modules']['fast']['success'])
+
+    def test_hung_modules_do_not_starve_others(self):
+        """Modules stuck in sync hooks hold only their own workers"""
+        self.orchestrator._config['module_timeout_seconds'] = 0.2
+        self.orchestrator._config['cancel_grace_seconds'] = 0
+        release = threading.Event()
+        self.addCleanup(release.set)
+        for i in range(self.orchestrator._config['max_concurrent_modules']):
+            hung = SyncModule(f"hung_{i}")
+            hung.analyze_opportunities = lambda: release.wait(5) and []
+            self.orchestrator.register_module(hung)
+        self.orchestrator.register_module(SyncModule('healthy'))
+
+        results = self.orchestrator.run_single_cycle()
+
+        self.assertTrue(results['modules']['healthy']['success'])
+        self.assertFalse(results['modules']['hung_0']['success'])
+
+
+if __name__ == '__main__':
+    unittest.main()
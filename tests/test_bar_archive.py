@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""
+Tests for the memory-mapped bar archive
+
+Tests append/range-read round trips, forming-bar replacement, file growth,
+persistence across instances, batched index writes, freshness checks, and
+warm restarts of the in-memory bar store.
+"""
+
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+
+import numpy as np
+import pandas as pd
+
+from utils.bar_archive import BarArchive
+from utils.bar_store import BarStore
+
+
+NOW = datetime(2025, 1, 1, 12, 0, tzinfo=timezone.utc)
+
+
+def _series(n, start_hours_ago):
+    timestamps = [NOW - timedelta(hours=start_hours_ago - i) for i in range(n)]
+    close = np.arange(n, dtype=np.float64) + 100.0
+    return timestamps, close, close + 1, close - 1, close, np.full(n, 10.0)
+
+
+class TestBarArchive(unittest.TestCase):
+    """Test on-disk archive behaviour"""
+
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.archive = BarArchive(self.root, initial_capacity=8)
+
+    def tearDown(self):
+        self.archive.close()
+        shutil.rmtree(self.root, ignore_errors=True)
+
+    def test_append_and_read_range(self):
+        """Test appended bars come back as read-only arrays in time order"""
+        added = self.archive.append('BTCUSD', '1Hour', *_series(5, 5))
+
+        self.assertEqual(added, 5)
+        history = self.archive.read_range('BTCUSD', '1Hour')
+        np.testing.assert_array_equal(history.close, [100.0, 101.0, 102.0, 103.0, 104.0])
+        self.assertEqual(history.last_timestamp, NOW - timedelta(hours=1))
+        self.assertIsInstance(history.close.base, np.ndarray)
+        with self.assertRaises(ValueError):
+            history.close[0] = 0.0
+
+        window = self.archive.read_range('BTCUSD', '1Hour', start=NOW - timedelta(hours=4),
+                                         end=NOW - timedelta(hours=2))
+        np.testing.assert_array_equal(window.close, [101.0, 102.0, 103.0])
+        self.assertEqual(len(self.archive.read_range('BTCUSD', '1Hour', last_n=2)), 2)
+        self.assertIsNone(self.archive.read_range('ETHUSD', '1Hour'))
+
+    def test_forming_bar_replaced_and_old_bars_skipped(self):
+        """Test same-timestamp bars overwrite and older bars are ignored"""
+        self.archive.append('BTCUSD', '1Hour', *_series(3, 3))
+        last = NOW - timedelta(hours=1)
+
+        added = self.archive.append('BTCUSD', '1Hour', [NOW - timedelta(hours=5), last, NOW],
+                                    [1, 2, 3], [1, 2, 3], [1, 2, 3], [1.0, 250.0, 260.0], [1, 2, 3])
+
+        self.assertEqual(added, 1)
+        history = self.archive.read_range('BTCUSD', '1Hour')
+        np.testing.assert_array_equal(history.close, [100.0, 101.0, 250.0, 260.0])
+
+    def test_growth_and_persistence(self):
+        """Test files grow past initial capacity and reopen with the same data"""
+        self.archive.append('BTCUSD', '1Hour', *_series(20, 20))
+        self.archive.close()
+
+        reopened = BarArchive(self.root)
+        history = reopened.read_range('BTCUSD', '1Hour')
+
+        self.assertEqual(len(history), 20)
+        self.assertEqual(history.close[-1], 119.0)
+        self.assertEqual(reopened.count('BTCUSD', '1Hour'), 20)
+        self.assertIn(('BTCUSD', '1Hour'), reopened.series())
+        reopened.close()
+
+    def test_growth_and_replace_leave_earlier_reads_intact(self):
+        """Test reads are copies that survive appends, growth and replace()"""
+        self.archive.append('BTCUSD', '1Hour', *_series(8, 20))
+        before = self.archive.read_range('BTCUSD', '1Hour')
+        path = os.path.join(self.root, 'BTCUSD__1Hour.bars')
+        inode = os.stat(path).st_ino
+
+        self.archive.append('BTCUSD', '1Hour', *_series(8, 8))
+        self.assertNotEqual(os.stat(path).st_ino, inode)  # Grown into a new file, not truncated in place
+        self.archive.replace('BTCUSD', '1Hour', [NOW - timedelta(hours=30)], [1.0], [1.0], [1.0], [1.0], [1.0])
+
+        np.testing.assert_array_equal(before.close, np.arange(8) + 100.0)
+        self.assertEqual(self.archive.count('BTCUSD', '1Hour'), 17)
+        self.assertEqual(self.archive.read_range('BTCUSD', '1Hour').close[0], 1.0)
+
+    def test_index_written_in_batches(self):
+        """Test appends defer the index rewrite until the flush interval or flush()"""
+        archive = BarArchive(self.root, initial_capacity=64, index_flush_seconds=60)
+        index_path = os.path.join(self.root, 'index.json')
+        archive.append('ETHUSD', '1Hour', *_series(3, 10))
+        archive.append('ETHUSD', '1Hour', *_series(3, 5))
+
+        with open(index_path) as f:
+            self.assertEqual(json.load(f)['ETHUSD|1Hour']['count'], 3)
+        archive.flush()
+        with open(index_path) as f:
+            self.assertEqual(json.load(f)['ETHUSD|1Hour']['count'], 6)
+        archive.close()
+
+    def test_is_current(self):
+        """Test a series is current only with a recent last bar that was written recently"""
+        now = NOW + timedelta(minutes=30)
+        with patch('utils.bar_archive.time.time', return_value=NOW.timestamp() + 10 * 60):
+            self.archive.append('BTCUSD', '1Hour', [now - timedelta(hours=2, minutes=30)], [1], [1], [1], [1], [1])
+        self.assertFalse(self.archive.is_current('BTCUSD', '1Hour', now=now))
+
+        with patch('utils.bar_archive.time.time', return_value=NOW.timestamp() + 20 * 60):
+            self.archive.append('BTCUSD', '1Hour', [now - timedelta(minutes=30)], [1], [1], [1], [1], [1])
+        self.assertTrue(self.archive.is_current('BTCUSD', '1Hour', now=now))
+        self.assertFalse(self.archive.is_current('BTCUSD', '1Hour', now=now + timedelta(minutes=20)))
+        self.assertFalse(self.archive.is_current('BTCUSD', '1Hour', now=now - timedelta(minutes=15)))
+        self.assertFalse(self.archive.is_current('ETHUSD', '1Hour', now=now))
+
+    def test_bar_store_warm_restart(self):
+        """Test a new bar store seeds from the archive and fetches only missed bars"""
+        def bars(hours):
+            return [SimpleNamespace(t=NOW - timedelta(hours=h), o=1.0, h=2.0, l=0.5, c=float(100 - h), v=5.0)
+                    for h in hours]
+
+        first_store = BarStore(lambda symbols, tf, start: {'BTCUSD': bars(range(10, 1, -1))},
+                               history_depth=50, archive=self.archive)
+        first_store.update(['BTCUSD'], '1Hour', now=NOW - timedelta(hours=2))
+        self.assertEqual(self.archive.count('BTCUSD', '1Hour'), 9)
+
+        requests = []
+
+        def fetch(symbols, tf, start):
+            requests.append(start)
+            return {'BTCUSD': bars([2, 1])}
+
+        restarted_store = BarStore(fetch, history_depth=50, archive=self.archive)
+        restarted_store.update(['BTCUSD'], '1Hour', now=NOW)
+
+        self.assertEqual(requests, [NOW - timedelta(hours=2)])
+        self.assertEqual(len(restarted_store.get_history('BTCUSD')), 10)
+        self.assertEqual(restarted_store.get_stats()['archive_loads'], 1)
+        self.assertEqual(self.archive.count('BTCUSD', '1Hour'), 10)
+
+    def test_enhanced_data_manager_archive_fallback(self):
+        """Test archived daily bars are written through and served when live sources fail"""
+        from enhanced_data_manager import EnhancedDataManager
+
+        manager = EnhancedDataManager()
+        manager.bar_archive = self.archive
+        index = pd.date_range(end=datetime.now(timezone.utc).date(), periods=5, freq='D', tz='UTC')
+        frame = pd.DataFrame({'open': 1.0, 'high': 2.0, 'low': 0.5, 'close': [1.0, 2.0, 3.0, 4.0, 5.0],
+                              'volume': 100.0}, index=index)
+
+        manager._archive_historical_data('AAPL', '1d', frame)
+        manager.yfinance_available = False
+        data = manager.get_historical_data('AAPL', period='1mo', interval='1d')
+
+        self.assertEqual(data['close'].tolist(), [1.0, 2.0, 3.0, 4.0, 5.0])
+        self.assertEqual(data['source'].iloc[0], 'bar_archive')
+        self.assertEqual(len(manager.get_archived_history('AAPL', '1d', last_n=3)), 3)
+
+    def test_enhanced_data_manager_reads_current_archive_first(self):
+        """Test current intraday archives are served without hitting live sources"""
+        import enhanced_data_manager
+        from enhanced_data_manager import EnhancedDataManager
+
+        manager = EnhancedDataManager()
+        manager.bar_archive = self.archive
+        manager.yfinance_available = True
+        now = datetime.now(timezone.utc).replace(minute=0, second=0, microsecond=0)
+        index = pd.date_range(end=now, periods=24 * 35, freq='h', tz='UTC')
+        frame = pd.DataFrame({'open': 1.0, 'high': 2.0, 'low': 0.5, 'close': 3.0, 'volume': 100.0}, index=index)
+        manager._archive_historical_data('BTCUSD', '1h', frame)
+
+        yf = Mock()
+        with patch.object(enhanced_data_manager, 'yf', yf, create=True):
+            data = manager.get_historical_data('BTCUSD', period='1mo', interval='1h')
+
+        yf.Ticker.assert_not_called()
+        self.assertEqual(data['source'].iloc[0], 'bar_archive')
+        self.assertEqual(len(data), 24 * 30)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Tests for the incremental OHLCV bar store
+
+Tests cold backfill, incremental fetching from the last stored bar, in-place
+updates of the forming bar, capacity rollover, and read-only numpy views.
+"""
+
+import unittest
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+import numpy as np
+
+from utils.bar_store import BarStore, timeframe_to_seconds
+
+
+NOW = datetime(2025, 1, 1, 12, 0, tzinfo=timezone.utc)
+
+
+def _bar(hours_ago, close, volume=10.0):
+    return SimpleNamespace(t=NOW - timedelta(hours=hours_ago), o=close, h=close + 1,
+                           l=close - 1, c=close, v=volume)
+
+
+class RecordingFetcher:
+    """Fetcher returning pre-set bars per symbol and recording each request"""
+
+    def __init__(self, bars_by_symbol):
+        self.bars_by_symbol = bars_by_symbol
+        self.calls = []
+
+    def __call__(self, symbols, timeframe, start):
+        self.calls.append((list(symbols), timeframe, start))
+        return {s: [b for b in self.bars_by_symbol.get(s, []) if b.t >= start] for s in symbols}
+
+
+class TestBarStore(unittest.TestCase):
+    """Test incremental bar store behaviour"""
+
+    def setUp(self):
+        self.fetcher = RecordingFetcher({
+            'BTCUSD': [_bar(h, 100.0 + (10 - h)) for h in range(10, 0, -1)],
+            'ETHUSD': [_bar(h, 50.0) for h in range(10, 0, -1)]
+        })
+        self.store = BarStore(self.fetcher, history_depth=20)
+
+    def test_timeframe_to_seconds(self):
+        """Test Alpaca timeframe parsing"""
+        self.assertEqual(timeframe_to_seconds('1Min'), 60)
+        self.assertEqual(timeframe_to_seconds('15Min'), 900)
+        self.assertEqual(timeframe_to_seconds('1Hour'), 3600)
+        self.assertEqual(timeframe_to_seconds('1Day'), 86400)
+        with self.assertRaises(ValueError):
+            timeframe_to_seconds('1Fortnight')
+
+    def test_cold_backfill_uses_one_request(self):
+        """Test new series are backfilled with history_depth bars in one request"""
+        appended = self.store.update(['BTCUSD', 'ETHUSD'], '1Hour', now=NOW)
+
+        self.assertEqual(appended, {'BTCUSD': 10, 'ETHUSD': 10})
+        self.assertEqual(len(self.fetcher.calls), 1)
+        self.assertEqual(self.fetcher.calls[0][2], NOW - timedelta(hours=20))
+
+        history = self.store.get_history('BTCUSD', '1Hour')
+        self.assertEqual(len(history), 10)
+        self.assertEqual(history.close[-1], 109.0)
+        self.assertEqual(history.last_timestamp, NOW - timedelta(hours=1))
+
+    def test_warm_update_fetches_from_last_bar(self):
+        """Test warm series only request bars from the last stored bar on"""
+        self.store.update(['BTCUSD'], '1Hour', now=NOW)
+        self.fetcher.bars_by_symbol['BTCUSD'].append(_bar(0, 111.0))
+
+        appended = self.store.update(['BTCUSD'], '1Hour', now=NOW)
+
+        self.assertEqual(appended['BTCUSD'], 1)
+        self.assertEqual(self.fetcher.calls[-1][2], NOW - timedelta(hours=1))
+        self.assertEqual(len(self.store.get_history('BTCUSD')), 11)
+        self.assertEqual(self.store.get_stats()['bars_updated'], 1)
+
+    def test_forming_bar_updated_in_place(self):
+        """Test a re-sent bar with the same timestamp replaces the stored one"""
+        self.store.update(['BTCUSD'], '1Hour', now=NOW)
+        self.fetcher.bars_by_symbol['BTCUSD'][-1] = _bar(1, 120.0, volume=99.0)
+
+        self.store.update(['BTCUSD'], '1Hour', now=NOW)
+        history = self.store.get_history('BTCUSD')
+
+        self.assertEqual(len(history), 10)
+        self.assertEqual(history.close[-1], 120.0)
+        self.assertEqual(history.volume[-1], 99.0)
+
+    def test_capacity_rollover_keeps_newest_bars(self):
+        """Test the store keeps only history_depth bars through compaction"""
+        store = BarStore(self.fetcher, history_depth=4)
+        for hours_ago in range(10, 0, -1):
+            self.fetcher.bars_by_symbol['BTCUSD'] = [_bar(hours_ago, float(hours_ago))]
+            store.update(['BTCUSD'], '1Hour', now=NOW)
+
+        history = store.get_history('BTCUSD')
+        np.testing.assert_array_equal(history.close, [4.0, 3.0, 2.0, 1.0])
+        self.assertEqual(len(store.get_history('BTCUSD', last_n=2)), 2)
+
+    def test_views_are_read_only(self):
+        """Test returned arrays cannot modify stored bars"""
+        self.store.update(['BTCUSD'], '1Hour', now=NOW)
+        history = self.store.get_history('BTCUSD')
+
+        with self.assertRaises(ValueError):
+            history.close[0] = 0.0
+
+    def test_fetch_error_is_isolated(self):
+        """Test a failed fetch leaves stored history untouched"""
+        self.store.update(['BTCUSD'], '1Hour', now=NOW)
+
+        def failing_fetch(symbols, timeframe, start):
+            raise Exception("API down")
+
+        self.store.fetch_bars = failing_fetch
+        appended = self.store.update(['BTCUSD'], '1Hour', now=NOW)
+
+        self.assertEqual(appended['BTCUSD'], 0)
+        self.assertEqual(len(self.store.get_history('BTCUSD')), 10)
+        self.assertEqual(self.store.get_stats()['request_errors'], 1)
+        self.assertIsNone(self.store.get_history('SOLUSD'))
+
+
+if __name__ == '__main__':
+    unittest.main()
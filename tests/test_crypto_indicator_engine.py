@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Tests for the vectorized crypto indicator engine
+
+Tests ragged history stacking, the closed-form EMA, and that the cross-symbol
+results match straightforward per-symbol calculations.
+"""
+
+import unittest
+
+import numpy as np
+
+from utils.crypto_indicator_engine import CryptoIndicatorEngine, ema_last, stack_price_histories
+
+
+def reference_ema(prices, period):
+    """Recursive EMA seeded with the first price"""
+    multiplier = 2 / (period + 1)
+    ema = prices[0]
+    for price in prices[1:]:
+        ema = price * multiplier + ema * (1 - multiplier)
+    return ema
+
+
+def make_history(length, seed, drift=0.0):
+    rng = np.random.default_rng(seed)
+    return 100 * np.exp(np.cumsum(rng.normal(drift, 0.02, length)))
+
+
+class TestCryptoIndicatorEngine(unittest.TestCase):
+    """Test cross-symbol indicator calculations"""
+
+    def setUp(self):
+        self.engine = CryptoIndicatorEngine(ma_period=20, oversold_threshold=-0.15)
+
+    def _market_data(self, prices, current_price=None, volume_24h=1500.0, avg_volume=1000.0):
+        return {
+            'price_history': prices,
+            'current_price': float(prices[-1]) if current_price is None else current_price,
+            'volume_24h': volume_24h,
+            'avg_volume_7d': avg_volume
+        }
+
+    def test_stack_right_aligns_ragged_histories(self):
+        """Test shorter histories are left-padded so the latest bars share a column"""
+        matrix, lengths = stack_price_histories([[1.0, 2.0, 3.0], [5.0], []])
+
+        self.assertEqual(matrix.shape, (3, 3))
+        self.assertEqual(list(lengths), [3, 1, 0])
+        self.assertEqual(matrix[1, -1], 5.0)
+        self.assertTrue(np.isnan(matrix[1, 0]))
+        self.assertTrue(np.isnan(matrix[2]).all())
+
+    def test_closed_form_ema_matches_recursion(self):
+        """Test the weighted-sum EMA equals the recursive EMA for every row"""
+        histories = [make_history(n, seed) for seed, n in enumerate((26, 40, 60, 1))]
+        matrix, lengths = stack_price_histories(histories)
+
+        for period in (9, 12, 26):
+            result = ema_last(matrix, lengths, period)
+            for row, history in enumerate(histories):
+                self.assertAlmostEqual(result[row], reference_ema(list(history), period), places=8)
+
+    def test_rsi_and_bollinger_match_per_symbol_formulas(self):
+        """Test RSI, MA deviation and bands for each symbol in a mixed batch"""
+        histories = {'BTCUSD': make_history(30, 1, 0.01), 'ETHUSD': make_history(45, 2, -0.01),
+                     'SOLUSD': make_history(22, 3)}
+        results = self.engine.analyze({s: self._market_data(h) for s, h in histories.items()})
+
+        for symbol, prices in histories.items():
+            changes = np.diff(prices)[-14:]
+            avg_gain = changes.clip(min=0).sum() / 14
+            avg_loss = (-changes).clip(min=0).sum() / 14
+            expected_rsi = 100 - 100 / (1 + avg_gain / avg_loss)
+            sma = prices[-20:].mean()
+
+            rsi = results[symbol].rsi
+            bollinger = results[symbol].bollinger
+            self.assertAlmostEqual(rsi['rsi_value'], expected_rsi, places=8)
+            self.assertAlmostEqual(rsi['ma_deviation'], (prices[-1] - sma) / sma, places=10)
+            self.assertAlmostEqual(bollinger['sma_20'], sma, places=8)
+            self.assertAlmostEqual(bollinger['upper_band'], sma + 2 * prices[-20:].std(), places=8)
+            self.assertAlmostEqual(bollinger['sell_strength'], 1 - bollinger['buy_strength'])
+
+    def test_macd_uses_fallback_periods_for_short_histories(self):
+        """Test 21-25 bars use EMA-9/21 and fewer than 21 bars give no MACD"""
+        histories = {'LONG': make_history(40, 4), 'SHORT': make_history(23, 5), 'TINY': make_history(15, 6)}
+        results = self.engine.analyze({s: self._market_data(h) for s, h in histories.items()})
+
+        long_prices = list(histories['LONG'])
+        self.assertAlmostEqual(results['LONG'].macd['macd_line'],
+                               reference_ema(long_prices, 12) - reference_ema(long_prices, 26), places=8)
+        self.assertNotIn('fallback_method', results['LONG'].macd)
+        short_prices = list(histories['SHORT'])
+        self.assertAlmostEqual(results['SHORT'].macd['macd_line'],
+                               reference_ema(short_prices, 9) - reference_ema(short_prices, 21), places=8)
+        self.assertTrue(results['SHORT'].macd['fallback_method'])
+        self.assertIsNone(results['TINY'].macd)
+        self.assertIsNone(results['TINY'].bollinger)
+        self.assertIsNotNone(results['TINY'].rsi)
+
+    def test_signal_bands_and_volume_confirmation(self):
+        """Test strengths for a falling symbol below its lower band with strong volume"""
+        prices = np.concatenate([np.full(20, 100.0), np.linspace(100, 70, 10)])
+        results = self.engine.analyze({
+            'DOWN': self._market_data(prices, current_price=60.0, volume_24h=2500.0),
+            'NOVOL': self._market_data(make_history(30, 7), avg_volume=0.0, volume_24h=0.0)
+        })
+
+        down = results['DOWN']
+        self.assertEqual(down.rsi['signal'], 'strong_buy')
+        self.assertTrue(down.rsi['mean_reversion_context'].startswith('mean_reversion_oversold'))
+        self.assertAlmostEqual(down.rsi['buy_strength'], 0.95)
+        self.assertEqual(down.bollinger['position'], 'below_lower')
+        self.assertEqual(down.macd['macd_signal'], 'bearish')
+        self.assertEqual(down.volume['confirmation'], 'strong')
+        self.assertEqual(down.volume['strength_multiplier'], 1.2)
+        self.assertIsNone(results['NOVOL'].volume)
+
+
+if __name__ == '__main__':
+    unittest.main()
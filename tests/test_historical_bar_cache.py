@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+Tests for the historical daily-bar cache
+
+Tests completed/partial bar splitting, tail-only fetching, partial bar
+refresh, longer-range refetches, warm restarts from the bar archive, and
+EnhancedDataManager integration.
+"""
+
+import shutil
+import tempfile
+import unittest
+from datetime import datetime, timedelta, timezone
+from unittest.mock import Mock, patch
+
+import pandas as pd
+
+from utils.bar_archive import BarArchive
+from utils.historical_bar_cache import HistoricalBarCache
+
+
+NOW = datetime(2025, 3, 14, 18, 0, tzinfo=timezone.utc)  # Friday, US market open
+
+
+def _daily_bars(end_day, days):
+    """yfinance-style daily bars (America/New_York midnight index) ending at end_day inclusive"""
+    index = pd.date_range(end=pd.Timestamp(end_day).tz_localize('America/New_York'), periods=days, freq='D')
+    close = [100.0 + i for i in range(days)]
+    return pd.DataFrame({'open': close, 'high': [c + 1 for c in close], 'low': [c - 1 for c in close],
+                         'close': close, 'volume': 1000.0, 'dividends': 0.0}, index=index)
+
+
+class RecordingHistory:
+    """Fetcher serving bars from a fixed frame and recording each start date"""
+
+    def __init__(self, frame):
+        self.frame = frame
+        self.starts = []
+
+    def __call__(self, symbol, interval, start):
+        self.starts.append(start)
+        data = self.frame[self.frame.index >= pd.Timestamp(start.date()).tz_localize('America/New_York')]
+        return data.copy() if not data.empty else None
+
+
+class TestHistoricalBarCache(unittest.TestCase):
+    """Test tail-only fetching of daily bars"""
+
+    def setUp(self):
+        self.fetcher = RecordingHistory(_daily_bars('2025-03-14', 60))
+        self.cache = HistoricalBarCache(self.fetcher)
+
+    def test_first_request_fetches_range_and_splits_partial_bar(self):
+        """Test today's bar is kept as the partial bar and earlier bars as completed"""
+        data = self.cache.get('AAPL', '1d', NOW - timedelta(days=30), now=NOW)
+
+        self.assertEqual(len(self.fetcher.starts), 1)
+        self.assertEqual(list(data.columns), ['open', 'high', 'low', 'close', 'volume'])
+        self.assertEqual(data['close'].iloc[-1], 159.0)
+        series = self.cache._series[('AAPL', '1d')]
+        self.assertEqual(len(series.partial), 1)
+        self.assertEqual(series.completed.index[-1].date().isoformat(), '2025-03-13')
+
+    def test_repeat_request_is_served_from_cache(self):
+        """Test a shorter or equal range within the refresh window needs no fetch"""
+        self.cache.get('AAPL', '1d', NOW - timedelta(days=60), now=NOW)
+        data = self.cache.get('AAPL', '1d', NOW - timedelta(days=30), now=NOW)
+
+        self.assertEqual(len(self.fetcher.starts), 1)
+        self.assertEqual(self.cache.get_stats()['hits'], 1)
+        self.assertLessEqual(len(data), 31)
+
+    def test_stale_partial_fetches_only_the_tail(self):
+        """Test an intraday refresh asks only for bars after the last completed bar"""
+        self.cache.get('AAPL', '1d', NOW - timedelta(days=30), now=NOW)
+        self.fetcher.frame.loc[self.fetcher.frame.index[-1], 'close'] = 170.0
+        self.cache.partial_refresh_seconds = 0
+
+        data = self.cache.get('AAPL', '1d', NOW - timedelta(days=30), now=NOW)
+
+        self.assertEqual(self.fetcher.starts[-1].date().isoformat(), '2025-03-14')
+        self.assertEqual(data['close'].iloc[-1], 170.0)
+        self.assertEqual(self.cache.get_stats()['tail_fetches'], 1)
+
+    def test_next_day_completes_previous_partial_bar(self):
+        """Test yesterday's forming bar becomes completed after the date rolls over"""
+        self.cache.get('AAPL', '1d', NOW - timedelta(days=30), now=NOW)
+        self.fetcher.frame = _daily_bars('2025-03-15', 61)
+
+        tomorrow = NOW + timedelta(days=1)
+        self.cache.get('AAPL', '1d', NOW - timedelta(days=30), now=tomorrow)
+
+        series = self.cache._series[('AAPL', '1d')]
+        self.assertEqual(series.completed.index[-1].date().isoformat(), '2025-03-14')
+        self.assertEqual(series.partial.index[-1].date().isoformat(), '2025-03-15')
+
+    def test_longer_range_triggers_full_fetch(self):
+        """Test a request reaching before the cached range refetches from its start"""
+        self.cache.get('AAPL', '1d', NOW - timedelta(days=20), now=NOW)
+        data = self.cache.get('AAPL', '1d', NOW - timedelta(days=50), now=NOW)
+
+        self.assertEqual(self.cache.get_stats()['full_fetches'], 2)
+        self.assertGreater(len(data), 45)
+
+    def test_fetch_failure_serves_cached_bars(self):
+        """Test a failed tail fetch keeps serving cached bars"""
+        self.cache.get('AAPL', '1d', NOW - timedelta(days=30), now=NOW)
+        self.cache.fetch_history = Mock(side_effect=Exception("rate limited"))
+        self.cache.partial_refresh_seconds = 0
+
+        data = self.cache.get('AAPL', '1d', NOW - timedelta(days=30), now=NOW)
+
+        self.assertIsNotNone(data)
+        self.assertEqual(self.cache.get_stats()['fetch_errors'], 1)
+
+    def test_warm_restart_from_archive(self):
+        """Test completed bars and coverage survive a restart through the bar archive"""
+        root = tempfile.mkdtemp()
+        try:
+            archive = BarArchive(root, initial_capacity=16)
+            HistoricalBarCache(self.fetcher, archive=archive).get('AAPL', '1d', NOW - timedelta(days=40), now=NOW)
+            self.assertEqual(archive.count('AAPL', '1Day'), 40)
+            archive.close()
+
+            reopened = BarArchive(root)
+            fetcher = RecordingHistory(self.fetcher.frame)
+            restarted = HistoricalBarCache(fetcher, archive=reopened)
+            data = restarted.get('AAPL', '1d', NOW - timedelta(days=30), now=NOW)
+
+            self.assertEqual(restarted.get_stats()['archive_loads'], 1)
+            self.assertEqual(restarted.get_stats()['full_fetches'], 0)
+            self.assertEqual(fetcher.starts[0].date().isoformat(), '2025-03-14')
+            self.assertEqual(data['close'].iloc[-1], 159.0)
+            reopened.close()
+        finally:
+            shutil.rmtree(root, ignore_errors=True)
+
+    def test_enhanced_data_manager_uses_cache_for_daily_bars(self):
+        """Test repeated get_historical_data calls reuse cached daily bars"""
+        from enhanced_data_manager import EnhancedDataManager
+
+        manager = EnhancedDataManager()
+        manager.yfinance_available = True
+        ticker = Mock()
+        ticker.history.side_effect = lambda start, interval: _daily_bars(
+            datetime.now(timezone.utc).date().isoformat(), 120).rename(columns=str.capitalize)
+
+        with patch('enhanced_data_manager.yf', create=True) as yf:
+            yf.Ticker.return_value = ticker
+            first = manager.get_historical_data('AAPL', period='3mo', interval='1d')
+            second = manager.get_historical_data('AAPL', period='1mo', interval='1d')
+
+        self.assertEqual(ticker.history.call_count, 1)
+        self.assertEqual(second['source'].iloc[0], 'yfinance')
+        self.assertLess(len(second), len(first))
+        self.assertEqual(first['close'].iloc[-1], second['close'].iloc[-1])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Tests for the pooled HTTP sessions
+
+Tests per-host session reuse, pool sizing and resizing, adopted client
+sessions, warm-up, and usage statistics.
+"""
+
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import Mock, patch
+
+import requests
+
+from utils.http_pool import HttpSessionPool
+
+
+def _start_counting_server():
+    """Local keep-alive HTTP server that records the client port of every request"""
+    ports = set()
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+
+        def do_GET(self):
+            ports.add(self.client_address[1])
+            self.send_response(200)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, ports
+
+
+class TestHttpSessionPool(unittest.TestCase):
+    """Test keep-alive session pooling"""
+
+    def setUp(self):
+        self.pool = HttpSessionPool(pool_size=3)
+        self.addCleanup(self.pool.close)
+
+    def test_session_reused_per_host(self):
+        """Test requests to one host share a session and other hosts get their own"""
+        first = self.pool.session_for('https://paper-api.alpaca.markets/v2/options/contracts')
+        second = self.pool.session_for('https://paper-api.alpaca.markets/v2/account')
+        other = self.pool.session_for('https://www.alphavantage.co/query')
+
+        self.assertIs(first, second)
+        self.assertIsNot(first, other)
+        self.assertEqual(first.get_adapter('https://').poolmanager.connection_pool_kw['maxsize'], 3)
+
+    def test_resize_remounts_owned_and_adopted_sessions(self):
+        """Test resize applies the new pool size to every session"""
+        owned = self.pool.session_for('https://finnhub.io')
+        adopted = requests.Session()
+        self.pool.adopt_session('alpaca', adopted)
+
+        self.pool.resize(6)
+
+        for session in (owned, adopted):
+            self.assertEqual(session.get_adapter('https://').poolmanager.connection_pool_kw['maxsize'], 6)
+        adopted.close()
+
+    def test_adopted_session_keeps_connections_to_several_hosts(self):
+        """Test alternating between two hosts on an adopted session reuses one connection per host"""
+        servers = [_start_counting_server() for _ in range(2)]
+        adopted = requests.Session()
+        self.pool.adopt_session('alpaca', adopted)
+        try:
+            for i in range(20):
+                server, _ = servers[i % 2]
+                adopted.get(f'http://127.0.0.1:{server.server_address[1]}/').close()
+        finally:
+            adopted.close()
+            for server, _ in servers:
+                server.shutdown()
+                server.server_close()
+
+        self.assertEqual([len(ports) for _, ports in servers], [1, 1])
+
+    @patch('utils.http_pool.requests.Session.request')
+    def test_get_routes_through_session_and_records_stats(self, mock_request):
+        """Test get() uses the pooled session and counts requests and errors per host"""
+        mock_request.return_value = Mock(status_code=200)
+
+        self.pool.get('https://www.alphavantage.co/query?function=GLOBAL_QUOTE', timeout=10)
+        mock_request.side_effect = requests.ConnectionError("reset")
+        with self.assertRaises(requests.ConnectionError):
+            self.pool.get('https://www.alphavantage.co/query', timeout=10)
+
+        mock_request.assert_called_with('GET', 'https://www.alphavantage.co/query', timeout=10)
+        stats = self.pool.get_stats()['www.alphavantage.co']
+        self.assertEqual(stats['requests'], 2)
+        self.assertEqual(stats['errors'], 1)
+        self.assertEqual(stats['pool_size'], 3)
+        self.assertIn('connections_opened', stats)
+
+    @patch('utils.http_pool.requests.Session.request')
+    def test_warm_up_reports_each_host(self, mock_request):
+        """Test warm-up sends HEAD requests and tolerates unreachable hosts"""
+        mock_request.side_effect = [Mock(status_code=404), requests.Timeout("slow")]
+
+        results = self.pool.warm_up(['https://paper-api.alpaca.markets', 'https://finnhub.io'])
+
+        self.assertEqual(results, {'paper-api.alpaca.markets': True, 'finnhub.io': False})
+        self.assertEqual(mock_request.call_args_list[0][0], ('HEAD', 'https://paper-api.alpaca.markets'))
+
+    def test_warm_up_adopted_session(self):
+        """Test warm-up can open connections on an adopted client session instead of the pool's own"""
+        adopted = Mock(spec=requests.Session)
+        self.pool.adopt_session('alpaca', adopted)
+
+        results = self.pool.warm_up(['https://data.alpaca.markets'], adopted='alpaca')
+
+        self.assertEqual(results, {'data.alpaca.markets': True})
+        adopted.request.assert_called_once_with('HEAD', 'https://data.alpaca.markets', timeout=5.0,
+                                                allow_redirects=False)
+        self.assertEqual(self.pool.get_stats(), {})
+        self.assertEqual(self.pool.warm_up(['https://finnhub.io'], adopted='missing'), {})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Tests for the indicator result cache
+
+Tests reuse until a new bar arrives, LRU eviction, hit-rate counters, and
+memoization through EnhancedTechnicalIndicators.
+"""
+
+import unittest
+from unittest.mock import Mock
+
+import numpy as np
+import pandas as pd
+
+from enhanced_technical_indicators import EnhancedTechnicalIndicators
+from utils.indicator_cache import IndicatorCache
+
+
+class TestIndicatorCache(unittest.TestCase):
+    """Test memoization keyed by series and last bar time"""
+
+    def setUp(self):
+        self.cache = IndicatorCache(max_entries=2)
+
+    def test_reused_until_new_bar(self):
+        """Test the same bar hits, a new bar recomputes and replaces the entry"""
+        compute = Mock(side_effect=[1.0, 2.0])
+        bar = pd.Timestamp('2024-01-02')
+
+        first = self.cache.get_or_compute('SPY', '1d', 'rsi', (14,), bar, compute)
+        second = self.cache.get_or_compute('SPY', '1d', 'rsi', (14,), bar, compute)
+        third = self.cache.get_or_compute('SPY', '1d', 'rsi', (14,), bar + pd.Timedelta(days=1), compute)
+
+        self.assertEqual((first, second, third), (1.0, 1.0, 2.0))
+        self.assertEqual(compute.call_count, 2)
+        self.assertEqual(len(self.cache), 1)
+        stats = self.cache.get_stats()
+        self.assertEqual((stats['hits'], stats['misses'], stats['stale']), (1, 2, 1))
+        self.assertAlmostEqual(stats['by_indicator']['rsi']['hit_rate'], 1 / 3)
+
+    def test_lru_eviction_and_none_results(self):
+        """Test least recently used series are evicted and None results are cached"""
+        bar = 1
+        self.cache.get_or_compute('SPY', '1d', 'rsi', (14,), bar, lambda: None)
+        self.cache.get_or_compute('QQQ', '1d', 'rsi', (14,), bar, lambda: 50.0)
+        self.cache.get_or_compute('SPY', '1d', 'rsi', (14,), bar, lambda: self.fail("should hit"))
+        self.cache.get_or_compute('IWM', '1d', 'rsi', (14,), bar, lambda: 40.0)
+
+        stats = self.cache.get_stats()
+        self.assertEqual(stats['evictions'], 1)
+        self.assertEqual(stats['size'], 2)
+        self.assertEqual(self.cache.get_or_compute('QQQ', '1d', 'rsi', (14,), bar, lambda: 55.0), 55.0)
+
+    def test_returned_dicts_are_copies(self):
+        """Test callers mutating a result do not corrupt the cache"""
+        result = self.cache.get_or_compute('SPY', '1d', 'macd', (), 1, lambda: {'macd': 1.0})
+        result['macd'] = 99.0
+        self.assertEqual(self.cache.get_or_compute('SPY', '1d', 'macd', (), 1, dict), {'macd': 1.0})
+
+
+class TestEnhancedIndicatorMemoization(unittest.TestCase):
+    """Test EnhancedTechnicalIndicators routes identified series through the cache"""
+
+    def setUp(self):
+        self.cache = IndicatorCache()
+        self.indicators = EnhancedTechnicalIndicators(indicator_cache=self.cache)
+        rng = np.random.default_rng(3)
+        self.prices = list(100 * np.exp(np.cumsum(rng.normal(0, 0.01, 60))))
+        self.bar = pd.Timestamp('2024-03-01')
+
+    def test_memoized_results_match_direct_calculation(self):
+        """Test cached indicators equal uncached ones and repeat calls hit"""
+        series = {'symbol': 'SPY', 'timeframe': '1d', 'last_bar_time': self.bar}
+        for _ in range(2):
+            self.assertEqual(self.indicators.calculate_rsi(self.prices, **series),
+                             self.indicators.calculate_rsi(self.prices))
+            self.assertEqual(self.indicators.calculate_macd(self.prices, **series),
+                             self.indicators.calculate_macd(self.prices))
+            self.assertEqual(self.indicators.calculate_bollinger_bands(self.prices, **series),
+                             self.indicators.calculate_bollinger_bands(self.prices))
+
+        stats = self.cache.get_stats()
+        self.assertEqual(stats['hits'], 3)
+        self.assertEqual(stats['misses'], 3)
+
+    def test_analyze_comprehensive_shares_indicators(self):
+        """Test comprehensive analysis is memoized and reuses per-indicator results"""
+        self.indicators.calculate_rsi(self.prices, symbol='SPY', timeframe='1d', last_bar_time=self.bar)
+
+        first = self.indicators.analyze_comprehensive('SPY', self.prices, last_bar_time=self.bar, bar_timeframe='1d')
+        second = self.indicators.analyze_comprehensive('SPY', self.prices, last_bar_time=self.bar, bar_timeframe='1d')
+
+        self.assertEqual(first, second)
+        self.assertEqual(first, self.indicators.analyze_comprehensive('SPY', self.prices))
+        by_indicator = self.cache.get_stats()['by_indicator']
+        self.assertEqual(by_indicator['rsi']['hits'], 1)
+        self.assertEqual(by_indicator['comprehensive']['hits'], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
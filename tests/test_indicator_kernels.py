@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Tests for the indicator kernel backends
+
+Tests that the numpy kernels, the loop kernels Numba compiles, and (when
+installed) the compiled Numba kernels return the same values, and that
+EnhancedTechnicalIndicators uses them for its custom fallbacks.
+"""
+
+import unittest
+
+import numpy as np
+
+from enhanced_technical_indicators import EnhancedTechnicalIndicators
+from utils.indicator_cache import IndicatorCache
+from utils.indicator_kernels import LOOP_KERNELS, NUMBA_KERNELS, NUMPY_KERNELS
+
+BACKENDS = [LOOP_KERNELS] + ([NUMBA_KERNELS] if NUMBA_KERNELS is not None else [])
+
+
+def make_ohlc(bars, seed):
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, bars)))
+    high = close * (1 + np.abs(rng.normal(0, 0.005, bars)))
+    low = close * (1 - np.abs(rng.normal(0, 0.005, bars)))
+    return high, low, close
+
+
+def run_all(kernels, high, low, close):
+    return {
+        'ema': kernels.ema(close, 12),
+        'macd': kernels.macd(close, 12, 26, 9),
+        'rsi': kernels.rsi(close, 14),
+        'bollinger': kernels.bollinger(close, 20),
+        'atr': kernels.atr(high, low, close, 14),
+        'adx': kernels.adx(high, low, close, 14),
+        'williams_r': kernels.williams_r(high, low, close, 14),
+        'stochastic': kernels.stochastic(high, low, close, 5, 3, 3),
+    }
+
+
+class TestKernelBackends(unittest.TestCase):
+    """Test backend equivalence"""
+
+    def assert_backends_agree(self, high, low, close):
+        expected = run_all(NUMPY_KERNELS, high, low, close)
+        for kernels in BACKENDS:
+            actual = run_all(kernels, high, low, close)
+            for name, value in expected.items():
+                np.testing.assert_allclose(np.asarray(actual[name], dtype=float), np.asarray(value, dtype=float),
+                                           rtol=1e-10, atol=1e-10, equal_nan=True,
+                                           err_msg=f"{kernels.name} {name} ({len(close)} bars)")
+
+    def test_backends_agree_across_lengths(self):
+        """Test every indicator matches from too-short histories to long ones"""
+        for seed, bars in enumerate((1, 10, 15, 27, 28, 60, 1000, 20000)):
+            self.assert_backends_agree(*make_ohlc(bars, seed))
+
+    def test_backends_agree_on_flat_prices(self):
+        """Test zero ranges and zero losses take the same guarded branches"""
+        flat = np.full(60, 50.0)
+        self.assert_backends_agree(flat, flat, flat)
+        self.assertEqual(NUMPY_KERNELS.rsi(flat, 14), 100.0)
+        self.assertEqual(NUMPY_KERNELS.adx(flat, flat, flat, 14), 0.0)
+
+    def test_short_histories_return_nan(self):
+        """Test kernels report missing values as NaN"""
+        high, low, close = make_ohlc(20, 9)
+        self.assertTrue(np.isnan(NUMPY_KERNELS.adx(high, low, close, 14)))
+        self.assertTrue(np.isnan(NUMPY_KERNELS.ema(close[:5], 12)))
+        self.assertFalse(np.isnan(NUMPY_KERNELS.atr(high, low, close, 14)))
+        self.assertTrue(np.isnan(NUMPY_KERNELS.macd(close, 12, 26, 9)).all())
+
+
+class TestEnhancedIndicatorsUseKernels(unittest.TestCase):
+    """Test the custom fallbacks in EnhancedTechnicalIndicators"""
+
+    def setUp(self):
+        self.indicators = EnhancedTechnicalIndicators(indicator_cache=IndicatorCache())
+        self.indicators.talib_available = False
+        self.high, self.low, self.close = make_ohlc(80, 11)
+
+    def test_custom_rsi_and_ema_match_reference(self):
+        """Test kernel-backed RSI and EMA equal the straightforward formulas"""
+        deltas = np.diff(self.close)[-14:]
+        gain, loss = deltas.clip(min=0).mean(), (-deltas).clip(min=0).mean()
+        self.assertAlmostEqual(self.indicators.calculate_rsi(self.close), 100 - 100 / (1 + gain / loss), places=9)
+
+        ema = self.close[0]
+        for price in self.close[1:]:
+            ema = price * (2 / 13) + ema * (1 - 2 / 13)
+        self.assertAlmostEqual(self.indicators._calculate_ema(self.close, 12), ema, places=9)
+        self.assertIsNone(self.indicators._calculate_ema(self.close[:3], 12))
+
+    def test_advanced_indicators_without_talib(self):
+        """Test ATR, ADX, Williams %R and Stochastic are available without TA-Lib"""
+        advanced = self.indicators.calculate_advanced_indicators(self.high, self.low, self.close)
+
+        self.assertEqual(set(advanced), {'atr', 'adx', 'williams_r', 'stoch_k', 'stoch_d'})
+        self.assertTrue(0 <= advanced['adx'] <= 100)
+        self.assertTrue(-100 <= advanced['williams_r'] <= 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
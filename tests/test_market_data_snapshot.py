@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+"""
+Tests for the per-cycle MarketDataSnapshot
+
+Tests batched snapshot construction, read-only lookups, injection of one
+shared snapshot into every module and the order executor by the orchestrator,
+and the per-cycle market regime attached to it.
+"""
+
+import unittest
+from unittest.mock import Mock
+from types import SimpleNamespace
+from datetime import datetime, timezone
+from typing import List
+
+from modular.base_module import ModuleConfig, TradingModule
+from modular.market_data_snapshot import (
+    MarketDataSnapshotBuilder, is_crypto_symbol, normalize_symbol
+)
+from modular.market_regime import CycleRegime, CycleRegimeBuilder, REGIME_SECTOR_SYMBOLS
+from modular.orchestrator import ModularOrchestrator
+from modular.order_executor import ModularOrderExecutor
+
+
+def _build_api():
+    """API client answering batched snapshot requests"""
+    now = datetime.now(timezone.utc)
+
+    def snapshot(price):
+        return SimpleNamespace(
+            latest_quote=SimpleNamespace(ap=price + 0.5, bp=price - 0.5, timestamp=now),
+            latest_trade=SimpleNamespace(p=price, t=now),
+            minute_bar=SimpleNamespace(o=price, h=price + 1, l=price - 1, c=price, v=1000.0, t=now)
+        )
+
+    api = Mock()
+    api.get_snapshots.side_effect = lambda symbols: {s: snapshot(100.0) for s in symbols}
+    api.get_crypto_snapshots.side_effect = lambda symbols: {s: snapshot(50000.0) for s in symbols}
+    api.get_clock.return_value = SimpleNamespace(is_open=True, next_open=None, next_close=None)
+    return api
+
+
+class RecordingModule(TradingModule):
+    """Minimal module that records the snapshot price it sees during analysis"""
+
+    def __init__(self, name, symbols, order_executor):
+        self._name = name
+        self._symbols = symbols
+        self.seen_prices = {}
+        self.seen_snapshot = None
+        super().__init__(ModuleConfig(module_name=name), Mock(), Mock(), order_executor)
+
+    @property
+    def module_name(self) -> str:
+        return self._name
+
+    @property
+    def supported_symbols(self) -> List[str]:
+        return self._symbols
+
+    def analyze_opportunities(self):
+        self.seen_snapshot = self.market_data
+        self.seen_regime = self.get_cycle_regime()
+        self.seen_prices = {s: self.get_snapshot_price(s) for s in self._symbols}
+        return []
+
+    def execute_trades(self, opportunities):
+        return []
+
+    def monitor_positions(self):
+        return []
+
+
+class TestMarketDataSnapshotBuilder(unittest.TestCase):
+    """Test snapshot construction and lookups"""
+
+    def setUp(self):
+        self.api = _build_api()
+        self.builder = MarketDataSnapshotBuilder(self.api)
+
+    def test_symbol_helpers(self):
+        """Test crypto detection and key normalization"""
+        self.assertTrue(is_crypto_symbol('BTCUSD'))
+        self.assertTrue(is_crypto_symbol('BTC/USD'))
+        self.assertFalse(is_crypto_symbol('AAPL'))
+        self.assertEqual(normalize_symbol('BTC/USD'), 'BTCUSD')
+
+    def test_build_uses_batched_requests(self):
+        """Test one stock, one crypto and one clock request regardless of symbol count"""
+        snapshot = self.builder.build(['AAPL', 'MSFT', 'SPY', 'BTCUSD', 'ETHUSD'], cycle_id=3)
+
+        self.assertEqual(self.api.get_snapshots.call_count, 1)
+        self.assertEqual(self.api.get_crypto_snapshots.call_count, 1)
+        self.assertEqual(self.api.get_clock.call_count, 1)
+        self.api.get_crypto_snapshots.assert_called_with(['BTC/USD', 'ETH/USD'])
+
+        self.assertEqual(snapshot.cycle_id, 3)
+        self.assertTrue(snapshot.is_market_open)
+        self.assertEqual(snapshot.get_price('AAPL'), 100.5)
+        self.assertEqual(snapshot.get_price('BTC/USD'), snapshot.get_price('BTCUSD'))
+        self.assertEqual(snapshot.get_bar('ETHUSD').close, 50000.0)
+        self.assertIsNone(snapshot.get_price('TSLA'))
+        self.assertEqual(len(snapshot.symbols), 5)
+
+    def test_snapshot_is_read_only(self):
+        """Test snapshot fields and maps cannot be modified"""
+        snapshot = self.builder.build(['AAPL'])
+
+        with self.assertRaises(Exception):
+            snapshot.cycle_id = 99
+        with self.assertRaises(TypeError):
+            snapshot.quotes['AAPL'] = None
+
+    def test_partial_snapshot_on_request_failure(self):
+        """Test a failed crypto request still yields stock quotes"""
+        self.api.get_crypto_snapshots.side_effect = Exception("API down")
+
+        snapshot = self.builder.build(['AAPL', 'BTCUSD'])
+
+        self.assertTrue(snapshot.has_symbol('AAPL'))
+        self.assertFalse(snapshot.has_symbol('BTCUSD'))
+
+
+class TestOrchestratorSnapshotInjection(unittest.TestCase):
+    """Test orchestrator shares one snapshot across modules and the executor"""
+
+    def setUp(self):
+        self.api = _build_api()
+        firebase_db = Mock()
+        firebase_db.db.collection.return_value.document.return_value.get.return_value.exists = False
+        self.executor = ModularOrderExecutor(api_client=self.api, firebase_db=firebase_db)
+        self.orchestrator = ModularOrchestrator(
+            firebase_db=None,
+            risk_manager=Mock(),
+            order_executor=self.executor,
+            api_client=self.api
+        )
+        self.stocks = RecordingModule('stocks', ['AAPL', 'SPY'], self.executor)
+        self.crypto = RecordingModule('crypto', ['BTCUSD'], self.executor)
+        self.orchestrator.register_module(self.stocks)
+        self.orchestrator.register_module(self.crypto)
+
+    def test_modules_share_one_snapshot(self):
+        """Test every module sees the same snapshot built once per cycle"""
+        self.orchestrator.run_single_cycle()
+
+        self.assertIsNotNone(self.stocks.seen_snapshot)
+        self.assertIs(self.stocks.seen_snapshot, self.crypto.seen_snapshot)
+        self.assertEqual(self.stocks.seen_prices['AAPL'], 100.5)
+        self.assertEqual(self.crypto.seen_prices['BTCUSD'], 50000.5)
+        self.assertEqual(self.api.get_snapshots.call_count, 1)
+        self.assertEqual(self.api.get_crypto_snapshots.call_count, 1)
+
+        # Snapshot is detached once the cycle is over
+        self.assertIsNone(self.stocks.market_data)
+        self.assertIsNone(self.executor.market_data)
+
+    def test_modules_share_one_cycle_regime(self):
+        """Test the regime is computed once from the same snapshot request and reaches every module"""
+        self.orchestrator.run_single_cycle()
+
+        self.assertIsInstance(self.stocks.seen_regime, CycleRegime)
+        self.assertIs(self.stocks.seen_regime, self.crypto.seen_regime)
+        self.assertEqual(self.stocks.seen_regime.symbols_analyzed, len(CycleRegimeBuilder.symbols))
+        requested = self.api.get_snapshots.call_args[0][0]
+        self.assertTrue(set(CycleRegimeBuilder.symbols) <= set(requested))
+        self.assertEqual(self.api.get_snapshots.call_count, 1)
+        self.assertIsNone(self.stocks.get_cycle_regime())
+
+    def test_cycle_regime_fed_only_new_bars(self):
+        """Test a snapshot without newer bars reuses the last regime instead of feeding the detectors again"""
+        builder = CycleRegimeBuilder()
+        snapshot = MarketDataSnapshotBuilder(self.api).build(list(CycleRegimeBuilder.symbols))
+        first = builder.build(snapshot, cycle_id=1)
+        history = len(builder.ml_detector.regime_history)
+
+        second = builder.build(snapshot, cycle_id=2)
+
+        self.assertEqual(second.cycle_id, 2)
+        self.assertEqual(second.regime, first.regime)
+        self.assertEqual(len(builder.ml_detector.regime_history), history)
+    
+    def test_executor_reads_snapshot_price(self):
+        """Test executor uses the cycle snapshot instead of re-quoting"""
+        snapshot = MarketDataSnapshotBuilder(self.api).build(['AAPL', 'BTCUSD'])
+        self.executor.set_market_data(snapshot)
+
+        self.assertEqual(self.executor._get_current_price('AAPL'), 100.5)
+        self.assertEqual(self.executor._get_current_price('BTCUSD'), 50000.5)
+        self.assertTrue(self.executor._is_market_open())
+        self.api.get_latest_quote.assert_not_called()
+        self.api.get_latest_crypto_quotes.assert_not_called()
+
+
+
+class TestCycleRegime(unittest.TestCase):
+    """Test the regime assessment and its per-symbol sector context"""
+
+    def test_neutral_without_regime_symbols(self):
+        """Test a snapshot without index/sector ETFs gives the neutral regime"""
+        snapshot = MarketDataSnapshotBuilder(_build_api()).build(['BTCUSD'])
+        regime = CycleRegimeBuilder().build(snapshot, cycle_id=4)
+
+        self.assertEqual((regime.regime, regime.trend_label, regime.cycle_id), ('sideways', 'sideways', 4))
+        self.assertEqual(regime.symbols_analyzed, 0)
+
+    def test_sector_context(self):
+        """Test sector ETFs use their own rotation signal, other symbols the rotation phase"""
+        regime = CycleRegime(cycle_id=1, created_at=datetime.now(timezone.utc), regime='bullish',
+                             rotation_phase='risk_on', leading_sectors=('XLK',), lagging_sectors=('XLE',))
+
+        self.assertEqual(regime.trend_label, 'bull')
+        self.assertEqual(regime.sector_context('XLK')['rotation_signal'], 'positive')
+        self.assertEqual(regime.sector_context('XLE')['rotation_signal'], 'negative')
+        self.assertEqual(regime.sector_context('AAPL')['rotation_signal'], 'positive')
+        self.assertIn('XLE', REGIME_SECTOR_SYMBOLS)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,267 @@
+#!/usr/bin/env python3
+"""
+Tests for per-module time budgets and cooperative cancellation
+
+Tests the cancellation token, that the symbol fan-out returns at the deadline
+with the symbols it finished, and that the orchestrator reports partial
+results and skipped symbols for a slow module, abandons a module that ignores
+its budget, and leaves the other modules unaffected.
+"""
+
+import threading
+import time
+import unittest
+from typing import List
+from unittest.mock import Mock
+
+from modular.base_module import ModuleConfig, ModuleHealthStatus, TradeAction, TradeOpportunity, TradingModule
+from modular.orchestrator import ModularOrchestrator
+from utils.cancellation import CancellationToken, cancellation_scope, current_token
+from utils.rate_limiter import RateLimit, RateLimitService
+from utils.symbol_fanout import SymbolFanOut
+from utils.symbol_locks import get_symbol_locks
+
+
+class TestCancellationToken(unittest.TestCase):
+
+    def test_deadline(self):
+        token = CancellationToken(0.05)
+        self.assertFalse(token.cancelled)
+        time.sleep(0.06)
+        self.assertTrue(token.cancelled)
+        self.assertFalse(token.aborted)
+        self.assertEqual(token.remaining(), 0.0)
+
+    def test_explicit_cancel_aborts(self):
+        token = CancellationToken()
+        self.assertIsNone(token.remaining())
+        token.cancel("abandoned")
+        self.assertTrue(token.cancelled)
+        self.assertTrue(token.aborted)
+
+    def test_should_stop_records_pending(self):
+        token = CancellationToken(0)
+        self.assertTrue(token.should_stop(['AAPL', 'MSFT']))
+        token.skip(['MSFT', 'SPY'])
+        self.assertEqual(token.skipped, ['AAPL', 'MSFT', 'SPY'])
+
+    def test_scope(self):
+        token = CancellationToken(10)
+        self.assertIsNot(current_token(), token)
+        with cancellation_scope(token):
+            self.assertIs(current_token(), token)
+        self.assertFalse(current_token().cancelled)
+
+
+class TestFanOutDeadline(unittest.TestCase):
+
+    def setUp(self):
+        limiter = RateLimitService({('alpaca', None): RateLimit(10.0, 20)})
+        self.fanout = SymbolFanOut('test', max_concurrency=4, limiter=limiter)
+        self.release = threading.Event()
+
+    def tearDown(self):
+        self.release.set()
+        self.fanout.shutdown()
+
+    def test_returns_at_deadline_with_finished_symbols(self):
+        def analyze(symbol):
+            if symbol == 'SLOW':
+                self.release.wait(5)
+            return symbol
+
+        token = CancellationToken(0.2)
+        start = time.monotonic()
+        results = self.fanout.map(analyze, ['AAPL', 'SLOW', 'MSFT'], token=token)
+
+        self.assertLess(time.monotonic() - start, 1.0)
+        self.assertEqual([r.ok for r in results], [True, False, True])
+        self.assertTrue(results[1].skipped)
+        self.assertEqual(token.skipped, ['SLOW'])
+
+    def test_uses_current_token(self):
+        token = CancellationToken(0)
+        with cancellation_scope(token):
+            results = self.fanout.map(lambda symbol: symbol, ['AAPL', 'MSFT'])
+        self.assertTrue(all(r.skipped for r in results))
+        self.assertEqual(token.skipped, ['AAPL', 'MSFT'])
+
+
+class SlowProviderModule(TradingModule):
+    """Module whose fan-out stalls on the symbols listed in slow"""
+
+    def __init__(self, name, slow=(), release=None, ignore_budget=False):
+        self._name = name
+        self.slow = set(slow)
+        self.release = release or threading.Event()
+        self.ignore_budget = ignore_budget
+        super().__init__(ModuleConfig(module_name=name, min_confidence=0.0,
+                                      custom_params={'symbol_concurrency': 4}), Mock(), Mock(), Mock())
+
+    @property
+    def module_name(self) -> str:
+        return self._name
+
+    @property
+    def supported_symbols(self) -> List[str]:
+        return ['AAPL', 'SLOW', 'MSFT']
+
+    def _analyze(self, symbol):
+        if symbol in self.slow:
+            self.release.wait(5)
+        return TradeOpportunity(symbol=symbol, action=TradeAction.BUY, quantity=1, confidence=0.9, strategy='test')
+
+    def analyze_opportunities(self):
+        if self.ignore_budget:
+            self.release.wait(5)
+            return []
+        return [r.value for r in self.symbol_fanout.map(self._analyze, self.supported_symbols) if r.ok]
+
+    def validate_opportunity(self, opportunity):
+        return False
+
+    def execute_trades(self, opportunities):
+        return []
+
+    def monitor_positions(self):
+        return []
+
+
+class TestModuleBudgets(unittest.TestCase):
+
+    def setUp(self):
+        self.release = threading.Event()
+        self.orchestrator = ModularOrchestrator(firebase_db=Mock(), risk_manager=Mock(), order_executor=Mock(api=None))
+        self.orchestrator._config['module_timeout_seconds'] = 0.2
+        self.orchestrator._config['cancel_grace_seconds'] = 0.3
+
+    def tearDown(self):
+        self.release.set()
+        self.orchestrator.shutdown()
+
+    def test_slow_provider_degrades_only_its_module(self):
+        self.orchestrator.register_module(SlowProviderModule('stocks', slow={'SLOW'}, release=self.release))
+        self.orchestrator.register_module(SlowProviderModule('crypto', release=self.release))
+
+        start = time.monotonic()
+        results = self.orchestrator.run_single_cycle()['modules']
+
+        self.assertLess(time.monotonic() - start, 1.0)
+        self.assertTrue(results['stocks']['success'])
+        self.assertTrue(results['stocks']['partial'])
+        self.assertEqual(results['stocks']['opportunities_count'], 2)
+        self.assertEqual(results['stocks']['skipped_symbols'], ['SLOW'])
+        self.assertFalse(results['crypto']['partial'])
+        self.assertEqual(results['crypto']['opportunities_count'], 3)
+
+    def test_budget_override_per_module(self):
+        module = SlowProviderModule('stocks', slow={'SLOW'}, release=self.release)
+        module.config.custom_params['budget_seconds'] = 0.05
+        self.orchestrator.register_module(module)
+        self.assertEqual(self.orchestrator._module_budget(module), 0.05)
+
+    def test_module_ignoring_budget_is_abandoned(self):
+        self.orchestrator.register_module(SlowProviderModule('stuck', release=self.release, ignore_budget=True))
+        self.orchestrator.register_module(SlowProviderModule('crypto', release=self.release))
+
+        start = time.monotonic()
+        results = self.orchestrator.run_single_cycle()['modules']
+
+        self.assertLess(time.monotonic() - start, 1.5)
+        self.assertFalse(results['stuck']['success'])
+        self.assertIn('timed out', results['stuck']['error'])
+        self.assertTrue(results['crypto']['success'])
+
+        # Even once healthy again, the abandoned run still occupies the module: no overlapping run
+        self.orchestrator.registry.update_health('stuck', ModuleHealthStatus.HEALTHY)
+        again = self.orchestrator.run_single_cycle()['modules']
+        self.assertIn('still in flight', again['stuck']['error'])
+
+    def test_async_mode_partial_results(self):
+        self.orchestrator.set_async_execution(True)
+        self.orchestrator.register_module(SlowProviderModule('stocks', slow={'SLOW'}, release=self.release))
+
+        results = self.orchestrator.run_single_cycle()['modules']
+
+        self.assertTrue(results['stocks']['success'])
+        self.assertEqual(results['stocks']['skipped_symbols'], ['SLOW'])
+
+
+
+class BlockingSyncModule(SlowProviderModule):
+    """Sync-only module whose analysis or order placement blocks until released"""
+
+    def __init__(self, name, release, block_in='analyze'):
+        super().__init__(name, release=release)
+        self.block_in = block_in
+        self.lock = threading.Lock()
+        self.active = 0
+        self.peak = 0
+
+    def analyze_opportunities(self):
+        with self.lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        try:
+            if self.block_in == 'analyze':
+                self.release.wait(5)
+            return [TradeOpportunity(symbol='AAPL', action=TradeAction.BUY, quantity=1, confidence=0.9, strategy='test')]
+        finally:
+            with self.lock:
+                self.active -= 1
+
+    def validate_opportunity(self, opportunity):
+        return True
+
+    def execute_trades(self, opportunities):
+        if self.block_in == 'execute':
+            self.release.wait(5)
+        return []
+
+
+class TestAsyncBudgets(unittest.TestCase):
+
+    def setUp(self):
+        self.release = threading.Event()
+        self.orchestrator = ModularOrchestrator(firebase_db=Mock(), risk_manager=Mock(), order_executor=Mock(api=None))
+        self.orchestrator.set_async_execution(True)
+        self.orchestrator._config['module_timeout_seconds'] = 0.1
+        self.orchestrator._config['cancel_grace_seconds'] = 0.1
+
+    def tearDown(self):
+        self.release.set()
+        self.orchestrator.shutdown()
+
+    def test_timed_out_sync_hook_keeps_module_claimed(self):
+        module = BlockingSyncModule('stocks', self.release)
+        self.orchestrator.register_module(module)
+
+        results = [self.orchestrator._run_modules_async([module])['stocks'] for _ in range(3)]
+
+        self.assertIn('timed out', results[0]['error'])
+        self.assertTrue(all('still in flight' in r['error'] for r in results[1:]))
+        self.assertEqual(module.peak, 1)
+
+        self.release.set()
+        deadline = time.monotonic() + 2
+        while self.orchestrator._running_modules and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(self.orchestrator._running_modules, {})
+
+    def test_symbol_locks_held_while_orders_are_placed(self):
+        module = BlockingSyncModule('stocks', self.release, block_in='execute')
+        self.orchestrator.register_module(module)
+
+        result = self.orchestrator._run_modules_async([module])['stocks']
+
+        self.assertIn('timed out', result['error'])
+        self.assertEqual(get_symbol_locks().owner('AAPL'), 'stocks:scan')
+        self.release.set()
+        deadline = time.monotonic() + 2
+        while get_symbol_locks().owner('AAPL') and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertIsNone(get_symbol_locks().owner('AAPL'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Tests for pattern recognition
+
+Tests incremental pivot tracking and support/resistance cache invalidation,
+the batch API against per-symbol analysis, and the pattern confidence score.
+"""
+
+import unittest
+
+import numpy as np
+
+from utils.pattern_recognition import PatternRecognition, batch_pivots, pattern_confidence
+
+
+def strip_timestamps(value):
+    if isinstance(value, dict):
+        return {k: strip_timestamps(v) for k, v in value.items() if k != 'timestamp'}
+    if isinstance(value, list):
+        return [strip_timestamps(v) for v in value]
+    return value
+
+
+def make_prices(length, seed, volatility=0.01):
+    rng = np.random.default_rng(seed)
+    return 100 * np.exp(np.cumsum(rng.normal(0, volatility, length)))
+
+
+class TestSupportResistanceCache(unittest.TestCase):
+    """Test pivots are tracked incrementally"""
+
+    def setUp(self):
+        self.patterns = PatternRecognition()
+
+    def feed(self, prices):
+        for price in prices:
+            self.patterns.add_price_data('TEST', float(price), volume=1000)
+
+    def test_cache_kept_until_pivot_changes(self):
+        """Test ticks that complete no pivot keep the cached levels"""
+        self.feed([100, 101, 102, 99, 103, 104, 105] + [105 + i for i in range(1, 16)])
+        self.patterns.find_support_resistance_levels('TEST')
+        self.assertIn('TEST', self.patterns.support_resistance_cache)
+
+        self.feed([121])  # Still rising: no new pivot
+        self.assertIn('TEST', self.patterns.support_resistance_cache)
+
+        self.feed([118, 117])  # 121 is now a resistance pivot
+        self.assertNotIn('TEST', self.patterns.support_resistance_cache)
+        levels = self.patterns.find_support_resistance_levels('TEST')
+        self.assertEqual(levels['support_levels'], [99.0])
+        self.assertEqual(levels['resistance_levels'], [121.0])
+        self.assertEqual(levels['current_price'], 117.0)
+
+    def test_pivots_match_full_scan_after_wrap(self):
+        """Test pivots leaving the 50-point window are dropped"""
+        prices = make_prices(140, 1)
+        self.feed(prices)
+
+        support_mask, resistance_mask = batch_pivots(prices[-50:][np.newaxis, :])
+        window = prices[-50:][2:-2]
+        tracked = self.patterns._pivots['TEST']
+        self.assertEqual(sorted(p for _, p, kind in tracked if kind == 'support'),
+                         sorted(window[support_mask[0]].tolist()))
+        self.assertEqual(sorted(p for _, p, kind in tracked if kind == 'resistance'),
+                         sorted(window[resistance_mask[0]].tolist()))
+
+
+class TestBatchAnalysis(unittest.TestCase):
+    """Test the batch API"""
+
+    def test_batch_matches_per_symbol_analysis(self):
+        """Test ragged multi-symbol batches give the per-symbol results"""
+        histories = {}
+        expected = {}
+        for seed in range(30):
+            length = 3 + seed * 3
+            prices = make_prices(length, seed, 0.003 if seed % 2 else 0.015)
+            if seed % 5 == 0:
+                prices[-1] *= 1.06
+            volumes = np.arange(length) * 10.0 if seed % 3 else None
+            histories[f'S{seed}'] = (prices, volumes)
+
+            single = PatternRecognition()
+            for i, price in enumerate(prices):
+                single.add_price_data(f'S{seed}', float(price), volumes[i] if volumes is not None else 0)
+            expected[f'S{seed}'] = strip_timestamps(single.get_comprehensive_pattern_analysis(f'S{seed}'))
+
+        results = PatternRecognition().analyze_batch(histories)
+
+        for symbol in histories:
+            self.assertEqual(strip_timestamps(results[symbol]), expected[symbol], symbol)
+        self.assertTrue(any('mean_reversion' in r['patterns'] for r in results.values()))
+        self.assertTrue(any('consolidation' in r['patterns'] for r in results.values()))
+
+    def test_batch_defaults_to_tracked_symbols(self):
+        """Test analyze_batch() with no arguments covers every tracked symbol"""
+        patterns = PatternRecognition()
+        for price in make_prices(30, 4):
+            patterns.add_price_data('AAA', float(price))
+            patterns.add_price_data('BBB', float(price) * 2)
+
+        results = patterns.analyze_batch()
+        self.assertEqual(set(results), {'AAA', 'BBB'})
+        self.assertEqual(strip_timestamps(results['AAA']),
+                         strip_timestamps(patterns.get_comprehensive_pattern_analysis('AAA')))
+
+
+class TestPatternConfidence(unittest.TestCase):
+    """Test pattern scores"""
+
+    def test_confidence_from_signals(self):
+        """Test bullish signals raise and bearish signals lower the neutral score"""
+        self.assertEqual(pattern_confidence({'trading_signals': []}), 0.5)
+        bullish = {'trading_signals': [{'signal': 'bullish', 'strength': 1.0},
+                                       {'signal': 'watch', 'strength': 0.8}]}
+        self.assertAlmostEqual(pattern_confidence(bullish), 0.8)
+        bearish = {'trading_signals': [{'signal': 'bearish', 'strength': 0.5}]}
+        self.assertAlmostEqual(pattern_confidence(bearish), 0.35)
+
+    def test_analyze_patterns_on_given_history(self):
+        """Test analyze_patterns scores an oversold history as bullish"""
+        prices = [100.0 + 0.2 * (i % 2) for i in range(25)] + [92.0]
+        analysis = PatternRecognition().analyze_patterns('TEST', prices)
+
+        self.assertEqual(analysis['patterns']['mean_reversion']['signal'], 'bullish')
+        self.assertGreater(analysis['confidence'], 0.5)
+        self.assertEqual(analysis['strength'], analysis['confidence'])
+
+
+if __name__ == '__main__':
+    unittest.main()
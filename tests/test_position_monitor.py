@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+Tests for the fast position monitor and per-symbol locks
+
+Tests symbol lock exclusion, that a guarded exit is deferred while the scan
+orders the same symbol (and vice versa), and that the monitor thread keeps
+running exit checks while a slow scan is in progress.
+"""
+
+import threading
+import time
+import unittest
+from typing import List
+from unittest.mock import Mock, patch
+
+from modular.base_module import (
+    ModuleConfig, TradeAction, TradeOpportunity, TradeResult, TradeStatus, TradingModule, guarded_exit
+)
+from modular.orchestrator import ModularOrchestrator
+from modular.scheduler import Calendar, ModuleCadence, Phase, PhaseCadence
+from utils.symbol_locks import SymbolLocks, get_symbol_locks
+
+
+class TestSymbolLocks(unittest.TestCase):
+
+    def test_exclusive_per_symbol(self):
+        locks = SymbolLocks()
+        self.assertTrue(locks.acquire('BTC/USD', 'scan'))
+        self.assertFalse(locks.acquire('BTCUSD', 'exit'))  # Same symbol, either notation
+        self.assertEqual(locks.owner('BTCUSD'), 'scan')
+        self.assertTrue(locks.acquire('ETHUSD', 'exit'))
+        locks.release('BTC/USD')
+        self.assertIsNone(locks.owner('BTCUSD'))
+        self.assertTrue(locks.acquire('BTCUSD', 'exit'))
+
+    def test_hold_many_skips_busy_symbols(self):
+        locks = SymbolLocks()
+        with locks.hold('AAPL', 'exit'):
+            with locks.hold_many(['AAPL', 'MSFT', 'MSFT'], 'scan') as held:
+                self.assertEqual(held, {'MSFT'})
+        self.assertIsNone(locks.owner('MSFT'))
+        self.assertIsNone(locks.owner('AAPL'))
+
+    def test_hold_waits_for_release(self):
+        locks = SymbolLocks()
+        locks.acquire('SPY', 'scan')
+        threading.Timer(0.05, locks.release, args=('SPY',)).start()
+        with locks.hold('SPY', 'exit', timeout=2.0) as acquired:
+            self.assertTrue(acquired)
+
+
+class MonitoredModule(TradingModule):
+    """Module whose scan can be slowed down and whose monitor exits every position"""
+
+    def __init__(self, name='crypto', scan_seconds=0.0):
+        self._name = name
+        self.scan_seconds = scan_seconds
+        self.scan_started = threading.Event()
+        self.monitors = 0
+        self.executed: List[str] = []
+        self.positions = [{'symbol': 'BTCUSD', 'qty': 1}]
+        super().__init__(ModuleConfig(module_name=name, min_confidence=0.0), Mock(), Mock(), Mock())
+
+    @property
+    def module_name(self) -> str:
+        return self._name
+
+    @property
+    def supported_symbols(self) -> List[str]:
+        return ['BTCUSD', 'ETHUSD']
+
+    @property
+    def cadence(self):
+        return ModuleCadence(
+            scan=PhaseCadence(60, Calendar.ALWAYS, priority=10),
+            monitor=PhaseCadence(0.02, Calendar.ALWAYS, priority=0),
+            persist=PhaseCadence(60, Calendar.ALWAYS, priority=50)
+        )
+
+    def analyze_opportunities(self):
+        self.scan_started.set()
+        time.sleep(self.scan_seconds)
+        return [TradeOpportunity(symbol=symbol, action=TradeAction.BUY, quantity=1, confidence=0.9, strategy='test')
+                for symbol in ('BTC/USD', 'ETH/USD')]
+
+    def validate_opportunity(self, opportunity):
+        return True
+
+    def execute_trades(self, opportunities):
+        self.executed.extend(opp.symbol for opp in opportunities)
+        return []
+
+    def monitor_positions(self):
+        self.monitors += 1
+        return [result for result in (self._exit(position, 'stop_loss') for position in self.positions) if result]
+
+    @guarded_exit
+    def _exit(self, position, exit_reason):
+        opportunity = TradeOpportunity(symbol=position['symbol'], action=TradeAction.SELL, quantity=1,
+                                       confidence=1.0, strategy='test')
+        return TradeResult(opportunity=opportunity, status=TradeStatus.EXECUTED)
+
+
+class TestGuardedExit(unittest.TestCase):
+
+    def test_exit_deferred_while_scan_holds_symbol(self):
+        module = MonitoredModule()
+        with get_symbol_locks().hold('BTC/USD', 'crypto:scan'):
+            with patch('modular.base_module.EXIT_LOCK_TIMEOUT_SECONDS', 0.01):
+                self.assertEqual(module.monitor_positions(), [])
+        self.assertEqual(len(module.monitor_positions()), 1)
+
+
+class TestPositionMonitor(unittest.TestCase):
+
+    def setUp(self):
+        self.orchestrator = ModularOrchestrator(firebase_db=Mock(), risk_manager=Mock(), order_executor=Mock(api=None))
+        self.orchestrator._config['max_idle_seconds'] = 0.05
+
+    def tearDown(self):
+        self.orchestrator.shutdown()
+
+    def test_monitor_phase_moves_to_monitor_thread(self):
+        module = MonitoredModule()
+        self.orchestrator.register_module(module)
+        self.assertIn('monitor', self.orchestrator._scheduler.get_status()['crypto'])
+
+        self.orchestrator.start_position_monitor()
+        self.assertNotIn('monitor', self.orchestrator._scheduler.get_status()['crypto'])
+        self.assertEqual(set(self.orchestrator.get_schedule()['crypto']), {p.value for p in Phase})
+
+        self.orchestrator.stop_position_monitor()
+        self.assertIn('monitor', self.orchestrator._scheduler.get_status()['crypto'])
+
+    def test_exits_keep_running_during_slow_scan(self):
+        module = MonitoredModule(scan_seconds=0.5)
+        module.positions = []
+        self.orchestrator.register_module(module)
+        self.orchestrator.start_position_monitor()
+
+        scan = threading.Thread(target=self.orchestrator.run_due_work)
+        scan.start()
+        module.scan_started.wait(1)
+        monitors_at_scan_start = module.monitors
+        scan.join()
+
+        self.assertGreater(module.monitors - monitors_at_scan_start, 3)
+
+    def test_scan_skips_symbol_being_exited(self):
+        module = MonitoredModule()
+        module.positions = []
+        self.orchestrator.register_module(module)
+        with get_symbol_locks().hold('BTCUSD', 'crypto:exit'):
+            self.orchestrator.run_due_work()
+        self.assertEqual(module.executed, ['ETH/USD'])
+
+    def test_monitor_exits_persisted_by_scan_loop(self):
+        module = MonitoredModule()
+        module.save_result = Mock()
+        self.orchestrator.register_module(module)
+        self.orchestrator._monitor_scheduler.add_module('crypto', module.cadence, phases=frozenset({Phase.MONITOR}))
+
+        self.orchestrator.run_due_monitors()
+        module.save_result.assert_not_called()
+        self.orchestrator._persist_module_results(module)
+        self.assertEqual(module.save_result.call_count, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
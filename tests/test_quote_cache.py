@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Tests for the real-time quote cache
+
+Tests TTL expiry, LRU eviction, hit/miss/stale counters, and cache-ok vs
+fresh-required reads through EnhancedDataManager.get_real_time_quote.
+"""
+
+import unittest
+from unittest.mock import Mock, patch
+
+from data_mode_manager import DataModeManager
+from utils.quote_cache import QuoteCache, QuoteFreshness
+
+
+class FakeClock:
+    """Controllable replacement for time.monotonic"""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestQuoteCache(unittest.TestCase):
+    """Test cache bookkeeping"""
+
+    def setUp(self):
+        self.clock = FakeClock()
+        patcher = patch('utils.quote_cache.time.monotonic', self.clock)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.cache = QuoteCache(max_entries=2, default_ttl=10)
+
+    def test_hit_returns_copy(self):
+        """Test hits return a copy callers can modify safely"""
+        self.cache.put('AAPL', {'price': 100.0})
+        quote = self.cache.get('AAPL')
+        quote['price'] = 0.0
+
+        self.assertEqual(self.cache.get('AAPL')['price'], 100.0)
+        self.assertEqual(self.cache.get_stats()['hits'], 2)
+
+    def test_ttl_expiry_and_max_age(self):
+        """Test expired entries miss and max_age reads count as stale"""
+        self.cache.put('AAPL', {'price': 100.0}, ttl=5)
+        self.clock.now += 3
+
+        self.assertIsNone(self.cache.get('AAPL', max_age=2))
+        self.assertIsNotNone(self.cache.get('AAPL'))
+        self.clock.now += 3
+        self.assertIsNone(self.cache.get('AAPL'))
+
+        stats = self.cache.get_stats()
+        self.assertEqual(stats['stale'], 2)
+        self.assertEqual(stats['misses'], 2)
+        self.assertEqual(stats['size'], 0)
+
+    def test_lru_eviction(self):
+        """Test the least recently used symbol is evicted first"""
+        self.cache.put('AAPL', {'price': 1.0})
+        self.cache.put('MSFT', {'price': 2.0})
+        self.cache.get('AAPL')
+        self.cache.put('SPY', {'price': 3.0})
+
+        self.assertIsNone(self.cache.get('MSFT'))
+        self.assertIsNotNone(self.cache.get('AAPL'))
+        self.assertEqual(self.cache.get_stats()['evictions'], 1)
+
+
+class TestEnhancedDataManagerQuoteCache(unittest.TestCase):
+    """Test quote caching in EnhancedDataManager"""
+
+    def setUp(self):
+        from enhanced_data_manager import EnhancedDataManager
+
+        self.clock = FakeClock()
+        patcher = patch('utils.quote_cache.time.monotonic', self.clock)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.manager = EnhancedDataManager(data_mode_manager=DataModeManager(subscription_level='unlimited'))
+        self.manager._fetch_real_time_quote = Mock(side_effect=lambda symbol: {'symbol': symbol, 'price': 100.0})
+
+    def test_cache_ok_reads_reuse_quote(self):
+        """Test scanning reads within the TTL share one upstream fetch"""
+        for _ in range(3):
+            self.assertEqual(self.manager.get_real_time_quote('AAPL')['price'], 100.0)
+
+        self.assertEqual(self.manager._fetch_real_time_quote.call_count, 1)
+        self.assertEqual(self.manager.get_cache_stats()['quotes']['hits'], 2)
+
+    def test_fresh_required_refetches_older_quote(self):
+        """Test execution reads refetch quotes older than the fresh bound"""
+        self.manager.get_real_time_quote('AAPL')
+        self.clock.now += 5  # Within the real-time TTL (10s), beyond fresh bound (2s)
+
+        self.manager.get_real_time_quote('AAPL')
+        self.assertEqual(self.manager._fetch_real_time_quote.call_count, 1)
+        self.manager.get_real_time_quote('AAPL', freshness=QuoteFreshness.FRESH_REQUIRED)
+        self.assertEqual(self.manager._fetch_real_time_quote.call_count, 2)
+
+    def test_ttl_follows_data_mode(self):
+        """Test delayed data mode keeps quotes longer than real-time mode"""
+        self.manager.get_real_time_quote('AAPL')
+        self.clock.now += 30
+        self.manager.get_real_time_quote('AAPL')
+        self.assertEqual(self.manager._fetch_real_time_quote.call_count, 2)
+
+        self.manager.data_mode_manager = DataModeManager(subscription_level='free')
+        self.manager.get_real_time_quote('MSFT')
+        self.clock.now += 30
+        self.manager.get_real_time_quote('MSFT')
+        self.assertEqual(self.manager._fetch_real_time_quote.call_count, 3)
+
+    def test_failed_fetch_is_not_cached(self):
+        """Test a failed source chain is retried on the next read"""
+        self.manager._fetch_real_time_quote = Mock(return_value=None)
+
+        self.assertIsNone(self.manager.get_real_time_quote('AAPL'))
+        self.assertIsNone(self.manager.get_real_time_quote('AAPL'))
+        self.assertEqual(self.manager._fetch_real_time_quote.call_count, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
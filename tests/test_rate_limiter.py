@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Tests for the provider rate limiter
+
+Tests token bucket bursts and refill waits, provider plus endpoint budgets,
+timeouts, the async path, and the rate-limited API client proxy.
+"""
+
+import asyncio
+import unittest
+from unittest.mock import Mock, patch
+
+from utils.rate_limiter import (
+    DEFAULT_LIMITS, RateLimit, RateLimitService, RateLimitedClient, TokenBucket
+)
+
+
+class FakeTime:
+    """Controllable monotonic clock whose sleep advances the clock"""
+
+    def __init__(self):
+        self.now = 100.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class RateLimiterTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.clock = FakeTime()
+        for target, fake in (('utils.rate_limiter.time.monotonic', self.clock.monotonic),
+                             ('utils.rate_limiter.time.sleep', self.clock.sleep)):
+            patcher = patch(target, fake)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+
+class TestTokenBucket(RateLimiterTestCase):
+    """Test bucket arithmetic"""
+
+    def test_burst_is_free_then_waits_for_refill(self):
+        """Test requests within the burst never sleep and later ones wait for one token"""
+        bucket = TokenBucket(RateLimit(rate_per_second=2.0, burst=3))
+
+        for _ in range(3):
+            self.assertTrue(bucket.acquire())
+        self.assertEqual(self.clock.sleeps, [])
+
+        bucket.acquire()
+        self.assertEqual(self.clock.sleeps, [0.5])
+        self.assertEqual(bucket.get_stats()['waited'], 1)
+
+    def test_refill_is_capped_at_burst(self):
+        """Test an idle bucket refills only up to its capacity"""
+        bucket = TokenBucket(RateLimit(rate_per_second=1.0, burst=2))
+        bucket.acquire()
+        bucket.acquire()
+        self.clock.now += 60
+
+        for _ in range(2):
+            bucket.acquire()
+        self.assertEqual(self.clock.sleeps, [])
+        bucket.acquire()
+        self.assertEqual(self.clock.sleeps, [1.0])
+
+    def test_timeout_rejects_without_consuming(self):
+        """Test a wait longer than the timeout is refused and leaves the budget intact"""
+        bucket = TokenBucket(RateLimit(rate_per_second=0.1, burst=1))
+        bucket.acquire()
+
+        self.assertFalse(bucket.acquire(timeout=1.0))
+        self.assertEqual(bucket.get_stats()['rejected'], 1)
+        self.clock.now += 10
+        self.assertTrue(bucket.acquire(timeout=0))
+
+    def test_async_acquire(self):
+        """Test the async path waits with asyncio.sleep"""
+        bucket = TokenBucket(RateLimit(rate_per_second=4.0, burst=1))
+        bucket.acquire()
+
+        with patch('utils.rate_limiter.asyncio.sleep') as async_sleep:
+            async def fake_sleep(seconds):
+                self.clock.sleeps.append(seconds)
+            async_sleep.side_effect = fake_sleep
+            self.assertTrue(asyncio.run(bucket.acquire_async()))
+
+        self.assertEqual(self.clock.sleeps, [0.25])
+
+
+class TestRateLimitService(RateLimiterTestCase):
+    """Test provider and endpoint budgets"""
+
+    def test_default_limits_respect_documented_per_minute_caps(self):
+        """Test burst plus one minute of refill stays within each provider limit"""
+        documented = {'alpaca': 200, 'alpha_vantage': 5, 'finnhub': 60}
+        for (provider, _), limit in DEFAULT_LIMITS.items():
+            if provider in documented:
+                self.assertLessEqual(limit.burst + limit.rate_per_second * 60, documented[provider] + 1e-9)
+
+    def test_endpoint_budget_applies_on_top_of_provider(self):
+        """Test endpoint buckets limit their endpoint while sharing the provider budget"""
+        service = RateLimitService({('alpaca', None): RateLimit(10.0, 10),
+                                    ('alpaca', 'options_contracts'): RateLimit(1.0, 1)})
+
+        service.acquire('alpaca', 'options_contracts')
+        service.acquire('alpaca', 'options_contracts')
+        self.assertEqual(self.clock.sleeps, [1.0])
+
+        stats = service.get_stats()
+        self.assertEqual(stats['alpaca']['acquired'], 2)
+        self.assertEqual(stats['alpaca/options_contracts']['acquired'], 2)
+
+    def test_unknown_provider_is_not_limited(self):
+        """Test providers without a configured bucket pass straight through"""
+        service = RateLimitService({})
+        for _ in range(100):
+            self.assertTrue(service.acquire('somewhere'))
+        self.assertEqual(self.clock.sleeps, [])
+
+    def test_rate_limited_client_acquires_per_call(self):
+        """Test the client proxy takes one provider token per method call"""
+        service = RateLimitService({('alpaca', None): RateLimit(1.0, 2)})
+        api = Mock()
+        api.get_account.return_value = 'account'
+        client = RateLimitedClient(api, 'alpaca', service)
+
+        self.assertEqual(client.get_account(), 'account')
+        client.get_clock()
+        client.submit_order(symbol='AAPL')
+
+        self.assertEqual(self.clock.sleeps, [1.0])
+        self.assertEqual(service.get_stats()['alpaca']['acquired'], 3)
+        self.assertIs(client.wrapped_client, api)
+
+
+if __name__ == '__main__':
+    unittest.main()
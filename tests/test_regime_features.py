@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Tests for the incremental regime feature engine
+
+Tests the EW return state against direct calculations, partial bars, and
+its use by MLRegimeDetector and MarketRegimeDetector.
+"""
+
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from market_regime_detector import MarketRegimeDetector
+from ml_regime_detector import MLRegimeDetector
+from utils.regime_features import RegimeFeatureEngine
+
+SYMBOLS = ['SPY', 'QQQ', 'IWM']
+
+
+def correlated_prices(bars, seed=0, drift=None):
+    """Prices driven by one common factor plus idiosyncratic noise"""
+    rng = np.random.default_rng(seed)
+    factor = rng.normal(0, 0.01, bars)
+    drift = drift or {}
+    returns = {s: factor + rng.normal(drift.get(s, 0.0), 0.005, bars) for s in SYMBOLS + list(drift)}
+    return {s: 100 * np.exp(np.cumsum(r)) for s, r in returns.items()}
+
+
+class TestRegimeFeatureEngine(unittest.TestCase):
+    """Test running EW state"""
+
+    def setUp(self):
+        self.engine = RegimeFeatureEngine(span=500, window=50)
+
+    def feed(self, prices, volumes=None):
+        for t in range(len(next(iter(prices.values())))):
+            self.engine.update({s: p[t] for s, p in prices.items()},
+                               {s: v[t] for s, v in volumes.items()} if volumes else None)
+
+    def test_matches_direct_calculation(self):
+        """Test EW mean equals pandas' recursive EWM and correlation approaches the sample correlation"""
+        prices = correlated_prices(400)
+        self.feed(prices)
+
+        returns = {s: np.diff(np.log(p)) for s, p in prices.items()}
+        expected_mean = pd.Series(returns['SPY']).ewm(alpha=self.engine.alpha, adjust=False).mean().iloc[-1]
+        self.assertAlmostEqual(self.engine.symbol_stats('SPY')['mean_return'], expected_mean, places=12)
+
+        sample = np.corrcoef([returns[s] for s in SYMBOLS])
+        expected_corr = sample[~np.eye(3, dtype=bool)].mean()
+        self.assertAlmostEqual(self.engine.average_correlation(SYMBOLS), expected_corr, delta=0.05)
+
+        breadth = (np.mean([returns[s][-1] > 0 for s in SYMBOLS]) - 0.5) * 2
+        self.assertAlmostEqual(self.engine.features(SYMBOLS)['breadth_indicators'], breadth)
+
+        window = self.engine.recent_returns(SYMBOLS)
+        self.assertEqual(window.shape, (50, 3))
+        np.testing.assert_allclose(window[:, 0], returns['SPY'][-50:])
+
+    def test_warm_up_and_partial_bars(self):
+        """Test features wait for MIN_RETURNS and absent symbols keep their state"""
+        prices = correlated_prices(5)
+        self.feed(prices)
+        self.assertIsNone(self.engine.features())
+
+        self.engine.update({'SPY': prices['SPY'][-1] * 1.01})
+        stats = self.engine.symbol_stats('SPY')
+        self.assertEqual(stats['returns'], 5)
+        self.assertEqual(self.engine.symbol_stats('QQQ')['returns'], 4)
+        self.assertIsNotNone(self.engine.features(['SPY']))
+        self.assertIsNone(self.engine.features(['QQQ']))
+        self.assertTrue(np.isnan(self.engine.recent_returns(['QQQ'], last=1)[0, 0]))
+
+    def test_volume_pattern_tracks_rising_volume(self):
+        """Test recent volume above the slow average is a positive pattern"""
+        prices = correlated_prices(60)
+        volumes = {s: np.linspace(1e6, 3e6, 60) for s in SYMBOLS}
+        self.feed(prices, volumes)
+
+        self.assertGreater(self.engine.features()['volume_pattern'], 0)
+
+
+class TestDetectorsShareEngine(unittest.TestCase):
+    """Test MLRegimeDetector and MarketRegimeDetector read the same state"""
+
+    def test_detectors_use_engine(self):
+        ml_detector = MLRegimeDetector()
+        market_detector = MarketRegimeDetector(feature_engine=ml_detector.feature_engine)
+        self.assertEqual(ml_detector.extract_regime_features(SYMBOLS), ml_detector._default_features())
+
+        prices = correlated_prices(80, drift={'XLK': 0.004, 'XLE': -0.004})
+        for t in range(80):
+            ml_detector.detect_regime_with_ml(
+                [{'symbol': s, 'ask': p[t], 'volume': 1e6} for s, p in prices.items()])
+
+        features = ml_detector.extract_regime_features(SYMBOLS)
+        self.assertEqual(features, ml_detector.feature_engine.features(SYMBOLS))
+        self.assertGreater(features['correlation_structure'], 0.5)
+
+        rotation = market_detector.analyze_sector_rotation()
+        self.assertEqual(set(rotation['sector_scores']), {'XLK', 'XLE'})
+        self.assertGreater(rotation['sector_scores']['XLK'], 0)
+        self.assertLess(rotation['sector_scores']['XLE'], 0)
+        self.assertIn('sector_correlation', rotation)
+
+    def test_per_symbol_updates_form_one_bar(self):
+        """Test symbols fed one at a time reach the engine as multi-symbol bars"""
+        ml_detector = MLRegimeDetector()
+        prices = correlated_prices(80)
+        for t in range(80):
+            for symbol in SYMBOLS:
+                ml_detector.update_price_history(symbol, prices[symbol][t], 1e6)
+
+        features = ml_detector.extract_regime_features(SYMBOLS)
+        self.assertEqual(ml_detector.feature_engine.bars, 80)
+        self.assertGreater(features['correlation_structure'], 0.5)
+
+        ml_detector.update_price_history('SPY', 101.0, timestamp=1)
+        ml_detector.update_price_history('QQQ', 102.0, timestamp=1)
+        ml_detector.update_price_history('SPY', 103.0, timestamp=2)
+        self.assertEqual(ml_detector.feature_engine.bars, 81)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Tests for the price ring buffer
+
+Tests wrap-around ordering, contiguous read-only views, time-window reads,
+and the indicator and pattern histories built on it.
+"""
+
+import unittest
+from datetime import datetime, timedelta
+
+import numpy as np
+
+from utils.pattern_recognition import PatternRecognition
+from utils.ring_buffer import PriceRingBuffer
+from utils.technical_indicators import TechnicalIndicators
+
+
+class TestPriceRingBuffer(unittest.TestCase):
+    """Test circular storage"""
+
+    def test_views_are_chronological_after_wrap(self):
+        """Test views stay oldest-to-newest once the buffer overwrites old values"""
+        buffer = PriceRingBuffer(4)
+        for i in range(10):
+            buffer.append(float(i), volume=i * 10.0)
+
+        self.assertEqual(len(buffer), 4)
+        self.assertEqual(buffer.total_appended, 10)
+        np.testing.assert_array_equal(buffer.prices, [6.0, 7.0, 8.0, 9.0])
+        np.testing.assert_array_equal(buffer.view('volume', last=2), [80.0, 90.0])
+        self.assertEqual(buffer.latest(), 9.0)
+
+    def test_views_are_zero_copy_and_read_only(self):
+        """Test views share the buffer memory, are contiguous and cannot be written"""
+        buffer = PriceRingBuffer(8)
+        for i in range(13):
+            buffer.append(float(i))
+
+        prices = buffer.prices
+        self.assertTrue(prices.flags.c_contiguous)
+        self.assertTrue(np.shares_memory(prices, buffer._data))
+        with self.assertRaises(ValueError):
+            prices[0] = 1.0
+
+    def test_missing_high_low_are_nan(self):
+        """Test high/low default to NaN so callers can detect missing OHLC"""
+        buffer = PriceRingBuffer(3)
+        buffer.append(10.0)
+        buffer.append(11.0, high=11.5, low=10.5)
+
+        self.assertTrue(np.isnan(buffer.highs[0]))
+        self.assertEqual(buffer.lows[-1], 10.5)
+
+    def test_since_filters_by_timestamp(self):
+        """Test time-window reads return only points after the cutoff"""
+        buffer = PriceRingBuffer(10)
+        start = datetime(2024, 1, 1)
+        for day in range(5):
+            buffer.append(100.0 + day, timestamp=start + timedelta(days=day))
+
+        np.testing.assert_array_equal(buffer.since('price', start + timedelta(days=2)), [103.0, 104.0])
+
+
+class TestHistoriesUseRingBuffer(unittest.TestCase):
+    """Test indicator and pattern histories"""
+
+    def test_pattern_recognition_keeps_last_50_points(self):
+        """Test long feeds are bounded and pattern checks keep working"""
+        patterns = PatternRecognition()
+        for i in range(120):
+            patterns.add_price_data('TEST', 100.0 + (i % 7), volume=1000)
+
+        self.assertEqual(len(patterns.price_history['TEST']), PatternRecognition.max_data_points)
+        self.assertIsNotNone(patterns.find_support_resistance_levels('TEST'))
+        self.assertIn('patterns', patterns.get_comprehensive_pattern_analysis('TEST'))
+
+    def test_technical_indicators_volume_profile(self):
+        """Test volume analysis reads from the shared buffer"""
+        indicators = TechnicalIndicators()
+        for i in range(25):
+            indicators.add_price_data('TEST', 100.0 + i, volume=1000 if i < 24 else 3000)
+
+        profile = indicators.analyze_volume_profile('TEST')
+        self.assertEqual(profile['volume_ratio'], 3.0)
+        self.assertEqual(profile['activity'], 'high')
+
+
+if __name__ == '__main__':
+    unittest.main()
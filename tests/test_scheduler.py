@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""
+Tests for the per-module cadence scheduler
+
+Tests deadline ordering and rescheduling, deferral of market-hours phases
+while the market is closed, the regular-hours calendar, and that the
+orchestrator runs only the due phases of due modules, with maintenance on
+wall-clock intervals.
+"""
+
+import unittest
+from datetime import datetime
+from typing import List
+from unittest.mock import Mock
+
+import pytz
+
+from modular.base_module import ModuleConfig, TradeAction, TradeOpportunity, TradingModule
+from modular.orchestrator import ModularOrchestrator
+from modular.scheduler import (
+    CadenceScheduler, Calendar, MarketHours, ModuleCadence, Phase, PhaseCadence
+)
+
+T0 = 1_700_000_000.0
+ET = pytz.timezone('America/New_York')
+
+
+def _cadence(scan=10, monitor=5, persist=60, calendar=Calendar.ALWAYS):
+    return ModuleCadence(
+        scan=PhaseCadence(scan, calendar, priority=20),
+        monitor=PhaseCadence(monitor, calendar, priority=0),
+        persist=PhaseCadence(persist, Calendar.ALWAYS, priority=50)
+    )
+
+
+class FixedMarketHours(MarketHours):
+    def __init__(self, is_open, next_open=None):
+        super().__init__()
+        self.state = (is_open, next_open)
+
+    def session(self, now):
+        is_open, next_open = self.state
+        return is_open, now if is_open else next_open
+
+
+class TestCadenceScheduler(unittest.TestCase):
+
+    def test_due_phases_by_priority_and_rescheduled(self):
+        scheduler = CadenceScheduler(FixedMarketHours(True))
+        scheduler.add_module('crypto', _cadence(), now=T0)
+
+        first = scheduler.pop_due(T0)
+        self.assertEqual([t.phase for t in first], [Phase.MONITOR, Phase.SCAN, Phase.PERSIST])
+        self.assertEqual(scheduler.next_due(), T0 + 5)
+        self.assertEqual(scheduler.pop_due(T0 + 4), [])
+        self.assertEqual([t.phase for t in scheduler.pop_due(T0 + 5)], [Phase.MONITOR])
+        self.assertEqual([t.phase for t in scheduler.pop_due(T0 + 10)], [Phase.MONITOR, Phase.SCAN])
+
+    def test_late_phase_runs_once(self):
+        """A phase several intervals behind runs once and restarts from now"""
+        scheduler = CadenceScheduler(FixedMarketHours(True))
+        scheduler.add_module('crypto', _cadence(scan=10, monitor=1000, persist=1000), now=T0)
+        scheduler.pop_due(T0)
+
+        self.assertEqual([t.phase for t in scheduler.pop_due(T0 + 35)], [Phase.SCAN])
+        self.assertEqual(scheduler.next_due(), T0 + 45)
+
+    def test_market_hours_phase_deferred_while_closed(self):
+        market = FixedMarketHours(False, next_open=T0 + 3600)
+        scheduler = CadenceScheduler(market)
+        scheduler.add_module('stocks', _cadence(calendar=Calendar.MARKET_HOURS), now=T0)
+
+        self.assertEqual([t.phase for t in scheduler.pop_due(T0)], [Phase.PERSIST])
+        self.assertEqual(scheduler.next_due(), T0 + 60)
+        scheduler.pop_due(T0 + 60)
+        self.assertEqual(scheduler.next_due(), T0 + 120)
+
+        market.state = (True, None)
+        due = scheduler.pop_due(T0 + 3600)
+        self.assertEqual([t.phase for t in due], [Phase.MONITOR, Phase.SCAN, Phase.PERSIST])
+
+    def test_regular_hours(self):
+        wednesday_open = ET.localize(datetime(2026, 10, 14, 10, 0)).timestamp()
+        self.assertEqual(MarketHours.regular_hours(wednesday_open), (True, wednesday_open))
+
+        saturday = ET.localize(datetime(2026, 10, 17, 12, 0)).timestamp()
+        monday_open = ET.localize(datetime(2026, 10, 19, 9, 30)).timestamp()
+        self.assertEqual(MarketHours.regular_hours(saturday), (False, monday_open))
+
+        friday_evening = ET.localize(datetime(2026, 10, 16, 17, 0)).timestamp()
+        self.assertEqual(MarketHours.regular_hours(friday_evening), (False, monday_open))
+
+    def test_interval_overrides(self):
+        cadence = _cadence().with_overrides({'scan_interval_seconds': 15})
+        self.assertEqual(cadence.scan.interval_seconds, 15)
+        self.assertEqual(cadence.scan.priority, 20)
+        self.assertEqual(cadence.monitor.interval_seconds, 5)
+
+
+class CountingModule(TradingModule):
+    """Module counting phase calls and saves"""
+
+    def __init__(self, name, cadence):
+        self._name = name
+        self._cadence = cadence
+        self.scans = 0
+        self.monitors = 0
+        self.saved = []
+        super().__init__(ModuleConfig(module_name=name), Mock(), Mock(), Mock())
+
+    @property
+    def module_name(self) -> str:
+        return self._name
+
+    @property
+    def supported_symbols(self) -> List[str]:
+        return ['BTCUSD']
+
+    @property
+    def cadence(self):
+        return self._cadence
+
+    def analyze_opportunities(self):
+        self.scans += 1
+        return [TradeOpportunity(symbol='BTCUSD', action=TradeAction.BUY, quantity=1, confidence=0.9, strategy='test')]
+
+    def validate_opportunity(self, opportunity):
+        return False
+
+    def execute_trades(self, opportunities):
+        return []
+
+    def monitor_positions(self):
+        self.monitors += 1
+        return []
+
+    def save_opportunity(self, opportunity):
+        self.saved.append(opportunity)
+
+
+class TestScheduledOrchestrator(unittest.TestCase):
+
+    def setUp(self):
+        self.orchestrator = ModularOrchestrator(firebase_db=Mock(), risk_manager=Mock(), order_executor=Mock(api=None))
+        self.orchestrator._scheduler.market_hours = FixedMarketHours(True)
+        self.module = CountingModule('crypto', _cadence(scan=10, monitor=5, persist=60))
+        self.orchestrator.register_module(self.module)
+        self.orchestrator._scheduler.add_module('crypto', self.module.cadence, now=T0)
+
+    def tearDown(self):
+        self.orchestrator.shutdown()
+
+    def test_runs_only_due_phases(self):
+        self.orchestrator.run_due_work(T0)
+        self.assertEqual((self.module.scans, self.module.monitors), (1, 1))
+        self.assertEqual(len(self.module.saved), 1)
+
+        self.assertIsNone(self.orchestrator.run_due_work(T0 + 1))
+        self.orchestrator.run_due_work(T0 + 5)
+        self.assertEqual((self.module.scans, self.module.monitors), (1, 2))
+
+    def test_results_wait_for_persist_phase(self):
+        self.orchestrator.run_due_work(T0)
+        self.orchestrator.run_due_work(T0 + 10)
+        self.assertEqual(self.module.scans, 2)
+        self.assertEqual(len(self.module.saved), 1)
+
+        self.orchestrator.run_due_work(T0 + 60)
+        self.assertEqual(self.module.scans, 3)
+        self.assertEqual(len(self.module.saved), 3)  # Scans at +10 and +60 saved by the persist phase
+
+    def test_maintenance_keyed_on_elapsed_time(self):
+        self.orchestrator.ml_optimizer = Mock()
+        self.orchestrator.portfolio_rebalancer = Mock()
+        self.orchestrator._run_ml_optimization = Mock()
+        self.orchestrator._run_portfolio_rebalancing = Mock()
+
+        for second in range(0, 1800, 30):  # A cycle every 30s for 30 minutes
+            self.orchestrator._run_periodic_maintenance(now=T0 + second)
+        self.orchestrator._run_ml_optimization.assert_not_called()
+        self.assertEqual(self.orchestrator._run_portfolio_rebalancing.call_count, 1)
+
+        self.orchestrator._run_periodic_maintenance(now=T0 + 1800)
+        self.assertEqual(self.orchestrator._run_ml_optimization.call_count, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Tests for single-flight request coalescing
+
+Tests that concurrent identical requests share one upstream call and its
+result or exception, that distinct or sequential requests are not merged,
+and that the API client proxy only coalesces read methods.
+"""
+
+import threading
+import time
+import unittest
+from unittest.mock import Mock
+
+from utils.single_flight import SingleFlight, SingleFlightClient, make_request_key
+
+
+class SlowRequest:
+    """Upstream call that blocks until released and counts invocations"""
+
+    def __init__(self, result=None, error=None):
+        self.result = result
+        self.error = error
+        self.calls = 0
+        self.release = threading.Event()
+
+    def __call__(self, *args, **kwargs):
+        self.calls += 1
+        self.release.wait(timeout=5)
+        if self.error:
+            raise self.error
+        return self.result
+
+
+def _run_concurrently(count, target):
+    """Start count threads running target and return (threads, outcomes)"""
+    outcomes = [None] * count
+
+    def worker(i):
+        try:
+            outcomes[i] = ('ok', target())
+        except Exception as e:
+            outcomes[i] = ('error', e)
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(count)]
+    for thread in threads:
+        thread.start()
+    return threads, outcomes
+
+
+def _wait_for_waiters(flight, expected_shared):
+    deadline = time.time() + 5
+    while flight.get_stats()['shared'] < expected_shared and time.time() < deadline:
+        time.sleep(0.005)
+
+
+class TestSingleFlight(unittest.TestCase):
+    """Test in-flight deduplication"""
+
+    def setUp(self):
+        self.flight = SingleFlight()
+
+    def test_concurrent_identical_calls_share_one_request(self):
+        """Test waiters receive the leader's result object"""
+        request = SlowRequest(result={'price': 100.0})
+        threads, outcomes = _run_concurrently(5, lambda: self.flight.do(('quote', 'AAPL'), request))
+        _wait_for_waiters(self.flight, 4)
+        request.release.set()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(request.calls, 1)
+        self.assertTrue(all(outcome[1] is outcomes[0][1] for outcome in outcomes))
+        self.assertEqual(self.flight.get_stats(), {'calls': 1, 'shared': 4, 'errors': 0})
+        self.assertEqual(self.flight.in_flight(), 0)
+
+    def test_exception_is_shared(self):
+        """Test every waiter sees the leader's exception"""
+        request = SlowRequest(error=RuntimeError("429 Too Many Requests"))
+        threads, outcomes = _run_concurrently(3, lambda: self.flight.do('bars', request))
+        _wait_for_waiters(self.flight, 2)
+        request.release.set()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(request.calls, 1)
+        self.assertTrue(all(kind == 'error' and str(error) == "429 Too Many Requests"
+                            for kind, error in outcomes))
+
+    def test_sequential_and_distinct_calls_are_not_merged(self):
+        """Test completed calls are not cached and different keys run separately"""
+        request = Mock(return_value=1)
+
+        self.flight.do(('quote', 'AAPL'), request)
+        self.flight.do(('quote', 'AAPL'), request)
+        self.flight.do(('quote', 'MSFT'), request)
+
+        self.assertEqual(request.call_count, 3)
+        self.assertEqual(self.flight.get_stats()['shared'], 0)
+
+    def test_make_request_key(self):
+        """Test list and dict arguments are frozen into equal keys"""
+        key = make_request_key('api.get_bars', (['BTC/USD', 'ETH/USD'],), {'timeframe': '1Hour'})
+
+        self.assertEqual(key, make_request_key('api.get_bars', (['BTC/USD', 'ETH/USD'],), {'timeframe': '1Hour'}))
+        self.assertNotEqual(key, make_request_key('api.get_bars', (['BTC/USD'],), {'timeframe': '1Hour'}))
+        self.assertIsNone(make_request_key('api.get_bars', (bytearray(b'x'),), {}))
+
+
+class TestSingleFlightClient(unittest.TestCase):
+    """Test the API client proxy"""
+
+    def test_read_methods_coalesce_and_writes_pass_through(self):
+        """Test concurrent get_* calls share a request while submit_order never does"""
+        flight = SingleFlight()
+        api = Mock()
+        api.get_crypto_snapshots.side_effect = SlowRequest(result={'BTC/USD': 1})
+        client = SingleFlightClient(api, flight=flight)
+
+        threads, outcomes = _run_concurrently(4, lambda: client.get_crypto_snapshots(['BTC/USD']))
+        _wait_for_waiters(flight, 3)
+        api.get_crypto_snapshots.side_effect.release.set()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(api.get_crypto_snapshots.call_count, 1)
+        self.assertEqual([outcome[1] for outcome in outcomes], [{'BTC/USD': 1}] * 4)
+
+        client.submit_order(symbol='AAPL', qty=1)
+        client.submit_order(symbol='AAPL', qty=1)
+        self.assertEqual(api.submit_order.call_count, 2)
+        self.assertIs(client.wrapped_client, api)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+"""
+Tests for data source health tracking
+
+Tests circuit breaker transitions, latency-based ordering, and the adaptive
+quote fallback chain in EnhancedDataManager (including hedged requests).
+"""
+
+import threading
+import unittest
+from unittest.mock import Mock, patch
+
+from utils.source_health import BreakerState, SourceHealthTracker
+
+
+class FakeClock:
+    """Controllable replacement for time.monotonic"""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestSourceHealthTracker(unittest.TestCase):
+    """Test breaker state machine and ordering"""
+
+    def setUp(self):
+        self.clock = FakeClock()
+        patcher = patch('utils.source_health.time.monotonic', self.clock)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.tracker = SourceHealthTracker(failure_threshold=3, cooldown_seconds=60)
+
+    def _state(self, source):
+        return self.tracker.get_stats()[source]['state']
+
+    def test_breaker_opens_after_consecutive_failures(self):
+        """Test a source is skipped for the cool-down after repeated failures"""
+        for _ in range(3):
+            self.tracker.record_failure('finnhub', 10.0)
+
+        self.assertEqual(self._state('finnhub'), BreakerState.OPEN.value)
+        self.assertFalse(self.tracker.allow('finnhub'))
+        self.clock.now += 59
+        self.assertFalse(self.tracker.allow('finnhub'))
+        self.assertEqual(self.tracker.get_stats()['finnhub']['skipped'], 2)
+
+    def test_half_open_allows_one_trial(self):
+        """Test one trial request after the cool-down closes or re-opens the breaker"""
+        for _ in range(3):
+            self.tracker.record_failure('finnhub', 1.0)
+        self.clock.now += 61
+
+        self.assertTrue(self.tracker.allow('finnhub'))
+        self.assertFalse(self.tracker.allow('finnhub'))
+        self.tracker.record_failure('finnhub', 1.0)
+        self.assertEqual(self._state('finnhub'), BreakerState.OPEN.value)
+
+        self.clock.now += 119
+        self.assertFalse(self.tracker.allow('finnhub'))  # Cool-down doubled to 120s
+        self.clock.now += 2
+        self.assertTrue(self.tracker.allow('finnhub'))
+        self.tracker.record_success('finnhub', 0.2)
+        self.assertEqual(self._state('finnhub'), BreakerState.CLOSED.value)
+
+    def test_error_rate_opens_breaker(self):
+        """Test a high error rate opens the breaker without consecutive failures"""
+        for _ in range(3):
+            self.tracker.record_success('alpha_vantage', 0.5)
+            self.tracker.record_failure('alpha_vantage', 0.5)
+            self.tracker.record_failure('alpha_vantage', 0.5)
+
+        self.assertEqual(self._state('alpha_vantage'), BreakerState.OPEN.value)
+
+    def test_order_prefers_fast_healthy_sources(self):
+        """Test sorting by p50 with unmeasured sources first and open breakers last"""
+        for latency in (2.0, 2.5, 3.0):
+            self.tracker.record_success('finnhub', latency)
+        for latency in (0.1, 0.2, 0.3):
+            self.tracker.record_success('alpaca', latency)
+        for _ in range(3):
+            self.tracker.record_failure('alpha_vantage', 0.1)
+
+        order = self.tracker.order(['finnhub', 'alpha_vantage', 'alpaca', 'yfinance'])
+
+        self.assertEqual(order, ['yfinance', 'alpaca', 'finnhub', 'alpha_vantage'])
+        self.assertAlmostEqual(self.tracker.latency_percentile('alpaca', 50), 0.2)
+
+    def test_empty_answers_rank_lower_without_opening_breaker(self):
+        """Test answers without data count against ordering but never open the breaker"""
+        for _ in range(10):
+            self.tracker.record_empty('finnhub', 0.05)
+        self.tracker.record_success('alpaca', 0.3)
+
+        self.assertEqual(self._state('finnhub'), BreakerState.CLOSED.value)
+        self.assertEqual(self.tracker.order(['finnhub', 'alpaca']), ['alpaca', 'finnhub'])
+
+    def test_order_penalizes_fast_failures(self):
+        """Test a fast source that fails half the time ranks behind a slower reliable one"""
+        for _ in range(3):
+            self.tracker.record_success('finnhub', 0.1)
+            self.tracker.record_failure('finnhub', 0.1)  # Expected 0.1 / 0.5 = 0.2s per answer
+            self.tracker.record_success('alpaca', 0.15)
+
+        self.assertEqual(self._state('finnhub'), BreakerState.CLOSED.value)
+        self.assertEqual(self.tracker.order(['finnhub', 'alpaca']), ['alpaca', 'finnhub'])
+
+
+class TestAdaptiveQuoteChain(unittest.TestCase):
+    """Test EnhancedDataManager source chains"""
+
+    def setUp(self):
+        from enhanced_data_manager import EnhancedDataManager
+        self.manager = EnhancedDataManager(data_mode_manager=Mock(get_quote_cache_settings=Mock(
+            return_value={'ttl': 0, 'fresh_max_age': 0})))
+
+    def test_failing_source_is_skipped_after_breaker_opens(self):
+        """Test a down provider stops being called once its breaker opens"""
+        failing = Mock(side_effect=Exception("timeout"))
+
+        for _ in range(5):
+            self.assertIsNone(self.manager._run_source_chain('AAPL', [('finnhub', failing)]))
+
+        self.assertEqual(failing.call_count, 3)
+        self.assertEqual(self.manager.get_source_health()['finnhub']['state'], 'open')
+
+        healthy = Mock(return_value={'symbol': 'AAPL', 'price': 100.0, 'source': 'alpaca'})
+        quote = self.manager._run_source_chain('AAPL', [('finnhub', failing), ('alpaca', healthy)])
+        self.assertEqual(quote['price'], 100.0)
+        self.assertEqual(failing.call_count, 3)
+
+    def test_empty_source_is_not_ordered_first(self):
+        """Test a source answering fast with no data counts as failing, not as fast"""
+        empty = Mock(return_value=None)
+        healthy = Mock(return_value={'symbol': 'AAPL', 'price': 100.0, 'source': 'alpaca'})
+
+        for _ in range(5):
+            quote = self.manager._run_source_chain('AAPL', [('finnhub', empty), ('alpaca', healthy)])
+            self.assertEqual(quote['price'], 100.0)
+
+        self.assertEqual(empty.call_count, 1)
+        stats = self.manager.get_source_health()['finnhub']
+        self.assertEqual((stats['empty'], stats['errors'], stats['state']), (1, 0, 'closed'))
+        self.assertEqual(self.manager.source_health.order(['finnhub', 'alpaca']), ['alpaca', 'finnhub'])
+
+    def test_symbols_without_data_do_not_open_breakers(self):
+        """Test crypto lookups that stock-only sources cannot answer leave those sources open for stocks"""
+        def stock_only(source):
+            return lambda symbol: None if symbol.endswith('USD') else {'symbol': symbol, 'price': 100.0,
+                                                                       'source': source}
+        sources = [('alpaca', stock_only('alpaca')), ('finnhub', stock_only('finnhub'))]
+
+        for _ in range(5):
+            self.assertIsNone(self.manager._run_source_chain('BTCUSD', sources))
+        quote = self.manager._run_source_chain('AAPL', sources)
+
+        self.assertEqual(quote['price'], 100.0)
+        health = self.manager.get_source_health()
+        self.assertEqual({name: health[name]['state'] for name in ('alpaca', 'finnhub')},
+                         {'alpaca': 'closed', 'finnhub': 'closed'})
+        self.assertEqual(health['alpaca']['errors'], 0)
+
+    def test_hedged_request_returns_faster_source(self):
+        """Test a second source is raced once the first exceeds its p95"""
+        from enhanced_data_manager import EnhancedDataManager
+        manager = EnhancedDataManager(hedge_requests=True)
+        release = threading.Event()
+
+        def slow(symbol):
+            release.wait(timeout=5)
+            return {'symbol': symbol, 'price': 1.0, 'source': 'slow'}
+
+        fast = Mock(return_value={'symbol': 'AAPL', 'price': 2.0, 'source': 'fast'})
+        for _ in range(5):
+            manager.source_health.record_success('slow', 0.01)
+            manager.source_health.record_success('fast', 0.02)
+        self.assertEqual(manager.source_health.order(['fast', 'slow']), ['slow', 'fast'])
+
+        try:
+            quote = manager._run_source_chain('AAPL', [('slow', slow), ('fast', fast)])
+        finally:
+            release.set()
+
+        self.assertEqual(quote['source'], 'fast')
+        fast.assert_called_once_with('AAPL')
+
+    def test_fallback_quote_has_price_and_real_time_flag(self):
+        """Test delayed fallback quotes are normalized for get_enhanced_quote_data"""
+        self.manager.finnhub_available = False
+        self.manager.alpha_vantage_available = False
+        self.manager.alpaca_available = True
+        self.manager._quote_from_alpaca = Mock(return_value={'symbol': 'AAPL', 'price': 100.0,
+                                                              'bid': 99.9, 'ask': 100.1, 'source': 'alpaca'})
+
+        quote = self.manager._fetch_real_time_quote('AAPL')
+
+        self.assertEqual(quote['price'], 100.0)
+        self.assertFalse(quote['real_time'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Tests for streaming technical indicators
+
+Tests that the incremental RSI, MACD, Bollinger Bands and ADX state in
+TechnicalIndicators matches the full-window batch calculations, plus the
+building blocks they rely on.
+"""
+
+import unittest
+
+import numpy as np
+
+from utils.streaming_indicators import (
+    RollingSum, StreamingEMA, StreamingRSI, SymbolIndicatorState, WindowedEMA
+)
+from utils.technical_indicators import TechnicalIndicators
+
+
+def random_bars(count, seed=0):
+    """Random-walk closes with highs/lows around them"""
+    rng = np.random.default_rng(seed)
+    closes = 100 + np.cumsum(rng.normal(0, 1.0, count))
+    highs = closes + rng.uniform(0, 1.5, count)
+    lows = closes - rng.uniform(0, 1.5, count)
+    return closes, highs, lows
+
+
+class TestStreamingBuildingBlocks(unittest.TestCase):
+    """Test rolling sums and EMAs"""
+
+    def test_rolling_sum_is_exact_zero_for_zero_window(self):
+        """Test an all-zero window reports zero after non-zero values leave it"""
+        rolling = RollingSum(3)
+        for value in (0.1, 0.2, 0.3, 0.0, 0.0, 0.0):
+            rolling.append(value)
+
+        self.assertEqual(rolling.sum, 0.0)
+        self.assertTrue(rolling.full)
+
+    def test_windowed_ema_matches_recursion_over_window(self):
+        """Test the O(1) windowed EMA equals an EMA recomputed over the trailing window"""
+        closes, _, _ = random_bars(3000, seed=1)
+        ema = WindowedEMA(12)
+        multiplier = 2 / 13
+
+        for i, price in enumerate(closes):
+            value = ema.update(price)
+            if i >= 11 and i % 97 == 0:
+                window = closes[i - 11:i + 1]
+                expected = window[0]
+                for p in window[1:]:
+                    expected = p * multiplier + expected * (1 - multiplier)
+                self.assertAlmostEqual(value, expected, places=9)
+
+    def test_streaming_ema_seeded_with_sma(self):
+        """Test the running EMA starts from the SMA of the first period values"""
+        ema = StreamingEMA(3)
+        self.assertIsNone(ema.update(1.0))
+        self.assertIsNone(ema.update(2.0))
+        self.assertEqual(ema.update(3.0), 2.0)
+        self.assertEqual(ema.update(4.0), 3.0)
+
+    def test_wilder_rsi(self):
+        """Test Wilder smoothing continues from the SMA seed"""
+        rsi = StreamingRSI(2)
+        for price in (10.0, 11.0, 10.0):
+            rsi.update(price)
+        self.assertEqual(rsi.wilder_value, 50.0)  # avg gain 0.5, avg loss 0.5
+
+        rsi.update(12.0)  # gain 2 -> avg gain 1.25, avg loss 0.25
+        self.assertAlmostEqual(rsi.wilder_value, 100 - 100 / (1 + 5.0))
+
+
+class TestStreamingMatchesBatch(unittest.TestCase):
+    """Test TechnicalIndicators answers are unchanged by streaming"""
+
+    def setUp(self):
+        self.streaming = TechnicalIndicators()
+        self.batch = TechnicalIndicators(streaming=False)
+
+    def _feed(self, count=400, seed=2, with_hl=True):
+        closes, highs, lows = random_bars(count, seed)
+        for i in range(count):
+            for indicators in (self.streaming, self.batch):
+                indicators.add_price_data('TEST', float(closes[i]), 1000,
+                                          high=float(highs[i]) if with_hl else None,
+                                          low=float(lows[i]) if with_hl else None)
+            yield i
+
+    def test_rsi_bollinger_adx_match_each_bar(self):
+        """Test values agree at every bar, including after the history window rolls"""
+        for i in self._feed():
+            self.assertEqual(self.streaming.calculate_rsi('TEST'), self.batch.calculate_rsi('TEST'))
+            self.assertEqual(self.streaming.calculate_bollinger_bands('TEST'),
+                             self.batch.calculate_bollinger_bands('TEST'))
+            streaming_adx = self.streaming.calculate_adx('TEST')
+            batch_adx = self.batch.calculate_adx('TEST')
+            if batch_adx is None:
+                self.assertIsNone(streaming_adx)
+            else:
+                self.assertAlmostEqual(streaming_adx, batch_adx, places=6)
+
+        self.assertEqual(len(self.streaming.price_history['TEST']), TechnicalIndicators.max_data_points)
+
+    def test_macd_matches_batch_line_and_converges_on_signal(self):
+        """Test the MACD line matches exactly and the signal line within tolerance"""
+        for i in self._feed(count=300, seed=3):
+            streaming = self.streaming.calculate_macd('TEST')
+            batch = self.batch.calculate_macd('TEST')
+            if batch is None:
+                continue
+            self.assertAlmostEqual(streaming['macd'], batch['macd'], places=4)
+            if i > 120:
+                self.assertAlmostEqual(streaming['signal'], batch['signal'], delta=2e-4)
+
+    def test_adx_none_without_high_low(self):
+        """Test ADX is unavailable when bars carry no high/low"""
+        for _ in self._feed(count=60, with_hl=False):
+            pass
+        self.assertIsNone(self.streaming.calculate_adx('TEST'))
+        self.assertIsNone(self.batch.calculate_adx('TEST'))
+
+    def test_non_default_periods_use_batch_path(self):
+        """Test custom periods still work alongside the streaming defaults"""
+        for _ in self._feed(count=50):
+            pass
+        self.assertEqual(self.streaming.calculate_rsi('TEST', period=7), self.batch.calculate_rsi('TEST', period=7))
+        state = self.streaming.indicator_state['TEST']
+        self.assertIsInstance(state, SymbolIndicatorState)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Tests for the per-symbol fan-out worker pool
+
+Tests that results keep input order, that a failing symbol is isolated,
+that symbols run concurrently up to the limit, and that the limit is capped
+by the provider burst.
+"""
+
+import threading
+import time
+import unittest
+
+from utils.rate_limiter import RateLimit, RateLimitService
+from utils.symbol_fanout import SymbolFanOut
+
+
+def _limiter(burst=20):
+    return RateLimitService({('alpaca', None): RateLimit(10.0, burst)})
+
+
+class TestSymbolFanOut(unittest.TestCase):
+
+    def setUp(self):
+        self.fanout = SymbolFanOut('test', max_concurrency=4, limiter=_limiter())
+
+    def tearDown(self):
+        self.fanout.shutdown()
+
+    def test_results_keep_input_order(self):
+        """Later symbols finishing first does not reorder the results"""
+        delays = {'AAPL': 0.05, 'MSFT': 0.03, 'NVDA': 0.01, 'SPY': 0.0}
+
+        def analyze(symbol):
+            time.sleep(delays[symbol])
+            return symbol.lower()
+
+        results = self.fanout.map(analyze, list(delays))
+        self.assertEqual([r.symbol for r in results], list(delays))
+        self.assertEqual([r.value for r in results], ['aapl', 'msft', 'nvda', 'spy'])
+
+    def test_failure_is_isolated(self):
+        """An exception is captured for its symbol only"""
+        def analyze(symbol):
+            if symbol == 'BAD':
+                raise ValueError("no data")
+            return 1
+
+        results = self.fanout.map(analyze, ['AAPL', 'BAD', 'MSFT'])
+        self.assertEqual([r.ok for r in results], [True, False, True])
+        self.assertIsInstance(results[1].error, ValueError)
+        self.assertEqual(results[2].value, 1)
+        self.assertEqual(self.fanout.get_stats()['errors'], 1)
+
+    def test_runs_concurrently_up_to_limit(self):
+        """Eight 0.1s symbols on four workers take about two rounds, never more than four at once"""
+        lock = threading.Lock()
+        state = {'active': 0, 'peak': 0}
+
+        def analyze(symbol):
+            with lock:
+                state['active'] += 1
+                state['peak'] = max(state['peak'], state['active'])
+            time.sleep(0.1)
+            with lock:
+                state['active'] -= 1
+
+        start = time.monotonic()
+        self.fanout.map(analyze, [f"S{i}" for i in range(8)])
+        self.assertLess(time.monotonic() - start, 0.5)
+        self.assertEqual(state['peak'], 4)
+
+    def test_concurrency_capped_by_provider_burst(self):
+        fanout = SymbolFanOut('capped', max_concurrency=50, limiter=_limiter(burst=5))
+        self.assertEqual(fanout.max_concurrency, 5)
+        unlimited = SymbolFanOut('free', max_concurrency=12, providers=('unknown',), limiter=_limiter())
+        self.assertEqual(unlimited.max_concurrency, 12)
+
+    def test_pool_is_reused_across_runs(self):
+        self.fanout.map(lambda s: s, ['A', 'B'])
+        executor = self.fanout._executor
+        self.fanout.map(lambda s: s, ['C', 'D'])
+        self.assertIs(self.fanout._executor, executor)
+
+
+if __name__ == '__main__':
+    unittest.main()
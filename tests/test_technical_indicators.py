@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Tests for the cached RSI series
+
+Tests the vectorized series against per-window RSI, cache invalidation on new
+data, and the slope and divergence features derived from it.
+"""
+
+import unittest
+
+import numpy as np
+
+from utils.technical_indicators import TechnicalIndicators
+
+
+def window_rsi(prices, period):
+    """RSI of the last `period` changes, computed directly"""
+    deltas = np.diff(prices)[-period:]
+    avg_gain = deltas.clip(min=0).sum() / period
+    avg_loss = (-deltas).clip(min=0).sum() / period
+    return 100.0 if avg_loss == 0 else 100 - 100 / (1 + avg_gain / avg_loss)
+
+
+class TestRsiSeries(unittest.TestCase):
+    """Test rsi_series and derived RSI features"""
+
+    def setUp(self):
+        self.indicators = TechnicalIndicators()
+
+    def _add(self, prices, symbol='TEST'):
+        for price in prices:
+            self.indicators.add_price_data(symbol, float(price), 1000)
+
+    def test_series_matches_per_window_rsi(self):
+        """Test every series element equals the RSI recomputed for its window"""
+        prices = 100 + np.cumsum(np.random.default_rng(4).normal(0, 1, 60))
+        self._add(prices)
+
+        series = self.indicators.rsi_series('TEST', 14)
+
+        self.assertEqual(len(series), len(prices) - 14)
+        for i in range(len(series)):
+            self.assertAlmostEqual(series[i], window_rsi(prices[:i + 15], 14), places=9)
+        self.assertEqual(round(series[-1], 2), self.indicators.calculate_rsi('TEST'))
+
+    def test_series_cached_until_new_data(self):
+        """Test repeated calls reuse the array and new prices invalidate it"""
+        self._add(np.linspace(100, 120, 30))
+
+        first = self.indicators.rsi_series('TEST')
+        self.assertIs(self.indicators.rsi_series('TEST'), first)
+        self.assertFalse(first.flags.writeable)
+
+        self._add([110.0])
+        second = self.indicators.rsi_series('TEST')
+        self.assertIsNot(second, first)
+        self.assertEqual(len(second), len(first) + 1)
+        self.assertLess(second[-1], 100.0)
+
+    def test_rsi_slope_from_series(self):
+        """Test the slope is the least squares fit over the last RSI values"""
+        prices = 100 + np.cumsum(np.random.default_rng(5).normal(0, 1, 40))
+        self._add(prices)
+
+        series = self.indicators.rsi_series('TEST')
+        expected = np.polyfit(np.arange(5), series[-5:], 1)[0]
+        self.assertAlmostEqual(self.indicators.calculate_rsi_slope('TEST', slope_period=5), round(expected, 3))
+        self.assertIsNone(self.indicators.calculate_rsi_slope('MISSING'))
+
+    def test_bullish_divergence(self):
+        """Test a lower price low on fading selling pressure is flagged as bullish divergence"""
+        warm_up = np.linspace(130, 128, 14)
+        capitulation = np.linspace(128, 100, 14)  # RSI pinned at 0 on the first low
+        choppy_lower_low = 103 + np.cumsum([1.0, -1.5] * 7)  # Lower low at 99.5 with buyers stepping in
+        self._add(np.concatenate([warm_up, capitulation, choppy_lower_low]))
+
+        result = self.indicators.calculate_rsi_divergence('TEST', lookback=14)
+
+        self.assertEqual(result['divergence'], 'bullish')
+        self.assertLess(result['price_change'], 0)
+        self.assertGreater(result['rsi_change'], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
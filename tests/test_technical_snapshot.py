@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Tests for EnhancedTechnicalIndicators.analyze_bars
+
+Tests the typed snapshot computed from bar-store records against the
+per-indicator methods, its legacy dict form, and memoization per bar.
+"""
+
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from enhanced_technical_indicators import EnhancedTechnicalIndicators
+from utils.bar_store import BarHistory
+from utils.indicator_cache import IndicatorCache
+
+
+def make_bars(symbol, bars, seed=0):
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, bars)))
+    data = pd.DataFrame({
+        'open': close, 'high': close * 1.01, 'low': close * 0.99, 'close': close,
+        'volume': np.full(bars, 1e6)
+    }, index=pd.date_range('2024-01-01', periods=bars, freq='D', tz='UTC'))
+    return BarHistory.from_dataframe(symbol, '1Day', data), data
+
+
+class TestAnalyzeBars(unittest.TestCase):
+    """Test the OHLC snapshot path"""
+
+    def setUp(self):
+        self.indicators = EnhancedTechnicalIndicators(indicator_cache=IndicatorCache())
+        self.indicators.talib_available = False
+
+    def test_from_dataframe_wraps_without_copy(self):
+        """Test float64 columns are shared with the DataFrame"""
+        bars, data = make_bars('SPY', 30)
+        self.assertTrue(np.shares_memory(bars.close, data['close'].to_numpy()))
+        self.assertEqual(bars.last_timestamp, data.index[-1].to_pydatetime())
+
+    def test_snapshot_matches_indicator_methods(self):
+        """Test shared-intermediate values equal the individual calculations on real highs/lows"""
+        bars, data = make_bars('SPY', 250, seed=3)
+        close = data['close'].to_numpy()
+        snapshot = self.indicators.analyze_bars(bars)
+
+        self.assertAlmostEqual(snapshot.rsi, self.indicators.calculate_rsi(close), places=9)
+        for period, value in self.indicators.calculate_moving_averages(close).items():
+            self.assertAlmostEqual(snapshot.moving_averages[period], value, places=9)
+        bands = self.indicators.calculate_bollinger_bands(close)
+        self.assertAlmostEqual(snapshot.bb_upper, bands['upper'], places=9)
+        self.assertAlmostEqual(snapshot.bb_position, bands['position'], places=6)
+        self.assertAlmostEqual(snapshot.ema_fast, self.indicators._calculate_ema(close, 12), places=9)
+        self.assertAlmostEqual(snapshot.macd, snapshot.ema_fast - snapshot.ema_slow, places=12)
+        self.assertEqual(snapshot.advanced, self.indicators.calculate_advanced_indicators(
+            data['high'].to_numpy(), data['low'].to_numpy(), close))
+
+        comprehensive = snapshot.to_comprehensive(timeframe='intraday')
+        self.assertEqual(comprehensive['analysis_quality'], 'good')
+        self.assertEqual(comprehensive['raw_indicators']['macd']['histogram'], snapshot.macd_histogram)
+        self.assertEqual(comprehensive['signals_count'], 4)
+
+    def test_short_history_leaves_indicators_empty(self):
+        """Test indicators needing more bars are None"""
+        snapshot = self.indicators.analyze_bars(make_bars('SPY', 15)[0])
+
+        self.assertIsNone(snapshot.macd)
+        self.assertIsNone(snapshot.bb_middle)
+        self.assertIsNone(snapshot.sma_20)
+        self.assertIsNotNone(snapshot.rsi)
+        self.assertEqual(set(snapshot.to_comprehensive()['raw_indicators']), {'rsi', 'moving_averages', 'advanced'})
+
+    def test_memoized_until_new_bar(self):
+        """Test the same last bar is served from the cache"""
+        bars, _ = make_bars('SPY', 60)
+        first = self.indicators.analyze_bars(bars)
+        second = self.indicators.analyze_bars(bars)
+
+        self.assertIs(first, second)
+        self.assertEqual(self.indicators.indicator_cache.get_stats()['hits'], 1)
+
+    def test_recomputed_when_forming_bar_close_moves(self):
+        """Test a new close on the same last bar misses the cache"""
+        _, data = make_bars('SPY', 60)
+        first = self.indicators.analyze_bars(BarHistory.from_dataframe('SPY', '1Day', data))
+        data = data.copy()
+        data.iloc[-1, data.columns.get_loc('close')] *= 1.02
+        second = self.indicators.analyze_bars(BarHistory.from_dataframe('SPY', '1Day', data))
+
+        self.assertIsNot(first, second)
+        self.assertNotEqual(first.rsi, second.rsi)
+        self.assertEqual(self.indicators.indicator_cache.get_stats()['hits'], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
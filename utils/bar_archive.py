@@ -0,0 +1,405 @@
+"""
+Memory-Mapped Columnar Bar Archive
+
+On-disk OHLCV history that survives process restarts. Each (symbol, timeframe)
+series lives in one numpy memmap file laid out column by column (timestamp,
+open, high, low, close, volume), so reading a column range is one contiguous
+copy out of the mapped file. A small JSON index records row counts and
+first/last timestamps for every series; it is rewritten at most every
+index_flush_seconds (and on growth, replace and close), which is safe because
+bar data always reaches the file before the index refers to it.
+
+Files are never truncated in place: growth and replace() write a new file and
+swap it in with os.replace, so a mapping opened earlier keeps seeing the old
+(intact) file.
+
+The archive is enabled by setting BAR_ARCHIVE_DIR (e.g. a Railway volume);
+get_bar_archive() returns None when it is not configured.
+"""
+
+import json
+import logging
+import os
+import re
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from utils.bar_store import BarHistory, timeframe_to_seconds
+
+
+_COLUMNS = ('timestamp', 'open', 'high', 'low', 'close', 'volume')
+_INDEX_FILE = 'index.json'
+_ROW_BYTES = np.dtype(np.float64).itemsize
+MAX_WRITE_AGE_SECONDS = 900  # A series not written for this long is not current, whatever its timeframe
+
+
+def _epoch(value) -> Optional[int]:
+    """Convert a datetime or epoch value to epoch seconds"""
+    if value is None:
+        return None
+    if isinstance(value, datetime):
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+        return int(value.timestamp())
+    return int(value)
+
+
+def _sorted_unique(epochs: np.ndarray, columns: List[np.ndarray]) -> Tuple[np.ndarray, List[np.ndarray]]:
+    """Sort bars by timestamp; of duplicate timestamps the last given wins"""
+    order = np.argsort(epochs, kind='stable')
+    epochs = epochs[order]
+    columns = [column[order] for column in columns]
+    if len(epochs) > 1:
+        unique_last = np.append(epochs[1:] != epochs[:-1], True)
+        epochs = epochs[unique_last]
+        columns = [column[unique_last] for column in columns]
+    return epochs, columns
+
+
+class BarArchive:
+    """
+    Append-only columnar bar archive backed by numpy memmaps.
+
+    Files grow by doubling their row capacity; appends only accept bars newer
+    than the last archived bar, except that a bar with the same timestamp as
+    the last one overwrites it (the bar was still forming when first written).
+    """
+
+    def __init__(self, root_dir: str, initial_capacity: int = 512,
+                 index_flush_seconds: float = 5.0, logger: Optional[logging.Logger] = None):
+        """
+        Initialize the archive.
+
+        Args:
+            root_dir: Directory holding the memmap files and index
+            initial_capacity: Rows allocated for a new series file
+            index_flush_seconds: Minimum time between index rewrites on append
+            logger: Optional logger instance
+        """
+        self.root_dir = root_dir
+        self.initial_capacity = initial_capacity
+        self.index_flush_seconds = index_flush_seconds
+        self.logger = logger or logging.getLogger(self.__class__.__name__)
+        self._lock = threading.RLock()
+        self._maps: Dict[Tuple[str, str], np.memmap] = {}
+        self._index_dirty = False
+        self._index_saved_at = 0.0
+
+        os.makedirs(self.root_dir, exist_ok=True)
+        self._index: Dict[str, Dict] = self._load_index()
+
+    # Index management
+
+    @staticmethod
+    def _key(symbol: str, timeframe: str) -> str:
+        return f"{symbol}|{timeframe}"
+
+    @staticmethod
+    def _file_name(symbol: str, timeframe: str) -> str:
+        safe_symbol = re.sub(r'[^A-Za-z0-9_-]', '_', symbol)
+        return f"{safe_symbol}__{timeframe}.bars"
+
+    def _load_index(self) -> Dict[str, Dict]:
+        path = os.path.join(self.root_dir, _INDEX_FILE)
+        if not os.path.exists(path):
+            return {}
+        try:
+            with open(path, 'r') as f:
+                return json.load(f)
+        except Exception as e:
+            self.logger.warning(f"⚠️ Bar archive index unreadable ({e}) - starting with an empty archive")
+            return {}
+
+    def _save_index(self, force: bool = False):
+        """Mark the index dirty and rewrite it if forced or index_flush_seconds have passed"""
+        self._index_dirty = True
+        if not force and time.monotonic() - self._index_saved_at < self.index_flush_seconds:
+            return
+        path = os.path.join(self.root_dir, _INDEX_FILE)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(self._index, f)
+        os.replace(tmp_path, path)
+        self._index_dirty = False
+        self._index_saved_at = time.monotonic()
+
+    def _new_entry(self, symbol: str, timeframe: str) -> Dict:
+        entry = {
+            'symbol': symbol,
+            'timeframe': timeframe,
+            'file': self._file_name(symbol, timeframe),
+            'count': 0,
+            'capacity': self.initial_capacity,
+            'first_ts': None,
+            'last_ts': None
+        }
+        self._index[self._key(symbol, timeframe)] = entry
+        return entry
+
+    # Memmap management
+
+    def _open_map(self, symbol: str, timeframe: str, entry: Dict) -> np.memmap:
+        key = (symbol, timeframe)
+        mm = self._maps.get(key)
+        if mm is None:
+            path = os.path.join(self.root_dir, entry['file'])
+            if os.path.exists(path):
+                # The file size is authoritative: the index may lag a growth that happened before a crash
+                entry['capacity'] = os.path.getsize(path) // (len(_COLUMNS) * _ROW_BYTES)
+                mm = np.memmap(path, dtype=np.float64, mode='r+', shape=(len(_COLUMNS), entry['capacity']))
+            else:
+                mm = self._write_file(entry, entry['capacity'], np.empty((len(_COLUMNS), 0)))
+            self._maps[key] = mm
+        return mm
+
+    def _write_file(self, entry: Dict, capacity: int, rows: np.ndarray) -> np.memmap:
+        """Write rows into a new file of the given capacity and swap it in atomically"""
+        path = os.path.join(self.root_dir, entry['file'])
+        tmp_path = f"{path}.tmp"
+        tmp = np.memmap(tmp_path, dtype=np.float64, mode='w+', shape=(len(_COLUMNS), capacity))
+        tmp[:, :rows.shape[1]] = rows
+        tmp.flush()
+        del tmp
+        os.replace(tmp_path, path)
+
+        entry['capacity'] = capacity
+        mm = np.memmap(path, dtype=np.float64, mode='r+', shape=(len(_COLUMNS), capacity))
+        self._maps[(entry['symbol'], entry['timeframe'])] = mm
+        return mm
+
+    def _grow(self, symbol: str, timeframe: str, entry: Dict, required: int) -> np.memmap:
+        """Copy a series into a new file with at least the required row capacity"""
+        rows = np.array(self._open_map(symbol, timeframe, entry)[:, :entry['count']])
+        mm = self._write_file(entry, max(entry['capacity'] * 2, required), rows)
+        self._save_index(force=True)
+        return mm
+
+    # Public API
+
+    def append(self, symbol: str, timeframe: str, timestamps: Sequence, open_: Sequence,
+               high: Sequence, low: Sequence, close: Sequence, volume: Sequence) -> int:
+        """
+        Append bars (oldest first) to a series.
+
+        Bars older than the last archived bar are skipped; a bar with the same
+        timestamp as the last archived bar replaces it.
+
+        Returns:
+            Number of rows added (replacements are not counted)
+        """
+        epochs = np.asarray([_epoch(t) for t in timestamps], dtype=np.int64)
+        if len(epochs) == 0:
+            return 0
+        columns = [np.asarray(values, dtype=np.float64) for values in (open_, high, low, close, volume)]
+
+        with self._lock:
+            entry = self._index.get(self._key(symbol, timeframe)) or self._new_entry(symbol, timeframe)
+            epochs, columns = _sorted_unique(epochs, columns)
+
+            last_ts = entry['last_ts']
+            replace_last = False
+            if last_ts is not None:
+                keep = epochs >= last_ts
+                epochs = epochs[keep]
+                columns = [column[keep] for column in columns]
+                replace_last = len(epochs) > 0 and epochs[0] == last_ts
+
+            if len(epochs) == 0:
+                return 0
+
+            write_at = entry['count'] - 1 if replace_last else entry['count']
+            required = write_at + len(epochs)
+            mm = self._open_map(symbol, timeframe, entry)
+            if required > entry['capacity']:
+                mm = self._grow(symbol, timeframe, entry, required)
+
+            mm[0, write_at:required] = epochs.view(np.float64)
+            for row, column in enumerate(columns, start=1):
+                mm[row, write_at:required] = column
+            mm.flush()
+
+            added = required - entry['count']
+            entry['count'] = required
+            entry['last_ts'] = int(epochs[-1])
+            entry['updated_ts'] = int(time.time())
+            if entry['first_ts'] is None:
+                entry['first_ts'] = int(epochs[0])
+            self._save_index()
+            return added
+
+    def replace(self, symbol: str, timeframe: str, timestamps: Sequence, open_: Sequence,
+                high: Sequence, low: Sequence, close: Sequence, volume: Sequence) -> int:
+        """
+        Rewrite a series with the union of archived and given bars.
+
+        Used when older history must be added in front of what is archived
+        (append() only accepts bars at or after the last archived bar).
+        Given bars win over archived bars with the same timestamp.
+
+        Returns:
+            Row count of the rewritten series
+        """
+        new_epochs = np.asarray([_epoch(t) for t in timestamps], dtype=np.int64)
+        new_columns = [np.asarray(values, dtype=np.float64) for values in (open_, high, low, close, volume)]
+
+        with self._lock:
+            existing = self.read_range(symbol, timeframe)
+            if existing is not None:
+                keep = ~np.isin(existing.timestamps, new_epochs)
+                epochs = np.concatenate([existing.timestamps[keep], new_epochs])
+                columns = [np.concatenate([old[keep], new]) for old, new in
+                           zip((existing.open, existing.high, existing.low, existing.close, existing.volume),
+                               new_columns)]
+            else:
+                epochs, columns = new_epochs, new_columns
+            epochs, columns = _sorted_unique(epochs, columns)
+            if len(epochs) == 0:
+                return self.count(symbol, timeframe)
+
+            entry = self._index.get(self._key(symbol, timeframe)) or self._new_entry(symbol, timeframe)
+            capacity = self.initial_capacity
+            while capacity < len(epochs):
+                capacity *= 2
+            self._write_file(entry, capacity, np.vstack([epochs.view(np.float64)] + columns))
+
+            entry['count'] = len(epochs)
+            entry['first_ts'] = int(epochs[0])
+            entry['last_ts'] = int(epochs[-1])
+            entry['updated_ts'] = int(time.time())
+            self._save_index(force=True)
+            return entry['count']
+
+    def get_metadata(self, symbol: str, timeframe: str) -> Dict:
+        """Free-form metadata stored with a series in the index"""
+        entry = self._index.get(self._key(symbol, timeframe))
+        return dict(entry.get('metadata', {})) if entry else {}
+
+    def set_metadata(self, symbol: str, timeframe: str, **values):
+        """Update metadata of an archived series (ignored if the series does not exist)"""
+        with self._lock:
+            entry = self._index.get(self._key(symbol, timeframe))
+            if entry is None:
+                return
+            entry.setdefault('metadata', {}).update(values)
+            self._save_index()
+
+    def append_history(self, history: BarHistory) -> int:
+        """Append a BarHistory (e.g. from the in-memory bar store) to the archive"""
+        return self.append(history.symbol, history.timeframe, history.timestamps, history.open,
+                           history.high, history.low, history.close, history.volume)
+
+    def read_range(self, symbol: str, timeframe: str, start=None, end=None,
+                   last_n: Optional[int] = None) -> Optional[BarHistory]:
+        """
+        Read archived bars.
+
+        Args:
+            symbol: Symbol
+            timeframe: Bar timeframe
+            start: Inclusive start (datetime or epoch seconds)
+            end: Inclusive end (datetime or epoch seconds)
+            last_n: Keep only the newest last_n bars of the range
+
+        Returns:
+            BarHistory of read-only arrays copied out of the mapped file (one
+            block for all columns, taken under the lock so concurrent appends,
+            growth or replace() never show through), or None if not archived
+        """
+        with self._lock:
+            entry = self._index.get(self._key(symbol, timeframe))
+            if entry is None or entry['count'] == 0:
+                return None
+            mm = self._open_map(symbol, timeframe, entry)
+            count = entry['count']
+
+            timestamps = mm[0, :count].view(np.int64)
+            lo = 0 if start is None else int(np.searchsorted(timestamps, _epoch(start), side='left'))
+            hi = count if end is None else int(np.searchsorted(timestamps, _epoch(end), side='right'))
+            if last_n is not None:
+                lo = max(lo, hi - last_n)
+            block = np.array(mm[:, lo:hi])
+
+        block.flags.writeable = False
+        return BarHistory(symbol, timeframe, block[0].view(np.int64), *block[1:])
+
+    def is_current(self, symbol: str, timeframe: str, now=None) -> bool:
+        """
+        Whether a series is up to date at now (datetime or epoch seconds).
+
+        True when its newest bar is the forming or just-completed bar and the
+        series was written within min(timeframe, MAX_WRITE_AGE_SECONDS), so
+        the forming bar is not stale either. Unknown timeframes, and a now
+        earlier than the last write, are never current.
+        """
+        entry = self._index.get(self._key(symbol, timeframe))
+        if entry is None or entry['last_ts'] is None or entry.get('updated_ts') is None:
+            return False
+        try:
+            seconds = timeframe_to_seconds(timeframe)
+        except ValueError:
+            return False
+        now = time.time() if now is None else _epoch(now)
+        write_age = now - entry['updated_ts']
+        return (now - entry['last_ts'] < 2 * seconds
+                and 0 <= write_age <= min(seconds, MAX_WRITE_AGE_SECONDS))
+
+    def last_timestamp(self, symbol: str, timeframe: str) -> Optional[datetime]:
+        """Open time of the newest archived bar"""
+        entry = self._index.get(self._key(symbol, timeframe))
+        if entry is None or entry['last_ts'] is None:
+            return None
+        return datetime.fromtimestamp(entry['last_ts'], tz=timezone.utc)
+
+    def count(self, symbol: str, timeframe: str) -> int:
+        """Number of archived bars for a series"""
+        entry = self._index.get(self._key(symbol, timeframe))
+        return entry['count'] if entry else 0
+
+    def series(self) -> List[Tuple[str, str]]:
+        """All archived (symbol, timeframe) pairs"""
+        return [(entry['symbol'], entry['timeframe']) for entry in self._index.values()]
+
+    def flush(self):
+        """Flush all memmaps and write the index if it has unsaved changes"""
+        with self._lock:
+            for mm in self._maps.values():
+                mm.flush()
+            if self._index_dirty:
+                self._save_index(force=True)
+
+    def close(self):
+        """Flush and release all memmaps"""
+        with self._lock:
+            self.flush()
+            self._maps.clear()
+
+
+# Process-wide archive shared by the data manager and trading modules
+_bar_archive = None
+_bar_archive_lock = threading.Lock()
+
+
+def get_bar_archive(root_dir: Optional[str] = None,
+                    logger: Optional[logging.Logger] = None) -> Optional[BarArchive]:
+    """
+    Get the shared bar archive.
+
+    Uses root_dir or the BAR_ARCHIVE_DIR environment variable; returns None
+    when neither is set so callers fall back to in-memory history only.
+    """
+    global _bar_archive
+    root_dir = root_dir or os.getenv('BAR_ARCHIVE_DIR')
+    if not root_dir:
+        return None
+    with _bar_archive_lock:
+        if _bar_archive is None or os.path.abspath(_bar_archive.root_dir) != os.path.abspath(root_dir):
+            try:
+                _bar_archive = BarArchive(root_dir, logger=logger)
+            except Exception as e:
+                (logger or logging.getLogger(__name__)).warning(f"⚠️ Bar archive unavailable at {root_dir}: {e}")
+                return None
+        return _bar_archive
@@ -0,0 +1,357 @@
+"""
+Incremental OHLCV Bar Store
+
+Per-(symbol, timeframe) in-memory bar history backed by fixed-capacity numpy
+buffers. The store remembers the last bar timestamp for every series and only
+asks the data provider for bars from that point on, so a steady-state cycle
+downloads one or two bars per symbol instead of the whole lookback window.
+"""
+
+import logging
+import re
+import threading
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+
+# Fetcher signature: (symbols, timeframe, start) -> {symbol: [bar, ...]}
+BarFetcher = Callable[[List[str], str, datetime], Dict[str, List]]
+
+_TIMEFRAME_UNITS = {
+    'min': 60, 't': 60,
+    'hour': 3600, 'h': 3600,
+    'day': 86400, 'd': 86400,
+    'week': 604800, 'w': 604800,
+}
+
+
+def timeframe_to_seconds(timeframe: str) -> int:
+    """Convert an Alpaca timeframe string ('1Min', '15Min', '1Hour', '1Day') to seconds"""
+    match = re.fullmatch(r'(\d*)\s*([A-Za-z]+)', timeframe.strip())
+    if not match:
+        raise ValueError(f"Unsupported timeframe: {timeframe}")
+    amount = int(match.group(1) or 1)
+    unit = match.group(2).lower()
+    if unit not in _TIMEFRAME_UNITS:
+        raise ValueError(f"Unsupported timeframe: {timeframe}")
+    return amount * _TIMEFRAME_UNITS[unit]
+
+
+def _bar_value(bar, *attrs) -> Optional[float]:
+    """Read the first available attribute from a bar entity"""
+    for attr in attrs:
+        value = getattr(bar, attr, None)
+        if value is not None:
+            return value
+    return None
+
+
+def _to_epoch(timestamp) -> Optional[int]:
+    """Convert a bar timestamp (datetime, pandas Timestamp, ISO string or epoch) to epoch seconds"""
+    if timestamp is None:
+        return None
+    if isinstance(timestamp, (int, float, np.integer, np.floating)):
+        return int(timestamp)
+    if isinstance(timestamp, str):
+        timestamp = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
+    if getattr(timestamp, 'tzinfo', None) is None:
+        timestamp = timestamp.replace(tzinfo=timezone.utc)
+    return int(timestamp.timestamp())
+
+
+@dataclass(frozen=True)
+class BarHistory:
+    """
+    Read-only numpy views of one bar series, oldest bar first.
+
+    Views share memory with the store and are only guaranteed stable until the
+    next update of the same series; copy them if they must outlive the cycle.
+    """
+    symbol: str
+    timeframe: str
+    timestamps: np.ndarray  # int64 epoch seconds
+    open: np.ndarray
+    high: np.ndarray
+    low: np.ndarray
+    close: np.ndarray
+    volume: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.close)
+
+    @classmethod
+    def from_dataframe(cls, symbol: str, timeframe: str, data) -> 'BarHistory':
+        """
+        Wrap an OHLCV DataFrame (open/high/low/close/volume columns, timestamp index).
+
+        float64 columns are used without copying; other dtypes are converted.
+        """
+        timestamps = np.fromiter((_to_epoch(ts) for ts in data.index), dtype=np.int64, count=len(data))
+        columns = [np.ascontiguousarray(data[name].to_numpy(dtype=np.float64))
+                   for name in ('open', 'high', 'low', 'close', 'volume')]
+        return cls(symbol, timeframe, timestamps, *columns)
+
+    @property
+    def last_timestamp(self) -> Optional[datetime]:
+        """Open time of the most recent bar"""
+        if len(self.timestamps) == 0:
+            return None
+        return datetime.fromtimestamp(int(self.timestamps[-1]), tz=timezone.utc)
+
+
+class _SeriesBuffer:
+    """
+    Fixed-capacity append buffer for one series.
+
+    Backed by arrays of twice the capacity: appends write past the live window
+    and the window is compacted to the front only when the spare half is used
+    up, so reads are always contiguous slices (numpy views, no copies).
+    """
+
+    _COLUMNS = ('open', 'high', 'low', 'close', 'volume')
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self.timestamps = np.zeros(capacity * 2, dtype=np.int64)
+        self.columns = {name: np.zeros(capacity * 2, dtype=np.float64) for name in self._COLUMNS}
+        self.start = 0
+        self.end = 0
+
+    def __len__(self) -> int:
+        return self.end - self.start
+
+    @property
+    def last_epoch(self) -> Optional[int]:
+        return int(self.timestamps[self.end - 1]) if self.end > self.start else None
+
+    def upsert(self, epoch: int, values: Tuple[float, float, float, float, float]) -> str:
+        """Append a newer bar or overwrite the last (still-forming) bar; older bars are ignored"""
+        last = self.last_epoch
+        if last is not None and epoch < last:
+            return 'ignored'
+        if last is not None and epoch == last:
+            index = self.end - 1
+            result = 'updated'
+        else:
+            if self.end == len(self.timestamps):
+                self._compact()
+            index = self.end
+            self.end += 1
+            if len(self) > self.capacity:
+                self.start += 1
+            result = 'appended'
+        self.timestamps[index] = epoch
+        for name, value in zip(self._COLUMNS, values):
+            self.columns[name][index] = value
+        return result
+
+    def _compact(self):
+        """Move the live window back to the front of the buffers"""
+        size = len(self)
+        self.timestamps[:size] = self.timestamps[self.start:self.end]
+        for column in self.columns.values():
+            column[:size] = column[self.start:self.end]
+        self.start, self.end = 0, size
+
+    def view(self, symbol: str, timeframe: str, last_n: Optional[int] = None) -> BarHistory:
+        """Read-only views of the newest last_n bars (all bars when None)"""
+        start = self.start if last_n is None else max(self.start, self.end - last_n)
+        arrays = [self.timestamps[start:self.end]] + [self.columns[name][start:self.end] for name in self._COLUMNS]
+        for array in arrays:
+            array.flags.writeable = False
+        return BarHistory(symbol, timeframe, *arrays)
+
+
+class BarStore:
+    """
+    Incremental bar cache keyed by (symbol, timeframe).
+
+    Cold series are backfilled with history_depth bars; warm series are
+    refreshed from their last stored bar (inclusive, so a still-forming bar is
+    updated in place). Each update() issues at most one request for cold and
+    one for warm symbols, whatever the number of symbols.
+
+    With an on-disk archive (utils.bar_archive.BarArchive) cold series are
+    first loaded from disk and every fetched bar is written through, so a
+    restarted process only downloads the bars it missed while down.
+
+    Thread-safe: modules fan symbol analysis out over worker threads.
+    """
+
+    def __init__(self, fetch_bars: BarFetcher, history_depth: int = 200,
+                 logger: Optional[logging.Logger] = None, archive=None):
+        """
+        Initialize the bar store.
+
+        Args:
+            fetch_bars: Callable(symbols, timeframe, start) returning {symbol: [bar, ...]}
+            history_depth: Bars kept per series (and backfilled for new series)
+            logger: Optional logger instance
+            archive: Optional BarArchive for warm restarts and write-through
+        """
+        if history_depth <= 0:
+            raise ValueError("history_depth must be positive")
+        self.fetch_bars = fetch_bars
+        self.history_depth = history_depth
+        self.logger = logger or logging.getLogger(self.__class__.__name__)
+        self.archive = archive
+        self._lock = threading.RLock()
+        self._series: Dict[Tuple[str, str], _SeriesBuffer] = {}
+        self._stats = {
+            'requests': 0,
+            'bars_received': 0,
+            'bars_appended': 0,
+            'bars_updated': 0,
+            'request_errors': 0,
+            'archive_loads': 0
+        }
+
+    def update(self, symbols: Iterable[str], timeframe: str = '1Hour',
+               now: Optional[datetime] = None) -> Dict[str, int]:
+        """
+        Fetch only the bars each series is missing.
+
+        Args:
+            symbols: Symbols to refresh
+            timeframe: Bar timeframe ('1Min', '1Hour', '1Day', ...)
+            now: Current time (for testing)
+
+        Returns:
+            Number of newly appended bars per symbol
+        """
+        with self._lock:
+            return self._update(symbols, timeframe, now or datetime.now(timezone.utc))
+
+    def _update(self, symbols: Iterable[str], timeframe: str, now: datetime) -> Dict[str, int]:
+        tf_seconds = timeframe_to_seconds(timeframe)
+
+        cold, warm = [], []
+        for symbol in dict.fromkeys(symbols):
+            series = self._series.get((symbol, timeframe))
+            if (series is None or series.last_epoch is None) and self._load_from_archive(symbol, timeframe):
+                series = self._series[(symbol, timeframe)]
+            (warm if series is not None and series.last_epoch is not None else cold).append(symbol)
+
+        appended = {symbol: 0 for symbol in cold + warm}
+        if cold:
+            start = now - timedelta(seconds=tf_seconds * self.history_depth)
+            self._fetch_into(cold, timeframe, start, appended)
+        if warm:
+            start_epoch = min(self._series[(symbol, timeframe)].last_epoch for symbol in warm)
+            # Never ask for more than history_depth bars (e.g. after a long outage)
+            start_epoch = max(start_epoch, int(now.timestamp()) - tf_seconds * self.history_depth)
+            start = datetime.fromtimestamp(start_epoch, tz=timezone.utc)
+            self._fetch_into(warm, timeframe, start, appended)
+        return appended
+
+    def _fetch_into(self, symbols: List[str], timeframe: str, start: datetime, appended: Dict[str, int]):
+        """Run one fetch and merge the returned bars into their series"""
+        self._stats['requests'] += 1
+        try:
+            bars_by_symbol = self.fetch_bars(symbols, timeframe, start) or {}
+        except Exception as e:
+            self._stats['request_errors'] += 1
+            self.logger.warning(f"⚠️ Bar store fetch failed for {len(symbols)} symbols ({timeframe}): {e}")
+            return
+
+        for symbol in symbols:
+            bars = bars_by_symbol.get(symbol) or []
+            self._stats['bars_received'] += len(bars)
+            series = self._series.setdefault((symbol, timeframe), _SeriesBuffer(self.history_depth))
+            changed_rows = []
+            for bar in sorted(bars, key=lambda b: _to_epoch(_bar_value(b, 't', 'timestamp')) or 0):
+                row = self._parse_bar(bar)
+                if row is None:
+                    continue
+                result = series.upsert(*row)
+                if result == 'appended':
+                    appended[symbol] += 1
+                    self._stats['bars_appended'] += 1
+                elif result == 'updated':
+                    self._stats['bars_updated'] += 1
+                if result != 'ignored':
+                    changed_rows.append(row)
+            if changed_rows:
+                self._write_through(symbol, timeframe, changed_rows)
+
+    @staticmethod
+    def _parse_bar(bar) -> Optional[Tuple[int, Tuple[float, float, float, float, float]]]:
+        epoch = _to_epoch(_bar_value(bar, 't', 'timestamp'))
+        close = _bar_value(bar, 'c', 'close')
+        if epoch is None or close is None:
+            return None
+        close = float(close)
+        values = (
+            float(_bar_value(bar, 'o', 'open') or close),
+            float(_bar_value(bar, 'h', 'high') or close),
+            float(_bar_value(bar, 'l', 'low') or close),
+            close,
+            float(_bar_value(bar, 'v', 'volume') or 0.0)
+        )
+        return epoch, values
+
+    def _load_from_archive(self, symbol: str, timeframe: str) -> bool:
+        """Seed a cold series with the newest archived bars"""
+        if self.archive is None:
+            return False
+        try:
+            history = self.archive.read_range(symbol, timeframe, last_n=self.history_depth)
+        except Exception as e:
+            self.logger.warning(f"⚠️ Bar archive read failed for {symbol} ({timeframe}): {e}")
+            return False
+        if history is None or len(history) == 0:
+            return False
+        series = self._series.setdefault((symbol, timeframe), _SeriesBuffer(self.history_depth))
+        for i in range(len(history)):
+            series.upsert(int(history.timestamps[i]), (float(history.open[i]), float(history.high[i]),
+                                                       float(history.low[i]), float(history.close[i]),
+                                                       float(history.volume[i])))
+        self._stats['archive_loads'] += 1
+        return True
+
+    def _write_through(self, symbol: str, timeframe: str, rows: List):
+        """Persist newly received bars to the archive"""
+        if self.archive is None:
+            return
+        try:
+            epochs = [row[0] for row in rows]
+            values = list(zip(*[row[1] for row in rows]))
+            self.archive.append(symbol, timeframe, epochs, *values)
+        except Exception as e:
+            self.logger.warning(f"⚠️ Bar archive write failed for {symbol} ({timeframe}): {e}")
+
+    def get_history(self, symbol: str, timeframe: str = '1Hour',
+                    last_n: Optional[int] = None) -> Optional[BarHistory]:
+        """Read-only views of a stored series (None if the series has never been loaded)"""
+        with self._lock:
+            series = self._series.get((symbol, timeframe))
+            if series is None or len(series) == 0:
+                return None
+            return series.view(symbol, timeframe, last_n)
+
+    def last_timestamp(self, symbol: str, timeframe: str = '1Hour') -> Optional[datetime]:
+        """Open time of the newest stored bar for a series"""
+        with self._lock:
+            series = self._series.get((symbol, timeframe))
+        if series is None or series.last_epoch is None:
+            return None
+        return datetime.fromtimestamp(series.last_epoch, tz=timezone.utc)
+
+    def clear(self, symbol: Optional[str] = None):
+        """Drop stored history for one symbol or for every series"""
+        with self._lock:
+            if symbol is None:
+                self._series.clear()
+            else:
+                for key in [key for key in self._series if key[0] == symbol]:
+                    del self._series[key]
+
+    def get_stats(self) -> Dict[str, int]:
+        """Request and bar counters"""
+        with self._lock:
+            stats = dict(self._stats)
+            stats['series'] = len(self._series)
+        return stats
@@ -0,0 +1,162 @@
+"""
+Cooperative Cancellation
+
+A CancellationToken carries one module run's time budget. Long loops check it
+between symbols and stages: once the deadline passes they stop starting new
+work, record what they skipped and return the results finished so far, so a
+slow provider shrinks one module's coverage instead of stalling the cycle.
+
+The orchestrator installs a token for the duration of a module run with
+cancellation_scope(); code below it (including asyncio.to_thread calls, which
+copy the context) finds it with current_token() without threading it through
+every signature.
+
+A coroutine can be cancelled but the thread it awaits cannot. Async code runs
+blocking calls through to_thread() below, which counts them on the token, so
+the run stays "in flight" (when_idle() callbacks wait) until they return.
+"""
+
+import asyncio
+import concurrent.futures
+import contextvars
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Iterable, Iterator, List, Optional
+
+DEADLINE = "deadline"
+
+
+class CancellationToken:
+    """Deadline plus explicit cancellation, shared by a module run and its workers"""
+
+    def __init__(self, budget_seconds: Optional[float] = None, name: str = ""):
+        self.name = name
+        self.budget_seconds = budget_seconds
+        self.deadline = None if budget_seconds is None else time.monotonic() + budget_seconds
+        self.reason: Optional[str] = None
+        self._event = threading.Event()
+        self._lock = threading.Lock()
+        self._skipped: List[str] = []
+        self._threads = 0  # Blocking calls of this run still executing in worker threads
+        self._idle_callbacks: List[Callable[[], None]] = []
+
+    def cancel(self, reason: str = "cancelled"):
+        """Cancel explicitly (e.g. the orchestrator abandoning an overrunning module)"""
+        with self._lock:
+            if self.reason is None:
+                self.reason = reason
+        self._event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        """True once the deadline passed or cancel() was called: start no new work"""
+        if self._event.is_set():
+            return True
+        if self.deadline is not None and time.monotonic() >= self.deadline:
+            self.cancel(DEADLINE)
+            return True
+        return False
+
+    @property
+    def aborted(self) -> bool:
+        """Cancelled for a reason other than the deadline: drop unfinished stages too"""
+        return self._event.is_set() and self.reason != DEADLINE
+
+    def remaining(self) -> Optional[float]:
+        """Seconds left in the budget, None without a deadline"""
+        if self._event.is_set():
+            return 0.0
+        if self.deadline is None:
+            return None
+        return max(0.0, self.deadline - time.monotonic())
+
+    def skip(self, symbols: Iterable[str]):
+        """Record symbols left unprocessed because of cancellation"""
+        with self._lock:
+            self._skipped.extend(symbol for symbol in symbols if symbol not in self._skipped)
+
+    def should_stop(self, pending: Iterable[str] = ()) -> bool:
+        """Check between symbols: True when cancelled, recording the pending symbols as skipped"""
+        if not self.cancelled:
+            return False
+        self.skip(pending)
+        return True
+
+    @property
+    def skipped(self) -> List[str]:
+        with self._lock:
+            return list(self._skipped)
+
+    @property
+    def threads_in_flight(self) -> int:
+        with self._lock:
+            return self._threads
+
+    def _thread_started(self):
+        with self._lock:
+            self._threads += 1
+
+    def _thread_finished(self):
+        with self._lock:
+            self._threads -= 1
+            callbacks = self._idle_callbacks if self._threads == 0 else []
+            if callbacks:
+                self._idle_callbacks = []
+        for callback in callbacks:
+            callback()
+
+    def when_idle(self, callback: Callable[[], None]):
+        """Call callback once none of the run's to_thread() calls is still executing (now if none is)"""
+        with self._lock:
+            if self._threads:
+                self._idle_callbacks.append(callback)
+                return
+        callback()
+
+
+_current_token: contextvars.ContextVar[Optional[CancellationToken]] = contextvars.ContextVar(
+    "cancellation_token", default=None)
+
+
+def current_token() -> CancellationToken:
+    """The token of the running module, or a token that never cancels"""
+    token = _current_token.get()
+    return token if token is not None else CancellationToken()
+
+
+@contextmanager
+def cancellation_scope(token: CancellationToken) -> Iterator[CancellationToken]:
+    """Make token the current token for this thread / task"""
+    reset = _current_token.set(token)
+    try:
+        yield token
+    finally:
+        _current_token.reset(reset)
+
+
+async def to_thread(fn: Callable[..., Any], *args,
+                    executor: Optional[concurrent.futures.Executor] = None, **kwargs) -> Any:
+    """
+    asyncio.to_thread() that keeps the current run in flight until fn returns.
+
+    Cancelling the awaiting coroutine cancels a call that has not started yet;
+    one already running finishes in its thread and only then counts as done.
+    Runs on executor, or the event loop's default executor.
+    """
+    token = current_token()
+    context = contextvars.copy_context()
+    future: concurrent.futures.Future = concurrent.futures.Future()
+    token._thread_started()
+    future.add_done_callback(lambda _: token._thread_finished())
+
+    def call():
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            future.set_result(context.run(fn, *args, **kwargs))
+        except BaseException as e:
+            future.set_exception(e)
+
+    asyncio.get_running_loop().run_in_executor(executor, call)
+    return await asyncio.wrap_future(future)
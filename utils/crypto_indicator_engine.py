@@ -0,0 +1,293 @@
+"""
+Vectorized Crypto Indicator Engine
+
+Computes the crypto module's signal stack (RSI with mean reversion, EMA/MACD,
+Bollinger Bands and volume confirmation) for the whole symbol universe at once.
+Price histories are stacked into a right-aligned (symbols x bars) matrix padded
+with NaN, so every indicator is a handful of numpy operations regardless of
+how many pairs are analyzed. Results are per-symbol records whose dicts have
+the same keys and values as the module's per-symbol calculations, so they can
+be passed straight to _calculate_directional_confidence.
+"""
+
+import logging
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+RSI_PERIOD = 14
+BOLLINGER_PERIOD = 20
+MACD_FAST, MACD_SLOW = 12, 26
+MACD_FALLBACK_FAST, MACD_FALLBACK_SLOW = 9, 21
+
+
+@dataclass
+class SymbolIndicators:
+    """Indicator results for one symbol (None where data was insufficient)"""
+    symbol: str
+    rsi: Optional[Dict] = None
+    macd: Optional[Dict] = None
+    bollinger: Optional[Dict] = None
+    volume: Optional[Dict] = None
+
+
+def stack_price_histories(histories: Sequence[Sequence[float]]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Stack ragged price histories into a right-aligned NaN-padded matrix.
+
+    Returns:
+        (matrix of shape (symbols, max_len), lengths array)
+    """
+    lengths = np.fromiter((len(h) for h in histories), dtype=np.int64, count=len(histories))
+    width = int(lengths.max()) if len(lengths) else 0
+    matrix = np.full((len(histories), width), np.nan)
+    for row, history in enumerate(histories):
+        if lengths[row]:
+            matrix[row, width - lengths[row]:] = np.asarray(history, dtype=float)
+    return matrix, lengths
+
+
+def _window_mean(matrix: np.ndarray, lengths: np.ndarray, period: int) -> np.ndarray:
+    """Mean of each row's last `period` values (NaN padding ignored)"""
+    return np.nansum(matrix[:, -period:], axis=1) / np.minimum(lengths, period)
+
+
+def ema_last(matrix: np.ndarray, lengths: np.ndarray, period: int) -> np.ndarray:
+    """
+    Final EMA of each row, seeded with the row's first price.
+
+    Uses the closed form of the recursion: the bar k steps from the end has
+    weight a(1-a)^k and the seed keeps the remaining (1-a)^(n-1).
+    """
+    alpha = 2.0 / (period + 1)
+    width = matrix.shape[1]
+    if width == 0:
+        return np.full(len(lengths), np.nan)
+    decay = (1 - alpha) ** np.arange(width - 1, -1, -1)  # Column j is width-1-j bars from the end
+    weighted = np.nansum(matrix * (alpha * decay), axis=1)
+
+    rows = np.arange(len(lengths))
+    first = matrix[rows, np.clip(width - lengths, 0, width - 1)]
+    seed_weight = (1 - alpha) ** (lengths - 1) * (1 - alpha)  # (1-a)^(n-1) minus the a(1-a)^(n-1) counted above
+    result = weighted + seed_weight * first
+    return np.where(lengths > 0, result, np.nan)
+
+
+class CryptoIndicatorEngine:
+    """Cross-symbol indicator engine for the crypto signal stack"""
+
+    def __init__(self, ma_period: int = 20, oversold_threshold: float = -0.15,
+                 logger: Optional[logging.Logger] = None):
+        """
+        Initialize the engine.
+
+        Args:
+            ma_period: Moving average period for the mean reversion reference
+            oversold_threshold: Deviation from the MA that counts as oversold (negative)
+            logger: Optional logger instance
+        """
+        self.ma_period = ma_period
+        self.oversold_threshold = oversold_threshold
+        self.logger = logger or logging.getLogger(self.__class__.__name__)
+
+    def analyze(self, market_data: Dict[str, Dict]) -> Dict[str, SymbolIndicators]:
+        """
+        Compute all indicators for every symbol in one pass.
+
+        Args:
+            market_data: symbol -> market data dict with price_history, current_price,
+                volume_24h and avg_volume_7d
+
+        Returns:
+            symbol -> SymbolIndicators
+        """
+        symbols = [symbol for symbol, data in market_data.items() if data]
+        if not symbols:
+            return {}
+
+        matrix, lengths = stack_price_histories([market_data[s].get('price_history', []) for s in symbols])
+        current = np.array([market_data[s].get('current_price', 0) or 0 for s in symbols], dtype=float)
+
+        rsi = self._rsi(matrix, lengths)
+        macd = self._macd(matrix, lengths, current)
+        bollinger = self._bollinger(matrix, lengths, current)
+        volume = self._volume(symbols, market_data)
+
+        fallback = [s for s, n in zip(symbols, lengths) if MACD_FALLBACK_SLOW <= n < MACD_SLOW]
+        if fallback:
+            self.logger.warning(f"MACD fallback: Using EMA-9/21 instead of EMA-12/26 for {', '.join(fallback)}")
+
+        results = {}
+        for row, symbol in enumerate(symbols):
+            results[symbol] = SymbolIndicators(
+                symbol=symbol,
+                rsi=self._rsi_record(rsi, row),
+                macd=self._macd_record(macd, row),
+                bollinger=self._bollinger_record(bollinger, row),
+                volume=volume.get(symbol)
+            )
+        return results
+
+    # Array computations (one call per indicator for the whole universe)
+
+    def _rsi(self, matrix: np.ndarray, lengths: np.ndarray) -> Dict[str, np.ndarray]:
+        """Simple-average RSI over the last 14 changes combined with MA mean reversion"""
+        changes = np.nan_to_num(np.diff(matrix[:, -(RSI_PERIOD + 1):], axis=1))
+        avg_gain = np.clip(changes, 0, None).sum(axis=1) / RSI_PERIOD
+        avg_loss = np.clip(-changes, 0, None).sum(axis=1) / RSI_PERIOD
+        with np.errstate(divide='ignore', invalid='ignore'):
+            rsi = np.where(avg_loss == 0, 100.0, 100 - 100 / (1 + avg_gain / avg_loss))
+
+        has_ma = lengths >= self.ma_period
+        with np.errstate(divide='ignore', invalid='ignore'):
+            moving_average = _window_mean(matrix, lengths, self.ma_period)
+            deviation = np.where(has_ma, (matrix[:, -1] - moving_average) / moving_average, np.nan)
+
+        oversold = has_ma & (deviation <= self.oversold_threshold)
+        overbought = has_ma & ~oversold & (deviation >= -self.oversold_threshold)
+        buy_boost = np.select([oversold, overbought], [0.3, -0.2], 0.0)
+        sell_penalty = np.select([oversold, overbought], [-0.3, 0.2], 0.0)
+
+        bands = [rsi <= 30, rsi <= 45, rsi <= 55, rsi <= 70]
+        buy = np.select(bands, [np.minimum(0.95, 0.85 + buy_boost),
+                                np.minimum(0.85, 0.70 + buy_boost),
+                                np.clip(0.50 + buy_boost, 0.30, 0.70),
+                                np.maximum(0.15, 0.40 + buy_boost)],
+                        np.maximum(0.05, 0.25 + buy_boost))
+        sell = np.select(bands, [np.maximum(0.05, 0.15 + sell_penalty),
+                                 np.maximum(0.15, 0.30 + sell_penalty),
+                                 np.clip(0.50 + sell_penalty, 0.30, 0.70),
+                                 np.minimum(0.85, 0.60 + sell_penalty)],
+                         np.minimum(0.95, 0.75 + sell_penalty))
+        signal = np.select(bands, [0, 1, 2, 3], 4)
+
+        return {'valid': lengths >= RSI_PERIOD, 'rsi': rsi, 'buy': buy, 'sell': sell, 'signal': signal,
+                'deviation': deviation, 'has_ma': has_ma, 'oversold': oversold, 'overbought': overbought}
+
+    def _macd(self, matrix: np.ndarray, lengths: np.ndarray, current: np.ndarray) -> Dict[str, np.ndarray]:
+        """MACD line from EMA-12/26, or EMA-9/21 for 21-25 bars"""
+        standard = lengths >= MACD_SLOW
+        fallback = ~standard & (lengths >= MACD_FALLBACK_SLOW)
+        macd_line = np.where(standard,
+                             ema_last(matrix, lengths, MACD_FAST) - ema_last(matrix, lengths, MACD_SLOW),
+                             ema_last(matrix, lengths, MACD_FALLBACK_FAST) - ema_last(matrix, lengths, MACD_FALLBACK_SLOW))
+
+        price = np.where(current != 0, current, 1.0)
+        strength = 0.5 + np.minimum(np.abs(macd_line / price * 100) / 2.0, 0.4)
+        bullish = macd_line > 0
+        buy = np.where(bullish, strength, 1 - strength)
+
+        # Fallback strengths match the per-symbol implementation
+        fallback_strength = np.where(bullish, 0.6, 0.4)
+        fallback_buy = np.where(bullish, fallback_strength, 1 - fallback_strength)
+        fallback_sell = np.where(bullish, 1 - fallback_strength, fallback_strength)
+
+        return {'standard': standard, 'fallback': fallback, 'macd_line': macd_line, 'bullish': bullish,
+                'buy': np.where(fallback, fallback_buy, buy),
+                'sell': np.where(fallback, fallback_sell, 1 - buy)}
+
+    def _bollinger(self, matrix: np.ndarray, lengths: np.ndarray, current: np.ndarray) -> Dict[str, np.ndarray]:
+        """20-period Bollinger Bands (population std) and price position"""
+        valid = (lengths >= BOLLINGER_PERIOD) & (current > 0)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            sma = _window_mean(matrix, lengths, BOLLINGER_PERIOD)
+            std = np.sqrt(_window_mean((matrix - sma[:, None]) ** 2, lengths, BOLLINGER_PERIOD))
+            upper = sma + 2 * std
+            lower = sma - 2 * std
+            band_range = upper - lower
+            band_position = (current - lower) / band_range
+
+            above = current > upper
+            below = ~above & (current < lower)
+            within_buy = np.where(band_position <= 0.5,
+                                  0.5 + (0.5 - band_position) * 0.6,
+                                  0.5 - (band_position - 0.5) * 0.6)
+            buy = np.select([above, below],
+                            [np.maximum(0.1, 0.3 - np.minimum((current - upper) / upper * 2, 0.2)),
+                             np.minimum(0.9, 0.7 + np.minimum((lower - current) / lower * 2, 0.2))],
+                            within_buy)
+            has_range = band_range > 0
+            buy = np.where(has_range, buy, 0.5)
+            position = np.where(has_range, np.select([above, below], [0, 1], 2), 3)
+            volatility = np.minimum(band_range / sma / 0.1, 1.0)
+
+        return {'valid': valid, 'sma': sma, 'upper': upper, 'lower': lower, 'buy': buy,
+                'position': position, 'volatility': volatility}
+
+    @staticmethod
+    def _volume(symbols: List[str], market_data: Dict[str, Dict]) -> Dict[str, Optional[Dict]]:
+        """Volume ratio and confirmation strength"""
+        volume_24h = np.array([market_data[s].get('volume_24h', 0) for s in symbols], dtype=float)
+        avg_volume = np.array([market_data[s].get('avg_volume_7d', market_data[s].get('volume_24h', 0))
+                               for s in symbols], dtype=float)
+        valid = avg_volume > 0
+        ratio = np.divide(volume_24h, avg_volume, out=np.zeros_like(volume_24h), where=valid)
+        bands = [ratio >= 2.0, ratio >= 1.5, ratio >= 0.8]
+        multiplier = np.select(bands, [1.2, 1.1, 1.0], 0.8)
+        level = np.select(bands, [0, 1, 2], 3)
+        score = np.minimum(ratio / 2.0, 1.0)
+        confirmations = ('strong', 'moderate', 'neutral', 'weak')
+
+        return {symbol: {
+            'volume_ratio': float(ratio[row]),
+            'confirmation': confirmations[level[row]],
+            'strength_multiplier': float(multiplier[row]),
+            'volume_score': float(score[row])
+        } if valid[row] else None for row, symbol in enumerate(symbols)}
+
+    # Per-symbol records (same keys as the crypto module's signal dicts)
+
+    _RSI_SIGNALS = ('strong_buy', 'buy', 'neutral', 'weak_sell', 'sell')
+    _BAND_POSITIONS = ('above_upper', 'below_lower', 'within_bands', 'neutral')
+
+    def _rsi_record(self, rsi: Dict[str, np.ndarray], row: int) -> Optional[Dict]:
+        if not rsi['valid'][row]:
+            return None
+        deviation = float(rsi['deviation'][row])
+        if not rsi['has_ma'][row]:
+            context = "insufficient_data_for_mean_reversion"
+        elif rsi['oversold'][row]:
+            context = f"mean_reversion_oversold_{deviation:.1%}"
+        elif rsi['overbought'][row]:
+            context = f"mean_reversion_overbought_{deviation:.1%}"
+        else:
+            context = f"mean_reversion_neutral_{deviation:.1%}"
+
+        return {
+            'rsi_value': float(rsi['rsi'][row]),
+            'signal': self._RSI_SIGNALS[rsi['signal'][row]],
+            'buy_strength': float(rsi['buy'][row]),
+            'sell_strength': float(rsi['sell'][row]),
+            'mean_reversion_context': context,
+            'ma_deviation': deviation if rsi['has_ma'][row] else None
+        }
+
+    @staticmethod
+    def _macd_record(macd: Dict[str, np.ndarray], row: int) -> Optional[Dict]:
+        if not (macd['standard'][row] or macd['fallback'][row]):
+            return None
+        record = {
+            'macd_line': float(macd['macd_line'][row]),
+            'macd_signal': 'bullish' if macd['bullish'][row] else 'bearish',
+            'buy_strength': float(macd['buy'][row]),
+            'sell_strength': float(macd['sell'][row])
+        }
+        if macd['fallback'][row]:
+            record['confidence'] = 0.5  # Lower confidence for fallback method
+            record['fallback_method'] = True
+        return record
+
+    def _bollinger_record(self, bollinger: Dict[str, np.ndarray], row: int) -> Optional[Dict]:
+        if not bollinger['valid'][row]:
+            return None
+        buy = float(bollinger['buy'][row])
+        return {
+            'position': self._BAND_POSITIONS[bollinger['position'][row]],
+            'upper_band': float(bollinger['upper'][row]),
+            'lower_band': float(bollinger['lower'][row]),
+            'sma_20': float(bollinger['sma'][row]),
+            'buy_strength': buy,
+            'sell_strength': 1 - buy,
+            'volatility_score': float(bollinger['volatility'][row])
+        }
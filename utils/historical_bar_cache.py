@@ -0,0 +1,259 @@
+"""
+Historical Bar Cache
+
+Daily (and weekly) bar cache for EnhancedDataManager.get_historical_data.
+Completed bars never change, so they are fetched once, kept per
+(symbol, interval) and persisted to the bar archive when one is configured.
+Later requests only fetch the missing tail - normally just the current,
+still-forming bar - and that partial bar is refreshed at most once per
+partial_refresh_seconds.
+"""
+
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Dict, Optional, Tuple
+
+import pandas as pd
+
+
+# Fetcher signature: (symbol, interval, start) -> DataFrame with lowercase OHLCV columns
+HistoryFetcher = Callable[[str, str, datetime], Optional[pd.DataFrame]]
+
+_OHLCV = ['open', 'high', 'low', 'close', 'volume']
+
+
+@dataclass
+class _CachedSeries:
+    """Cached state of one (symbol, interval) series"""
+    completed: pd.DataFrame  # Completed bars, UTC index, oldest first
+    covered_from: Optional[datetime] = None  # Earliest start fetched so far
+    partial: Optional[pd.DataFrame] = None  # Current forming bar (0 or 1 rows)
+    partial_fetched_at: float = 0.0
+    partial_day: Optional[str] = None  # UTC date the partial bar was fetched on
+
+
+def _empty_frame() -> pd.DataFrame:
+    return pd.DataFrame({column: pd.Series(dtype='float64') for column in _OHLCV},
+                        index=pd.DatetimeIndex([], tz='UTC'))
+
+
+class HistoricalBarCache:
+    """
+    Completed/partial split cache of OHLCV history.
+
+    A series is fetched in full only when a request reaches further back than
+    anything fetched before; otherwise only bars after the last completed bar
+    are requested, and not at all while the partial bar is still fresh.
+    """
+
+    # Supported intervals -> (bar archive timeframe, bar length in days)
+    SUPPORTED_INTERVALS = {'1d': ('1Day', 1), '1wk': ('1Week', 7)}
+
+    def __init__(self, fetch_history: HistoryFetcher, archive=None,
+                 partial_refresh_seconds: float = 300.0,
+                 logger: Optional[logging.Logger] = None):
+        """
+        Initialize the cache.
+
+        Args:
+            fetch_history: Callable(symbol, interval, start) returning an OHLCV DataFrame
+            archive: Optional BarArchive persisting completed bars across restarts
+            partial_refresh_seconds: Minimum age before the forming bar is re-fetched
+            logger: Optional logger instance
+        """
+        self.fetch_history = fetch_history
+        self.archive = archive
+        self.partial_refresh_seconds = partial_refresh_seconds
+        self.logger = logger or logging.getLogger(self.__class__.__name__)
+        self._series: Dict[Tuple[str, str], _CachedSeries] = {}
+        self._locks: Dict[Tuple[str, str], threading.Lock] = {}
+        self._locks_guard = threading.Lock()
+        self._stats = {
+            'hits': 0,
+            'tail_fetches': 0,
+            'full_fetches': 0,
+            'fetch_errors': 0,
+            'archive_loads': 0
+        }
+
+    def supports(self, interval: str) -> bool:
+        return interval in self.SUPPORTED_INTERVALS
+
+    def get(self, symbol: str, interval: str, start: datetime,
+            now: Optional[datetime] = None) -> Optional[pd.DataFrame]:
+        """
+        Bars from start to now, fetching only what the cache is missing.
+
+        Args:
+            symbol: Symbol in Alpaca format
+            interval: '1d' or '1wk'
+            start: Earliest bar wanted
+            now: Current time (for testing)
+
+        Returns:
+            DataFrame with open/high/low/close/volume columns and a UTC index,
+            or None if nothing is cached and the fetch failed
+        """
+        if not self.supports(interval):
+            raise ValueError(f"Unsupported interval for historical cache: {interval}")
+        now = now or datetime.now(timezone.utc)
+        key = (symbol, interval)
+
+        with self._lock_for(key):
+            series = self._series.get(key)
+            if series is None:
+                series = self._load_from_archive(symbol, interval)
+                self._series[key] = series
+
+            if series.covered_from is None or start < series.covered_from:
+                self._refresh(series, symbol, interval, start, now, full=True)
+            elif self._partial_is_stale(series, now):
+                tail_start = start
+                if not series.completed.empty:
+                    tail_start = series.completed.index[-1].to_pydatetime() + timedelta(days=1)
+                self._refresh(series, symbol, interval, tail_start, now, full=False)
+            else:
+                self._stats['hits'] += 1
+
+            frames = [series.completed[series.completed.index >= pd.Timestamp(start)]]
+            if series.partial is not None and not series.partial.empty:
+                frames.append(series.partial)
+            data = pd.concat(frames) if len(frames) > 1 else frames[0].copy()
+
+        return None if data.empty else data
+
+    def _lock_for(self, key: Tuple[str, str]) -> threading.Lock:
+        with self._locks_guard:
+            return self._locks.setdefault(key, threading.Lock())
+
+    def _partial_is_stale(self, series: _CachedSeries, now: datetime) -> bool:
+        if series.partial_day != now.astimezone(timezone.utc).date().isoformat():
+            return True
+        return time.time() - series.partial_fetched_at >= self.partial_refresh_seconds
+
+    def _refresh(self, series: _CachedSeries, symbol: str, interval: str, start: datetime,
+                 now: datetime, full: bool):
+        """Fetch bars from start and merge them into the series"""
+        self._stats['full_fetches' if full else 'tail_fetches'] += 1
+        try:
+            data = self.fetch_history(symbol, interval, start)
+        except Exception as e:
+            self._stats['fetch_errors'] += 1
+            self.logger.warning(f"⚠️ Historical fetch failed for {symbol} ({interval}): {e}")
+            return
+        if data is None:
+            if full:
+                # Don't mark an unfetched range as covered
+                self._stats['fetch_errors'] += 1
+                return
+            data = _empty_frame()
+
+        completed, partial = self._split_completed(data, interval, now)
+        if full:
+            series.covered_from = start
+        self._merge_completed(series, symbol, interval, completed, prepend=full)
+        series.partial = partial
+        series.partial_fetched_at = time.time()
+        series.partial_day = now.astimezone(timezone.utc).date().isoformat()
+
+    def _split_completed(self, data: pd.DataFrame, interval: str,
+                         now: datetime) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        """Split fetched bars into completed bars and the current forming bar (UTC index)"""
+        if data.empty or not all(column in data.columns for column in _OHLCV):
+            return _empty_frame(), _empty_frame()
+
+        bar_days = self.SUPPORTED_INTERVALS[interval][1]
+        index = pd.DatetimeIndex(data.index)
+        if index.tz is None:
+            index = index.tz_localize('UTC')
+        # A bar is complete once its whole period lies before today in the bar's own timezone
+        today = pd.Timestamp(now).tz_convert(index.tz).normalize()
+        is_complete = (index.normalize() + pd.Timedelta(days=bar_days)) <= today
+
+        frame = data[_OHLCV].astype('float64')
+        frame.index = index.tz_convert('UTC')
+        frame['complete'] = is_complete
+        frame = frame[~frame.index.duplicated(keep='last')].sort_index()
+        complete = frame.pop('complete').to_numpy(dtype=bool)
+        return frame[complete], frame[~complete]
+
+    def _merge_completed(self, series: _CachedSeries, symbol: str, interval: str,
+                         completed: pd.DataFrame, prepend: bool):
+        if completed.empty:
+            if prepend:
+                self._persist_coverage(series, symbol, interval)
+            return
+        merged = pd.concat([series.completed, completed])
+        series.completed = merged[~merged.index.duplicated(keep='last')].sort_index()
+        self._persist(series, symbol, interval, completed, prepend)
+
+    def _persist(self, series: _CachedSeries, symbol: str, interval: str,
+                 completed: pd.DataFrame, prepend: bool):
+        """Write completed bars through to the archive"""
+        if self.archive is None:
+            return
+        timeframe = self.SUPPORTED_INTERVALS[interval][0]
+        try:
+            columns = [completed[column].to_numpy() for column in _OHLCV]
+            timestamps = list(completed.index.to_pydatetime())
+            if prepend:
+                self.archive.replace(symbol, timeframe, timestamps, *columns)
+            else:
+                self.archive.append(symbol, timeframe, timestamps, *columns)
+        except Exception as e:
+            self.logger.warning(f"⚠️ Bar archive write failed for {symbol} ({interval}): {e}")
+            return
+        self._persist_coverage(series, symbol, interval)
+
+    def _persist_coverage(self, series: _CachedSeries, symbol: str, interval: str):
+        if self.archive is None or series.covered_from is None:
+            return
+        try:
+            self.archive.set_metadata(symbol, self.SUPPORTED_INTERVALS[interval][0],
+                                      covered_from=series.covered_from.isoformat())
+        except Exception as e:
+            self.logger.warning(f"⚠️ Bar archive metadata write failed for {symbol}: {e}")
+
+    def _load_from_archive(self, symbol: str, interval: str) -> _CachedSeries:
+        """Seed a series with archived completed bars"""
+        series = _CachedSeries(completed=_empty_frame())
+        if self.archive is None:
+            return series
+        timeframe = self.SUPPORTED_INTERVALS[interval][0]
+        try:
+            history = self.archive.read_range(symbol, timeframe)
+            covered_from = self.archive.get_metadata(symbol, timeframe).get('covered_from')
+        except Exception as e:
+            self.logger.warning(f"⚠️ Bar archive read failed for {symbol} ({interval}): {e}")
+            return series
+        if history is None or len(history) == 0 or covered_from is None:
+            return series
+
+        series.completed = pd.DataFrame({
+            'open': history.open,
+            'high': history.high,
+            'low': history.low,
+            'close': history.close,
+            'volume': history.volume
+        }, index=pd.to_datetime(history.timestamps, unit='s', utc=True), copy=True)
+        series.covered_from = datetime.fromisoformat(covered_from)
+        self._stats['archive_loads'] += 1
+        return series
+
+    def clear(self, symbol: Optional[str] = None):
+        """Drop in-memory state for one symbol or every series (the archive is kept)"""
+        with self._locks_guard:
+            if symbol is None:
+                self._series.clear()
+            else:
+                for key in [key for key in self._series if key[0] == symbol]:
+                    del self._series[key]
+
+    def get_stats(self) -> Dict[str, int]:
+        """Hit and fetch counters"""
+        stats = dict(self._stats)
+        stats['series'] = len(self._series)
+        return stats
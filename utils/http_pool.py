@@ -0,0 +1,184 @@
+"""
+Pooled HTTP Sessions
+
+One keep-alive requests.Session per host, with connection pools sized to the
+number of modules that run concurrently. Reusing sessions avoids a new TCP and
+TLS handshake per REST call; warm_up() opens the connections at startup so the
+first trading cycle does not pay for them either.
+"""
+
+import logging
+import threading
+import time
+from typing import Dict, Iterable, Optional
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+
+
+class HttpSessionPool:
+    """Per-host keep-alive sessions with request and connection pool statistics"""
+
+    def __init__(self, pool_size: int = 4, logger: Optional[logging.Logger] = None):
+        """
+        Initialize the pool.
+
+        Args:
+            pool_size: Connections kept alive per host (match concurrent modules)
+            logger: Optional logger instance
+        """
+        self.pool_size = max(1, pool_size)
+        self.logger = logger or logging.getLogger(self.__class__.__name__)
+        self._lock = threading.Lock()
+        self._sessions: Dict[str, requests.Session] = {}
+        self._adopted: Dict[str, requests.Session] = {}
+        self._stats: Dict[str, Dict[str, float]] = {}
+
+    @staticmethod
+    def _host(url_or_host: str) -> str:
+        return urlparse(url_or_host).netloc if '://' in url_or_host else url_or_host
+
+    def _mount(self, session: requests.Session, multi_host: bool = False):
+        # An owned session talks to one host; an adopted client session may talk to several
+        # (Alpaca trading and data), so it keeps requests' default number of host pools
+        if multi_host:
+            adapter = HTTPAdapter(pool_maxsize=self.pool_size)
+        else:
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.pool_size)
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+
+    def session_for(self, url_or_host: str) -> requests.Session:
+        """Keep-alive session for a host (created on first use)"""
+        host = self._host(url_or_host)
+        with self._lock:
+            session = self._sessions.get(host)
+            if session is None:
+                session = requests.Session()
+                self._mount(session)
+                self._sessions[host] = session
+            return session
+
+    def adopt_session(self, name: str, session: requests.Session):
+        """Resize the connection pool of a session owned by a client library (e.g. Alpaca REST)"""
+        with self._lock:
+            self._mount(session, multi_host=True)
+            self._adopted[name] = session
+
+    def resize(self, pool_size: int):
+        """Change connections per host (e.g. to the orchestrator's max_concurrent_modules)"""
+        with self._lock:
+            if max(1, pool_size) == self.pool_size:
+                return
+            self.pool_size = max(1, pool_size)
+            for session in self._sessions.values():
+                self._mount(session)
+            for session in self._adopted.values():
+                self._mount(session, multi_host=True)
+        self.logger.info(f"🔌 HTTP pool resized to {self.pool_size} connections per host")
+
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """Send a request on the host's pooled session"""
+        host = self._host(url)
+        session = self.session_for(host)
+        start = time.monotonic()
+        try:
+            response = session.request(method, url, **kwargs)
+        except Exception:
+            self._record(host, time.monotonic() - start, error=True)
+            raise
+        self._record(host, time.monotonic() - start, error=False)
+        return response
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        return self.request('GET', url, **kwargs)
+
+    def post(self, url: str, **kwargs) -> requests.Response:
+        return self.request('POST', url, **kwargs)
+
+    def _record(self, host: str, seconds: float, error: bool):
+        with self._lock:
+            stats = self._stats.setdefault(host, {'requests': 0, 'errors': 0, 'total_seconds': 0.0})
+            stats['requests'] += 1
+            stats['errors'] += int(error)
+            stats['total_seconds'] += seconds
+
+    def warm_up(self, urls: Iterable[str], timeout: float = 5.0, adopted: Optional[str] = None) -> Dict[str, bool]:
+        """
+        Open connections ahead of the first cycle with lightweight HEAD requests.
+
+        Any HTTP response (even 401/404) counts as warmed - the connection is open.
+
+        Args:
+            urls: One URL per host to warm
+            timeout: Per-request timeout in seconds
+            adopted: Name of an adopted session to warm instead of the pool's own sessions
+        """
+        if adopted is not None:
+            with self._lock:
+                session = self._adopted.get(adopted)
+            if session is None:
+                self.logger.warning(f"⚠️ HTTP warm-up skipped: no adopted session '{adopted}'")
+                return {}
+        results = {}
+        for url in urls:
+            host = self._host(url)
+            try:
+                if adopted is None:
+                    self.request('HEAD', url, timeout=timeout, allow_redirects=False)
+                else:
+                    session.request('HEAD', url, timeout=timeout, allow_redirects=False)
+                results[host] = True
+            except Exception as e:
+                results[host] = False
+                self.logger.warning(f"⚠️ HTTP warm-up failed for {host}: {e}")
+        warmed = sum(results.values())
+        self.logger.info(f"🔌 HTTP pool warmed {warmed}/{len(results)} hosts"
+                         + (f" on the {adopted} session" if adopted else ""))
+        return results
+
+    def get_stats(self) -> Dict[str, Dict]:
+        """Per-host request counts, average latency and open connections"""
+        with self._lock:
+            sessions = dict(self._sessions)
+            stats = {host: dict(values) for host, values in self._stats.items()}
+
+        for host, session in sessions.items():
+            entry = stats.setdefault(host, {'requests': 0, 'errors': 0, 'total_seconds': 0.0})
+            adapter = session.get_adapter('https://')
+            pools = getattr(getattr(adapter, 'poolmanager', None), 'pools', None)
+            connections = 0
+            idle = 0
+            if pools is not None:
+                for key in pools.keys():
+                    pool = pools[key]
+                    connections += getattr(pool, 'num_connections', 0)
+                    idle += pool.pool.qsize() if getattr(pool, 'pool', None) is not None else 0
+            entry['connections_opened'] = connections
+            entry['idle_connections'] = idle
+
+        for entry in stats.values():
+            entry['avg_latency_ms'] = round(1000 * entry['total_seconds'] / entry['requests'], 1) if entry['requests'] else 0.0
+            entry['pool_size'] = self.pool_size
+        return stats
+
+    def close(self):
+        """Close every owned session"""
+        with self._lock:
+            for session in self._sessions.values():
+                session.close()
+            self._sessions.clear()
+
+
+_http_pool: Optional[HttpSessionPool] = None
+_http_pool_lock = threading.Lock()
+
+
+def get_http_pool() -> HttpSessionPool:
+    """Process-wide HTTP session pool"""
+    global _http_pool
+    with _http_pool_lock:
+        if _http_pool is None:
+            _http_pool = HttpSessionPool()
+        return _http_pool
@@ -0,0 +1,136 @@
+"""
+Indicator Result Cache
+
+Memoizes indicator results per (symbol, timeframe, indicator, params) series
+and the version of the last bar they were computed from. A result is reused
+until a different version arrives, which replaces it, so each series holds at
+most one entry. Callers whose newest bar may still be forming pass its time
+and close as the version, so a moving close recomputes too. Bounded with
+least-recently-used eviction and hit/miss counters per indicator.
+"""
+
+import copy
+import logging
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+
+@dataclass
+class _IndicatorEntry:
+    last_bar_time: Hashable
+    value: Any
+
+
+class IndicatorCache:
+    """
+    LRU cache of indicator results keyed by series and last bar time.
+
+    A lookup that finds an entry computed from an older bar counts as stale
+    (and as a miss). Results are copied on store and on read so callers may
+    mutate returned dicts.
+    """
+
+    def __init__(self, max_entries: int = 5000, logger: Optional[logging.Logger] = None):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Maximum cached series before least-recently-used eviction
+            logger: Optional logger instance
+        """
+        if max_entries <= 0:
+            raise ValueError("max_entries must be positive")
+        self.max_entries = max_entries
+        self.logger = logger or logging.getLogger(self.__class__.__name__)
+        self._entries: "OrderedDict[Tuple, _IndicatorEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {'hits': 0, 'misses': 0, 'stale': 0, 'evictions': 0, 'stores': 0}
+        self._indicator_stats: Dict[str, Dict[str, int]] = {}
+
+    @staticmethod
+    def _copy(value: Any) -> Any:
+        return copy.deepcopy(value) if isinstance(value, (dict, list)) else value
+
+    def _count(self, indicator: str, outcome: str):
+        self._stats[outcome] += 1
+        counts = self._indicator_stats.setdefault(indicator, {'hits': 0, 'misses': 0})
+        if outcome in counts:
+            counts[outcome] += 1
+
+    def get_or_compute(self, symbol: str, timeframe: str, indicator: str, params: Tuple,
+                       last_bar_time: Hashable, compute: Callable[[], Any]) -> Any:
+        """
+        Cached result for the series at last_bar_time, computing it on a miss.
+
+        Args:
+            symbol: Instrument symbol
+            timeframe: Bar timeframe the input series was built from (e.g. '1d')
+            indicator: Indicator name
+            params: Hashable indicator parameters
+            last_bar_time: Version of the newest bar in the input series (its timestamp,
+                or (timestamp, close) when that bar may still be forming)
+            compute: Zero-argument callable producing the result (None results are cached too)
+        """
+        key = (symbol, timeframe, indicator, params)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.last_bar_time == last_bar_time:
+                self._entries.move_to_end(key)
+                self._count(indicator, 'hits')
+                return self._copy(entry.value)
+            if entry is not None:
+                self._stats['stale'] += 1
+            self._count(indicator, 'misses')
+
+        # Compute outside the lock; concurrent misses may both compute, last store wins
+        value = compute()
+
+        with self._lock:
+            self._entries[key] = _IndicatorEntry(last_bar_time, self._copy(value))
+            self._entries.move_to_end(key)
+            self._stats['stores'] += 1
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._stats['evictions'] += 1
+        return value
+
+    def invalidate(self, symbol: Optional[str] = None):
+        """Drop one symbol's results or every cached result"""
+        with self._lock:
+            if symbol is None:
+                self._entries.clear()
+            else:
+                for key in [k for k in self._entries if k[0] == symbol]:
+                    del self._entries[key]
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Hit/miss/stale counters, per-indicator hit rates and current size"""
+        with self._lock:
+            stats = dict(self._stats)
+            stats['size'] = len(self._entries)
+            by_indicator = {name: dict(counts) for name, counts in self._indicator_stats.items()}
+        lookups = stats['hits'] + stats['misses']
+        stats['hit_rate'] = stats['hits'] / lookups if lookups else 0.0
+        for counts in by_indicator.values():
+            total = counts['hits'] + counts['misses']
+            counts['hit_rate'] = counts['hits'] / total if total else 0.0
+        stats['by_indicator'] = by_indicator
+        return stats
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+_indicator_cache: Optional[IndicatorCache] = None
+_indicator_cache_lock = threading.Lock()
+
+
+def get_indicator_cache() -> IndicatorCache:
+    """Process-wide indicator result cache shared by every module"""
+    global _indicator_cache
+    with _indicator_cache_lock:
+        if _indicator_cache is None:
+            _indicator_cache = IndicatorCache()
+        return _indicator_cache
@@ -0,0 +1,339 @@
+"""
+Indicator Kernels
+
+Per-series indicator kernels with two interchangeable backends:
+
+- numba: explicit loops compiled with Numba (used when Numba is installed)
+- numpy: vectorized numpy (closed-form EMA shared with the crypto indicator
+  engine, pandas' recursive filter for Wilder smoothing)
+
+Both return the latest value of each indicator and agree to floating point
+rounding. KERNELS is the preferred backend; NUMPY_KERNELS and NUMBA_KERNELS
+(None without Numba) are exposed for testing and benchmarking.
+
+Inputs are float64 arrays. Kernels return NaN when there are too few bars.
+"""
+
+import math
+from types import SimpleNamespace
+from typing import Tuple
+
+import numpy as np
+import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
+
+from utils.crypto_indicator_engine import ema_last
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+# ---------------------------------------------------------------------------
+# Loop kernels (compiled by Numba when available)
+# ---------------------------------------------------------------------------
+
+def _ema_loop(prices: np.ndarray, period: int) -> float:
+    """Recursive EMA seeded with the first price"""
+    n = prices.shape[0]
+    if n < period:
+        return np.nan
+    multiplier = 2.0 / (period + 1)
+    ema = prices[0]
+    for i in range(1, n):
+        ema = prices[i] * multiplier + ema * (1 - multiplier)
+    return ema
+
+
+def _macd_loop(prices: np.ndarray, fast: int, slow: int, signal: int) -> Tuple[float, float, float, float]:
+    """
+    One pass over the prices: fast/slow EMAs seeded with the first price, MACD
+    line, and its signal EMA seeded with the first MACD value.
+
+    Returns (fast EMA, slow EMA, MACD, signal) at the last bar.
+    """
+    n = prices.shape[0]
+    if n < slow + signal:
+        return np.nan, np.nan, np.nan, np.nan
+    fast_k = 2.0 / (fast + 1)
+    slow_k = 2.0 / (slow + 1)
+    signal_k = 2.0 / (signal + 1)
+    ema_fast = prices[0]
+    ema_slow = prices[0]
+    signal_line = 0.0
+    for i in range(1, n):
+        ema_fast = prices[i] * fast_k + ema_fast * (1 - fast_k)
+        ema_slow = prices[i] * slow_k + ema_slow * (1 - slow_k)
+        signal_line = (ema_fast - ema_slow) * signal_k + signal_line * (1 - signal_k)
+    return ema_fast, ema_slow, ema_fast - ema_slow, signal_line
+
+
+def _rsi_loop(prices: np.ndarray, period: int) -> float:
+    """RSI from the simple average of the last `period` gains and losses"""
+    n = prices.shape[0]
+    if n < period + 1:
+        return np.nan
+    gains = 0.0
+    losses = 0.0
+    for i in range(n - period, n):
+        delta = prices[i] - prices[i - 1]
+        if delta > 0:
+            gains += delta
+        elif delta < 0:
+            losses -= delta
+    avg_gain = gains / period
+    avg_loss = losses / period
+    if avg_loss == 0:
+        return 100.0
+    return 100 - (100 / (1 + avg_gain / avg_loss))
+
+
+def _bollinger_loop(prices: np.ndarray, period: int) -> Tuple[float, float]:
+    """Mean and population standard deviation of the last `period` prices"""
+    n = prices.shape[0]
+    if n < period:
+        return np.nan, np.nan
+    total = 0.0
+    for i in range(n - period, n):
+        total += prices[i]
+    mean = total / period
+    squares = 0.0
+    for i in range(n - period, n):
+        squares += (prices[i] - mean) ** 2
+    return mean, math.sqrt(squares / period)
+
+
+def _atr_loop(high: np.ndarray, low: np.ndarray, close: np.ndarray, period: int) -> float:
+    """Wilder ATR: mean of the first `period` true ranges, then Wilder smoothing"""
+    n = close.shape[0]
+    if n < period + 1:
+        return np.nan
+    atr = 0.0
+    for i in range(1, n):
+        tr = max(high[i] - low[i], abs(high[i] - close[i - 1]), abs(low[i] - close[i - 1]))
+        if i <= period:
+            atr += tr / period
+        else:
+            atr = (atr * (period - 1) + tr) / period
+    return atr
+
+
+def _adx_loop(high: np.ndarray, low: np.ndarray, close: np.ndarray, period: int) -> float:
+    """Wilder ADX: smoothed TR/+DM/-DM, DX per bar, ADX seeded with the mean of the first `period` DX"""
+    n = close.shape[0]
+    if n < 2 * period:
+        return np.nan
+    tr_s = 0.0
+    plus_s = 0.0
+    minus_s = 0.0
+    adx = 0.0
+    for i in range(1, n):
+        tr = max(high[i] - low[i], abs(high[i] - close[i - 1]), abs(low[i] - close[i - 1]))
+        up = high[i] - high[i - 1]
+        down = low[i - 1] - low[i]
+        plus_dm = up if (up > down and up > 0) else 0.0
+        minus_dm = down if (down > up and down > 0) else 0.0
+        if i <= period:
+            tr_s += tr / period
+            plus_s += plus_dm / period
+            minus_s += minus_dm / period
+            if i < period:
+                continue
+        else:
+            tr_s = (tr_s * (period - 1) + tr) / period
+            plus_s = (plus_s * (period - 1) + plus_dm) / period
+            minus_s = (minus_s * (period - 1) + minus_dm) / period
+
+        plus_di = 100 * plus_s / tr_s if tr_s > 0 else 0.0
+        minus_di = 100 * minus_s / tr_s if tr_s > 0 else 0.0
+        di_sum = plus_di + minus_di
+        dx = 100 * abs(plus_di - minus_di) / di_sum if di_sum > 0 else 0.0
+
+        j = i - period  # Index of this DX value (0-based)
+        if j < period:
+            adx += dx / period
+        else:
+            adx = (adx * (period - 1) + dx) / period
+    return adx
+
+
+def _williams_r_loop(high: np.ndarray, low: np.ndarray, close: np.ndarray, period: int) -> float:
+    """Williams %R over the last `period` bars"""
+    n = close.shape[0]
+    if n < period:
+        return np.nan
+    highest = high[n - period]
+    lowest = low[n - period]
+    for i in range(n - period + 1, n):
+        highest = max(highest, high[i])
+        lowest = min(lowest, low[i])
+    if highest == lowest:
+        return 0.0
+    return -100 * (highest - close[n - 1]) / (highest - lowest)
+
+
+def _stochastic_loop(high: np.ndarray, low: np.ndarray, close: np.ndarray,
+                     fastk_period: int, slowk_period: int, slowd_period: int) -> Tuple[float, float]:
+    """Slow stochastic %K (SMA of fast %K) and %D (SMA of slow %K)"""
+    n = close.shape[0]
+    needed = fastk_period + slowk_period + slowd_period - 2
+    if n < needed:
+        return np.nan, np.nan
+    slow_k = np.empty(slowd_period)
+    for d in range(slowd_period):
+        k_sum = 0.0
+        for s in range(slowk_period):
+            end = n - (slowd_period - 1 - d) - (slowk_period - 1 - s)  # Exclusive end of the fast %K window
+            highest = high[end - fastk_period]
+            lowest = low[end - fastk_period]
+            for i in range(end - fastk_period + 1, end):
+                highest = max(highest, high[i])
+                lowest = min(lowest, low[i])
+            k_sum += 100 * (close[end - 1] - lowest) / (highest - lowest) if highest > lowest else 0.0
+        slow_k[d] = k_sum / slowk_period
+    d_sum = 0.0
+    for d in range(slowd_period):
+        d_sum += slow_k[d]
+    return slow_k[slowd_period - 1], d_sum / slowd_period
+
+
+# ---------------------------------------------------------------------------
+# Numpy kernels
+# ---------------------------------------------------------------------------
+
+def _wilder_series(values: np.ndarray, period: int) -> np.ndarray:
+    """Wilder-smoothed series seeded with the mean of the first `period` values"""
+    seeded = np.concatenate(([values[:period].mean()], values[period:]))
+    return pd.Series(seeded).ewm(alpha=1 / period, adjust=False).mean().to_numpy()
+
+
+def _trim_for_wilder(period: int, *arrays: np.ndarray) -> Tuple[np.ndarray, ...]:
+    """
+    Drop bars too old to affect the latest Wilder-smoothed value.
+
+    Wilder smoothing is an EMA with period 2n-1; ADX smooths twice, so keep
+    two horizons plus the seed windows.
+    """
+    keep = 2 * (_ema_horizon(2 * period - 1) + period)
+    return tuple(a[-keep:] for a in arrays)
+
+
+def _true_range(high: np.ndarray, low: np.ndarray, close: np.ndarray) -> np.ndarray:
+    prev_close = close[:-1]
+    return np.maximum.reduce([high[1:] - low[1:], np.abs(high[1:] - prev_close), np.abs(low[1:] - prev_close)])
+
+
+def _ema_horizon(period: int) -> int:
+    """Bars after which older prices weigh less than float64 resolution"""
+    return int(math.ceil(math.log(np.finfo(float).eps / 4) / math.log(1 - 2.0 / (period + 1)))) + 1
+
+
+def _ema_numpy(prices: np.ndarray, period: int) -> float:
+    if len(prices) < period:
+        return np.nan
+    recent = prices[-max(_ema_horizon(period), period):]
+    return float(ema_last(recent[np.newaxis, :], np.array([len(recent)]), period)[0])
+
+
+def _macd_numpy(prices: np.ndarray, fast: int, slow: int, signal: int) -> Tuple[float, float, float, float]:
+    if len(prices) < slow + signal:
+        return np.nan, np.nan, np.nan, np.nan
+    series = pd.Series(prices)
+    ema_fast = series.ewm(span=fast, adjust=False).mean()
+    ema_slow = series.ewm(span=slow, adjust=False).mean()
+    macd = ema_fast - ema_slow
+    signal_line = macd.ewm(span=signal, adjust=False).mean()
+    return float(ema_fast.iloc[-1]), float(ema_slow.iloc[-1]), float(macd.iloc[-1]), float(signal_line.iloc[-1])
+
+
+def _rsi_numpy(prices: np.ndarray, period: int) -> float:
+    if len(prices) < period + 1:
+        return np.nan
+    deltas = np.diff(prices[-(period + 1):])
+    avg_gain = np.mean(np.where(deltas > 0, deltas, 0))
+    avg_loss = np.mean(np.where(deltas < 0, -deltas, 0))
+    if avg_loss == 0:
+        return 100.0
+    return float(100 - (100 / (1 + avg_gain / avg_loss)))
+
+
+def _bollinger_numpy(prices: np.ndarray, period: int) -> Tuple[float, float]:
+    if len(prices) < period:
+        return np.nan, np.nan
+    recent = prices[-period:]
+    return float(np.mean(recent)), float(np.std(recent))
+
+
+def _atr_numpy(high: np.ndarray, low: np.ndarray, close: np.ndarray, period: int) -> float:
+    if len(close) < period + 1:
+        return np.nan
+    high, low, close = _trim_for_wilder(period, high, low, close)
+    return float(_wilder_series(_true_range(high, low, close), period)[-1])
+
+
+def _adx_numpy(high: np.ndarray, low: np.ndarray, close: np.ndarray, period: int) -> float:
+    if len(close) < 2 * period:
+        return np.nan
+    high, low, close = _trim_for_wilder(period, high, low, close)
+    up = np.diff(high)
+    down = -np.diff(low)
+    plus_dm = np.where((up > down) & (up > 0), up, 0.0)
+    minus_dm = np.where((down > up) & (down > 0), down, 0.0)
+
+    tr_s = _wilder_series(_true_range(high, low, close), period)
+    safe_tr = np.where(tr_s > 0, tr_s, 1.0)
+    plus_di = np.where(tr_s > 0, 100 * _wilder_series(plus_dm, period) / safe_tr, 0.0)
+    minus_di = np.where(tr_s > 0, 100 * _wilder_series(minus_dm, period) / safe_tr, 0.0)
+    di_sum = plus_di + minus_di
+    dx = np.where(di_sum > 0, 100 * np.abs(plus_di - minus_di) / np.where(di_sum > 0, di_sum, 1.0), 0.0)
+    return float(_wilder_series(dx, period)[-1])
+
+
+def _williams_r_numpy(high: np.ndarray, low: np.ndarray, close: np.ndarray, period: int) -> float:
+    if len(close) < period:
+        return np.nan
+    highest = high[-period:].max()
+    lowest = low[-period:].min()
+    if highest == lowest:
+        return 0.0
+    return float(-100 * (highest - close[-1]) / (highest - lowest))
+
+
+def _stochastic_numpy(high: np.ndarray, low: np.ndarray, close: np.ndarray,
+                      fastk_period: int, slowk_period: int, slowd_period: int) -> Tuple[float, float]:
+    needed = fastk_period + slowk_period + slowd_period - 2
+    if len(close) < needed:
+        return np.nan, np.nan
+    highest = sliding_window_view(high[-needed:], fastk_period).max(axis=1)
+    lowest = sliding_window_view(low[-needed:], fastk_period).min(axis=1)
+    spread = highest - lowest
+    fast_k = np.where(spread > 0, 100 * (close[-len(spread):] - lowest) / np.where(spread > 0, spread, 1.0), 0.0)
+    slow_k = sliding_window_view(fast_k, slowk_period).mean(axis=1)
+    return float(slow_k[-1]), float(slow_k.mean())
+
+
+NUMPY_KERNELS = SimpleNamespace(
+    name='numpy', ema=_ema_numpy, macd=_macd_numpy, rsi=_rsi_numpy, bollinger=_bollinger_numpy, atr=_atr_numpy,
+    adx=_adx_numpy, williams_r=_williams_r_numpy, stochastic=_stochastic_numpy
+)
+
+NUMBA_KERNELS = None
+if NUMBA_AVAILABLE:
+    NUMBA_KERNELS = SimpleNamespace(
+        name='numba', ema=njit(cache=True)(_ema_loop), macd=njit(cache=True)(_macd_loop),
+        rsi=njit(cache=True)(_rsi_loop),
+        bollinger=njit(cache=True)(_bollinger_loop), atr=njit(cache=True)(_atr_loop),
+        adx=njit(cache=True)(_adx_loop), williams_r=njit(cache=True)(_williams_r_loop),
+        stochastic=njit(cache=True)(_stochastic_loop)
+    )
+
+# Uncompiled loop kernels (what Numba compiles), for equivalence checks without Numba
+LOOP_KERNELS = SimpleNamespace(
+    name='loop', ema=_ema_loop, macd=_macd_loop, rsi=_rsi_loop, bollinger=_bollinger_loop, atr=_atr_loop,
+    adx=_adx_loop, williams_r=_williams_r_loop, stochastic=_stochastic_loop
+)
+
+KERNELS = NUMBA_KERNELS or NUMPY_KERNELS
+KERNEL_BACKEND = KERNELS.name
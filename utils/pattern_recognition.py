@@ -1,20 +1,37 @@
 #!/usr/bin/env python3
 
-from typing import Dict, List, Optional, Tuple
+from collections import deque
+from typing import Deque, Dict, List, Optional, Sequence, Tuple
 from datetime import datetime, timedelta
-import math
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+from utils.crypto_indicator_engine import stack_price_histories
+from utils.ring_buffer import PriceRingBuffer
 
 class PatternRecognition:
     """
     Pattern recognition for Phase 3 Intelligence Layer.
     Detects support/resistance levels, breakouts, and mean reversion patterns.
+    
+    Pivots are tracked incrementally as prices arrive, so cached support and
+    resistance levels are only rebuilt when a pivot enters or leaves the
+    window. analyze_batch() runs the same checks for many symbols at once on
+    a stacked price matrix.
     """
     
+    # Keep last 50 data points for pattern analysis
+    max_data_points = 50
+    
+    # Pivot = strictly lower/higher than the PIVOT_SPAN prices on each side
+    PIVOT_SPAN = 2
+    
     def __init__(self, lookback_period: int = 20):
         self.lookback_period = lookback_period
-        self.price_history = {}  # symbol -> list of price data
-        self.volume_history = {}  # symbol -> list of volume data
-        self.support_resistance_cache = {}  # Cache for S/R levels
+        self.price_history: Dict[str, PriceRingBuffer] = {}  # symbol -> price/volume ring buffer
+        self.support_resistance_cache = {}  # symbol -> {sensitivity: (support, resistance) consolidated levels}
+        self._pivots: Dict[str, Deque[Tuple[int, float, str]]] = {}  # symbol -> (tick index, price, kind)
     
     def add_price_data(self, symbol: str, price: float, volume: int = 0, timestamp: datetime = None):
         """Add new price and volume data for pattern analysis"""
@@ -22,123 +39,101 @@ class PatternRecognition:
             timestamp = datetime.now()
             
         if symbol not in self.price_history:
-            self.price_history[symbol] = []
-            self.volume_history[symbol] = []
-        
-        # Keep last 50 data points for pattern analysis
-        if len(self.price_history[symbol]) >= 50:
-            self.price_history[symbol].pop(0)
-            self.volume_history[symbol].pop(0)
-        
-        self.price_history[symbol].append({
-            'price': price, 
-            'volume': volume,
-            'timestamp': timestamp,
-            'high': price,  # Simplified - in real implementation would track OHLC
-            'low': price,
-            'close': price
-        })
-        
-        # Clear S/R cache when new data added
-        if symbol in self.support_resistance_cache:
-            del self.support_resistance_cache[symbol]
-    
-    def find_support_resistance_levels(self, symbol: str, sensitivity: float = 0.02) -> Optional[Dict]:
-        """
-        Find dynamic support and resistance levels
-        Returns: {'support_levels': List[float], 'resistance_levels': List[float], 'current_price': float}
-        """
-        if symbol not in self.price_history or len(self.price_history[symbol]) < self.lookback_period:
-            return None
-        
-        # Check cache first
-        if symbol in self.support_resistance_cache:
-            return self.support_resistance_cache[symbol]
+            self.price_history[symbol] = PriceRingBuffer(self.max_data_points)
+            self._pivots[symbol] = deque()
         
-        prices = [p['price'] for p in self.price_history[symbol]]
-        current_price = prices[-1]
+        # Simplified - in real implementation would track OHLC
+        history = self.price_history[symbol]
+        history.append(price, volume, high=price, low=price, timestamp=timestamp)
         
-        # Find local minima (potential support) and maxima (potential resistance)
-        support_levels = []
-        resistance_levels = []
-        
-        # Look for pivot points in the last lookback_period
-        for i in range(2, len(prices) - 2):
-            price = prices[i]
-            
-            # Check for local minimum (support)
-            if (prices[i] < prices[i-1] and prices[i] < prices[i-2] and 
-                prices[i] < prices[i+1] and prices[i] < prices[i+2]):
-                support_levels.append(price)
-            
-            # Check for local maximum (resistance)
-            if (prices[i] > prices[i-1] and prices[i] > prices[i-2] and 
-                prices[i] > prices[i+1] and prices[i] > prices[i+2]):
-                resistance_levels.append(price)
-        
-        # Remove levels too close to each other (within sensitivity)
-        def consolidate_levels(levels):
-            if not levels:
-                return []
-            
-            levels.sort()
-            consolidated = [levels[0]]
-            
-            for level in levels[1:]:
-                if abs(level - consolidated[-1]) / consolidated[-1] > sensitivity:
-                    consolidated.append(level)
-            
-            return consolidated
-        
-        support_levels = consolidate_levels(support_levels)
-        resistance_levels = consolidate_levels(resistance_levels)
+        # Only a pivot entering or leaving the window changes the S/R levels
+        if self._update_pivots(symbol) and symbol in self.support_resistance_cache:
+            del self.support_resistance_cache[symbol]
+    
+    def _update_pivots(self, symbol: str) -> bool:
+        """Record the pivot completed by the newest price and drop pivots that left the window"""
+        history = self.price_history[symbol]
+        pivots = self._pivots[symbol]
+        span = self.PIVOT_SPAN
+        total = history.total_appended
+        changed = False
+        
+        if len(history) >= 2 * span + 1:
+            window = history.view('price', last=2 * span + 1)
+            kind = _pivot_kind(window, span)
+            if kind:
+                pivots.append((total - span - 1, float(window[span]), kind))
+                changed = True
+        
+        # A pivot needs `span` prices before it inside the window
+        first_valid = total - len(history) + span
+        while pivots and pivots[0][0] < first_valid:
+            pivots.popleft()
+            changed = True
+        return changed
+    
+    @staticmethod
+    def _consolidate_levels(levels, sensitivity: float) -> List[float]:
+        """Remove levels too close to each other (within sensitivity)"""
+        levels = sorted(levels)
+        if not levels:
+            return []
+        
+        consolidated = [levels[0]]
+        for level in levels[1:]:
+            if abs(level - consolidated[-1]) / consolidated[-1] > sensitivity:
+                consolidated.append(level)
+        
+        return consolidated
+    
+    @staticmethod
+    def _relevant_levels(levels: List[float], current_price: float, max_levels: int = 3) -> List[float]:
+        """Keep only the most relevant levels (closest to current price)"""
+        if not levels:
+            return []
         
-        # Keep only the most relevant levels (closest to current price)
-        def filter_relevant_levels(levels, current_price, max_levels=3):
-            if not levels:
-                return []
-            
-            # Sort by distance from current price
-            levels_with_distance = [(level, abs(level - current_price) / current_price) for level in levels]
-            levels_with_distance.sort(key=lambda x: x[1])
-            
-            return [level for level, _ in levels_with_distance[:max_levels]]
+        # Sort by distance from current price
+        levels_with_distance = [(level, abs(level - current_price) / current_price) for level in levels]
+        levels_with_distance.sort(key=lambda x: x[1])
         
-        relevant_support = filter_relevant_levels([s for s in support_levels if s < current_price], current_price)
-        relevant_resistance = filter_relevant_levels([r for r in resistance_levels if r > current_price], current_price)
+        return [level for level, _ in levels_with_distance[:max_levels]]
+    
+    def _support_resistance_result(self, support_levels: List[float], resistance_levels: List[float],
+                                   current_price: float) -> Dict:
+        relevant_support = self._relevant_levels([s for s in support_levels if s < current_price], current_price)
+        relevant_resistance = self._relevant_levels([r for r in resistance_levels if r > current_price], current_price)
         
-        result = {
+        return {
             'support_levels': relevant_support,
             'resistance_levels': relevant_resistance,
             'current_price': current_price,
             'timestamp': datetime.now().isoformat()
         }
-        
-        # Cache the result
-        self.support_resistance_cache[symbol] = result
-        
-        return result
     
-    def detect_breakout_pattern(self, symbol: str, volume_confirmation: bool = True) -> Optional[Dict]:
+    def find_support_resistance_levels(self, symbol: str, sensitivity: float = 0.02) -> Optional[Dict]:
         """
-        Detect breakout patterns above resistance or below support
-        Returns: {'pattern': str, 'level': float, 'volume_confirmed': bool, 'strength': float}
+        Find dynamic support and resistance levels
+        Returns: {'support_levels': List[float], 'resistance_levels': List[float], 'current_price': float}
         """
-        sr_levels = self.find_support_resistance_levels(symbol)
-        if not sr_levels:
-            return None
-        
-        if symbol not in self.price_history or len(self.price_history[symbol]) < 5:
+        if symbol not in self.price_history or len(self.price_history[symbol]) < self.lookback_period:
             return None
         
-        current_data = self.price_history[symbol][-1]
-        current_price = current_data['price']
-        current_volume = current_data['volume']
-        
-        # Calculate average volume for comparison
-        recent_volumes = [p['volume'] for p in self.price_history[symbol][-10:] if p['volume'] > 0]
-        avg_volume = sum(recent_volumes) / len(recent_volumes) if recent_volumes else 0
-        
+        # Consolidated levels are cached until the pivot set changes
+        levels_by_sensitivity = self.support_resistance_cache.setdefault(symbol, {})
+        if sensitivity not in levels_by_sensitivity:
+            pivots = self._pivots[symbol]
+            levels_by_sensitivity[sensitivity] = (
+                self._consolidate_levels((p for _, p, kind in pivots if kind == 'support'), sensitivity),
+                self._consolidate_levels((p for _, p, kind in pivots if kind == 'resistance'), sensitivity)
+            )
+        support_levels, resistance_levels = levels_by_sensitivity[sensitivity]
+        
+        return self._support_resistance_result(support_levels, resistance_levels,
+                                               self.price_history[symbol].latest('price'))
+    
+    @staticmethod
+    def _breakout_result(sr_levels: Dict, current_price: float, current_volume: float,
+                         avg_volume: float, volume_confirmation: bool) -> Optional[Dict]:
         # Check for resistance breakout
         for resistance in sr_levels['resistance_levels']:
             if current_price > resistance:
@@ -187,22 +182,32 @@ class PatternRecognition:
         
         return None
     
-    def detect_mean_reversion_setup(self, symbol: str, std_dev_threshold: float = 2.0) -> Optional[Dict]:
+    def detect_breakout_pattern(self, symbol: str, volume_confirmation: bool = True) -> Optional[Dict]:
         """
-        Detect mean reversion opportunities when price is far from average
-        Returns: {'pattern': str, 'deviation': float, 'signal': str, 'strength': float}
+        Detect breakout patterns above resistance or below support
+        Returns: {'pattern': str, 'level': float, 'volume_confirmed': bool, 'strength': float}
         """
-        if symbol not in self.price_history or len(self.price_history[symbol]) < self.lookback_period:
+        sr_levels = self.find_support_resistance_levels(symbol)
+        if not sr_levels:
             return None
         
-        prices = [p['price'] for p in self.price_history[symbol][-self.lookback_period:]]
-        current_price = prices[-1]
+        if symbol not in self.price_history or len(self.price_history[symbol]) < 5:
+            return None
         
-        # Calculate mean and standard deviation
-        mean_price = sum(prices) / len(prices)
-        variance = sum((price - mean_price) ** 2 for price in prices) / len(prices)
-        std_dev = math.sqrt(variance)
+        history = self.price_history[symbol]
+        current_price = history.latest('price')
+        current_volume = history.latest('volume')
         
+        # Calculate average volume for comparison
+        recent_volumes = history.view('volume', last=10)
+        recent_volumes = recent_volumes[recent_volumes > 0]
+        avg_volume = float(recent_volumes.mean()) if len(recent_volumes) else 0
+        
+        return self._breakout_result(sr_levels, current_price, current_volume, avg_volume, volume_confirmation)
+    
+    @staticmethod
+    def _mean_reversion_result(current_price: float, mean_price: float, std_dev: float,
+                               std_dev_threshold: float) -> Optional[Dict]:
         if std_dev == 0:
             return None
         
@@ -236,6 +241,36 @@ class PatternRecognition:
         
         return None
     
+    def detect_mean_reversion_setup(self, symbol: str, std_dev_threshold: float = 2.0) -> Optional[Dict]:
+        """
+        Detect mean reversion opportunities when price is far from average
+        Returns: {'pattern': str, 'deviation': float, 'signal': str, 'strength': float}
+        """
+        if symbol not in self.price_history or len(self.price_history[symbol]) < self.lookback_period:
+            return None
+        
+        prices = self.price_history[symbol].view('price', last=self.lookback_period)
+        
+        # Calculate mean and standard deviation
+        return self._mean_reversion_result(float(prices[-1]), float(prices.mean()), float(prices.std()),
+                                           std_dev_threshold)
+    
+    @staticmethod
+    def _consolidation_result(avg_volatility: float, consolidation_duration: int,
+                              range_percentage: float) -> Dict:
+        # Calculate breakout probability (longer consolidation = higher probability)
+        breakout_probability = min(consolidation_duration / 10.0, 0.8)  # Cap at 80%
+        
+        return {
+            'pattern': 'consolidation',
+            'volatility': round(avg_volatility * 100, 2),  # Convert to percentage
+            'duration': consolidation_duration,
+            'breakout_probability': round(breakout_probability, 2),
+            'price_range_pct': round(range_percentage, 2),
+            'signal': 'neutral',
+            'strength': breakout_probability
+        }
+    
     def detect_consolidation_pattern(self, symbol: str, volatility_threshold: float = 0.02) -> Optional[Dict]:
         """
         Detect consolidation patterns (low volatility periods before potential breakouts)
@@ -244,18 +279,14 @@ class PatternRecognition:
         if symbol not in self.price_history or len(self.price_history[symbol]) < 10:
             return None
         
-        recent_prices = [p['price'] for p in self.price_history[symbol][-10:]]
+        recent_prices = self.price_history[symbol].view('price', last=10)
         
         # Calculate recent volatility
         if len(recent_prices) < 2:
             return None
         
-        price_changes = []
-        for i in range(1, len(recent_prices)):
-            change_pct = abs(recent_prices[i] - recent_prices[i-1]) / recent_prices[i-1]
-            price_changes.append(change_pct)
-        
-        avg_volatility = sum(price_changes) / len(price_changes)
+        price_changes = np.abs(np.diff(recent_prices)) / recent_prices[:-1]
+        avg_volatility = float(price_changes.mean())
         
         # Check if we're in a low volatility period
         if avg_volatility < volatility_threshold:
@@ -267,23 +298,12 @@ class PatternRecognition:
                 else:
                     break
             
-            # Calculate breakout probability (longer consolidation = higher probability)
-            breakout_probability = min(consolidation_duration / 10.0, 0.8)  # Cap at 80%
-            
             # Determine price range during consolidation
             consolidation_prices = recent_prices[-consolidation_duration-1:]
-            price_range = max(consolidation_prices) - min(consolidation_prices)
-            range_percentage = price_range / recent_prices[-1] * 100
+            price_range = float(consolidation_prices.max() - consolidation_prices.min())
+            range_percentage = price_range / float(recent_prices[-1]) * 100
             
-            return {
-                'pattern': 'consolidation',
-                'volatility': round(avg_volatility * 100, 2),  # Convert to percentage
-                'duration': consolidation_duration,
-                'breakout_probability': round(breakout_probability, 2),
-                'price_range_pct': round(range_percentage, 2),
-                'signal': 'neutral',
-                'strength': breakout_probability
-            }
+            return self._consolidation_result(avg_volatility, consolidation_duration, range_percentage)
         
         return None
     
@@ -292,6 +312,18 @@ class PatternRecognition:
         Get comprehensive pattern analysis combining all pattern types
         Returns complete pattern recognition results
         """
+        sr_levels = self.find_support_resistance_levels(symbol)
+        return self._assemble_analysis(
+            symbol,
+            sr_levels,
+            self.detect_breakout_pattern(symbol),
+            self.detect_mean_reversion_setup(symbol),
+            self.detect_consolidation_pattern(symbol)
+        )
+    
+    @staticmethod
+    def _assemble_analysis(symbol: str, sr_levels: Optional[Dict], breakout: Optional[Dict],
+                           mean_reversion: Optional[Dict], consolidation: Optional[Dict]) -> Dict:
         analysis = {
             'symbol': symbol,
             'timestamp': datetime.now().isoformat(),
@@ -300,12 +332,10 @@ class PatternRecognition:
         }
         
         # Support/Resistance levels
-        sr_levels = self.find_support_resistance_levels(symbol)
         if sr_levels:
             analysis['patterns']['support_resistance'] = sr_levels
         
         # Breakout patterns
-        breakout = self.detect_breakout_pattern(symbol)
         if breakout:
             analysis['patterns']['breakout'] = breakout
             analysis['trading_signals'].append({
@@ -316,7 +346,6 @@ class PatternRecognition:
             })
         
         # Mean reversion patterns
-        mean_reversion = self.detect_mean_reversion_setup(symbol)
         if mean_reversion:
             analysis['patterns']['mean_reversion'] = mean_reversion
             analysis['trading_signals'].append({
@@ -327,7 +356,6 @@ class PatternRecognition:
             })
         
         # Consolidation patterns
-        consolidation = self.detect_consolidation_pattern(symbol)
         if consolidation:
             analysis['patterns']['consolidation'] = consolidation
             if consolidation['breakout_probability'] > 0.6:
@@ -362,6 +390,179 @@ class PatternRecognition:
             }
         
         return analysis
+    
+    def analyze_batch(self, histories: Dict[str, Tuple[Sequence[float], Optional[Sequence[float]]]] = None,
+                      sensitivity: float = 0.02, std_dev_threshold: float = 2.0,
+                      volatility_threshold: float = 0.02) -> Dict[str, Dict]:
+        """
+        Comprehensive pattern analysis for many symbols at once.
+        
+        Args:
+            histories: symbol -> (prices, volumes or None), oldest first. Only the
+                last max_data_points values are used, as if fed through
+                add_price_data. Defaults to every symbol tracked by this instance.
+        
+        Returns:
+            symbol -> same dict as get_comprehensive_pattern_analysis
+        """
+        if histories is None:
+            histories = {symbol: (history.prices, history.volumes) for symbol, history in self.price_history.items()}
+        if not histories:
+            return {}
+        
+        symbols = list(histories)
+        keep = self.max_data_points
+        prices, lengths = stack_price_histories([np.asarray(histories[s][0], dtype=float)[-keep:] for s in symbols])
+        volumes, _ = stack_price_histories([
+            np.asarray(histories[s][1], dtype=float)[-keep:] if histories[s][1] is not None and len(histories[s][1])
+            else np.zeros(lengths[row]) for row, s in enumerate(symbols)
+        ])
+        width = prices.shape[1]
+        if volumes.shape[1] < width:  # Volume histories may be shorter than prices
+            volumes = np.hstack([np.full((len(symbols), width - volumes.shape[1]), np.nan), volumes])
+        volumes = volumes[:, -width:] if width else volumes
+        
+        current_prices = prices[:, -1] if width else np.full(len(symbols), np.nan)
+        support_mask, resistance_mask = batch_pivots(prices, self.PIVOT_SPAN)
+        pivot_prices = prices[:, self.PIVOT_SPAN:width - self.PIVOT_SPAN]
+        mean_reversion_stats = batch_window_stats(prices, self.lookback_period)
+        consolidation_stats = batch_consolidation(prices, volatility_threshold)
+        avg_volumes = batch_average_volume(volumes)
+        
+        results = {}
+        for row, symbol in enumerate(symbols):
+            length = lengths[row]
+            current_price = float(current_prices[row]) if length else 0.0
+            
+            sr_levels = None
+            if length >= self.lookback_period:
+                sr_levels = self._support_resistance_result(
+                    self._consolidate_levels(pivot_prices[row][support_mask[row]].tolist(), sensitivity),
+                    self._consolidate_levels(pivot_prices[row][resistance_mask[row]].tolist(), sensitivity),
+                    current_price
+                )
+            
+            breakout = None
+            if sr_levels and length >= 5:
+                current_volume = volumes[row, -1]
+                breakout = self._breakout_result(sr_levels, current_price,
+                                                 0.0 if np.isnan(current_volume) else float(current_volume),
+                                                 float(avg_volumes[row]), True)
+            
+            mean_reversion = None
+            if length >= self.lookback_period:
+                mean_price, std_dev = mean_reversion_stats[row]
+                mean_reversion = self._mean_reversion_result(current_price, float(mean_price), float(std_dev),
+                                                             std_dev_threshold)
+            
+            consolidation = None
+            avg_volatility, duration, range_percentage = consolidation_stats[row]
+            if length >= 10 and avg_volatility < volatility_threshold:
+                consolidation = self._consolidation_result(float(avg_volatility), int(duration),
+                                                           float(range_percentage))
+            
+            results[symbol] = self._assemble_analysis(symbol, sr_levels, breakout, mean_reversion, consolidation)
+        
+        return results
+    
+    def analyze_patterns(self, symbol: str, price_history: Sequence[float] = None,
+                         volume_history: Sequence[float] = None) -> Dict:
+        """
+        Comprehensive analysis plus a 0-1 'confidence' score (also as 'strength').
+        
+        Analyzes the given history, or this instance's tracked prices when none is given.
+        """
+        if price_history is not None and len(price_history):
+            analysis = self.analyze_batch({symbol: (price_history, volume_history)})[symbol]
+        else:
+            analysis = self.get_comprehensive_pattern_analysis(symbol)
+        confidence = pattern_confidence(analysis)
+        analysis['confidence'] = confidence
+        analysis['strength'] = confidence
+        return analysis
+
+
+def _pivot_kind(window: np.ndarray, span: int) -> Optional[str]:
+    """'support'/'resistance' when the window's center is strictly below/above every neighbour"""
+    center = window[span]
+    neighbours = np.concatenate((window[:span], window[span + 1:]))
+    if (center < neighbours).all():
+        return 'support'
+    if (center > neighbours).all():
+        return 'resistance'
+    return None
+
+
+def batch_pivots(prices: np.ndarray, span: int = 2) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Support/resistance pivot masks for every row of a right-aligned price matrix.
+    
+    Column j of the masks refers to price column j + span. NaN padding never
+    forms a pivot because comparisons with NaN are false.
+    """
+    rows, width = prices.shape
+    if width < 2 * span + 1:
+        empty = np.zeros((rows, max(width - 2 * span, 0)), dtype=bool)
+        return empty, empty
+    windows = sliding_window_view(prices, 2 * span + 1, axis=1)
+    center = windows[:, :, span:span + 1]
+    neighbours = np.concatenate((windows[:, :, :span], windows[:, :, span + 1:]), axis=2)
+    return (center < neighbours).all(axis=2), (center > neighbours).all(axis=2)
+
+
+def batch_window_stats(prices: np.ndarray, period: int) -> np.ndarray:
+    """(mean, population std) of each row's last `period` prices; NaN for short rows"""
+    window = prices[:, -period:]
+    with np.errstate(invalid='ignore'):
+        return np.stack([window.mean(axis=1), window.std(axis=1)], axis=1)
+
+
+def batch_consolidation(prices: np.ndarray, volatility_threshold: float, window: int = 10) -> np.ndarray:
+    """
+    (average volatility, consolidation duration, range %) over each row's last `window` prices.
+    
+    Duration counts trailing price changes below the threshold; the range covers
+    the prices spanned by those changes.
+    """
+    rows = prices.shape[0]
+    if prices.shape[1] < window:
+        return np.full((rows, 3), np.nan)
+    recent = prices[:, -window:]
+    with np.errstate(invalid='ignore'):
+        changes = np.abs(np.diff(recent, axis=1)) / recent[:, :-1]
+        avg_volatility = changes.mean(axis=1)
+    calm = changes < volatility_threshold
+    duration = np.cumprod(calm[:, ::-1], axis=1).sum(axis=1)
+    
+    in_range = np.arange(window)[np.newaxis, :] >= (window - 1 - duration)[:, np.newaxis]
+    with np.errstate(invalid='ignore'):
+        price_range = (np.where(in_range, recent, -np.inf).max(axis=1) -
+                       np.where(in_range, recent, np.inf).min(axis=1))
+        range_percentage = price_range / recent[:, -1] * 100
+    return np.stack([avg_volatility, duration, range_percentage], axis=1)
+
+
+def batch_average_volume(volumes: np.ndarray, window: int = 10) -> np.ndarray:
+    """Mean of each row's positive volumes among the last `window` (0 when none)"""
+    recent = volumes[:, -window:]
+    positive = recent > 0
+    counts = positive.sum(axis=1)
+    totals = np.where(positive, recent, 0.0).sum(axis=1)
+    return np.divide(totals, counts, out=np.zeros(len(volumes)), where=counts > 0)
+
+
+def pattern_confidence(analysis: Dict) -> float:
+    """
+    0-1 directional score from a comprehensive analysis: 0.5 when neutral,
+    moved up by bullish and down by bearish signals in proportion to strength.
+    """
+    score = 0.5
+    for signal in analysis.get('trading_signals', []):
+        if signal['signal'] == 'bullish':
+            score += 0.3 * signal['strength']
+        elif signal['signal'] == 'bearish':
+            score -= 0.3 * signal['strength']
+    return round(max(0.0, min(1.0, score)), 3)
 
 if __name__ == "__main__":
     # Test pattern recognition
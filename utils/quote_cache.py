@@ -0,0 +1,121 @@
+"""
+Quote Cache
+
+Bounded, thread-safe LRU cache of standardized quote dicts. Each entry keeps
+its own TTL (taken from the data mode when it is stored); reads either accept
+any unexpired entry (scanning) or demand an entry younger than a tighter
+freshness bound (execution).
+"""
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, Dict, Optional
+
+
+class QuoteFreshness(Enum):
+    """How fresh a quote read must be"""
+    CACHE_OK = "cache_ok"                # Any unexpired cached quote (scanning/analysis)
+    FRESH_REQUIRED = "fresh_required"    # Only very recent quotes (sizing/execution)
+
+
+@dataclass
+class _QuoteEntry:
+    quote: Dict[str, Any]
+    stored_at: float
+    ttl: float
+
+
+class QuoteCache:
+    """
+    LRU quote cache with per-entry TTLs and hit/miss/stale counters.
+
+    A lookup that finds an entry too old for the requested freshness counts
+    as stale (and as a miss); expired entries are dropped on access.
+    """
+
+    def __init__(self, max_entries: int = 500, default_ttl: float = 60.0,
+                 logger: Optional[logging.Logger] = None):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Maximum cached symbols before least-recently-used eviction
+            default_ttl: TTL in seconds for entries stored without an explicit TTL
+            logger: Optional logger instance
+        """
+        if max_entries <= 0:
+            raise ValueError("max_entries must be positive")
+        self.max_entries = max_entries
+        self.default_ttl = default_ttl
+        self.logger = logger or logging.getLogger(self.__class__.__name__)
+        self._entries: "OrderedDict[str, _QuoteEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {'hits': 0, 'misses': 0, 'stale': 0, 'evictions': 0, 'stores': 0}
+
+    def get(self, symbol: str, max_age: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """
+        Cached quote for a symbol.
+
+        Args:
+            symbol: Quote symbol
+            max_age: Maximum acceptable age in seconds (None = entry TTL only)
+
+        Returns:
+            Copy of the cached quote, or None on miss/stale
+        """
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(symbol)
+            if entry is None:
+                self._stats['misses'] += 1
+                return None
+
+            age = now - entry.stored_at
+            if age > entry.ttl:
+                del self._entries[symbol]
+                self._stats['stale'] += 1
+                self._stats['misses'] += 1
+                return None
+            if max_age is not None and age > max_age:
+                self._stats['stale'] += 1
+                self._stats['misses'] += 1
+                return None
+
+            self._entries.move_to_end(symbol)
+            self._stats['hits'] += 1
+            return dict(entry.quote)
+
+    def put(self, symbol: str, quote: Dict[str, Any], ttl: Optional[float] = None):
+        """Store a quote, evicting the least recently used entries beyond max_entries"""
+        with self._lock:
+            self._entries[symbol] = _QuoteEntry(dict(quote), time.monotonic(),
+                                                self.default_ttl if ttl is None else ttl)
+            self._entries.move_to_end(symbol)
+            self._stats['stores'] += 1
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._stats['evictions'] += 1
+
+    def invalidate(self, symbol: Optional[str] = None):
+        """Drop one symbol or every cached quote"""
+        with self._lock:
+            if symbol is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(symbol, None)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Hit/miss/stale counters and current size"""
+        with self._lock:
+            stats = dict(self._stats)
+            stats['size'] = len(self._entries)
+        lookups = stats['hits'] + stats['misses']
+        stats['hit_rate'] = stats['hits'] / lookups if lookups else 0.0
+        return stats
+
+    def __len__(self) -> int:
+        return len(self._entries)
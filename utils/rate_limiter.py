@@ -0,0 +1,205 @@
+"""
+Provider Rate Limiter
+
+Process-wide token buckets per data provider (and optionally per endpoint).
+Callers acquire a token before each request: while budget is available
+requests go out immediately (bursts are allowed up to the bucket size), and
+callers only block once the budget is used up. This replaces fixed
+time.sleep() pacing that cost seconds per cycle even far below quota.
+
+Default limits are chosen so that burst + one minute of refill never exceeds
+the provider's documented per-minute limit.
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+
+
+@dataclass(frozen=True)
+class RateLimit:
+    """Token bucket parameters"""
+    rate_per_second: float  # Sustained refill rate
+    burst: int              # Bucket capacity
+
+    @classmethod
+    def per_minute(cls, requests_per_minute: int, burst: int) -> 'RateLimit':
+        """Limit that never exceeds requests_per_minute in any one-minute window"""
+        if burst >= requests_per_minute:
+            raise ValueError("burst must be smaller than requests_per_minute")
+        return cls((requests_per_minute - burst) / 60.0, burst)
+
+
+# Provider-wide limits (endpoint buckets, when configured, apply in addition)
+DEFAULT_LIMITS: Dict[Tuple[str, Optional[str]], RateLimit] = {
+    ('alpaca', None): RateLimit.per_minute(200, 20),         # 200 req/min per account
+    ('alpha_vantage', None): RateLimit.per_minute(5, 1),      # Free tier: 5 req/min
+    ('finnhub', None): RateLimit.per_minute(60, 10),          # Free tier: 60 calls/min
+    ('yfinance', None): RateLimit.per_minute(40, 10),         # Unofficial, ~2000 req/hour
+    ('openai', None): RateLimit.per_minute(30, 5),            # Conservative across model tiers
+}
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket using reservations.
+
+    A caller that finds the bucket empty reserves its token immediately and
+    sleeps until it is refilled, so waiters are served in arrival order
+    without polling.
+    """
+
+    def __init__(self, limit: RateLimit):
+        if limit.rate_per_second <= 0 or limit.burst <= 0:
+            raise ValueError("rate_per_second and burst must be positive")
+        self.limit = limit
+        self._tokens = float(limit.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+        self._stats = {'acquired': 0, 'waited': 0, 'wait_seconds': 0.0, 'rejected': 0}
+
+    def _reserve(self, tokens: float, timeout: Optional[float]) -> Optional[float]:
+        """Reserve tokens and return the required wait, or None if it would exceed timeout"""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.limit.burst,
+                               self._tokens + (now - self._updated) * self.limit.rate_per_second)
+            self._updated = now
+
+            wait = max(0.0, (tokens - self._tokens) / self.limit.rate_per_second)
+            if timeout is not None and wait > timeout:
+                self._stats['rejected'] += 1
+                return None
+
+            self._tokens -= tokens
+            self._stats['acquired'] += 1
+            if wait > 0:
+                self._stats['waited'] += 1
+                self._stats['wait_seconds'] += wait
+            return wait
+
+    def acquire(self, tokens: float = 1.0, timeout: Optional[float] = None) -> bool:
+        """Block until tokens are available; False if that would take longer than timeout"""
+        wait = self._reserve(tokens, timeout)
+        if wait is None:
+            return False
+        if wait > 0:
+            time.sleep(wait)
+        return True
+
+    async def acquire_async(self, tokens: float = 1.0, timeout: Optional[float] = None) -> bool:
+        """Async variant of acquire() for coroutine callers"""
+        wait = self._reserve(tokens, timeout)
+        if wait is None:
+            return False
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return True
+
+    def get_stats(self) -> Dict[str, float]:
+        with self._lock:
+            stats = dict(self._stats)
+            stats['available'] = self._tokens
+        return stats
+
+
+class RateLimitService:
+    """Registry of token buckets keyed by (provider, endpoint)"""
+
+    def __init__(self, limits: Optional[Dict[Tuple[str, Optional[str]], RateLimit]] = None,
+                 logger: Optional[logging.Logger] = None):
+        self.logger = logger or logging.getLogger(self.__class__.__name__)
+        self._lock = threading.Lock()
+        self._buckets: Dict[Tuple[str, Optional[str]], TokenBucket] = {}
+        for key, limit in (limits if limits is not None else DEFAULT_LIMITS).items():
+            self._buckets[key] = TokenBucket(limit)
+
+    def configure(self, provider: str, limit: RateLimit, endpoint: Optional[str] = None):
+        """Set (or replace) the limit for a provider or one of its endpoints"""
+        with self._lock:
+            self._buckets[(provider, endpoint)] = TokenBucket(limit)
+
+    def _buckets_for(self, provider: str, endpoint: Optional[str]):
+        with self._lock:
+            buckets = [self._buckets.get((provider, None))]
+            if endpoint is not None:
+                buckets.append(self._buckets.get((provider, endpoint)))
+        return [bucket for bucket in buckets if bucket is not None]
+
+    def burst(self, provider: str, endpoint: Optional[str] = None) -> Optional[int]:
+        """Requests the provider (and endpoint) lets through at once; None if not limited"""
+        bursts = [bucket.limit.burst for bucket in self._buckets_for(provider, endpoint)]
+        return min(bursts) if bursts else None
+
+    def acquire(self, provider: str, endpoint: Optional[str] = None,
+                tokens: float = 1.0, timeout: Optional[float] = None) -> bool:
+        """
+        Take tokens from the provider bucket and the endpoint bucket (if configured).
+
+        Unknown providers are not limited. Returns False if the wait would
+        exceed timeout.
+        """
+        for bucket in self._buckets_for(provider, endpoint):
+            if not bucket.acquire(tokens, timeout):
+                self.logger.warning(f"⚠️ Rate limit budget exhausted for {provider}"
+                                    f"{'/' + endpoint if endpoint else ''}")
+                return False
+        return True
+
+    async def acquire_async(self, provider: str, endpoint: Optional[str] = None,
+                            tokens: float = 1.0, timeout: Optional[float] = None) -> bool:
+        """Async variant of acquire()"""
+        for bucket in self._buckets_for(provider, endpoint):
+            if not await bucket.acquire_async(tokens, timeout):
+                self.logger.warning(f"⚠️ Rate limit budget exhausted for {provider}"
+                                    f"{'/' + endpoint if endpoint else ''}")
+                return False
+        return True
+
+    def get_stats(self) -> Dict[str, Dict[str, float]]:
+        """Per-bucket acquisition and wait counters"""
+        with self._lock:
+            buckets = dict(self._buckets)
+        return {f"{provider}/{endpoint}" if endpoint else provider: bucket.get_stats()
+                for (provider, endpoint), bucket in buckets.items()}
+
+
+class RateLimitedClient:
+    """Proxy that acquires a provider token before every method call of an API client"""
+
+    def __init__(self, client, provider: str, limiter: Optional[RateLimitService] = None):
+        self._client = client
+        self._provider = provider
+        self._limiter = limiter or get_rate_limiter()
+
+    @property
+    def wrapped_client(self):
+        return self._client
+
+    def __getattr__(self, name: str):
+        attr = getattr(self._client, name)
+        if not callable(attr) or name.startswith('_'):
+            return attr
+
+        def limited(*args, **kwargs):
+            self._limiter.acquire(self._provider, name)
+            return attr(*args, **kwargs)
+
+        limited.__name__ = name
+        return limited
+
+
+_rate_limiter: Optional[RateLimitService] = None
+_rate_limiter_lock = threading.Lock()
+
+
+def get_rate_limiter() -> RateLimitService:
+    """Process-wide rate limit service"""
+    global _rate_limiter
+    with _rate_limiter_lock:
+        if _rate_limiter is None:
+            _rate_limiter = RateLimitService()
+        return _rate_limiter
@@ -0,0 +1,217 @@
+"""
+Incremental Cross-Asset Regime Features
+
+Exponentially weighted state over a cross-section of symbols, updated once
+per bar in O(symbols^2) without rescanning history:
+
+- running mean and covariance of log returns (West's EW update), giving
+  momentum, pooled volatility and average pairwise correlation
+- the latest return per symbol (breadth)
+- fast and slow EW mean volume per symbol (volume pattern)
+- a rolling matrix of the most recent returns
+
+Symbols missing from a bar keep their state; covariances only update for
+pairs that both traded in the bar.
+"""
+
+import math
+import threading
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+
+
+class RegimeFeatureEngine:
+    """EW return/covariance/volume state for regime features across symbols"""
+
+    MIN_RETURNS = 5       # Returns before a symbol contributes to features
+    MIN_PAIR_RETURNS = 4  # Joint returns before a pair contributes to correlation
+
+    def __init__(self, span: int = 60, volume_span: int = 5, window: int = 60):
+        """
+        Initialize the engine.
+
+        Args:
+            span: EW span (in bars) of the return mean/covariance and slow volume
+            volume_span: EW span of the fast ("recent") volume
+            window: Bars kept in the rolling returns matrix
+        """
+        if span <= 1 or volume_span < 1 or window <= 0:
+            raise ValueError("span must exceed 1, volume_span and window must be positive")
+        self.alpha = 2.0 / (span + 1)
+        self.volume_alpha = 2.0 / (volume_span + 1)
+        self.window = window
+        self._lock = threading.Lock()
+        self._index: Dict[str, int] = {}
+        self._last_price = np.empty(0)
+        self._mean = np.empty(0)
+        self._cov = np.empty((0, 0))
+        self._pair_counts = np.empty((0, 0), dtype=np.int64)
+        self._last_return = np.empty(0)
+        self._fast_volume = np.empty(0)
+        self._slow_volume = np.empty(0)
+        self._returns = np.empty((window, 0))
+        self._bars = 0
+
+    @property
+    def symbols(self) -> List[str]:
+        return list(self._index)
+
+    @property
+    def bars(self) -> int:
+        """Bars applied so far"""
+        return self._bars
+
+    def _add_symbols(self, symbols: List[str]):
+        """Grow every array for symbols seen for the first time"""
+        new = [s for s in symbols if s not in self._index]
+        if not new:
+            return
+        for symbol in new:
+            self._index[symbol] = len(self._index)
+        grow = len(new)
+        self._last_price = np.concatenate([self._last_price, np.full(grow, np.nan)])
+        self._mean = np.concatenate([self._mean, np.zeros(grow)])
+        self._last_return = np.concatenate([self._last_return, np.full(grow, np.nan)])
+        self._fast_volume = np.concatenate([self._fast_volume, np.full(grow, np.nan)])
+        self._slow_volume = np.concatenate([self._slow_volume, np.full(grow, np.nan)])
+        self._cov = np.pad(self._cov, ((0, grow), (0, grow)))
+        self._pair_counts = np.pad(self._pair_counts, ((0, grow), (0, grow)))
+        self._returns = np.pad(self._returns, ((0, 0), (0, grow)), constant_values=np.nan)
+
+    def update(self, prices: Dict[str, float], volumes: Optional[Dict[str, float]] = None):
+        """
+        Apply one bar.
+
+        Args:
+            prices: {symbol: price} for the symbols that traded this bar (non-positive prices are ignored)
+            volumes: Optional {symbol: volume} (non-positive volumes are ignored)
+        """
+        prices = {s: float(p) for s, p in prices.items() if p is not None and p > 0}
+        if not prices:
+            return
+        with self._lock:
+            self._add_symbols(list(prices))
+            n = len(self._index)
+            columns = np.fromiter((self._index[s] for s in prices), dtype=np.int64, count=len(prices))
+            current = np.full(n, np.nan)
+            current[columns] = list(prices.values())
+
+            returns = np.log(current / self._last_price)  # NaN for new and absent symbols
+            present = ~np.isnan(returns)
+            first = present & (self._pair_counts.diagonal() == 0)
+            self._mean[first] = returns[first]  # Seed the mean with the first return
+
+            a = self.alpha
+            delta = np.where(present, returns - self._mean, 0.0)
+            self._mean += a * delta
+            pairs = np.outer(present, present)
+            self._cov = np.where(pairs, (1 - a) * (self._cov + a * np.outer(delta, delta)), self._cov)
+            self._pair_counts += pairs
+            self._last_return[present] = returns[present]
+            self._last_price[columns] = current[columns]
+
+            self._returns[self._bars % self.window] = returns
+            self._bars += 1
+
+            for symbol, volume in (volumes or {}).items():
+                column = self._index.get(symbol)
+                if column is None or volume is None or volume <= 0:
+                    continue
+                if np.isnan(self._slow_volume[column]):
+                    self._fast_volume[column] = self._slow_volume[column] = volume
+                else:
+                    self._fast_volume[column] += self.volume_alpha * (volume - self._fast_volume[column])
+                    self._slow_volume[column] += self.alpha * (volume - self._slow_volume[column])
+
+    def _columns(self, symbols: Optional[Iterable[str]], min_returns: int) -> np.ndarray:
+        """Column indexes of the symbols with at least min_returns returns"""
+        names = self._index if symbols is None else [s for s in symbols if s in self._index]
+        columns = np.fromiter((self._index[s] for s in names), dtype=np.int64)
+        counts = self._pair_counts.diagonal()
+        return columns[counts[columns] >= min_returns] if len(columns) else columns
+
+    def symbol_stats(self, symbol: str) -> Optional[Dict[str, float]]:
+        """EW mean return, volatility and return count for one symbol (None if unseen)"""
+        with self._lock:
+            column = self._index.get(symbol)
+            if column is None:
+                return None
+            return {
+                'mean_return': float(self._mean[column]),
+                'volatility': math.sqrt(max(self._cov[column, column], 0.0)),
+                'returns': int(self._pair_counts[column, column])
+            }
+
+    def average_correlation(self, symbols: Optional[Iterable[str]] = None) -> float:
+        """Mean off-diagonal EW return correlation among the symbols (0.0 without enough pairs)"""
+        with self._lock:
+            return self._average_correlation(self._columns(symbols, self.MIN_PAIR_RETURNS))
+
+    def _average_correlation(self, columns: np.ndarray) -> float:
+        if len(columns) < 2:
+            return 0.0
+        cov = self._cov[np.ix_(columns, columns)]
+        std = np.sqrt(np.clip(cov.diagonal(), 0.0, None))
+        scale = np.outer(std, std)
+        mask = (~np.eye(len(columns), dtype=bool)
+                & (self._pair_counts[np.ix_(columns, columns)] >= self.MIN_PAIR_RETURNS) & (scale > 0))
+        if not mask.any():
+            return 0.0
+        return float(np.clip(np.mean(cov[mask] / scale[mask]), -1, 1))
+
+    def features(self, symbols: Optional[Iterable[str]] = None) -> Optional[Dict[str, float]]:
+        """
+        Regime features for the symbols (all tracked symbols when None).
+
+        Same keys and scaling as MLRegimeDetector.extract_regime_features;
+        None until some symbol has MIN_RETURNS returns.
+        """
+        with self._lock:
+            columns = self._columns(symbols, self.MIN_RETURNS)
+            if len(columns) == 0:
+                return None
+
+            means = self._mean[columns]
+            variances = np.clip(self._cov[columns, columns], 0.0, None)
+            # Pooled variance across symbols: mean within-symbol variance plus variance of the means
+            volatility = math.sqrt(float(np.mean(variances) + np.var(means)))
+
+            fast = self._fast_volume[columns]
+            slow = self._slow_volume[columns]
+            traded = ~np.isnan(slow)
+            if traded.any():
+                volume_ratio = fast[traded].sum() / max(slow[traded].sum(), 1)
+                volume_pattern = float(np.tanh((volume_ratio - 1) * 2))
+            else:
+                volume_pattern = 0.0
+
+            last_returns = self._last_return[columns]
+            return {
+                'returns_momentum': float(np.tanh(np.mean(means) * 100)),
+                'volatility_level': min(volatility * 10, 1.0),
+                'correlation_structure': self._average_correlation(self._columns(symbols, self.MIN_PAIR_RETURNS)),
+                'volume_pattern': volume_pattern,
+                'breadth_indicators': (float(np.mean(last_returns > 0)) - 0.5) * 2
+            }
+
+    def recent_returns(self, symbols: Iterable[str], last: Optional[int] = None) -> np.ndarray:
+        """
+        Rolling returns matrix (bars x symbols, oldest bar first; NaN where a symbol did not trade).
+
+        Args:
+            symbols: Column order of the result (unknown symbols are all NaN)
+            last: Only the most recent `last` bars (default the whole window)
+        """
+        symbols = list(symbols)
+        with self._lock:
+            rows = min(self._bars, self.window)
+            if last is not None:
+                rows = min(rows, max(last, 0))
+            order = [(self._bars - rows + i) % self.window for i in range(rows)]
+            result = np.full((rows, len(symbols)), np.nan)
+            for j, symbol in enumerate(symbols):
+                column = self._index.get(symbol)
+                if column is not None:
+                    result[:, j] = self._returns[order, column]
+            return result
@@ -0,0 +1,102 @@
+"""
+Fixed-Capacity Price Ring Buffer
+
+Per-symbol tick history stored as numpy arrays (price, volume, high, low,
+timestamp) with a head index instead of lists of per-tick dicts. Every value
+is written twice, at slot i and i + capacity, so the most recent window is
+always one contiguous slice: field views are zero-copy and appends are O(1)
+with no pop(0).
+"""
+
+from datetime import datetime
+from typing import Optional
+
+import numpy as np
+
+
+class PriceRingBuffer:
+    """Circular buffer of price, volume, high, low and timestamp (epoch seconds)"""
+
+    FIELDS = ('price', 'volume', 'high', 'low', 'timestamp')
+
+    def __init__(self, capacity: int):
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        self.capacity = capacity
+        self._data = np.full((len(self.FIELDS), 2 * capacity), np.nan)
+        self._head = -1  # Slot of the newest value
+        self._count = 0
+
+    def __len__(self) -> int:
+        return min(self._count, self.capacity)
+
+    @property
+    def total_appended(self) -> int:
+        """Number of values ever appended (keeps counting after the buffer wraps)"""
+        return self._count
+
+    def append(self, price: float, volume: float = 0.0, high: Optional[float] = None,
+               low: Optional[float] = None, timestamp: Optional[datetime] = None):
+        """Add one tick, overwriting the oldest once full (high/low are NaN when not given)"""
+        self._head = (self._head + 1) % self.capacity
+        if timestamp is None:
+            timestamp = datetime.now()
+        ts = timestamp.timestamp() if isinstance(timestamp, datetime) else float(timestamp)
+        row = (price, volume,
+               np.nan if high is None else high,
+               np.nan if low is None else low,
+               ts)
+        self._data[:, self._head] = row
+        self._data[:, self._head + self.capacity] = row
+        self._count += 1
+
+    def view(self, field: str, last: Optional[int] = None) -> np.ndarray:
+        """
+        Read-only contiguous view of a field, oldest to newest.
+
+        Args:
+            field: One of FIELDS
+            last: Only the most recent `last` values (default all)
+        """
+        length = len(self)
+        if last is not None:
+            length = min(length, max(last, 0))
+        end = self._head + self.capacity + 1
+        values = self._data[self.FIELDS.index(field), end - length:end]
+        values.flags.writeable = False
+        return values
+
+    @property
+    def prices(self) -> np.ndarray:
+        return self.view('price')
+
+    @property
+    def volumes(self) -> np.ndarray:
+        return self.view('volume')
+
+    @property
+    def highs(self) -> np.ndarray:
+        return self.view('high')
+
+    @property
+    def lows(self) -> np.ndarray:
+        return self.view('low')
+
+    @property
+    def timestamps(self) -> np.ndarray:
+        return self.view('timestamp')
+
+    def latest(self, field: str = 'price') -> Optional[float]:
+        """Most recent value of a field"""
+        if not self._count:
+            return None
+        return float(self._data[self.FIELDS.index(field), self._head])
+
+    def since(self, field: str, cutoff: datetime) -> np.ndarray:
+        """View of values with timestamps after cutoff (timestamps are appended in order)"""
+        start = np.searchsorted(self.timestamps, cutoff.timestamp(), side='right')
+        return self.view(field)[start:]
+
+    @property
+    def nbytes(self) -> int:
+        return self._data.nbytes
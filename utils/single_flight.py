@@ -0,0 +1,158 @@
+"""
+Single-Flight Request Coalescing
+
+When parallel modules ask for the same data at the same moment, only the
+first caller (the leader) performs the request; concurrent callers with the
+same key wait for it and receive the same result or exception. Nothing is
+cached: once the in-flight call finishes, the next identical request goes
+upstream again, so coalescing never adds staleness.
+"""
+
+import logging
+import threading
+from datetime import date, datetime
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+
+class _InFlightCall:
+    """State of one in-flight call shared by its waiters"""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """
+    Per-key in-flight call deduplication.
+
+    Results are shared objects - callers that mutate them should copy first.
+    """
+
+    def __init__(self, logger: Optional[logging.Logger] = None):
+        self.logger = logger or logging.getLogger(self.__class__.__name__)
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _InFlightCall] = {}
+        self._stats = {'calls': 0, 'shared': 0, 'errors': 0}
+
+    def do(self, key: Hashable, fn: Callable, *args, **kwargs) -> Any:
+        """
+        Run fn(*args, **kwargs), or join an identical call already in flight.
+
+        Args:
+            key: Identity of the request (endpoint plus arguments)
+            fn: Callable performing the request
+
+        Returns:
+            The leader's result (waiters re-raise the leader's exception)
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = _InFlightCall()
+                self._calls[key] = call
+                self._stats['calls'] += 1
+            else:
+                self._stats['shared'] += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn(*args, **kwargs)
+            return call.result
+        except BaseException as e:
+            call.error = e
+            with self._lock:
+                self._stats['errors'] += 1
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+            call.done.set()
+
+    def in_flight(self) -> int:
+        """Number of distinct calls currently running"""
+        with self._lock:
+            return len(self._calls)
+
+    def get_stats(self) -> Dict[str, int]:
+        """Leader calls, coalesced waiters and failed calls"""
+        with self._lock:
+            return dict(self._stats)
+
+
+def make_request_key(endpoint: str, args: Tuple = (), kwargs: Optional[Dict] = None) -> Optional[Tuple]:
+    """
+    Hashable key for an endpoint call, or None if an argument cannot be keyed.
+
+    Lists, tuples, sets and dicts are frozen recursively so that e.g.
+    get_crypto_bars(['BTC/USD'], ...) calls with equal arguments coalesce.
+    """
+    def freeze(value):
+        if isinstance(value, (str, int, float, bool, type(None), datetime, date)):
+            return value
+        if isinstance(value, (list, tuple)):
+            return tuple(freeze(item) for item in value)
+        if isinstance(value, (set, frozenset)):
+            return frozenset(freeze(item) for item in value)
+        if isinstance(value, dict):
+            return tuple(sorted((str(k), freeze(v)) for k, v in value.items()))
+        hash(value)  # Raises TypeError for unhashable objects
+        return value
+
+    try:
+        return (endpoint, freeze(tuple(args)), freeze(kwargs or {}))
+    except TypeError:
+        return None
+
+
+class SingleFlightClient:
+    """
+    Transparent proxy over an API client that coalesces concurrent read calls.
+
+    Only methods whose names start with one of read_prefixes are coalesced;
+    everything else (submit_order, cancel_order, ...) passes straight through.
+    """
+
+    def __init__(self, client, flight: Optional[SingleFlight] = None,
+                 read_prefixes: Tuple[str, ...] = ('get_', 'list_')):
+        self._client = client
+        self._flight = flight or get_single_flight()
+        self._read_prefixes = read_prefixes
+
+    @property
+    def wrapped_client(self):
+        return self._client
+
+    def __getattr__(self, name: str):
+        attr = getattr(self._client, name)
+        if not callable(attr) or not name.startswith(self._read_prefixes):
+            return attr
+
+        def coalesced(*args, **kwargs):
+            key = make_request_key(f"api.{name}", args, kwargs)
+            if key is None:
+                return attr(*args, **kwargs)
+            return self._flight.do(key, attr, *args, **kwargs)
+
+        coalesced.__name__ = name
+        return coalesced
+
+
+_single_flight: Optional[SingleFlight] = None
+_single_flight_lock = threading.Lock()
+
+
+def get_single_flight() -> SingleFlight:
+    """Process-wide SingleFlight shared by every data-access path"""
+    global _single_flight
+    with _single_flight_lock:
+        if _single_flight is None:
+            _single_flight = SingleFlight()
+        return _single_flight
@@ -0,0 +1,193 @@
+"""
+Data Source Health Tracking
+
+Rolling latency and error statistics per data source, a circuit breaker that
+skips a failing source for a cool-down, and latency-based ordering of
+fallback chains so the fastest healthy source is tried first.
+"""
+
+import logging
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Deque, Dict, List, Optional
+
+import numpy as np
+
+
+class BreakerState(Enum):
+    """Circuit breaker states"""
+    CLOSED = "closed"        # Source in use
+    OPEN = "open"            # Source skipped until the cool-down expires
+    HALF_OPEN = "half_open"  # One trial request allowed after the cool-down
+
+
+@dataclass
+class _SourceState:
+    latencies: Deque[float]
+    outcomes: Deque[bool]  # True = the source answered (breaker input)
+    answers: Deque[bool]   # True = the answer had data (ordering input)
+    state: BreakerState = BreakerState.CLOSED
+    consecutive_failures: int = 0
+    opened_at: float = 0.0
+    cooldown: float = 0.0
+    trial_in_flight: bool = False
+    totals: Dict[str, int] = field(default_factory=lambda: {'calls': 0, 'errors': 0, 'empty': 0, 'skipped': 0})
+
+
+class SourceHealthTracker:
+    """
+    Per-source latency/error tracker with circuit breakers.
+
+    A breaker opens after failure_threshold consecutive failures, or when the
+    error rate over the rolling window exceeds max_error_rate. Each re-open
+    from the half-open state doubles the cool-down up to max_cooldown_seconds.
+    An answer without data (the source has nothing for one symbol) is not a
+    failure of the source: it only counts against the source's ordering.
+    """
+
+    def __init__(self, window: int = 50, failure_threshold: int = 3, max_error_rate: float = 0.5,
+                 min_samples: int = 5, cooldown_seconds: float = 60.0,
+                 max_cooldown_seconds: float = 600.0, logger: Optional[logging.Logger] = None):
+        self.window = window
+        self.failure_threshold = failure_threshold
+        self.max_error_rate = max_error_rate
+        self.min_samples = min_samples
+        self.cooldown_seconds = cooldown_seconds
+        self.max_cooldown_seconds = max_cooldown_seconds
+        self.logger = logger or logging.getLogger(self.__class__.__name__)
+        self._lock = threading.Lock()
+        self._sources: Dict[str, _SourceState] = {}
+
+    def _state(self, source: str) -> _SourceState:
+        state = self._sources.get(source)
+        if state is None:
+            state = _SourceState(latencies=deque(maxlen=self.window), outcomes=deque(maxlen=self.window),
+                                 answers=deque(maxlen=self.window))
+            self._sources[source] = state
+        return state
+
+    def allow(self, source: str) -> bool:
+        """Whether a request may be sent to the source now"""
+        with self._lock:
+            state = self._state(source)
+            if state.state == BreakerState.OPEN:
+                if time.monotonic() - state.opened_at < state.cooldown:
+                    state.totals['skipped'] += 1
+                    return False
+                state.state = BreakerState.HALF_OPEN
+                state.trial_in_flight = False
+            if state.state == BreakerState.HALF_OPEN:
+                if state.trial_in_flight:
+                    state.totals['skipped'] += 1
+                    return False
+                state.trial_in_flight = True
+            return True
+
+    def record_success(self, source: str, latency: float):
+        self._record_answer(source, latency, has_data=True)
+
+    def record_empty(self, source: str, latency: float):
+        """The source answered but had no data for the request"""
+        self._record_answer(source, latency, has_data=False)
+
+    def _record_answer(self, source: str, latency: float, has_data: bool):
+        with self._lock:
+            state = self._state(source)
+            state.latencies.append(latency)
+            state.outcomes.append(True)
+            state.answers.append(has_data)
+            state.totals['calls'] += 1
+            state.totals['empty'] += int(not has_data)
+            state.consecutive_failures = 0
+            if state.state != BreakerState.CLOSED:
+                self.logger.info(f"✅ Data source {source} recovered - circuit closed")
+            state.state = BreakerState.CLOSED
+            state.trial_in_flight = False
+            state.cooldown = 0.0
+
+    def record_failure(self, source: str, latency: float):
+        with self._lock:
+            state = self._state(source)
+            state.latencies.append(latency)
+            state.outcomes.append(False)
+            state.answers.append(False)
+            state.totals['calls'] += 1
+            state.totals['errors'] += 1
+            state.consecutive_failures += 1
+
+            if state.state == BreakerState.HALF_OPEN:
+                self._open(source, state, min(max(state.cooldown, self.cooldown_seconds) * 2,
+                                              self.max_cooldown_seconds))
+            elif state.state == BreakerState.CLOSED and (
+                    state.consecutive_failures >= self.failure_threshold or
+                    (len(state.outcomes) >= self.min_samples and
+                     self._error_rate(state) > self.max_error_rate)):
+                self._open(source, state, self.cooldown_seconds)
+
+    def _open(self, source: str, state: _SourceState, cooldown: float):
+        state.state = BreakerState.OPEN
+        state.opened_at = time.monotonic()
+        state.cooldown = cooldown
+        state.trial_in_flight = False
+        self.logger.warning(f"⚠️ Data source {source} circuit open - skipping for {cooldown:.0f}s")
+
+    @staticmethod
+    def _error_rate(state: _SourceState) -> float:
+        if not state.outcomes:
+            return 0.0
+        return 1.0 - sum(state.outcomes) / len(state.outcomes)
+
+    def latency_percentile(self, source: str, percentile: float) -> Optional[float]:
+        """Rolling latency percentile in seconds (None without samples)"""
+        with self._lock:
+            state = self._sources.get(source)
+            if state is None or not state.latencies:
+                return None
+            return float(np.percentile(np.fromiter(state.latencies, dtype=float), percentile))
+
+    def order(self, sources: List[str]) -> List[str]:
+        """
+        Sources sorted for a fallback chain.
+
+        Sources with an open breaker go last; the rest are sorted by expected
+        time to a usable answer: rolling p50 latency divided by the share of
+        calls that returned data, so a source that fails fast or answers fast
+        with nothing does not rank as fast. Sources
+        without samples keep their configured position ahead of measured
+        ones, so they get measured.
+        """
+        def key(indexed):
+            index, source = indexed
+            with self._lock:
+                state = self._sources.get(source)
+                is_open = state is not None and state.state == BreakerState.OPEN
+                success_rate = sum(state.answers) / len(state.answers) if state and state.answers else 1.0
+            p50 = self.latency_percentile(source, 50)
+            if p50 is None:
+                return (is_open, False, 0.0, index)
+            cost = p50 / success_rate if success_rate > 0 else float('inf')
+            return (is_open, True, cost, index)
+
+        return [source for _, source in sorted(enumerate(sources), key=key)]
+
+    def get_stats(self) -> Dict[str, Dict]:
+        """Per-source p50/p95 latency, error rate and breaker state"""
+        with self._lock:
+            names = list(self._sources)
+        stats = {}
+        for source in names:
+            with self._lock:
+                state = self._sources[source]
+                entry = {
+                    'state': state.state.value,
+                    'error_rate': self._error_rate(state),
+                    'consecutive_failures': state.consecutive_failures,
+                    **state.totals
+                }
+            entry['p50'] = self.latency_percentile(source, 50)
+            entry['p95'] = self.latency_percentile(source, 95)
+            stats[source] = entry
+        return stats
@@ -0,0 +1,287 @@
+"""
+Streaming Technical Indicators
+
+Incremental indicator state that is updated in constant time per new price,
+for tick-level evaluation without recomputing full windows. Each indicator
+uses the same definition as the batch methods in TechnicalIndicators, so the
+values agree to floating point tolerance:
+
+- RSI: simple average of the last `period` gains/losses (Wilder-smoothed
+  value available as `wilder_value`)
+- MACD: fast/slow EMAs over the trailing fast/slow windows, with a running
+  EMA signal line seeded by the SMA of the first MACD values
+- Bollinger Bands: rolling sum and sum of squares
+- ADX: rolling true range and directional movement sums, averaged DX
+"""
+
+import math
+from collections import deque
+from typing import Deque, Dict, Optional
+
+
+class RollingSum:
+    """
+    Fixed-window running sum.
+
+    Tracks how many values in the window are non-zero so that an all-zero
+    window reports exactly zero despite accumulated rounding, and re-sums
+    the window periodically to stop drift.
+    """
+
+    RESYNC_INTERVAL = 1000
+
+    def __init__(self, period: int):
+        self.period = period
+        self.values: Deque[float] = deque(maxlen=period)
+        self._sum = 0.0
+        self._nonzero = 0
+        self._updates = 0
+
+    def append(self, value: float):
+        if len(self.values) == self.period:
+            old = self.values[0]
+            self._sum -= old
+            self._nonzero -= old != 0
+        self.values.append(value)
+        self._sum += value
+        self._nonzero += value != 0
+        self._updates += 1
+        if self._updates % self.RESYNC_INTERVAL == 0:
+            self._sum = math.fsum(self.values)
+
+    @property
+    def full(self) -> bool:
+        return len(self.values) == self.period
+
+    @property
+    def sum(self) -> float:
+        return self._sum if self._nonzero else 0.0
+
+    @property
+    def mean(self) -> float:
+        return self.sum / len(self.values) if self.values else 0.0
+
+
+class StreamingEMA:
+    """Running EMA seeded with the SMA of the first `period` values"""
+
+    def __init__(self, period: int):
+        self.period = period
+        self.multiplier = 2 / (period + 1)
+        self.value: Optional[float] = None
+        self._seed = RollingSum(period)
+
+    def update(self, value: float) -> Optional[float]:
+        if self.value is None:
+            self._seed.append(value)
+            if self._seed.full:
+                self.value = self._seed.mean
+        else:
+            self.value = value * self.multiplier + self.value * (1 - self.multiplier)
+        return self.value
+
+
+class WindowedEMA:
+    """
+    EMA over only the trailing `period` values, seeded with the oldest one.
+
+    The recursion over a window of n values weights the value k steps back
+    by a(1-a)^k and the seed by (1-a)^(n-1). The weighted sum of the newest
+    n-1 values is carried forward: scale by (1-a), add the new value, drop
+    the value that became the seed.
+    """
+
+    def __init__(self, period: int):
+        self.period = period
+        self.alpha = 2 / (period + 1)
+        self.values: Deque[float] = deque(maxlen=period)
+        self._weighted = 0.0  # Sum over the newest period-1 values
+        self._updates = 0
+
+    def update(self, value: float) -> Optional[float]:
+        a = self.alpha
+        tail = self.period - 1
+        if len(self.values) >= tail and tail > 0:
+            self._weighted -= a * (1 - a) ** (tail - 1) * self.values[-tail]
+        self._weighted = a * value + (1 - a) * self._weighted
+        self.values.append(value)
+        self._updates += 1
+        if self._updates % RollingSum.RESYNC_INTERVAL == 0:
+            recent = list(self.values)[-tail:] if tail else []
+            self._weighted = math.fsum(a * (1 - a) ** k * v for k, v in enumerate(reversed(recent)))
+        return self.value
+
+    @property
+    def value(self) -> Optional[float]:
+        if len(self.values) < self.period:
+            return None
+        return self._weighted + (1 - self.alpha) ** (self.period - 1) * self.values[0]
+
+
+class StreamingRSI:
+    """RSI from rolling gain/loss sums over the last `period` price changes"""
+
+    def __init__(self, period: int = 14):
+        self.period = period
+        self._gains = RollingSum(period)
+        self._losses = RollingSum(period)
+        self._last_price: Optional[float] = None
+        self._wilder_gain: Optional[float] = None
+        self._wilder_loss: Optional[float] = None
+
+    def update(self, price: float) -> Optional[float]:
+        if self._last_price is not None:
+            delta = price - self._last_price
+            gain, loss = max(delta, 0.0), max(-delta, 0.0)
+            self._gains.append(gain)
+            self._losses.append(loss)
+
+            # Wilder smoothing: SMA seed, then (prev * (n-1) + current) / n
+            if self._wilder_gain is None:
+                if self._gains.full:
+                    self._wilder_gain, self._wilder_loss = self._gains.mean, self._losses.mean
+            else:
+                n = self.period
+                self._wilder_gain = (self._wilder_gain * (n - 1) + gain) / n
+                self._wilder_loss = (self._wilder_loss * (n - 1) + loss) / n
+        self._last_price = price
+        return self.value
+
+    @staticmethod
+    def _rsi(avg_gain: float, avg_loss: float) -> float:
+        if avg_loss == 0:
+            return 100.0
+        return 100 - (100 / (1 + avg_gain / avg_loss))
+
+    @property
+    def value(self) -> Optional[float]:
+        if not self._gains.full:
+            return None
+        return self._rsi(self._gains.sum / self.period, self._losses.sum / self.period)
+
+    @property
+    def wilder_value(self) -> Optional[float]:
+        if self._wilder_gain is None:
+            return None
+        return self._rsi(self._wilder_gain, self._wilder_loss)
+
+
+class StreamingMACD:
+    """MACD line, signal line and histogram updated per price"""
+
+    def __init__(self, fast_period: int = 12, slow_period: int = 26, signal_period: int = 9):
+        self.fast_period = fast_period
+        self.slow_period = slow_period
+        self.signal_period = signal_period
+        self._fast = WindowedEMA(fast_period)
+        self._slow = WindowedEMA(slow_period)
+        self._signal = StreamingEMA(signal_period)
+        self.count = 0
+        self.macd: Optional[float] = None
+
+    def update(self, price: float) -> Optional[Dict[str, float]]:
+        self.count += 1
+        fast = self._fast.update(price)
+        slow = self._slow.update(price)
+        if fast is not None and slow is not None:
+            self.macd = fast - slow
+            self._signal.update(self.macd)
+        return self.value
+
+    @property
+    def value(self) -> Optional[Dict[str, float]]:
+        if self.count < self.slow_period + self.signal_period or self._signal.value is None:
+            return None
+        return {'macd': self.macd, 'signal': self._signal.value, 'histogram': self.macd - self._signal.value}
+
+
+class StreamingBollinger:
+    """Bollinger Bands from a rolling sum and sum of squares"""
+
+    def __init__(self, period: int = 20, std_dev: float = 2.0):
+        self.period = period
+        self.std_dev = std_dev
+        self._sum = RollingSum(period)
+        self._squares = RollingSum(period)
+        self._shift: Optional[float] = None  # Centering keeps the sum of squares well conditioned
+        self.current: Optional[float] = None
+
+    def update(self, price: float) -> Optional[Dict[str, float]]:
+        if self._shift is None:
+            self._shift = price
+        centered = price - self._shift
+        self._sum.append(centered)
+        self._squares.append(centered * centered)
+        self.current = price
+        return self.value
+
+    @property
+    def value(self) -> Optional[Dict[str, float]]:
+        if not self._sum.full:
+            return None
+        mean = self._sum.sum / self.period
+        std = math.sqrt(max(self._squares.sum / self.period - mean * mean, 0.0))
+        middle = mean + self._shift
+        return {'upper': middle + self.std_dev * std, 'middle': middle,
+                'lower': middle - self.std_dev * std, 'current': self.current}
+
+
+class StreamingADX:
+    """+DI, -DI and ADX from rolling true range and directional movement sums"""
+
+    def __init__(self, period: int = 14):
+        self.period = period
+        self.reset()
+
+    def reset(self):
+        """Drop state (e.g. when a bar arrives without high/low)"""
+        self._tr = RollingSum(self.period)
+        self._plus_dm = RollingSum(self.period)
+        self._minus_dm = RollingSum(self.period)
+        self._dx = RollingSum(self.period)
+        self._previous: Optional[tuple] = None
+        self.plus_di: Optional[float] = None
+        self.minus_di: Optional[float] = None
+
+    def update(self, high: float, low: float, close: float) -> Optional[float]:
+        if self._previous is not None:
+            prev_high, prev_low, prev_close = self._previous
+            self._tr.append(max(high - low, abs(high - prev_close), abs(low - prev_close)))
+            up_move = high - prev_high
+            down_move = prev_low - low
+            self._plus_dm.append(up_move if (up_move > down_move and up_move > 0) else 0.0)
+            self._minus_dm.append(down_move if (down_move > up_move and down_move > 0) else 0.0)
+
+            if self._tr.full:
+                tr_sum = self._tr.sum
+                self.plus_di = self._plus_dm.sum / tr_sum * 100 if tr_sum > 0 else 0.0
+                self.minus_di = self._minus_dm.sum / tr_sum * 100 if tr_sum > 0 else 0.0
+                di_sum = self.plus_di + self.minus_di
+                self._dx.append(abs(self.plus_di - self.minus_di) / di_sum * 100 if di_sum > 0 else 0.0)
+        self._previous = (high, low, close)
+        return self.value
+
+    @property
+    def value(self) -> Optional[float]:
+        return self._dx.mean if self._dx.full else None
+
+
+class SymbolIndicatorState:
+    """Streaming RSI, MACD, Bollinger and ADX state for one symbol"""
+
+    def __init__(self, rsi_period: int = 14, macd_periods: tuple = (12, 26, 9),
+                 bollinger_period: int = 20, bollinger_std: float = 2.0, adx_period: int = 14):
+        self.rsi = StreamingRSI(rsi_period)
+        self.macd = StreamingMACD(*macd_periods)
+        self.bollinger = StreamingBollinger(bollinger_period, bollinger_std)
+        self.adx = StreamingADX(adx_period)
+
+    def update(self, price: float, high: Optional[float] = None, low: Optional[float] = None):
+        """Advance every indicator by one price (ADX restarts on bars without high/low)"""
+        self.rsi.update(price)
+        self.macd.update(price)
+        self.bollinger.update(price)
+        if high is not None and low is not None:
+            self.adx.update(high, low, price)
+        else:
+            self.adx.reset()
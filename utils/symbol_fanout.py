@@ -0,0 +1,151 @@
+"""
+Per-Symbol Fan-Out
+
+Runs one analysis function over a module's symbols on a persistent, bounded
+thread pool. Cycle time becomes roughly the slowest symbol instead of the sum
+of every symbol's network waits.
+
+- Concurrency is capped at the burst of the providers the workers call, so
+  the pool never holds more requests in flight than the rate limiter would
+  release at once (workers still acquire their own tokens per request).
+- Results come back in input order whatever the completion order.
+- An exception in one symbol is captured in its SymbolResult and never
+  affects the other symbols.
+- The run honours the caller's CancellationToken: once its deadline passes
+  no new symbol starts, the map returns at the deadline with the symbols it
+  finished, and the rest are marked skipped (and recorded on the token).
+"""
+
+import contextvars
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from utils.cancellation import CancellationToken, current_token
+from utils.rate_limiter import RateLimitService, get_rate_limiter
+
+DEFAULT_SYMBOL_CONCURRENCY = 8
+
+
+@dataclass
+class SymbolResult:
+    """Outcome of one symbol's analysis"""
+    symbol: str
+    value: Any = None
+    error: Optional[Exception] = None
+    seconds: float = 0.0
+    skipped: bool = False  # Not analyzed: the module's budget ran out first
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None and not self.skipped
+
+
+class SymbolFanOut:
+    """Bounded persistent worker pool that maps a function over symbols"""
+
+    def __init__(self, name: str, max_concurrency: int = DEFAULT_SYMBOL_CONCURRENCY,
+                 providers: Iterable[str] = ('alpaca',), limiter: Optional[RateLimitService] = None,
+                 logger: Optional[logging.Logger] = None):
+        """
+        Initialize the fan-out.
+
+        Args:
+            name: Owner name (worker thread prefix and log messages)
+            max_concurrency: Requested number of symbols analyzed at once
+            providers: Data providers the workers call; concurrency is capped at their smallest burst
+            limiter: Rate limit service (defaults to the process-wide one)
+            logger: Optional logger instance
+        """
+        self.name = name
+        self.logger = logger or logging.getLogger(self.__class__.__name__)
+        limiter = limiter or get_rate_limiter()
+        bursts = [burst for burst in (limiter.burst(provider) for provider in providers) if burst]
+        self.max_concurrency = max(1, min([int(max_concurrency)] + bursts))
+        if self.max_concurrency < max_concurrency:
+            self.logger.info(f"🧵 {name} symbol concurrency capped at {self.max_concurrency} by provider burst")
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._stats = {'runs': 0, 'symbols': 0, 'errors': 0, 'skipped': 0,
+                       'last_run_seconds': 0.0, 'last_slowest_seconds': 0.0}
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_concurrency,
+                                                    thread_name_prefix=f"{self.name}-symbols")
+            return self._executor
+
+    @staticmethod
+    def _run(fn: Callable[[str], Any], symbol: str, token: CancellationToken) -> SymbolResult:
+        if token.cancelled:
+            return SymbolResult(symbol, skipped=True)
+        start = time.monotonic()
+        try:
+            return SymbolResult(symbol, value=fn(symbol), seconds=time.monotonic() - start)
+        except Exception as e:
+            return SymbolResult(symbol, error=e, seconds=time.monotonic() - start)
+
+    def map(self, fn: Callable[[str], Any], symbols: Iterable[str],
+            token: Optional[CancellationToken] = None) -> List[SymbolResult]:
+        """
+        Apply fn to every symbol concurrently.
+
+        Returns one SymbolResult per symbol in input order; exceptions are
+        captured per symbol, never raised. Symbols not finished by the
+        token's deadline (default: the current module's token) come back
+        with skipped=True; a call still running in a worker is left to finish
+        in the background and its result is discarded.
+        """
+        symbols = list(symbols)
+        token = token or current_token()
+        start = time.monotonic()
+        if self.max_concurrency == 1 or len(symbols) <= 1:
+            results = [self._run(fn, symbol, token) for symbol in symbols]
+        else:
+            executor = self._get_executor()
+            # Each task runs in a copy of the caller's context so nested code sees the same token
+            futures = [executor.submit(contextvars.copy_context().run, self._run, fn, symbol, token)
+                       for symbol in symbols]
+            done, _ = wait(futures, timeout=token.remaining())
+            results = []
+            for symbol, future in zip(symbols, futures):
+                if future in done:
+                    results.append(future.result())
+                else:
+                    future.cancel()
+                    results.append(SymbolResult(symbol, skipped=True))
+
+        elapsed = time.monotonic() - start
+        skipped = [result.symbol for result in results if result.skipped]
+        errors = sum(1 for result in results if result.error is not None)
+        if skipped:
+            token.skip(skipped)
+            self.logger.warning(f"⏱️ {self.name}: budget spent - {len(skipped)}/{len(symbols)} symbols skipped")
+        with self._lock:
+            self._stats['runs'] += 1
+            self._stats['symbols'] += len(results)
+            self._stats['errors'] += errors
+            self._stats['skipped'] += len(skipped)
+            self._stats['last_run_seconds'] = elapsed
+            self._stats['last_slowest_seconds'] = max((result.seconds for result in results), default=0.0)
+        if symbols:
+            self.logger.debug(f"🧵 {self.name}: {len(symbols)} symbols in {elapsed:.2f}s "
+                              f"({self.max_concurrency} workers, {errors} errors)")
+        return results
+
+    def get_stats(self) -> Dict[str, float]:
+        with self._lock:
+            stats = dict(self._stats)
+        stats['max_concurrency'] = self.max_concurrency
+        return stats
+
+    def shutdown(self):
+        """Stop the worker threads (a later map() starts a new pool)"""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
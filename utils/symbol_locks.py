@@ -0,0 +1,102 @@
+"""
+Per-Symbol Action Locks
+
+Process-wide mutual exclusion per symbol between the opportunity scan and
+the fast position monitor, which run on separate threads: while one of them
+is placing orders for a symbol the other skips (or briefly waits for) that
+symbol instead of acting on it at the same time.
+"""
+
+import threading
+from contextlib import contextmanager
+from typing import Dict, Iterable, Iterator, Optional, Set
+
+
+def _key(symbol: str) -> str:
+    return symbol.replace('/', '').upper()
+
+
+class SymbolLocks:
+    """Non-reentrant lock per symbol with the name of the current holder"""
+
+    def __init__(self):
+        self._guard = threading.Lock()
+        self._locks: Dict[str, threading.Lock] = {}
+        self._owners: Dict[str, str] = {}
+        self._stats = {'acquired': 0, 'contended': 0}
+
+    def _lock_for(self, key: str) -> threading.Lock:
+        with self._guard:
+            return self._locks.setdefault(key, threading.Lock())
+
+    def acquire(self, symbol: str, owner: str, timeout: float = 0.0) -> bool:
+        """Take the symbol's lock, waiting at most timeout seconds (0 = don't wait)"""
+        key = _key(symbol)
+        lock = self._lock_for(key)
+        acquired = lock.acquire(timeout=timeout) if timeout > 0 else lock.acquire(blocking=False)
+        with self._guard:
+            if acquired:
+                self._owners[key] = owner
+                self._stats['acquired'] += 1
+            else:
+                self._stats['contended'] += 1
+        return acquired
+
+    def release(self, symbol: str):
+        key = _key(symbol)
+        with self._guard:
+            self._owners.pop(key, None)
+            lock = self._locks.get(key)
+        if lock is not None and lock.locked():
+            lock.release()
+
+    def owner(self, symbol: str) -> Optional[str]:
+        """Who currently holds the symbol, None if nobody"""
+        with self._guard:
+            return self._owners.get(_key(symbol))
+
+    @contextmanager
+    def hold(self, symbol: str, owner: str, timeout: float = 0.0) -> Iterator[bool]:
+        """Context manager yielding whether the symbol was acquired (released on exit)"""
+        acquired = self.acquire(symbol, owner, timeout)
+        try:
+            yield acquired
+        finally:
+            if acquired:
+                self.release(symbol)
+
+    def acquire_many(self, symbols: Iterable[str], owner: str) -> Set[str]:
+        """Acquire every free symbol without waiting; returns the symbols acquired"""
+        return {symbol for symbol in dict.fromkeys(symbols) if self.acquire(symbol, owner)}
+
+    def release_many(self, symbols: Iterable[str]):
+        for symbol in symbols:
+            self.release(symbol)
+
+    @contextmanager
+    def hold_many(self, symbols: Iterable[str], owner: str) -> Iterator[Set[str]]:
+        """Acquire every free symbol without waiting; yields the symbols held"""
+        held = self.acquire_many(symbols, owner)
+        try:
+            yield held
+        finally:
+            self.release_many(held)
+
+    def get_stats(self) -> Dict[str, int]:
+        with self._guard:
+            stats = dict(self._stats)
+            stats['held'] = len(self._owners)
+        return stats
+
+
+_symbol_locks: Optional[SymbolLocks] = None
+_symbol_locks_lock = threading.Lock()
+
+
+def get_symbol_locks() -> SymbolLocks:
+    """Process-wide symbol locks"""
+    global _symbol_locks
+    with _symbol_locks_lock:
+        if _symbol_locks is None:
+            _symbol_locks = SymbolLocks()
+        return _symbol_locks
@@ -1,20 +1,39 @@
 #!/usr/bin/env python3
 
+import logging
 import math
+from collections import deque
 from typing import List, Dict, Tuple, Optional
 from datetime import datetime, timedelta
 
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+from utils.ring_buffer import PriceRingBuffer
+from utils.streaming_indicators import SymbolIndicatorState
+
 class TechnicalIndicators:
     """
     Technical analysis indicators for Phase 3 Intelligence Layer.
     Implements RSI, MACD, Bollinger Bands, and Volume analysis.
+    
+    With streaming enabled (default), RSI, MACD, Bollinger Bands and ADX with
+    default parameters are served from incremental per-symbol state updated in
+    add_price_data; other parameters use the full-window batch calculations.
     """
     
-    def __init__(self):
-        self.price_history = {}  # symbol -> list of prices
-        self.volume_history = {}  # symbol -> list of volumes
+    # Store more data points if needed for longer period calculations like ADX
+    max_data_points = 250
+    
+    def __init__(self, streaming: bool = True, logger: Optional[logging.Logger] = None):
+        self.logger = logger or logging.getLogger(__name__)
+        self.streaming = streaming
+        self.price_history: Dict[str, PriceRingBuffer] = {}  # symbol -> price/volume/high/low ring buffer
         self.initialized_symbols = set()
-        self.macd_history = {} # symbol -> list of macd values for signal line calculation
+        self.macd_history = {} # symbol -> deque of macd values for signal line calculation
+        self.indicator_state: Dict[str, SymbolIndicatorState] = {}  # symbol -> streaming indicators
+        self._data_version: Dict[str, int] = {}  # symbol -> count of added points (cache invalidation)
+        self._rsi_series_cache: Dict[Tuple[str, int], Tuple[int, np.ndarray]] = {}
     
     def add_price_data(self, symbol: str, price: float, volume: int = 0, timestamp: datetime = None, high: Optional[float]=None, low: Optional[float]=None):
         """Add new price, volume, high, and low data for a symbol"""
@@ -22,25 +41,14 @@ class TechnicalIndicators:
             timestamp = datetime.now()
             
         if symbol not in self.price_history:
-            self.price_history[symbol] = []
-            self.volume_history[symbol] = []
-            self.macd_history[symbol] = [] # Initialize for MACD
+            # Fixed-capacity ring buffer overwrites the oldest point in O(1)
+            self.price_history[symbol] = PriceRingBuffer(self.max_data_points)
+            self.macd_history[symbol] = deque(maxlen=self.max_data_points) # Initialize for MACD
+            self.indicator_state[symbol] = SymbolIndicatorState()
 
-        # Store more data points if needed for longer period calculations like ADX
-        # Max length could be adjusted based on longest period (e.g., ADX might need ~50 for 14-period)
-        max_data_points = 250 # Increased for longer indicators
-        
-        if len(self.price_history[symbol]) >= max_data_points:
-            self.price_history[symbol].pop(0)
-            self.volume_history[symbol].pop(0)
-            if self.macd_history[symbol]: self.macd_history[symbol].pop(0)
-
-        data_point = {'price': price, 'timestamp': timestamp}
-        if high is not None: data_point['high'] = high
-        if low is not None: data_point['low'] = low
-        
-        self.price_history[symbol].append(data_point)
-        self.volume_history[symbol].append({'volume': volume, 'timestamp': timestamp})
+        self.price_history[symbol].append(price, volume, high, low, timestamp)
+        self.indicator_state[symbol].update(price, high, low)
+        self._data_version[symbol] = self._data_version.get(symbol, 0) + 1
         
         # Mark as initialized once we have enough data (e.g., for a 20-period MA or RSI)
         if len(self.price_history[symbol]) >= 20: # Basic initialization
@@ -55,7 +63,12 @@ class TechnicalIndicators:
         if symbol not in self.price_history or len(self.price_history[symbol]) < period + 1:
             return None
         
-        prices = [p['price'] for p in self.price_history[symbol]]
+        state = self._streaming_state(symbol)
+        if state is not None and period == state.rsi.period:
+            rsi = state.rsi.value
+            return round(rsi, 2) if rsi is not None else None
+        
+        prices = self.price_history[symbol].prices.tolist()
         
         # Calculate price changes
         deltas = []
@@ -89,7 +102,20 @@ class TechnicalIndicators:
         if symbol not in self.price_history or len(self.price_history[symbol]) < slow_period + signal_period:
             return None
         
-        prices = [p['price'] for p in self.price_history[symbol]]
+        state = self._streaming_state(symbol)
+        if state is not None and (fast_period, slow_period, signal_period) == (
+                state.macd.fast_period, state.macd.slow_period, state.macd.signal_period):
+            macd = state.macd.value
+            if macd is None:
+                return None
+            return {
+                'macd': round(macd['macd'], 4),
+                'signal': round(macd['signal'], 4),
+                'histogram': round(macd['histogram'], 4),
+                'trend': "bullish" if macd['macd'] > macd['signal'] else "bearish"
+            }
+        
+        prices = self.price_history[symbol].prices.tolist()
         
         # Calculate EMAs
         def calculate_ema(data: List[float], period: int) -> float:
@@ -116,7 +142,7 @@ class TechnicalIndicators:
         if len(self.macd_history[symbol]) >= signal_period:
             # Use proper EMA calculation for signal line - use ALL available MACD values
             signal_line = self._calculate_ema_from_values(
-                self.macd_history[symbol], 
+                list(self.macd_history[symbol]), 
                 signal_period
             )
         else:
@@ -144,19 +170,27 @@ class TechnicalIndicators:
         if symbol not in self.price_history or len(self.price_history[symbol]) < period:
             return None
         
-        prices = [p['price'] for p in self.price_history[symbol][-period:]]
-        current_price = prices[-1]
-        
-        # Simple Moving Average (middle band)
-        sma = sum(prices) / len(prices)
-        
-        # Standard deviation
-        variance = sum((price - sma) ** 2 for price in prices) / len(prices)
-        std = math.sqrt(variance)
-        
-        # Bollinger Bands
-        upper_band = sma + (std_dev * std)
-        lower_band = sma - (std_dev * std)
+        state = self._streaming_state(symbol)
+        if state is not None and (period, std_dev) == (state.bollinger.period, state.bollinger.std_dev):
+            bands = state.bollinger.value
+            if bands is None:
+                return None
+            current_price, sma = bands['current'], bands['middle']
+            upper_band, lower_band = bands['upper'], bands['lower']
+        else:
+            prices = self.price_history[symbol].view('price', last=period).tolist()
+            current_price = prices[-1]
+            
+            # Simple Moving Average (middle band)
+            sma = sum(prices) / len(prices)
+            
+            # Standard deviation
+            variance = sum((price - sma) ** 2 for price in prices) / len(prices)
+            std = math.sqrt(variance)
+            
+            # Bollinger Bands
+            upper_band = sma + (std_dev * std)
+            lower_band = sma - (std_dev * std)
         
         # Determine position
         if current_price > upper_band:
@@ -182,15 +216,15 @@ class TechnicalIndicators:
         if symbol not in self.price_history:
             return None
         
-        prices = [p['price'] for p in self.price_history[symbol]]
-        current_price = prices[-1] if prices else 0
+        prices = self.price_history[symbol].prices
+        current_price = float(prices[-1]) if len(prices) else 0
         
         result = {'current': current_price}
         
         # Calculate available MAs
         for period in [20, 50, 200]:
             if len(prices) >= period:
-                ma = sum(prices[-period:]) / period
+                ma = float(prices[-period:].sum()) / period
                 result[f'ma{period}'] = round(ma, 2)
         
         # Determine trend if we have at least MA20
@@ -216,10 +250,10 @@ class TechnicalIndicators:
         Analyze volume patterns for institutional activity detection
         Returns: {'avg_volume': int, 'current_volume': int, 'volume_ratio': float, 'activity': str}
         """
-        if symbol not in self.volume_history or len(self.volume_history[symbol]) < period:
+        if symbol not in self.price_history or len(self.price_history[symbol]) < period:
             return None
         
-        volumes = [v['volume'] for v in self.volume_history[symbol][-period:]]
+        volumes = self.price_history[symbol].view('volume', last=period).tolist()
         current_volume = volumes[-1] if volumes else 0
         
         # Calculate average volume (excluding current)
@@ -245,6 +279,10 @@ class TechnicalIndicators:
             'activity': activity
         }
     
+    def _streaming_state(self, symbol: str) -> Optional[SymbolIndicatorState]:
+        """Incremental indicator state for a symbol (None when streaming is disabled)"""
+        return self.indicator_state.get(symbol) if self.streaming else None
+    
     def _calculate_ema_from_values(self, values: List[float], period: int) -> Optional[float]:
         """Helper to calculate EMA from a list of values."""
         if not values or len(values) < period:
@@ -273,122 +311,116 @@ class TechnicalIndicators:
             ema_values.append(ema)
         return ema_values[-1] if ema_values else None
 
+    def rsi_series(self, symbol: str, period: int = 14) -> Optional[np.ndarray]:
+        """
+        Full RSI series for a symbol in one vectorized pass.
+        
+        Element i is the RSI (simple average of the last `period` changes) as of
+        price i + period. Cached per symbol and period until new data is added;
+        the returned array is read-only.
+        """
+        history = self.price_history.get(symbol)
+        if history is None or len(history) < period + 1:
+            return None
+        
+        version = self._data_version.get(symbol, 0)
+        cached = self._rsi_series_cache.get((symbol, period))
+        if cached is not None and cached[0] == version:
+            return cached[1]
+        
+        deltas = np.diff(history.prices)
+        avg_gain = sliding_window_view(np.clip(deltas, 0, None), period).sum(axis=1) / period
+        avg_loss = sliding_window_view(np.clip(-deltas, 0, None), period).sum(axis=1) / period
+        with np.errstate(divide='ignore', invalid='ignore'):
+            series = np.where(avg_loss == 0, 100.0, 100 - 100 / (1 + avg_gain / avg_loss))
+        series.setflags(write=False)
+        
+        self._rsi_series_cache[(symbol, period)] = (version, series)
+        return series
+    
     def calculate_rsi_slope(self, symbol: str, rsi_period: int = 14, slope_period: int = 5) -> Optional[float]:
         """
         Calculate the slope of the RSI over the last 'slope_period' points.
         A positive slope indicates rising momentum, negative indicates falling.
         """
-        if symbol not in self.price_history or len(self.price_history[symbol]) < rsi_period + slope_period:
+        series = self.rsi_series(symbol, rsi_period)
+        if series is None or len(series) < slope_period:
             return None
-
-        rsi_values = []
-        # Temporarily get more prices if needed for rolling RSI calculation
-        prices_full = [p['price'] for p in self.price_history[symbol]]
-
-        for i in range(slope_period):
-            # Calculate RSI for the window ending at 'i' steps from the end
-            # prices_for_rsi_calc = prices_full[-(rsi_period + slope_period - 1 - i) : -(slope_period - 1 - i) if (slope_period - 1 - i) > 0 else None]
-            # This slicing is tricky. Simpler: calculate RSI for the last (rsi_period + slope_period -1) prices
-            # then take the last 'slope_period' RSI values.
-            
-            # To get RSI at point t, we need prices up to t.
-            # For RSI slope over `slope_period`, we need `slope_period` RSI values.
-            # The last RSI value uses prices up to T.
-            # The first RSI value (for the slope) uses prices up to T - slope_period + 1.
-            # Each RSI calculation itself needs `rsi_period` price changes (i.e., `rsi_period + 1` prices).
-
-            # Let's grab enough historical prices to calculate `slope_period` RSI values
-            # Total prices needed: rsi_period (for the first RSI) + slope_period (for subsequent RSI values)
-            if len(prices_full) < rsi_period + slope_period: # Need enough data points overall
-                 return None
-
-            # Calculate RSI for the latest `slope_period` points
-            # We need to simulate `self.price_history` for each point to call `calculate_rsi`
-            # This is inefficient. Better to calculate RSI series directly.
-            
-            # Direct RSI series calculation:
-            deltas = [prices_full[j] - prices_full[j-1] for j in range(1, len(prices_full))]
-            if len(deltas) < rsi_period + slope_period - 1:
-                return None
-
-            current_rsi_series = []
-            for k in range(slope_period):
-                # Window for RSI calculation moves back in time
-                # Last RSI point uses deltas[-rsi_period:]
-                # Second to last uses deltas[-(rsi_period+1):-1], etc.
-                end_index = len(deltas) - k
-                start_index = end_index - rsi_period
-                if start_index < 0: break # Not enough data for this RSI point
-
-                period_deltas = deltas[start_index:end_index]
-                
-                gains = [d for d in period_deltas if d > 0]
-                losses = [-d for d in period_deltas if d < 0]
-
-                avg_gain = sum(gains) / rsi_period if gains else 0
-                avg_loss = sum(losses) / rsi_period if losses else 0.00001 # Avoid division by zero
-
-                if avg_loss == 0: rs = float('inf') # Effectively 100 RSI
-                else: rs = avg_gain / avg_loss
-                
-                rsi = 100 - (100 / (1 + rs))
-                current_rsi_series.append(rsi)
-            
-            if len(current_rsi_series) < slope_period: return None
-            rsi_values_for_slope = list(reversed(current_rsi_series)) # Ensure chronological order for slope
-
-        # Linear regression: y = mx + c where y is RSI, x is time index (0, 1, ..., slope_period-1)
-        n = float(slope_period)
-        x_series = list(range(slope_period))
-        y_series = rsi_values_for_slope
-
-        sum_x = sum(x_series)
-        sum_y = sum(y_series)
-        sum_xy = sum(x * y for x, y in zip(x_series, y_series))
-        sum_x_sq = sum(x**2 for x in x_series)
-
-        numerator = (n * sum_xy) - (sum_x * sum_y)
-        denominator = (n * sum_x_sq) - (sum_x**2)
-
-        if denominator == 0:
+        if slope_period < 2:
             return 0.0  # Flat line, slope is 0
         
-        slope = numerator / denominator
+        # Least squares slope of RSI against time index (0, 1, ..., slope_period-1)
+        y = series[-slope_period:]
+        x = np.arange(slope_period, dtype=float)
+        x_centered = x - x.mean()
+        slope = float(np.dot(x_centered, y - y.mean()) / np.dot(x_centered, x_centered))
         return round(slope, 3)
+    
+    def calculate_rsi_divergence(self, symbol: str, rsi_period: int = 14, lookback: int = 14) -> Optional[Dict]:
+        """
+        Detect RSI divergence between the last two `lookback` windows.
+        Bullish: price makes a lower low while RSI makes a higher low.
+        Bearish: price makes a higher high while RSI makes a lower high.
+        Returns: {'divergence': 'bullish'|'bearish'|None, 'price_change': float, 'rsi_change': float}
+        """
+        series = self.rsi_series(symbol, rsi_period)
+        if series is None or len(series) < 2 * lookback:
+            return None
+        
+        # Prices aligned with the RSI series (one RSI value per price after the first rsi_period)
+        prices = self.price_history[symbol].view('price', last=2 * lookback)
+        rsi = series[-2 * lookback:]
+        previous, recent = slice(0, lookback), slice(lookback, 2 * lookback)
+        
+        price_low_change = prices[recent].min() - prices[previous].min()
+        price_high_change = prices[recent].max() - prices[previous].max()
+        rsi_low_change = rsi[recent].min() - rsi[previous].min()
+        rsi_high_change = rsi[recent].max() - rsi[previous].max()
+        
+        if price_low_change < 0 and rsi_low_change > 0:
+            return {'divergence': 'bullish', 'price_change': round(float(price_low_change), 4),
+                    'rsi_change': round(float(rsi_low_change), 2)}
+        if price_high_change > 0 and rsi_high_change < 0:
+            return {'divergence': 'bearish', 'price_change': round(float(price_high_change), 4),
+                    'rsi_change': round(float(rsi_high_change), 2)}
+        return {'divergence': None, 'price_change': round(float(prices[-1] - prices[0]), 4),
+                'rsi_change': round(float(rsi[-1] - rsi[0]), 2)}
 
     def calculate_adx(self, symbol: str, period: int = 14) -> Optional[float]:
         """
         Calculate ADX (Average Directional Index).
-        Requires High, Low, Close prices. Current implementation is a placeholder
-        as add_price_data might not consistently provide HLC.
+        Requires High, Low, Close prices (add_price_data called with high and low);
+        returns None when they are missing.
         ADX < 20: Weak trend or ranging market.
         ADX > 25-30: Strong trend (either up or down).
         ADX > 50: Very strong trend.
         """
-        # Placeholder: Full ADX requires High, Low, Close data points.
-        # Ensure add_price_data is called with high and low prices.
-        # For now, returning a neutral value or None.
-        self.logger.warning(f"ADX calculation for {symbol} requires HLC data. Current impl is a placeholder.")
+        state = self._streaming_state(symbol)
+        if state is not None and period == state.adx.period:
+            adx = state.adx.value
+            return round(adx, 2) if adx is not None else None
         
-        prices_data = self.price_history.get(symbol, [])
-        if len(prices_data) < period + period: # Need enough data for smoothing, e.g. period for TR/DM, period for ADX smoothing
-             # self.logger.debug(f"Insufficient data for ADX {symbol}: have {len(prices_data)}, need ~{2*period}")
+        # Full ADX requires High, Low, Close data points.
+        # Ensure add_price_data is called with high and low prices.
+        history = self.price_history.get(symbol)
+        if history is None or len(history) < period + period: # Need enough data for smoothing, e.g. period for TR/DM, period for ADX smoothing
              return None
 
-        # Check if HLC data is available
-        if not all('high' in p and 'low' in p and 'price' in p for p in prices_data[- (2*period):]): # Check recent data needed
-            # self.logger.warning(f"HLC data missing for ADX calculation of {symbol}. Fallback or skip.")
-            return None # Or a mock value like 25.0
+        # ADX depends only on the last 2*period bars; all of them need high/low (NaN when missing)
+        highs = history.view('high', last=2 * period)
+        lows = history.view('low', last=2 * period)
+        if np.isnan(highs).any() or np.isnan(lows).any():
+            return None
 
-        highs = [p['high'] for p in prices_data]
-        lows = [p['low'] for p in prices_data]
-        closes = [p['price'] for p in prices_data]
+        highs = highs.tolist()
+        lows = lows.tolist()
+        closes = history.view('price', last=2 * period).tolist()
 
         tr_values = []
         plus_dm_values = []
         minus_dm_values = []
 
-        for i in range(1, len(prices_data)):
+        for i in range(1, len(closes)):
             # True Range
             tr1 = highs[i] - lows[i]
             tr2 = abs(highs[i] - closes[i-1])